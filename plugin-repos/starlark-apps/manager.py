@@ -7,11 +7,14 @@ Provides seamless widget import without modification.
 API Version: 1.0.0
 """
 
+import hashlib
 import json
 import os
 import re
+import tempfile
 import time
 import fcntl
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from PIL import Image
@@ -23,6 +26,14 @@ from frame_extractor import FrameExtractor
 
 logger = get_logger(__name__)
 
+# LEDMatrix-internal timing keys; never passed to pixlet.
+INTERNAL_KEYS = {'render_interval', 'display_duration'}
+
+# Retry delay after a failed render doubles per consecutive failure, from
+# BASE up to MAX, so a broken app stops costing a pixlet run every cycle.
+RENDER_BACKOFF_BASE = 30
+RENDER_BACKOFF_MAX = 1800
+
 
 class StarlarkApp:
     """Represents a single installed Starlark app."""
@@ -43,6 +54,8 @@ class StarlarkApp:
         self.config_file = app_dir / "config.json"
         self.schema_file = app_dir / "schema.json"
         self.cache_file = app_dir / "cached_render.webp"
+        # Fingerprint of the inputs that produced cache_file (see render_fingerprint)
+        self.fingerprint_file = app_dir / "cached_render.sha256"
 
         # Load app configuration and schema
         self.config = self._load_config()
@@ -56,6 +69,8 @@ class StarlarkApp:
         self.current_frame_index = 0
         self.last_frame_time = 0
         self.last_render_time = 0
+        self.render_failures = 0
+        self.retry_after = 0.0
 
     def _load_config(self) -> Dict[str, Any]:
         """Load app configuration from config.json."""
@@ -180,11 +195,80 @@ class StarlarkApp:
         # Clamp to safe range: min 1, max 600
         return max(1, min(duration, 600))
 
+    def get_render_timeout(self, default: float) -> float:
+        """Get pixlet timeout in seconds (manifest override, else default)."""
+        try:
+            timeout = float(self.manifest.get("render_timeout", default))
+        except (ValueError, TypeError):
+            timeout = default
+
+        # Same range the plugin accepts for render_timeout
+        return max(5.0, min(timeout, 120.0))
+
     def should_render(self, current_time: float) -> bool:
         """Check if app should be re-rendered based on interval."""
         interval = self.get_render_interval()
         return (current_time - self.last_render_time) >= interval
 
+    def in_backoff(self, current_time: float) -> bool:
+        """Check if a recent render failure is still delaying the next attempt."""
+        return current_time < self.retry_after
+
+    def record_render_failure(self, current_time: float) -> float:
+        """Schedule the next attempt after a failed render. Returns the delay."""
+        self.render_failures += 1
+        delay = min(RENDER_BACKOFF_BASE * 2 ** (self.render_failures - 1), RENDER_BACKOFF_MAX)
+        self.retry_after = current_time + delay
+        return delay
+
+    def record_render_success(self, fingerprint: Optional[str]) -> None:
+        """Clear backoff and remember which inputs produced cache_file."""
+        self.render_failures = 0
+        self.retry_after = 0.0
+        if fingerprint is None:
+            return
+        try:
+            self.fingerprint_file.write_text(fingerprint)
+        except OSError as e:
+            logger.warning(f"Could not save render fingerprint for {self.app_id}: {e}")
+
+    def render_fingerprint(self, pixlet_config: Dict[str, Any], magnify: int) -> Optional[str]:
+        """
+        Hash everything that determines pixlet's output for this app.
+
+        Args:
+            pixlet_config: Config as passed to pixlet
+            magnify: Magnification factor
+
+        Returns:
+            Hex digest, or None if the .star source cannot be read
+        """
+        try:
+            source = self.star_file.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(source)
+        digest.update(json.dumps(pixlet_config, sort_keys=True, default=str).encode())
+        digest.update(f"magnify={magnify}".encode())
+        return digest.hexdigest()
+
+    def is_cache_current(self, fingerprint: Optional[str], current_time: float,
+                         max_age: float) -> bool:
+        """
+        Check if cache_file can stand in for a fresh render.
+
+        True when it was rendered from the same source, config and magnify
+        as now, and is younger than max_age seconds.
+        """
+        if fingerprint is None:
+            return False
+        try:
+            age = current_time - self.cache_file.stat().st_mtime
+            stored = self.fingerprint_file.read_text().strip()
+        except OSError:
+            return False
+        return stored == fingerprint and age < max_age
+
 
 class StarlarkAppsPlugin(BasePlugin):
     """
@@ -208,6 +292,9 @@ class StarlarkAppsPlugin(BasePlugin):
             default_frame_delay=config.get("default_frame_delay", 50)
         )
 
+        # Concurrent pixlet processes during update() (0 = one per CPU)
+        self.render_workers = config.get("render_workers", 0) or os.cpu_count() or 1
+
         # App storage
         self.apps_dir = self._get_apps_directory()
         self.manifest_file = self.apps_dir / "manifest.json"
@@ -277,6 +364,13 @@ class StarlarkAppsPlugin(BasePlugin):
                 self.logger.error("render_timeout must be a number between 5 and 120")
                 return False
 
+        # Validate render_workers
+        if "render_workers" in self.config:
+            workers = self.config["render_workers"]
+            if not isinstance(workers, int) or workers < 0 or workers > 16:
+                self.logger.error("render_workers must be an integer between 0 and 16")
+                return False
+
         # Validate cache_ttl
         if "cache_ttl" in self.config:
             ttl = self.config["cache_ttl"]
@@ -672,14 +766,34 @@ class StarlarkAppsPlugin(BasePlugin):
             return False
 
     def update(self) -> None:
-        """Update method - check if apps need re-rendering."""
+        """
+        Update method - re-render apps whose refresh interval has elapsed.
+
+        Due apps render concurrently, up to render_workers pixlet processes
+        at a time, so a cycle takes about as long as its slowest render
+        rather than the sum of all of them. Apps still backing off from a
+        failed render wait for their retry time.
+        """
+        if not self.config.get("auto_refresh_apps", True):
+            return
+
         current_time = time.time()
+        due = [app for app in self.apps.values()
+               if app.is_enabled() and app.should_render(current_time)
+               and not app.in_backoff(current_time)]
+        if not due:
+            return
 
-        # Check apps that need re-rendering based on their intervals
-        if self.config.get("auto_refresh_apps", True):
-            for app in self.apps.values():
-                if app.is_enabled() and app.should_render(current_time):
-                    self._render_app(app, force=False)
+        workers = min(self.render_workers, len(due))
+        if workers == 1:
+            for app in due:
+                self._render_app(app, force=False)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="starlark-render") as pool:
+            # _render_app never raises; list() just waits for every app
+            list(pool.map(lambda app: self._render_app(app, force=False), due))
 
     def display(self, force_clear: bool = False) -> None:
         """
@@ -703,7 +817,7 @@ class StarlarkAppsPlugin(BasePlugin):
 
             # Render app if needed
             if not self.current_app.frames:
-                success = self._render_app(self.current_app, force=True)
+                success = self._render_app(self.current_app)
                 if not success:
                     self.logger.error(f"Failed to render app: {self.current_app.app_id}")
                     return
@@ -736,9 +850,14 @@ class StarlarkAppsPlugin(BasePlugin):
         """
         Render a Starlark app using Pixlet.
 
+        Without force, the cached WebP is reused when it was rendered from
+        the current source, config and magnify and is younger than the app's
+        render interval (capped by cache_ttl), and an app backing off from a
+        failed render is not retried early.
+
         Args:
             app: App to render
-            force: Force render even if cached
+            force: Force render even if cached or backing off
 
         Returns:
             True if successful
@@ -746,37 +865,62 @@ class StarlarkAppsPlugin(BasePlugin):
         try:
             current_time = time.time()
 
+            # Get effective magnification factor (config or auto-calculated)
+            magnify = self._get_effective_magnify()
+            pixlet_config = {k: v for k, v in app.config.items() if k not in INTERNAL_KEYS}
+            fingerprint = app.render_fingerprint(pixlet_config, magnify)
+
             # Check cache
             use_cache = self.config.get("cache_rendered_output", True)
             cache_ttl = self.config.get("cache_ttl", 300)
+            max_age = min(app.get_render_interval(), cache_ttl)
 
-            if (not force and use_cache and app.cache_file.exists() and
-                (current_time - app.last_render_time) < cache_ttl):
-                # Use cached render
+            if not force and use_cache and app.is_cache_current(fingerprint, current_time, max_age):
+                # Use cached render; it ages out on the file's own clock
                 self.logger.debug(f"Using cached render for: {app.app_id}")
-                return self._load_frames_from_cache(app)
+                if app.frames is None and not self._load_frames_from_cache(app):
+                    return False
+                app.last_render_time = app.cache_file.stat().st_mtime
+                return True
+
+            if not force and app.in_backoff(current_time):
+                self.logger.debug(f"Skipping render for {app.app_id}: retry in "
+                                  f"{app.retry_after - current_time:.0f}s")
+                return False
 
             # Render with Pixlet
             self.logger.info(f"Rendering app: {app.app_id}")
-
-            # Get effective magnification factor (config or auto-calculated)
-            magnify = self._get_effective_magnify()
             self.logger.debug(f"Using magnify={magnify} for {app.app_id}")
 
-            # Filter out LEDMatrix-internal timing keys before passing to pixlet
-            INTERNAL_KEYS = {'render_interval', 'display_duration'}
-            pixlet_config = {k: v for k, v in app.config.items() if k not in INTERNAL_KEYS}
+            # Render beside the cache and swap it in, so the display thread
+            # never decodes a half-written file. Each render gets its own
+            # temp file: a forced render can overlap the scheduled one.
+            fd, temp_path = tempfile.mkstemp(dir=app.cache_file.parent,
+                                             prefix=".cached_render_", suffix=".webp")
+            os.close(fd)
+            try:
+                success, error = self.pixlet.render(
+                    star_file=str(app.star_file),
+                    output_path=temp_path,
+                    config=pixlet_config,
+                    magnify=magnify,
+                    timeout=app.get_render_timeout(self.pixlet.timeout)
+                )
+                if success and os.path.getsize(temp_path) == 0:
+                    success, error = False, "Rendering succeeded but output file is empty"
 
-            success, error = self.pixlet.render(
-                star_file=str(app.star_file),
-                output_path=str(app.cache_file),
-                config=pixlet_config,
-                magnify=magnify
-            )
+                if not success:
+                    delay = app.record_render_failure(time.time())
+                    self.logger.error(f"Pixlet render failed for {app.app_id}: {error} "
+                                      f"(failure {app.render_failures}, retry in {delay}s)")
+                    return False
 
-            if not success:
-                self.logger.error(f"Pixlet render failed: {error}")
-                return False
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, app.cache_file)
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+            app.record_render_success(fingerprint)
 
             # Extract frames
             success = self._load_frames_from_cache(app)
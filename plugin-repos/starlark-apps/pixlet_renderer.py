@@ -218,7 +218,8 @@ class PixletRenderer:
         star_file: str,
         output_path: str,
         config: Optional[Dict[str, Any]] = None,
-        magnify: int = 1
+        magnify: int = 1,
+        timeout: Optional[float] = None
     ) -> Tuple[bool, Optional[str]]:
         """
         Render a .star file to WebP output.
@@ -228,6 +229,7 @@ class PixletRenderer:
             output_path: Where to save WebP output
             config: Configuration dictionary to pass to app
             magnify: Magnification factor (default 1)
+            timeout: Seconds to wait for this render (default: self.timeout)
 
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
@@ -238,6 +240,9 @@ class PixletRenderer:
         if not os.path.isfile(star_file):
             return False, f"Star file not found: {star_file}"
 
+        if timeout is None:
+            timeout = self.timeout
+
         try:
             # Build command - config params must be POSITIONAL between star_file and flags
             # Format: pixlet render <file.star> [key=value]... [flags]
@@ -294,7 +299,7 @@ class PixletRenderer:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=self.timeout,
+                timeout=timeout,
                 cwd=safe_cwd  # Run in .star file directory (or None if relative path)
             )
 
@@ -312,7 +317,7 @@ class PixletRenderer:
                 return False, error
 
         except subprocess.TimeoutExpired:
-            error = f"Rendering timeout after {self.timeout}s"
+            error = f"Rendering timeout after {timeout}s"
             logger.error(error)
             return False, error
         except (subprocess.SubprocessError, OSError):
@@ -20,6 +20,8 @@ parser.add_argument('-e', '--emulator', action='store_true',
                     help='Run in emulator mode (uses pygame/RGBMatrixEmulator instead of hardware)')
 parser.add_argument('-d', '--debug', action='store_true',
                     help='Enable debug logging and verbose output')
+parser.add_argument('--profile-imports', action='store_true',
+                    help='Log per-module import times during startup')
 args = parser.parse_args()
 
 # Set emulator mode if requested (must be done BEFORE any imports that check EMULATOR env var)
@@ -66,8 +68,16 @@ log_level = logging.DEBUG if debug_mode else logging.INFO
 format_type = 'readable'  # Use 'json' for structured logging in production
 setup_logging(level=log_level, format_type=format_type, include_location=debug_mode)
 
+# Import profiling has to be installed before the imports it is meant to time
+from src import startup_profiler
+
+if args.profile_imports or startup_profiler.is_enabled_by_env():
+    startup_profiler.enable_import_profiling()
+
 # Now import the display controller
 from src.display_controller import main
 
+startup_profiler.log_import_profile("display controller import")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
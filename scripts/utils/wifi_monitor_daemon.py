@@ -69,8 +69,9 @@ class WiFiMonitorDaemon:
         logger.info(f"Configuration: auto_enable_ap_mode={auto_enable}, ap_ssid={ap_ssid}")
         
         # Log initial status
-        initial_status = self.wifi_manager.get_wifi_status()
-        initial_ethernet = self.wifi_manager._is_ethernet_connected()
+        initial = self.wifi_manager.get_network_snapshot()
+        initial_status = initial.wifi
+        initial_ethernet = initial.ethernet_connected
         logger.info(f"Initial status: WiFi connected={initial_status.connected}, "
                    f"Ethernet connected={initial_ethernet}, AP active={initial_status.ap_mode_active}")
         if initial_status.connected:
@@ -184,8 +185,9 @@ class WiFiMonitorDaemon:
         # Ensure AP mode is disabled on shutdown if WiFi or Ethernet is connected
         logger.info("Performing cleanup on shutdown...")
         try:
-            status = self.wifi_manager.get_wifi_status()
-            ethernet_connected = self.wifi_manager._is_ethernet_connected()
+            final = self.wifi_manager.get_network_snapshot(max_age=0)
+            status = final.wifi
+            ethernet_connected = final.ethernet_connected
             logger.info(f"Final status: WiFi={status.connected}, Ethernet={ethernet_connected}, AP={status.ap_mode_active}")
             
             if (status.connected or ethernet_connected) and status.ap_mode_active:
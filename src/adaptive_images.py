@@ -20,12 +20,17 @@ genuinely adapts to larger displays; pass ``upscale=False`` for the old
 behavior.
 
 Use via ``LayoutContext.fit_image(...)`` (cached per panel size) or
-``BasePlugin.draw_image(...)``; the module-level functions are the
-uncached primitives.
+``BasePlugin.draw_image(...)``. ``fit_image``/``draw_fitted_image`` are the
+uncached primitives; ``fit_image_cached`` memoizes ``fit_image`` process-wide
+so contexts that are rebuilt every frame (skins get a fresh LayoutContext
+per render) stop re-running the resize.
 """
 
+import threading
+import weakref
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from PIL import Image
 
@@ -148,6 +153,145 @@ def fit_image(img: Image.Image, box: Any, *, mode: str = "contain",
     return ImageFitResult(out, out_w, out_h, scale, mode, (src_w, src_h))
 
 
+# Fitted logos/art on a 64x32..256x64 panel are a few KB to ~64KB each; 8MB
+# holds every image a full rotation draws with room to spare.
+DEFAULT_FIT_CACHE_BYTES = 8 * 1024 * 1024
+
+
+class FitImageCache:
+    """Byte-bounded LRU of fit_image results, keyed by source identity.
+
+    Keys are (id(source), source size/mode, box, options). Sources are NOT
+    pinned: each one gets a weakref.finalize that queues its id, and queued
+    ids are purged before the next lookup -- so a dead image's entries go
+    away with it and a recycled id can never hit them. A source mutated in
+    place keeps its identity and serves the old fit; treat images passed
+    here as immutable (the same contract as LayoutContext's id()-keyed
+    cache), or pass a copy.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_FIT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, ImageFitResult]" = OrderedDict()
+        self._sizes: Dict[Tuple, int] = {}
+        self._keys_by_source: Dict[int, Set[Tuple]] = {}
+        self._finalizers: Dict[int, weakref.finalize] = {}
+        # Filled by finalizers, which can run from any allocation (including
+        # one made while _lock is held), so they only append here and never
+        # take the lock themselves.
+        self._dead_sources: Deque[int] = deque()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_dead()
+            return len(self._entries)
+
+    def fit(self, img: Image.Image, box: Any, *, mode: str = "contain",
+            crop_to_ink: bool = False, anchor: str = "center",
+            resample: Any = None, upscale: bool = True) -> ImageFitResult:
+        """fit_image(), served from the cache when the same source was
+        already fitted with the same box and options."""
+        box_w, box_h = _box_dims(box)
+        resample = RESAMPLE_LANCZOS if resample is None else resample
+        key = (id(img), img.size, img.mode, box_w, box_h, mode,
+               crop_to_ink, anchor, resample, upscale)
+        with self._lock:
+            self._purge_dead()
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = fit_image(img, (box_w, box_h), mode=mode,
+                           crop_to_ink=crop_to_ink, anchor=anchor,
+                           resample=resample, upscale=upscale)
+        nbytes = result.width * result.height * 4  # always RGBA
+        if nbytes > self.max_bytes:
+            return result
+
+        with self._lock:
+            self._purge_dead()
+            if key in self._entries:  # another thread fitted it meanwhile
+                return self._entries[key]
+            source_id = key[0]
+            if source_id not in self._finalizers:
+                finalizer = weakref.finalize(img, self._dead_sources.append, source_id)
+                finalizer.atexit = False
+                self._finalizers[source_id] = finalizer
+            self._entries[key] = result
+            self._sizes[key] = nbytes
+            self._keys_by_source.setdefault(source_id, set()).add(key)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._drop_key(old_key)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            for finalizer in self._finalizers.values():
+                finalizer.detach()
+            self._entries.clear()
+            self._sizes.clear()
+            self._keys_by_source.clear()
+            self._finalizers.clear()
+            self._dead_sources.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._purge_dead()
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    # ---- internals (call with _lock held) --------------------------------
+
+    def _purge_dead(self) -> None:
+        while self._dead_sources:
+            source_id = self._dead_sources.popleft()
+            self._finalizers.pop(source_id, None)
+            for key in self._keys_by_source.pop(source_id, ()):
+                self._entries.pop(key, None)
+                self._bytes -= self._sizes.pop(key, 0)
+
+    def _drop_key(self, key: Tuple) -> None:
+        """Account for an entry already removed from _entries."""
+        self._bytes -= self._sizes.pop(key, 0)
+        source_id = key[0]
+        keys = self._keys_by_source.get(source_id)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_source[source_id]
+            finalizer = self._finalizers.pop(source_id, None)
+            if finalizer is not None:
+                finalizer.detach()
+
+
+fit_image_cache = FitImageCache()
+
+
+def fit_image_cached(img: Image.Image, box: Any, **kwargs: Any) -> ImageFitResult:
+    """fit_image() through the shared process-wide FitImageCache.
+
+    Takes the same arguments as fit_image(). The returned result (and its
+    image) may be shared with other callers -- paste it, don't draw on it.
+    """
+    return fit_image_cache.fit(img, box, **kwargs)
+
+
 def draw_fitted_image(display_manager: Any, ifit: ImageFitResult, box: Any, *,
                       align: str = "center", valign: str = "center",
                       offset: Tuple[int, int] = (0, 0)) -> Optional[Tuple[int, int]]:
@@ -539,7 +539,7 @@ class LayoutContext:
         reloaded — the default id()-based key is safe (the entry pins the
         source image) but misses across reloads of the same content.
         """
-        from src.adaptive_images import fit_image as _fit_image
+        from src.adaptive_images import fit_image_cached
 
         box_w, box_h = _box_dims(box)
         resample_name = getattr(resample, "name", repr(resample)) if resample is not None else "default"
@@ -552,9 +552,12 @@ class LayoutContext:
             self._image_cache.move_to_end(key)
             return cached[0]
 
-        result = _fit_image(img, (box_w, box_h), mode=mode,
-                            crop_to_ink=crop_to_ink, anchor=anchor,
-                            resample=resample, upscale=upscale)
+        # Misses go through the process-wide memo: skins build a new
+        # LayoutContext per render, so this instance cache starts cold
+        # every frame while the source logos are the same objects.
+        result = fit_image_cached(img, (box_w, box_h), mode=mode,
+                                  crop_to_ink=crop_to_ink, anchor=anchor,
+                                  resample=resample, upscale=upscale)
         # Pin the source only for id()-keyed entries (see docstring).
         self._image_cache[key] = (result, img if cache_key is None else None)
         while len(self._image_cache) > self._IMAGE_CACHE_MAX:
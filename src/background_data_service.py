@@ -12,17 +12,29 @@ Key Features:
 - Graceful error handling
 - Progress tracking and logging
 - Memory-efficient data storage
+- In-flight deduplication of identical requests
+
+Requests used to go straight to the thread pool, so the priority queue was
+never read and two managers asking for the same scoreboard at the same time
+each made their own HTTP call. Submissions now go through request_queue,
+highest priority first, and a request identical to one that is still pending
+or in progress (same URL, query parameters and headers) joins it: the caller
+gets the same request ID and future, its callback is called with the same
+result, and a higher-priority caller raises the priority of a request that
+has not started yet.
 """
 
+import itertools
 import time
 import logging
 import threading
 import requests
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import queue
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
 from src.cache_manager import CacheManager
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -54,6 +66,37 @@ class FetchRequest:
     status: FetchStatus = FetchStatus.PENDING
     result: Optional[Any] = None
     error: Optional[str] = None
+    # Resolved with the FetchResult when the request finishes
+    future: 'Future[FetchResult]' = field(default_factory=Future, repr=False, compare=False)
+    # canonical_request_key() of the request, set by submit_fetch_request
+    dedup_key: Tuple = ()
+    # Callbacks and cache keys of identical requests that joined this one
+    joined_callbacks: List[Callable] = field(default_factory=list)
+    joined_cache_keys: List[str] = field(default_factory=list)
+
+def canonical_request_key(url: str, params: Optional[Dict[str, Any]] = None,
+                          headers: Optional[Dict[str, str]] = None) -> Tuple:
+    """
+    Key under which two requests are the same HTTP call.
+
+    Scheme and host are case-insensitive, the query string and params are
+    merged and sorted (params with a None value are dropped, as requests
+    does), and header names are compared case-insensitively.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        query.extend((str(name), str(v)) for v in values)
+    return (
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or '/',
+        tuple(sorted(query)),
+        tuple(sorted((name.lower(), str(value)) for name, value in (headers or {}).items())),
+    )
 
 @dataclass
 class FetchResult:
@@ -92,7 +135,10 @@ class BackgroundDataService:
         self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="BackgroundData")
         self.active_requests: Dict[str, FetchRequest] = {}
         self.completed_requests: Dict[str, FetchResult] = {}
+        # Entries are (-priority, sequence, request); see _run_next_request
         self.request_queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._in_flight: Dict[Tuple, FetchRequest] = {}
         
         # Thread safety
         self._lock = threading.RLock()
@@ -110,6 +156,8 @@ class BackgroundDataService:
             'failed_requests': 0,
             'cached_hits': 0,
             'cache_misses': 0,
+            'dedup_hits': 0,
+            'priority_bumps': 0,
             'total_fetch_time': 0.0,
             'average_fetch_time': 0.0
         }
@@ -168,7 +216,9 @@ class BackgroundDataService:
             callback: Optional callback function when request completes
             
         Returns:
-            Request ID for tracking the fetch operation
+            Request ID for tracking the fetch operation. An identical request
+            that is still pending or in progress is joined rather than
+            fetched again, and its ID is returned.
         """
         if self._shutdown:
             raise RuntimeError("BackgroundDataService is shutting down")
@@ -202,6 +252,14 @@ class BackgroundDataService:
                 logger.debug(f"Cache hit for {sport} {year} data")
                 return request_id
         
+        merged_headers = {**self.default_headers, **(headers or {})}
+        dedup_key = canonical_request_key(url, params, merged_headers)
+        with self._lock:
+            existing = self._in_flight.get(dedup_key)
+            if existing is not None:
+                self._join_request(existing, cache_key, priority, callback)
+                return existing.id
+        
         # Create fetch request
         request = FetchRequest(
             id=request_id,
@@ -210,24 +268,75 @@ class BackgroundDataService:
             cache_key=cache_key,
             url=url,
             params=params or {},
-            headers={**self.default_headers, **(headers or {})},
+            headers=merged_headers,
             timeout=timeout or self.request_timeout,
             max_retries=max_retries,
             priority=priority,
-            callback=callback
+            callback=callback,
+            dedup_key=dedup_key
         )
         
         with self._lock:
             self.active_requests[request_id] = request
+            self._in_flight[dedup_key] = request
             self.stats['total_requests'] += 1
             self.stats['cache_misses'] += 1
+            self.request_queue.put((-priority, next(self._sequence), request))
         
-        # Submit to executor
-        self.executor.submit(self._fetch_data_worker, request)
+        # One pool task per queued request; it runs whichever is most urgent
+        self.executor.submit(self._run_next_request)
         
         logger.info(f"Submitted background fetch request {request_id} for {sport} {year}")
         return request_id
     
+    def _join_request(self, request: FetchRequest, cache_key: str,
+                      priority: int, callback: Optional[Callable]) -> None:
+        """
+        Attach a caller to an identical request that is already in flight.
+        Must be called with self._lock held.
+        
+        Args:
+            request: The in-flight request
+            cache_key: The joining caller's cache key; the data is stored
+                under it as well
+            priority: The joining caller's priority
+            callback: The joining caller's callback, if any
+        """
+        self.stats['dedup_hits'] += 1
+        if callback:
+            request.joined_callbacks.append(callback)
+        if cache_key != request.cache_key and cache_key not in request.joined_cache_keys:
+            request.joined_cache_keys.append(cache_key)
+        if priority > request.priority and request.status == FetchStatus.PENDING:
+            # The old queue entry is skipped by whichever task takes it
+            request.priority = priority
+            self.request_queue.put((-priority, next(self._sequence), request))
+            self.executor.submit(self._run_next_request)
+            self.stats['priority_bumps'] += 1
+        logger.debug(f"Joined in-flight request {request.id} for {request.sport} {request.year}")
+    
+    def _run_next_request(self) -> Optional[FetchResult]:
+        """
+        Take the highest-priority pending request off the queue and fetch it.
+        
+        Entries left behind by a priority bump or a cancellation are skipped.
+        Every queue entry has its own pool task, so a task that finds only
+        stale entries has nothing left to do.
+        
+        Returns:
+            Fetch result, or None if there was no pending request
+        """
+        while True:
+            try:
+                neg_priority, _, request = self.request_queue.get_nowait()
+            except queue.Empty:
+                return None
+            with self._lock:
+                if request.status != FetchStatus.PENDING or -neg_priority != request.priority:
+                    continue
+                request.status = FetchStatus.IN_PROGRESS
+            return self._fetch_data_worker(request)
+    
     def _fetch_data_worker(self, request: FetchRequest) -> FetchResult:
         """
         Worker function that performs the actual data fetching.
@@ -311,6 +420,14 @@ class BackgroundDataService:
                 self.completed_requests[request.id] = result
                 if request.id in self.active_requests:
                     del self.active_requests[request.id]
+                # Callers arriving from here on start a new request
+                if self._in_flight.get(request.dedup_key) is request:
+                    del self._in_flight[request.dedup_key]
+                callbacks = [request.callback] if request.callback else []
+                callbacks += request.joined_callbacks
+                joined_cache_keys = list(request.joined_cache_keys)
+                if not request.future.done():
+                    request.future.set_result(result)
                 
                 # Update statistics
                 if result.success:
@@ -324,13 +441,17 @@ class BackgroundDataService:
                     (self.stats['completed_requests'] + self.stats['failed_requests'])
                 )
             
+            if result.success and result.data is not None:
+                for cache_key in joined_cache_keys:
+                    self.cache_manager.set(cache_key, result.data)
+            
             # Periodic cleanup after storing result
             self._cleanup_completed_requests()
             
-            # Call callback if provided
-            if request.callback:
+            # Call the callbacks of the submitter and of everyone who joined
+            for callback in callbacks:
                 try:
-                    request.callback(result)
+                    callback(result)
                 except Exception as e:
                     logger.error(f"Error in callback for request {request.id}: {e}")
         
@@ -391,6 +512,26 @@ class BackgroundDataService:
         with self._lock:
             return self.completed_requests.get(request_id)
     
+    def get_future(self, request_id: str) -> Optional['Future[FetchResult]']:
+        """
+        Get a future for a fetch request.
+        
+        Args:
+            request_id: Request ID to get a future for
+            
+        Returns:
+            Future resolved with the FetchResult (already done if the request
+            has completed), or None if the request is unknown
+        """
+        with self._lock:
+            if request_id in self.active_requests:
+                return self.active_requests[request_id].future
+            if request_id in self.completed_requests:
+                future: 'Future[FetchResult]' = Future()
+                future.set_result(self.completed_requests[request_id])
+                return future
+            return None
+    
     def is_request_complete(self, request_id: str) -> bool:
         """
         Check if a request has completed.
@@ -440,6 +581,9 @@ class BackgroundDataService:
                 request = self.active_requests[request_id]
                 request.status = FetchStatus.CANCELLED
                 del self.active_requests[request_id]
+                if self._in_flight.get(request.dedup_key) is request:
+                    del self._in_flight[request.dedup_key]
+                request.future.cancel()
                 logger.info(f"Cancelled request {request_id}")
                 return True
             return False
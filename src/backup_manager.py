@@ -12,6 +12,7 @@ used from scripts.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -20,6 +21,7 @@ import stat
 import socket
 import tempfile
 import zipfile
+import zlib
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -99,6 +101,9 @@ PLUGINS_MANIFEST_NAME = "plugins.json"
 _MAX_MEMBER_BYTES = 50 * 1024 * 1024
 # Hard cap on the total uncompressed size of an uploaded ZIP.
 _MAX_TOTAL_BYTES = 200 * 1024 * 1024
+# Read/write size when copying members in and out of an archive, so memory
+# stays flat however large the fonts and uploads are.
+_CHUNK_BYTES = 1024 * 1024
 
 
 # ---------------------------------------------------------------------------
@@ -163,16 +168,45 @@ def _ledmatrix_version(project_root: Path) -> str:
     return "unknown"
 
 
-def _build_manifest(contents: List[str], project_root: Path) -> Dict[str, Any]:
+def _build_manifest(
+    contents: List[str], project_root: Path, checksums: Dict[str, str]
+) -> Dict[str, Any]:
     return {
         "schema_version": SCHEMA_VERSION,
         "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "ledmatrix_version": _ledmatrix_version(project_root),
         "hostname": socket.gethostname(),
         "contents": contents,
+        # sha256 of every other member, checked as a restore extracts them.
+        # Backups made before this was added have none and restore unchecked.
+        "checksums": checksums,
     }
 
 
+def _write_file_member(zf: zipfile.ZipFile, src: Path, arcname: str) -> str:
+    """Copy ``src`` into the archive in chunks and return its sha256.
+
+    Hashing the chunks on their way into the archive means each file is read
+    once, and never whole.
+    """
+    info = zipfile.ZipInfo.from_file(src, arcname)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    digest = hashlib.sha256()
+    with src.open("rb") as f, zf.open(info, "w") as dst:
+        while True:
+            chunk = f.read(_CHUNK_BYTES)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def _write_bytes_member(zf: zipfile.ZipFile, arcname: str, data: bytes) -> str:
+    zf.writestr(arcname, data)
+    return hashlib.sha256(data).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Installed-plugin enumeration
 # ---------------------------------------------------------------------------
@@ -293,6 +327,11 @@ def create_backup(
     zip_path = output_dir / zip_name
 
     contents: List[str] = []
+    checksums: Dict[str, str] = {}
+
+    def add_file(src: Path) -> None:
+        arcname = src.relative_to(project_root).as_posix()
+        checksums[arcname] = _write_file_member(zf, src, arcname)
 
     # Stream directly to a temp file so we never hold the whole ZIP in memory.
     tmp_path = zip_path.with_suffix(".zip.tmp")
@@ -300,45 +339,45 @@ def create_backup(
         with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
             # Config files.
             if (project_root / _CONFIG_REL).exists():
-                zf.write(project_root / _CONFIG_REL, _CONFIG_REL.as_posix())
+                add_file(project_root / _CONFIG_REL)
                 contents.append("config")
             if (project_root / _SECRETS_REL).exists():
-                zf.write(project_root / _SECRETS_REL, _SECRETS_REL.as_posix())
+                add_file(project_root / _SECRETS_REL)
                 contents.append("secrets")
             if (project_root / _WIFI_REL).exists():
-                zf.write(project_root / _WIFI_REL, _WIFI_REL.as_posix())
+                add_file(project_root / _WIFI_REL)
                 contents.append("wifi")
             if (project_root / _YTM_REL).exists():
-                zf.write(project_root / _YTM_REL, _YTM_REL.as_posix())
+                add_file(project_root / _YTM_REL)
                 contents.append("ytm_auth")
 
             # User-uploaded fonts.
             user_fonts = iter_user_fonts(project_root)
             if user_fonts:
                 for font in user_fonts:
-                    arcname = font.relative_to(project_root).as_posix()
-                    zf.write(font, arcname)
+                    add_file(font)
                 contents.append("fonts")
 
             # Plugin uploads.
             plugin_uploads = iter_plugin_uploads(project_root)
             if plugin_uploads:
                 for upload in plugin_uploads:
-                    arcname = upload.relative_to(project_root).as_posix()
-                    zf.write(upload, arcname)
+                    add_file(upload)
                 contents.append("plugin_uploads")
 
             # Installed plugins manifest.
             plugins = list_installed_plugins(project_root)
             if plugins:
-                zf.writestr(
+                checksums[PLUGINS_MANIFEST_NAME] = _write_bytes_member(
+                    zf,
                     PLUGINS_MANIFEST_NAME,
-                    json.dumps(plugins, indent=2),
+                    json.dumps(plugins, indent=2).encode("utf-8"),
                 )
                 contents.append("plugins")
 
-            # Manifest goes last so that `contents` reflects what we actually wrote.
-            manifest = _build_manifest(contents, project_root)
+            # Manifest goes last so that `contents` and `checksums` reflect
+            # what we actually wrote.
+            manifest = _build_manifest(contents, project_root, checksums)
             zf.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
 
         os.replace(tmp_path, zip_path)
@@ -424,6 +463,12 @@ def validate_backup(zip_path: Path) -> Tuple[bool, str, Dict[str, Any]]:
 
             if not isinstance(manifest, dict) or "schema_version" not in manifest:
                 return False, "Invalid manifest structure", {}
+            checksums = manifest.get("checksums")
+            if checksums is not None and not (
+                isinstance(checksums, dict)
+                and all(isinstance(v, str) for v in checksums.values())
+            ):
+                return False, "Invalid manifest structure", {}
             if manifest.get("schema_version") != SCHEMA_VERSION:
                 return (
                     False,
@@ -464,6 +509,7 @@ def validate_backup(zip_path: Path) -> Tuple[bool, str, Dict[str, Any]]:
             result_manifest["plugins"] = plugins
             result_manifest["total_uncompressed"] = total
             result_manifest["file_count"] = len(names)
+            result_manifest["has_checksums"] = checksums is not None
             return True, "", result_manifest
     except zipfile.BadZipFile:
         return False, "File is not a valid ZIP archive", {}
@@ -476,9 +522,18 @@ def validate_backup(zip_path: Path) -> Tuple[bool, str, Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def _extract_zip_safe(zip_path: Path, dest_dir: Path) -> None:
-    """Extract ``zip_path`` into ``dest_dir`` rejecting any unsafe members."""
+def _extract_zip_safe(
+    zip_path: Path, dest_dir: Path, checksums: Optional[Dict[str, str]] = None
+) -> None:
+    """Extract ``zip_path`` into ``dest_dir`` rejecting any unsafe members.
+
+    With ``checksums`` (the manifest's), every member is hashed as it is
+    extracted and a mismatch, a member the manifest doesn't list, or a listed
+    one that is missing raises ``ValueError``. Extraction goes to a staging
+    directory, so that happens before anything in the project is replaced.
+    """
     with zipfile.ZipFile(zip_path, "r") as zf:
+        extracted = set()
         for info in zf.infolist():
             target = _safe_extract_path(dest_dir, info.filename)
             if target is None:
@@ -486,9 +541,27 @@ def _extract_zip_safe(zip_path: Path, dest_dir: Path) -> None:
             if info.is_dir():
                 target.mkdir(parents=True, exist_ok=True)
                 continue
+            expected = None
+            if checksums is not None and info.filename != MANIFEST_NAME:
+                expected = checksums.get(info.filename)
+                if expected is None:
+                    raise ValueError(f"{info.filename} is not listed in the manifest")
             target.parent.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.sha256()
             with zf.open(info, "r") as src, open(target, "wb") as dst:
-                shutil.copyfileobj(src, dst, length=64 * 1024)
+                while True:
+                    chunk = src.read(_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    dst.write(chunk)
+            if expected is not None and digest.hexdigest() != expected.lower():
+                raise ValueError(f"Checksum mismatch for {info.filename}")
+            extracted.add(info.filename)
+        if checksums is not None:
+            missing = sorted(set(checksums) - extracted)
+            if missing:
+                raise ValueError(f"{missing[0]} is listed in the manifest but missing")
 
 
 def _copy_file(src: Path, dst: Path) -> None:
@@ -575,8 +648,14 @@ def restore_backup(
     with tempfile.TemporaryDirectory(prefix="ledmatrix_restore_") as tmp:
         tmp_dir = Path(tmp)
         try:
-            _extract_zip_safe(Path(zip_path), tmp_dir)
-        except (ValueError, zipfile.BadZipFile, OSError) as e:
+            _extract_zip_safe(Path(zip_path), tmp_dir, manifest.get("checksums"))
+        except ValueError as e:
+            logger.error("[Backup] Backup failed verification: %s", e)
+            result.errors.append(f"Backup failed verification: {e}")
+            return result
+        except (zipfile.BadZipFile, zlib.error, OSError) as e:
+            # zipfile raises BadZipFile for a bad CRC and zlib.error for a
+            # damaged deflate stream; either way nothing has been replaced.
             logger.error("[Backup] Failed to extract backup: %s", e, exc_info=True)
             result.errors.append("Failed to extract backup")
             return result
@@ -6,8 +6,32 @@ docs/SPORTS_UNIFICATION.md for the architecture. The import path is
 unchanged: ``from src.base_classes.sports import SportsCore`` still works.
 """
 
-from .core import SportsCore
-from .modes import SportsLive, SportsRecent, SportsUpcoming
+import importlib
+from typing import Any, List
+
+# Resolved on first access (PEP 562). core pulls in requests, the background
+# data service and the logo downloader; importing it eagerly here made every
+# `from src.base_classes.sports.capabilities import ...` pay for all of that.
+_LAZY_EXPORTS = {
+    "SportsCore": ".core",
+    "SportsUpcoming": ".modes",
+    "SportsRecent": ".modes",
+    "SportsLive": ".modes",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "SportsCore",
@@ -206,7 +206,7 @@ class SportsCore(ABC):
         self._skin_slow_renders = 0
         
         # Initialize dynamic team resolver and resolve favorite teams
-        self.dynamic_resolver = DynamicTeamResolver()
+        self.dynamic_resolver = DynamicTeamResolver(cache_manager=self.cache_manager)
         raw_favorite_teams = self.mode_config.get("favorite_teams", [])
         self.favorite_teams = self.dynamic_resolver.resolve_teams(raw_favorite_teams, sport_key)
         
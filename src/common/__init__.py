@@ -12,44 +12,62 @@ This package provides reusable functionality for plugins and core modules:
 - General utilities
 """
 
-# Export commonly used utilities
-from src.common.error_handler import (
-    handle_file_operation,
-    handle_json_operation,
-    safe_execute,
-    retry_on_failure,
-    log_and_continue,
-    log_and_raise
-)
-from src.common.api_helper import APIHelper
-from src.common.scroll_helper import ScrollHelper
-from src.common.logo_helper import LogoHelper
-from src.common.text_helper import TextHelper
+import importlib
+from typing import Any, List
+
+# Exports are resolved on first attribute access (PEP 562) rather than imported
+# here. Importing any submodule runs this file first, so eager imports made
+# `from src.common import snapshot_policy` in the display process pull in
+# requests (api_helper, logo_helper), numpy (scroll_helper) and the adaptive
+# layout stack whether or not an enabled plugin uses them. Plugin code is
+# unaffected: `from src.common import ScrollHelper` resolves the same class.
+_LAZY_EXPORTS = {
+    'handle_file_operation': 'src.common.error_handler',
+    'handle_json_operation': 'src.common.error_handler',
+    'safe_execute': 'src.common.error_handler',
+    'retry_on_failure': 'src.common.error_handler',
+    'log_and_continue': 'src.common.error_handler',
+    'log_and_raise': 'src.common.error_handler',
+    'APIHelper': 'src.common.api_helper',
+    'ScrollHelper': 'src.common.scroll_helper',
+    'LogoHelper': 'src.common.logo_helper',
+    'TextHelper': 'src.common.text_helper',
+    # Adaptive layout & images (canonical homes: src.adaptive_layout /
+    # src.adaptive_images — re-exported here so plugin authors find them in the
+    # blessed-helpers package). See docs/ADAPTIVE_LAYOUT.md.
+    'Region': 'src.adaptive_layout',
+    'LayoutContext': 'src.adaptive_layout',
+    'FontStep': 'src.adaptive_layout',
+    'FontLadder': 'src.adaptive_layout',
+    'LADDER_GRID': 'src.adaptive_layout',
+    'LADDER_ARCADE': 'src.adaptive_layout',
+    'FitResult': 'src.adaptive_layout',
+    'draw_fitted_text': 'src.adaptive_layout',
+    'ScoreboardRegions': 'src.adaptive_layout',
+    'scoreboard_regions': 'src.adaptive_layout',
+    'MediaRow': 'src.adaptive_layout',
+    'media_row': 'src.adaptive_layout',
+    'ImageFitResult': 'src.adaptive_images',
+    'fit_image': 'src.adaptive_images',
+    'fit_image_cached': 'src.adaptive_images',
+    'draw_fitted_image': 'src.adaptive_images',
+    'RESAMPLE_LANCZOS': 'src.adaptive_images',
+    'RESAMPLE_NEAREST': 'src.adaptive_images',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Adaptive layout & images (canonical homes: src.adaptive_layout /
-# src.adaptive_images — re-exported here so plugin authors find them in the
-# blessed-helpers package). See docs/ADAPTIVE_LAYOUT.md.
-from src.adaptive_layout import (
-    Region,
-    LayoutContext,
-    FontStep,
-    FontLadder,
-    LADDER_GRID,
-    LADDER_ARCADE,
-    FitResult,
-    draw_fitted_text,
-    ScoreboardRegions,
-    scoreboard_regions,
-    MediaRow,
-    media_row,
-)
-from src.adaptive_images import (
-    ImageFitResult,
-    fit_image,
-    draw_fitted_image,
-    RESAMPLE_LANCZOS,
-    RESAMPLE_NEAREST,
-)
 
 __all__ = [
     'handle_file_operation',
@@ -77,6 +95,7 @@ __all__ = [
     'media_row',
     'ImageFitResult',
     'fit_image',
+    'fit_image_cached',
     'draw_fitted_image',
     'RESAMPLE_LANCZOS',
     'RESAMPLE_NEAREST',
@@ -6,15 +6,138 @@ Extracted from LEDMatrix core to provide reusable functionality for plugins.
 """
 
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
+# Longest Retry-After honored. A bogus or hostile header should not be able
+# to silence a host for days.
+MAX_RETRY_AFTER = 3600.0
+
+
+class TokenBucket:
+    """
+    Per-host request limiter: up to ``burst`` requests at once, refilled at
+    ``rate`` requests per second. A rate of 0 means unlimited (only a
+    Retry-After block applies). Thread-safe.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = float('-inf')
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            if self.rate > 0:
+                self._tokens = min(self.burst,
+                                   self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _wait_locked(self, now: float) -> float:
+        wait = max(0.0, self._blocked_until - now)
+        if self.rate > 0 and self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.rate)
+        return wait
+
+    def time_until_available(self) -> float:
+        """Seconds until try_acquire() would succeed (0 if it would now)."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return self._wait_locked(now)
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available now, without waiting."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if self._wait_locked(now) > 0:
+                return False
+            if self.rate > 0:
+                self._tokens -= 1
+            return True
+
+    def acquire(self, sleep: Callable[[float], None] = time.sleep) -> float:
+        """Block until a token is taken. Returns the seconds spent waiting.
+
+        Waiters re-check after sleeping, so a Retry-After block that lands
+        while they sleep still holds them back.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait = self._wait_locked(now)
+                if wait <= 0:
+                    if self.rate > 0:
+                        self._tokens -= 1
+                    return waited
+            sleep(wait)
+            waited += wait
+
+    def block_for(self, seconds: float) -> None:
+        """Allow no requests for the next ``seconds`` (e.g. from Retry-After)."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'tokens': self._tokens,
+                'blocked_for': max(0.0, self._blocked_until - now),
+            }
+
+
+def parse_retry_after(value: Optional[str],
+                      now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP-date),
+    clamped to [0, MAX_RETRY_AFTER]; None if absent or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - (now or datetime.now(timezone.utc))).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def _host_of(url: str) -> str:
+    """Rate-limit key for a URL (or a bare host): lower-cased host[:port]."""
+    if '//' not in url:
+        url = '//' + url
+    return urlsplit(url).netloc.lower()
+
+
 class APIHelper:
     """
     Helper class for HTTP requests, caching, and ESPN API integration.
@@ -23,7 +146,7 @@ class APIHelper:
     - HTTP requests with retry logic and timeouts
     - Response caching with TTL support
     - ESPN API integration for sports data
-    - Request rate limiting and throttling
+    - Per-host request rate limiting (token buckets) that honors Retry-After
     """
     
     def __init__(self, cache_manager=None, default_timeout: int = 30,
@@ -44,11 +167,19 @@ class APIHelper:
         
         # Setup session with retry strategy
         self.session = requests.Session()
+        # 429 is not retried here: urllib3 would either re-hit the host on
+        # its own backoff or sleep out a Retry-After of any length inside the
+        # caller's thread. Instead the response comes back, its Retry-After
+        # blocks that host's bucket, and later calls wait or fail fast (see
+        # _enforce_rate_limit). raise_on_status=False hands the last 503 back
+        # the same way once retries run out.
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD", "OPTIONS"]
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD", "OPTIONS"],
+            respect_retry_after_header=False,
+            raise_on_status=False,
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
@@ -65,9 +196,15 @@ class APIHelper:
             'Connection': 'keep-alive'
         })
         
-        # Rate limiting
+        # Rate limiting: one token bucket per host, so a slow-to-refill host
+        # never holds up requests to another. Defaults apply to hosts without
+        # their own set_rate_limit(..., host=...).
         self._last_request_time = 0
         self._min_request_interval = 1.0  # Minimum seconds between requests
+        self._default_burst = 1
+        self._host_limits: Dict[str, Tuple[float, float]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
     
     def get(self, url: str, params: Optional[Dict] = None, 
             headers: Optional[Dict] = None, timeout: Optional[int] = None,
@@ -94,7 +231,8 @@ class APIHelper:
                 return cached
         
         # Rate limiting
-        self._enforce_rate_limit()
+        if not self._enforce_rate_limit(url, timeout):
+            return None
         
         try:
             # Prepare request
@@ -109,6 +247,7 @@ class APIHelper:
                 headers=request_headers,
                 timeout=timeout or self.default_timeout
             )
+            self._note_retry_after(url, response)
             response.raise_for_status()
             
             # Parse JSON response
@@ -221,7 +360,8 @@ class APIHelper:
         Returns:
             Response data as dictionary or None if request fails
         """
-        self._enforce_rate_limit()
+        if not self._enforce_rate_limit(url, timeout):
+            return None
         
         try:
             request_headers = self.session.headers.copy()
@@ -235,6 +375,7 @@ class APIHelper:
                 headers=request_headers,
                 timeout=timeout or self.default_timeout
             )
+            self._note_retry_after(url, response)
             response.raise_for_status()
             
             return response.json()
@@ -313,26 +454,99 @@ class APIHelper:
         if self.cache_manager:
             self.cache_manager.set(key, data)
     
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        
-        if time_since_last < self._min_request_interval:
-            sleep_time = self._min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        
+    def _bucket_for(self, url: str) -> TokenBucket:
+        """The token bucket for a URL's host, created on first use."""
+        host = _host_of(url)
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._new_bucket_locked(host)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _new_bucket_locked(self, host: str) -> TokenBucket:
+        """A fresh bucket with the host's current limits (_buckets_lock held)."""
+        interval, burst = self._host_limits.get(
+            host, (self._min_request_interval, self._default_burst))
+        return TokenBucket(1.0 / interval if interval > 0 else 0, burst)
+
+    def _rebuild_bucket_locked(self, host: str) -> None:
+        """
+        Replace a host's bucket after its limits changed (_buckets_lock held).
+
+        A Retry-After block the server sent is carried over: changing the
+        request rate doesn't make the server willing to answer sooner.
+        """
+        old = self._buckets.get(host)
+        if old is None:
+            return
+        bucket = self._new_bucket_locked(host)
+        blocked_for = old.stats()['blocked_for']
+        if blocked_for > 0:
+            bucket.block_for(blocked_for)
+        self._buckets[host] = bucket
+
+    def _enforce_rate_limit(self, url: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the URL's host to allow a request.
+
+        Returns False without waiting if the host is blocked (Retry-After)
+        for longer than the request's timeout; the caller then fails the
+        request rather than parking its thread.
+        """
+        bucket = self._bucket_for(url)
+        wait = bucket.time_until_available()
+        if wait > (timeout or self.default_timeout):
+            self.logger.warning(
+                f"Skipping request to {_host_of(url)}: rate limited for another {wait:.0f}s")
+            return False
+        bucket.acquire()
         self._last_request_time = time.time()
-    
-    def set_rate_limit(self, min_interval: float) -> None:
+        return True
+
+    def _note_retry_after(self, url: str, response: Any) -> None:
+        """Block the host for a 429/503 response's Retry-After, if it sent one."""
+        if getattr(response, 'status_code', None) not in (429, 503):
+            return
+        headers = getattr(response, 'headers', None) or {}
+        delay = parse_retry_after(headers.get('Retry-After'))
+        if delay:
+            self._bucket_for(url).block_for(delay)
+            self.logger.warning(
+                f"{_host_of(url)} asked to retry after {delay:.0f}s (HTTP {response.status_code})")
+
+    def time_until_allowed(self, url: str) -> float:
+        """
+        Seconds until a request to this URL's host would go out without
+        waiting (0 if now). Lets a scheduler defer work for a throttled or
+        Retry-After-blocked host instead of blocking a worker in get().
+        """
+        return self._bucket_for(url).time_until_available()
+
+    def set_rate_limit(self, min_interval: float, host: Optional[str] = None,
+                       burst: Optional[int] = None) -> None:
         """
         Set minimum interval between requests.
         
         Args:
-            min_interval: Minimum seconds between requests
+            min_interval: Minimum seconds between requests (0 = unlimited)
+            host: Host (or URL) this limit applies to; None sets the default
+                for every host without its own limit
+            burst: Requests allowed back to back before the interval applies
         """
-        self._min_request_interval = min_interval
-        self.logger.debug(f"Rate limit set to {min_interval} seconds")
+        with self._buckets_lock:
+            if host is None:
+                self._min_request_interval = min_interval
+                if burst is not None:
+                    self._default_burst = burst
+                for key in [k for k in self._buckets if k not in self._host_limits]:
+                    self._rebuild_bucket_locked(key)
+            else:
+                key = _host_of(host)
+                self._host_limits[key] = (min_interval, burst or 1)
+                self._rebuild_bucket_locked(key)
+        self.logger.debug(f"Rate limit set to {min_interval} seconds"
+                          + (f" for {host}" if host else ""))
     
     def get_request_stats(self) -> Dict[str, Any]:
         """
@@ -341,8 +555,11 @@ class APIHelper:
         Returns:
             Dictionary with request statistics
         """
+        with self._buckets_lock:
+            buckets = dict(self._buckets)
         return {
             'min_request_interval': self._min_request_interval,
             'last_request_time': self._last_request_time,
-            'time_since_last_request': time.time() - self._last_request_time
+            'time_since_last_request': time.time() - self._last_request_time,
+            'hosts': {host: bucket.stats() for host, bucket in buckets.items()},
         }
@@ -8,6 +8,8 @@ Extracted from LEDMatrix core to provide reusable functionality for plugins.
 import logging
 import os
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -24,6 +26,16 @@ from src.common.permission_utils import (
 # Well above any real team logo; bounds what a remote URL can write to disk.
 MAX_LOGO_BYTES = 10 * 1024 * 1024
 
+# Default memory budget for decoded logos. A full league at two or three
+# sizes on a 128x64 panel is a few MB; the entry cap alone could not bound
+# this, since one oversized logo costs as much as hundreds of small ones.
+DEFAULT_LOGO_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def _image_nbytes(image: Image.Image) -> int:
+    """Decoded size of an image: one byte per band per pixel."""
+    return image.width * image.height * len(image.getbands())
+
 
 class LogoHelper:
     """
@@ -38,7 +50,8 @@ class LogoHelper:
     """
     
     def __init__(self, display_width: int, display_height: int, 
-                 cache_size: int = 100, logger: Optional[logging.Logger] = None):
+                 cache_size: int = 100, logger: Optional[logging.Logger] = None,
+                 cache_bytes: int = DEFAULT_LOGO_CACHE_BYTES):
         """
         Initialize the LogoHelper.
         
@@ -47,15 +60,23 @@ class LogoHelper:
             display_height: Height of the LED matrix display
             cache_size: Maximum number of logos to cache in memory
             logger: Optional logger instance
+            cache_bytes: Maximum decoded size of all cached logos
         """
         self.display_width = display_width
         self.display_height = display_height
         self.cache_size = cache_size
+        self.cache_bytes = cache_bytes
         self.logger = logger or logging.getLogger(__name__)
         
-        # In-memory logo cache
-        self._logo_cache: Dict[str, Image.Image] = {}
-        self._cache_order: List[str] = []  # For LRU cache management
+        # In-memory logo cache, least recently used first. Hits and
+        # evictions are O(1); the lock makes it safe to share between the
+        # update and display threads.
+        self._logo_cache: "OrderedDict[str, Image.Image]" = OrderedDict()
+        # Size charged for each entry when it was stored, so accounting stays
+        # exact even if a caller later modifies a cached image in place.
+        self._logo_sizes: Dict[str, int] = {}
+        self._cached_bytes = 0
+        self._cache_lock = threading.Lock()
         
         # Session for HTTP requests
         self.session = requests.Session()
@@ -92,13 +113,10 @@ class LogoHelper:
         if max_height is None:
             max_height = int(self.display_height * 1.5)
         cache_key = f"{team_abbr}_{logo_path}_{max_width}x{max_height}"
-        if cache_key in self._logo_cache:
+        cached = self._get_cached_logo(cache_key)
+        if cached is not None:
             self.logger.debug(f"Using cached logo for {team_abbr}")
-            # Update LRU order (move to end)
-            if cache_key in self._cache_order:
-                self._cache_order.remove(cache_key)
-            self._cache_order.append(cache_key)
-            return self._logo_cache[cache_key]
+            return cached
         
         try:
             logo_path = Path(logo_path)
@@ -218,8 +236,10 @@ class LogoHelper:
     
     def clear_cache(self) -> None:
         """Clear the logo cache."""
-        self._logo_cache.clear()
-        self._cache_order.clear()
+        with self._cache_lock:
+            self._logo_cache.clear()
+            self._logo_sizes.clear()
+            self._cached_bytes = 0
         self.logger.debug("Logo cache cleared")
     
     def get_cache_stats(self) -> Dict[str, int]:
@@ -229,13 +249,18 @@ class LogoHelper:
         Returns:
             Dictionary with cache statistics
         """
+        with self._cache_lock:
+            cached_logos = len(self._logo_cache)
+            cached_bytes = self._cached_bytes
         return {
-            'cached_logos': len(self._logo_cache),
+            'cached_logos': cached_logos,
             'cache_size_limit': self.cache_size,
             'cache_usage_percent': (
-                (len(self._logo_cache) / self.cache_size) * 100
+                (cached_logos / self.cache_size) * 100
                 if self.cache_size else 0
             ),
+            'cached_bytes': cached_bytes,
+            'cache_bytes_limit': self.cache_bytes,
         }
     
     def _resize_logo(self, logo: Image.Image, max_width: Optional[int] = None, 
@@ -254,17 +279,31 @@ class LogoHelper:
         logo.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
         return logo
     
+    def _get_cached_logo(self, cache_key: str) -> Optional[Image.Image]:
+        """Return a cached logo and mark it most recently used."""
+        with self._cache_lock:
+            logo = self._logo_cache.get(cache_key)
+            if logo is not None:
+                self._logo_cache.move_to_end(cache_key)
+            return logo
+
     def _cache_logo(self, cache_key: str, logo: Image.Image) -> None:
-        """Cache a logo with LRU eviction."""
-        # Remove oldest if cache is full
-        if len(self._logo_cache) >= self.cache_size:
-            if self._cache_order:
-                oldest_key = self._cache_order.pop(0)
-                del self._logo_cache[oldest_key]
-        
-        # Add to cache
-        self._logo_cache[cache_key] = logo
-        self._cache_order.append(cache_key)
+        """Cache a logo, evicting least recently used ones over either budget."""
+        size = _image_nbytes(logo)
+        with self._cache_lock:
+            if self._logo_cache.pop(cache_key, None) is not None:
+                self._cached_bytes -= self._logo_sizes.pop(cache_key)
+            if size > self.cache_bytes or self.cache_size <= 0:
+                # Would evict everything else and still not fit.
+                return
+
+            self._logo_cache[cache_key] = logo
+            self._logo_sizes[cache_key] = size
+            self._cached_bytes += size
+            while (len(self._logo_cache) > self.cache_size
+                   or self._cached_bytes > self.cache_bytes):
+                evicted_key, _ = self._logo_cache.popitem(last=False)
+                self._cached_bytes -= self._logo_sizes.pop(evicted_key)
     
     def _download_logo(self, url: str, file_path: Path) -> None:
         """Download logo from URL.
@@ -21,12 +21,31 @@ from typing import Optional, Dict, Any
 from PIL import Image
 import numpy as np
 
-# Try to import scipy for sub-pixel interpolation, fallback to simpler method if not available
-try:
-    from scipy.ndimage import shift
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
+# scipy is optional and only the sub-pixel shift path below uses it. It is
+# imported on first use rather than here: on a Pi Zero 2 importing scipy costs
+# seconds of startup for every process that merely imports this module.
+_scipy_shift: Optional[Any] = None
+_scipy_checked = False
+
+
+def _get_scipy_shift() -> Optional[Any]:
+    """scipy.ndimage.shift, imported on first call; None when scipy is missing."""
+    global _scipy_shift, _scipy_checked
+    if not _scipy_checked:
+        try:
+            from scipy.ndimage import shift
+            _scipy_shift = shift
+        except ImportError:
+            _scipy_shift = None
+        _scipy_checked = True
+    return _scipy_shift
+
+
+def __getattr__(name: str) -> Any:
+    # HAS_SCIPY stays importable without forcing the scipy import at load time.
+    if name == 'HAS_SCIPY':
+        return _get_scipy_shift() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ScrollHelper:
@@ -456,6 +475,7 @@ class ScrollHelper:
         Get visible portion with sub-pixel interpolation for smooth scrolling.
         Uses bilinear interpolation to blend between pixels.
         """
+        shift = _get_scipy_shift()
         # We need to extract a region that's 1 pixel wider to allow for interpolation
         start_x = start_x_int
         end_x = start_x_int + self.display_width + 1
@@ -466,7 +486,7 @@ class ScrollHelper:
             source_region = self.cached_array[:, start_x:end_x]
             
             # Use bilinear interpolation for sub-pixel shifting
-            if HAS_SCIPY:
+            if shift is not None:
                 # Use scipy for high-quality sub-pixel shifting
                 shifted = shift(source_region, (0, -fractional, 0), mode='nearest', order=1, prefilter=False)
                 # Extract the display_width portion
@@ -489,7 +509,7 @@ class ScrollHelper:
                 # Need width1 + 1 pixels for interpolation
                 source1_width = min(width1 + 1, self.cached_image.width - start_x)
                 source1 = self.cached_array[:, start_x:start_x + source1_width]
-                if HAS_SCIPY:
+                if shift is not None:
                     shifted1 = shift(source1, (0, -fractional, 0), mode='nearest', order=1, prefilter=False)
                     # Ensure we get exactly width1 pixels, padding if necessary
                     if shifted1.shape[1] >= width1:
@@ -517,7 +537,7 @@ class ScrollHelper:
                 remaining_width = self.display_width - width1
                 if remaining_width > 0:
                     source2 = self.cached_array[:, :remaining_width + 1]
-                    if HAS_SCIPY:
+                    if shift is not None:
                         shifted2 = shift(source2, (0, -fractional, 0), mode='nearest', order=1, prefilter=False)
                         # Ensure we get exactly remaining_width pixels
                         if shifted2.shape[1] >= remaining_width:
@@ -541,7 +561,7 @@ class ScrollHelper:
             else:
                 # Edge case: wrap to beginning
                 source = self.cached_array[:, :self.display_width + 1]
-                if HAS_SCIPY:
+                if shift is not None:
                     shifted = shift(source, (0, -fractional, 0), mode='nearest', order=1, prefilter=False)
                     # Ensure we get exactly display_width pixels
                     if shifted.shape[1] >= self.display_width:
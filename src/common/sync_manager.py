@@ -29,7 +29,6 @@ import time
 import logging
 from enum import Enum
 from typing import Callable, Optional
-import numpy as np
 from PIL import Image
 
 # Raw-frame wire format: 8-byte magic + 4-byte header + raw RGB pixels
@@ -403,9 +402,10 @@ class DisplaySyncManager:
         if self._leader_state != LeaderState.CONNECTED or not self._peer_ip:
             return
         try:
-            arr = np.asarray(image.convert("RGB"), dtype=np.uint8)
+            # PIL's RGB tobytes() is already the row-major uint8 layout the
+            # receiver expects; no numpy round trip (or import) needed.
             header = _RAW_MAGIC + _RAW_HEADER.pack(image.width, image.height)
-            data = header + arr.tobytes()
+            data = header + image.convert("RGB").tobytes()
             if len(data) <= 65000:
                 self._send_sock.sendto(data, (self._peer_ip, self.port))
             elif not self._oversized_frame_warned:
@@ -29,7 +29,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed  # pylint: disable=no-name-in-module
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait  # pylint: disable=no-name-in-module
 import pytz
 
 # Core system imports only - all functionality now handled via plugins
@@ -39,6 +39,7 @@ from src.config_service import ConfigService
 from src.cache_manager import CacheManager
 from src.font_manager import FontManager
 from src.logging_config import get_logger
+from src.frame_timing import LABEL_ON_DEMAND, LABEL_PLUGIN, get_frame_recorder
 from src.common.sync_manager import DisplaySyncManager, SyncRole
 
 # Get logger with consistent configuration
@@ -46,12 +47,19 @@ logger = get_logger(__name__)
 
 # How long startup will wait for plugins to fetch their first data before
 # showing anything. Each plugin's update blocks for up to the executor's 30s
-# timeout and they run one after another, so the uncapped total is the sum of
-# every slow plugin: 82 seconds on the worst boot measured, with a blank panel
-# throughout. Whatever does not finish in time is picked up by the scheduled
-# update tick moments later, with the display already running.
+# timeout; run one after another, the uncapped total was the sum of every slow
+# plugin: 82 seconds on the worst boot measured, with a blank panel throughout.
+# Updates now run concurrently and startup proceeds as soon as the first one
+# succeeds, so this only matters when none do. Whatever does not start in time
+# is picked up by the scheduled update tick moments later, with the display
+# already running.
 _INITIAL_UPDATE_BUDGET_SECONDS = 20.0
 
+# Initial updates in flight at once. Mostly network waits, so this is about
+# not opening a burst of connections on a Pi Zero rather than about cores;
+# matches the plugin loading pool.
+_INITIAL_UPDATE_WORKERS = 4
+
 # The least budget worth starting a plugin with. Below this the plugin is
 # deferred instead: granting it a floor would let the pass run past its
 # deadline, and granting it the true remainder would record a timeout for a
@@ -101,25 +109,6 @@ class DisplayController:
         self.cache_manager = CacheManager()
         logger.info("Config loaded in %.3f seconds (hot-reload: %s)", time.time() - start_time, enable_hot_reload)
         
-        # Validate startup configuration
-        try:
-            from src.startup_validator import StartupValidator
-            validator = StartupValidator(self.config_manager,
-                                         cache_manager=self.cache_manager)
-            is_valid, errors, warnings = validator.validate_all()
-            
-            if warnings:
-                for warning in warnings:
-                    logger.warning(f"Startup validation warning: {warning}")
-            
-            if not is_valid:
-                error_msg = "Startup validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
-                logger.error(error_msg)
-                # For now, log errors but continue - can be made stricter later
-                # validator.raise_on_errors()  # Uncomment to fail fast on errors
-        except Exception as e:
-            logger.warning(f"Startup validation could not be completed: {e}")
-        
         config_time = time.time()
         self.display_manager = DisplayManager(self.config)
         logger.info("DisplayManager initialized in %.3f seconds", time.time() - config_time)
@@ -226,6 +215,7 @@ class DisplayController:
         # loading loop below so the .pop() invalidation at load time is always safe.
         self._plugin_accepts_display_mode: Dict[str, bool] = {}
 
+        validated = False
         try:
             logger.info("Attempting to import plugin system...")
             from src.plugin_system import PluginManager
@@ -265,27 +255,16 @@ class DisplayController:
                 from src.plugin_system.plugin_health import PluginHealthTracker
                 from src.plugin_system.resource_monitor import PluginResourceMonitor
                 self.plugin_manager.health_tracker = PluginHealthTracker(self.cache_manager)
-                self.plugin_manager.resource_monitor = PluginResourceMonitor(self.cache_manager)
+                self.plugin_manager.resource_monitor = PluginResourceMonitor(
+                    self.cache_manager,
+                    memory_sample_every=plugin_system_config.get('memory_sample_every', 0))
                 logger.info("Plugin health tracking and resource monitoring enabled")
             except Exception as e:
                 logger.warning("Could not enable plugin health/resource monitoring: %s", e)
 
-            # Validate plugins after plugin manager is created
-            try:
-                from src.startup_validator import StartupValidator
-                validator = StartupValidator(self.config_manager, self.plugin_manager,
-                                             cache_manager=self.cache_manager)
-                is_valid, errors, warnings = validator.validate_all()
-                
-                if warnings:
-                    for warning in warnings:
-                        logger.warning(f"Plugin validation warning: {warning}")
-                
-                if not is_valid:
-                    error_msg = "Plugin validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
-                    logger.error(error_msg)
-            except Exception as e:
-                logger.warning(f"Plugin validation could not be completed: {e}")
+            # Validate once, now that plugin checks have a manager to use
+            self._run_startup_validation(self.plugin_manager)
+            validated = True
 
             # Discover plugins
             discovered_plugins = self.plugin_manager.discover_plugins()
@@ -412,6 +391,10 @@ class DisplayController:
             logger.exception("Plugin system initialization failed")
             self.plugin_manager = None
 
+        if not validated:
+            # The plugin system never came up; still check everything else.
+            self._run_startup_validation(None)
+
         # Display rotation state
         self.current_mode_index = 0
         self.current_display_mode = None
@@ -426,6 +409,9 @@ class DisplayController:
         self._memory_log_interval = 3600.0  # Log memory stats every hour
         self._last_memory_log = time.time()
         self._enable_memory_logging = self.config.get("display", {}).get("memory_logging", False)
+
+        # Frame-time histograms, served to the web UI through a status file
+        self._frame_recorder = get_frame_recorder()
         
         # Schedule management
         self.is_display_active = True
@@ -477,8 +463,15 @@ class DisplayController:
         # Initial data update for plugins (ensures data available on first display)
         logger.info("Performing initial plugin data update...")
         update_start = time.time()
-        self._update_modules(deadline=update_start + _INITIAL_UPDATE_BUDGET_SECONDS)
+        first_ready = self._update_modules(deadline=update_start + _INITIAL_UPDATE_BUDGET_SECONDS)
         logger.info("Initial plugin update completed in %.3f seconds", time.time() - update_start)
+        # Open on whichever plugin has data first rather than waiting on the
+        # head of the rotation to finish its fetch.
+        if first_ready and not self.on_demand_active:
+            first_modes = self.plugin_display_modes.get(first_ready) or []
+            if first_modes and first_modes[0] in self.available_modes:
+                self.current_mode_index = self.available_modes.index(first_modes[0])
+                logger.info("Starting rotation with %s (first plugin with data)", first_ready)
 
         # Initialize Vegas mode coordinator
         self.vegas_coordinator = None
@@ -486,6 +479,35 @@ class DisplayController:
 
         logger.info("DisplayController initialization completed in %.3f seconds", time.time() - start_time)
 
+    def _run_startup_validation(self, plugin_manager) -> None:
+        """Run StartupValidator once and log its findings.
+
+        Results are remembered in the cache directory keyed by a fingerprint
+        of each check's inputs, so a restart with nothing changed replays the
+        previous warnings instead of re-running the checks.
+        """
+        try:
+            from src.startup_validator import StartupValidator
+            cache_dir = self.cache_manager.get_cache_dir()
+            results_cache_path = (
+                os.path.join(cache_dir, 'startup_validation.json') if cache_dir else None
+            )
+            validator = StartupValidator(self.config_manager, plugin_manager,
+                                         cache_manager=self.cache_manager,
+                                         results_cache_path=results_cache_path)
+            is_valid, errors, warnings = validator.validate_all()
+
+            for warning in warnings:
+                logger.warning(f"Startup validation warning: {warning}")
+
+            if not is_valid:
+                error_msg = "Startup validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
+                logger.error(error_msg)
+                # For now, log errors but continue - can be made stricter later
+                # validator.raise_on_errors()  # Uncomment to fail fast on errors
+        except Exception as e:
+            logger.warning(f"Startup validation could not be completed: {e}")
+
     def _initialize_vegas_mode(self):
         """Initialize Vegas mode coordinator if enabled."""
         global _vegas_mode_imported, VegasModeCoordinator
@@ -833,81 +855,144 @@ class DisplayController:
             self._cached_target_brightness = normal_brightness  # persist for minute-gate
             return normal_brightness
 
-    def _update_modules(self, deadline: Optional[float] = None):
-        """Update all plugin modules.
+    def _update_modules(self, deadline: Optional[float] = None) -> Optional[str]:
+        """Run every loaded plugin's first update() across a bounded pool.
+
+        Updates run concurrently, _INITIAL_UPDATE_WORKERS at a time, so the
+        wait is set by the quickest plugin rather than the sum of all of them.
+        Run serially, one network-bound plugin could spend the whole budget:
+        the pass measured 82 seconds at startup on a live rig, 55 and 26 on the
+        two boots before -- all of it with nothing on the panel.
 
         Args:
-            deadline: Wall-clock time after which remaining plugins are left
-                for the scheduled update tick instead of being waited on. Each
-                update blocks this thread for up to the executor's timeout, and
-                they run one after another, so without a bound the total is the
-                sum of every slow plugin on the system. Measured at startup on
-                a live rig: 82 seconds, 55 and 26 on the two boots before -- all
-                of it with nothing on the panel.
+            deadline: Wall-clock time after which startup stops waiting. With
+                a deadline this returns as soon as the first plugin has fresh
+                data (or the deadline passes, whichever is first); updates
+                still in flight keep running in the background rather than
+                being cut off, and plugins that had not started by the
+                deadline are left to the scheduled update tick. Without one it
+                waits for every plugin.
+
+        Returns:
+            The id of the first plugin whose update succeeded, or None.
         """
         if not self.plugin_manager:
-            return
+            return None
 
-        # Update all loaded plugins
         plugins_dict = getattr(self.plugin_manager, 'loaded_plugins', None) or getattr(self.plugin_manager, 'plugins', {})
-        deferred = []
+        candidates = []
         for plugin_id, plugin_instance in plugins_dict.items():
-            update_timeout = None
-            if deadline is not None:
-                update_timeout = deadline - time.time()
-                if update_timeout < _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS:
-                    # Too little left to be worth starting. Deferring rather
-                    # than granting a floor keeps the budget a real ceiling --
-                    # clamping up to a minimum let a plugin that began with a
-                    # sliver left run on past the deadline -- and a plugin
-                    # handed a slot it cannot use would just be recorded as
-                    # having timed out.
-                    #
-                    # Nothing is lost either way: a plugin that has never
-                    # updated is immediately due, so run_scheduled_updates()
-                    # picks it up within seconds, with the display already
-                    # running.
-                    deferred.append(plugin_id)
-                    continue
             # Check circuit breaker before attempting update
             if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
                 if self.plugin_manager.health_tracker.should_skip_plugin(plugin_id):
                     logger.debug(f"Skipping update for plugin {plugin_id} due to circuit breaker")
                     continue
-            
-            # Use PluginExecutor if available for safe execution
-            if hasattr(self.plugin_manager, 'plugin_executor'):
-                # The remaining budget is the timeout, so the pass cannot
-                # run past its deadline. Bounding the loop alone did not do
-                # it: the last plugin to start could still block for the
-                # executor's full 30s, which turned a 20s budget into a 31.8s
-                # pass on the rig.
-                success = self.plugin_manager.plugin_executor.execute_update(
-                    plugin_instance, plugin_id, timeout=update_timeout)
-                if success and hasattr(self.plugin_manager, 'plugin_last_update'):
+            candidates.append((plugin_id, plugin_instance))
+
+        if deadline is not None and deadline - time.time() < _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS:
+            self._log_deferred_initial_updates([pid for pid, _ in candidates])
+            return None
+        if not candidates:
+            return None
+
+        late_deferred: List[str] = []
+        late_lock = threading.Lock()
+
+        def run_one(plugin_id, plugin_instance):
+            # Checked again as each update starts: a worker that only frees up
+            # after the budget is spent leaves the rest to the update tick.
+            # Nothing is lost -- a plugin that has never updated is
+            # immediately due, so run_scheduled_updates() picks it up within
+            # seconds, with the display already running.
+            if deadline is not None and deadline - time.time() < _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS:
+                with late_lock:
+                    late_deferred.append(plugin_id)
+                return False
+            return self._initial_update_one(plugin_id, plugin_instance)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(_INITIAL_UPDATE_WORKERS, len(candidates)),
+            thread_name_prefix='initial-update')
+        futures = {executor.submit(run_one, pid, inst): pid for pid, inst in candidates}
+        first_ready: Optional[str] = None
+        pending = set(futures)
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.time())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break  # deadline
+                for future in done:
+                    if first_ready is None and future.exception() is None and future.result():
+                        first_ready = futures[future]
+                if first_ready is not None and deadline is not None:
+                    break
+        finally:
+            # Never joins: whatever is still running finishes in the background.
+            executor.shutdown(wait=False)
+
+        if pending:
+            if first_ready is None:
+                # The deadline ended the wait. Updates already running carry
+                # on; those still queued behind them go to the update tick.
+                unstarted = [futures[f] for f in pending if f.cancel()]
+                self._log_deferred_initial_updates(unstarted)
+                pending = {f for f in pending if not f.cancelled()}
+            if pending:
+                logger.info("Initial update: %d plugin(s) still updating in the background: %s",
+                            len(pending), ", ".join(sorted(futures[f] for f in pending)))
+                self._report_late_deferrals(pending, late_deferred, late_lock)
+
+        return first_ready
+
+    def _initial_update_one(self, plugin_id: str, plugin_instance: Any) -> bool:
+        """Run one plugin's initial update on a pool worker; True on success."""
+        if hasattr(self.plugin_manager, 'update_plugin_now'):
+            # Claims the plugin and holds its lock, so the scheduler does not
+            # queue a second update() behind a straggler from this pass.
+            return self.plugin_manager.update_plugin_now(plugin_id)
+
+        # Fallback to direct call
+        try:
+            if hasattr(plugin_instance, 'update'):
+                plugin_instance.update()
+                if hasattr(self.plugin_manager, 'plugin_last_update'):
                     self.plugin_manager.plugin_last_update[plugin_id] = time.time()
-            else:
-                # Fallback to direct call
-                try:
-                    if hasattr(plugin_instance, 'update'):
-                        plugin_instance.update()
-                        if hasattr(self.plugin_manager, 'plugin_last_update'):
-                            self.plugin_manager.plugin_last_update[plugin_id] = time.time()
-                        # Record success
-                        if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
-                            self.plugin_manager.health_tracker.record_success(plugin_id)
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.exception("Error updating plugin %s", plugin_id)
-                    # Record failure
-                    if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
-                        self.plugin_manager.health_tracker.record_failure(plugin_id, exc)
+                # Record success
+                if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
+                    self.plugin_manager.health_tracker.record_success(plugin_id)
+                return True
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Error updating plugin %s", plugin_id)
+            # Record failure
+            if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
+                self.plugin_manager.health_tracker.record_failure(plugin_id, exc)
+        return False
 
+    @staticmethod
+    def _log_deferred_initial_updates(deferred: List[str]) -> None:
         if deferred:
             logger.info(
                 "Initial update budget spent; %d plugin(s) left to the update "
                 "tick so the display can start: %s",
                 len(deferred), ", ".join(deferred))
 
+    def _report_late_deferrals(self, pending, late_deferred: List[str],
+                               late_lock: threading.Lock) -> None:
+        """Log plugins the background pass deferred, once it has drained."""
+        remaining = {'count': len(pending)}
+
+        def _on_done(_future):
+            with late_lock:
+                remaining['count'] -= 1
+                if remaining['count'] > 0:
+                    return
+                deferred = list(late_deferred)
+            self._log_deferred_initial_updates(deferred)
+
+        for future in pending:
+            future.add_done_callback(_on_done)
+
     def _tick_plugin_updates_for_vegas(self) -> None:
         """Run scheduled plugin updates and tell Vegas mode which plugins
         actually got fresh data, so it can hot-swap them into the scroll
@@ -1621,8 +1706,8 @@ class DisplayController:
                 pass  # Background service may not be initialized
             
             # Log deferred updates stats
-            if hasattr(self.display_manager, '_scrolling_state'):
-                deferred_count = len(self.display_manager._scrolling_state.get('deferred_updates', []))
+            if hasattr(self.display_manager, 'get_scrolling_stats'):
+                deferred_count = self.display_manager.get_scrolling_stats().get('deferred_count', 0)
                 if deferred_count > 0:
                     logger.info(f"Deferred Updates Queue: {deferred_count} pending updates")
             
@@ -1742,6 +1827,7 @@ class DisplayController:
             self.current_display_mode = self.available_modes[self.current_mode_index] if self.available_modes else 'none'
             logger.info(f"Initial mode set to: {self.current_display_mode} (index: {self.current_mode_index}, total modes: {len(self.available_modes)})")
             self._publish_current_mode_state()
+            self._frame_recorder.start_status_writer()
             
             while True:
                 # Apply plugin enable/disable edits saved via the web UI. The
@@ -2346,6 +2432,7 @@ class DisplayController:
 
                         target_duration = max_duration
                         start_time = time.time()
+                        frame_label = LABEL_ON_DEMAND if self.on_demand_active else LABEL_PLUGIN
 
                         def _should_exit_dynamic(elapsed_time: float) -> bool:
                             if not dynamic_enabled:
@@ -2395,11 +2482,13 @@ class DisplayController:
                                 try:
                                     with self._display_lock_or_skip(plugin_id) as can_display:
                                         if can_display:
+                                            frame_started = time.perf_counter()
                                             # Pass display_mode to maintain sticky manager state
                                             if _accepts_display_mode:
                                                 result = manager_to_display.display(display_mode=active_mode, force_clear=False)
                                             else:
                                                 result = manager_to_display.display(force_clear=False)
+                                            self._frame_recorder.record(frame_label, time.perf_counter() - frame_started)
                                         else:
                                             # update() in flight — hold the last frame
                                             result = True
@@ -2464,11 +2553,13 @@ class DisplayController:
                                 try:
                                     with self._display_lock_or_skip(plugin_id) as can_display:
                                         if can_display:
+                                            frame_started = time.perf_counter()
                                             # Pass display_mode to maintain sticky manager state
                                             if _accepts_display_mode:
                                                 result = manager_to_display.display(display_mode=active_mode, force_clear=False)
                                             else:
                                                 result = manager_to_display.display(force_clear=False)
+                                            self._frame_recorder.record(frame_label, time.perf_counter() - frame_started)
                                         else:
                                             # update() in flight — hold the last frame
                                             result = True
@@ -3045,6 +3136,8 @@ class DisplayController:
             except Exception as e:
                 logger.warning("Error shutting down config service: %s", e)
         logger.info("Cleaning up display controller...")
+        if hasattr(self, '_frame_recorder'):
+            self._frame_recorder.stop_status_writer()
         if hasattr(self, 'display_manager'):
             self.display_manager.cleanup()
         logger.info("Cleanup complete.")
@@ -3052,6 +3145,9 @@ class DisplayController:
 def main():
     """Application entry point — create a DisplayController and run until interrupted."""
     controller = DisplayController()
+    # Plugins are imported during initialization; no-op unless profiling.
+    from src.startup_profiler import log_import_profile
+    log_import_profile("controller initialized")
     controller.run()
 
 if __name__ == "__main__":
@@ -23,6 +23,8 @@ first call to ``DisplayManager(config)`` creates it; subsequent calls return
 the same object.
 """
 
+import heapq
+import itertools
 import json
 import os
 import socket
@@ -37,7 +39,7 @@ from PIL import Image, ImageDraw, ImageFont
 import threading
 import time
 from collections import OrderedDict
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
 import math
 import zlib
@@ -97,12 +99,70 @@ class _LogicalMatrix:
         setattr(object.__getattribute__(self, "_matrix"), name, value)
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+class _ShadowMatrix(_LogicalMatrix):
+    """Matrix stand-in for a shadow canvas (see DisplayManager.shadow_canvas).
+
+    Reports the shadow canvas size and reads attributes (``brightness``,
+    ``width`` of the real chain, ...) through to the real matrix, but turns
+    every method call into a no-op and drops attribute writes, so a plugin
+    rendering on a worker thread cannot swap, clear or dim the live panel.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(object.__getattribute__(self, "_matrix"), name)
+        return _noop if callable(value) else value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+class _CanvasAttribute:
+    """A DisplayManager canvas attribute (``image``, ``draw``, ``matrix``)
+    that a thread inside ``shadow_canvas()`` sees privately.
+
+    Outside a shadow canvas reads and writes hit the shared value, exactly
+    like a plain instance attribute. Inside one they hit the calling
+    thread's shadow, so all of DisplayManager's drawing helpers -- and every
+    plugin that assigns ``display_manager.image`` -- work unchanged off the
+    render thread.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.shared_name = '_shared_' + name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        shadow = obj._thread_shadow()
+        if shadow is not None:
+            return shadow[self.name]
+        try:
+            return obj.__dict__[self.shared_name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        shadow = obj._thread_shadow()
+        if shadow is not None:
+            shadow[self.name] = value
+        else:
+            obj.__dict__[self.shared_name] = value
+
+
 def _resolve_double_sided(physical_width: int, physical_height: int,
                           ds_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Validate the ``display.double_sided`` config against the physical size.
 
-    Returns a dict ``{copies, axis, logical_width, logical_height}`` when the
-    feature is enabled and the physical panel divides evenly into ``copies``
+    Returns a dict ``{copies, axis, logical_width, logical_height, offsets}``
+    (``offsets`` being the top-left corner of each copy in the physical
+    frame) when the feature is enabled and the physical panel divides evenly into ``copies``
     along the chosen axis, otherwise ``None`` (single-screen behaviour). Bad
     config is logged and disabled rather than raised — a misconfigured panel
     should still light up.
@@ -147,11 +207,16 @@ def _resolve_double_sided(physical_width: int, physical_height: int,
         "double_sided enabled: %d copies on %s axis — logical screen %dx%d "
         "tiled across physical %dx%d", copies, axis, logical_width,
         logical_height, physical_width, physical_height)
+    if axis == 'horizontal':
+        offsets = tuple((i * logical_width, 0) for i in range(copies))
+    else:
+        offsets = tuple((0, i * logical_height) for i in range(copies))
     return {
         'copies': copies,
         'axis': axis,
         'logical_width': logical_width,
         'logical_height': logical_height,
+        'offsets': offsets,
     }
 
 
@@ -177,6 +242,11 @@ class DisplayManager:
     _instance = None
     _initialized = False
 
+    # Per-thread routable canvas (see shadow_canvas()).
+    image = _CanvasAttribute()
+    draw = _CanvasAttribute()
+    matrix = _CanvasAttribute()
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super(DisplayManager, cls).__new__(cls)
@@ -193,7 +263,8 @@ class DisplayManager:
         # Thread-local rather than a plain flag because Vegas mode prepares
         # upcoming content on a background thread: a shared flag set there would
         # suppress the render loop's own frame pushes for the duration, freezing
-        # the panel exactly when the point was to avoid a freeze.
+        # the panel exactly when the point was to avoid a freeze. Also holds
+        # the thread's shadow canvas, if any (see shadow_canvas()).
         self._capture_state = threading.local()
         # Double-sided mode state (resolved in _setup_matrix). When disabled,
         # the logical image is blitted to the matrix unchanged.
@@ -240,14 +311,25 @@ class DisplayManager:
         self._update_lock = threading.RLock()
         
         # Scrolling state tracking for graceful updates
-        self._scrolling_state = {
+        self._scrolling_state: Dict[str, Any] = {
             'is_scrolling': False,
             'last_scroll_activity': 0,
             'scroll_inactivity_threshold': 2.0,  # seconds of inactivity before considering "not scrolling"
-            'deferred_updates': [],
             'max_deferred_updates': 50,  # Limit queue size to prevent memory issues
-            'deferred_update_ttl': 300.0  # 5 minutes TTL for deferred updates
+            'deferred_update_ttl': 300.0,  # 5 minutes TTL for deferred updates
+            # Seconds of deferred work process_deferred_updates() may do per
+            # main-loop iteration (at least one update always runs).
+            'deferred_update_budget': 0.005,
         }
+        self._deferred_lock = threading.Lock()
+        # Heap of [priority, seq, timestamp, func, key] entries; see
+        # defer_update(). Replaced entries stay in the heap with func set to
+        # None until popped or compacted away.
+        self._deferred_heap: List[list] = []
+        self._deferred_seq = itertools.count()
+        self._deferred_by_key: Dict[Any, list] = {}
+        self._deferred_live = 0
+        self._deferred_last_sweep = 0.0
         
         self._setup_matrix()
         logger.info("Matrix setup completed in %.3f seconds", time.time() - start_time)
@@ -654,11 +736,65 @@ class DisplayManager:
         Entering this context prevents those writes without affecting the PIL
         image buffer, which the adapter reads to extract content.
         """
+        was_active = self._capture_mode_active
         self._capture_mode_active = True
         try:
             yield
         finally:
-            self._capture_mode_active = False
+            # Restore rather than clear: capture_mode() nests inside
+            # shadow_canvas(), which must stay in capture mode.
+            self._capture_mode_active = was_active
+
+    def _thread_shadow(self) -> Optional[Dict[str, Any]]:
+        """The calling thread's shadow canvas, or None on the shared one."""
+        state = self.__dict__.get('_capture_state')
+        if state is None:
+            return None
+        return getattr(state, 'shadow', None)
+
+    @contextmanager
+    def shadow_canvas(self, width: Optional[int] = None, height: Optional[int] = None):
+        """Give the calling thread a private canvas for the duration.
+
+        capture_mode() keeps a capture off the hardware, but the capture still
+        draws into the shared ``image`` -- the one the render loop is pushing
+        -- so it could only run on the render thread. Inside this context the
+        calling thread's ``image``, ``draw`` and ``matrix`` are its own: a
+        blank image of the current size, and a matrix stand-in that reports
+        that size and ignores hardware calls. Every other thread, the render
+        loop included, keeps seeing the live canvas. The thread is also in
+        capture mode, so update_display() and clear() never reach the panel.
+
+        render_size() and clear() work inside as they do outside, against the
+        shadow. Nested calls reuse the outer shadow.
+
+        Args:
+            width: Shadow canvas width, defaulting to the current width.
+            height: Shadow canvas height, defaulting to the current height.
+        """
+        state = self._capture_state
+        if getattr(state, 'shadow', None) is not None:
+            yield
+            return
+
+        target_w = int(width) if width else self.width
+        target_h = int(height) if height else self.height
+        real_matrix = self.matrix
+        image = Image.new('RGB', (target_w, target_h))
+        shadow = {
+            'image': image,
+            'draw': ImageDraw.Draw(image),
+            'matrix': (None if real_matrix is None
+                       else _ShadowMatrix(real_matrix, target_w, target_h)),
+        }
+        was_active = self._capture_mode_active
+        state.shadow = shadow
+        self._capture_mode_active = True
+        try:
+            yield
+        finally:
+            state.shadow = None
+            self._capture_mode_active = was_active
 
     @contextmanager
     def render_size(self, width: int, height: Optional[int] = None):
@@ -676,8 +812,10 @@ class DisplayManager:
         indirection that double-sided mode relies on, so plugins see a
         consistent size from every accessor.
 
-        Only meaningful inside :meth:`capture_mode` — this swaps the shared
-        image buffer, so the render loop must not be writing to it concurrently.
+        Only meaningful inside :meth:`capture_mode` — this swaps the image
+        buffer, so the render loop must not be writing to it concurrently.
+        Inside :meth:`shadow_canvas` the swap applies to the calling thread's
+        shadow only.
 
         Args:
             width: Logical width to report, clamped to at least 1 and to the
@@ -716,20 +854,18 @@ class DisplayManager:
     def _composite_double_sided(self):
         """Tile the logical screen across the full physical chain.
 
-        Renders once into ``self._physical_image`` by pasting the rendered
-        logical image ``copies`` times along the configured axis. The paste is
-        a single memcpy per copy, so the per-frame cost is negligible and the
-        plugin render path is untouched.
+        Renders into the preallocated ``self._physical_image`` by pasting the
+        rendered logical image at each precomputed offset. A paste is a row
+        memcpy in C: 7.7us for 2 copies of 64x32 and 30us for 4 copies of
+        256x64. Tiling through a numpy buffer instead measured 2-4x slower —
+        PIL keeps RGB as 4 bytes per pixel, so the array can't back the
+        image handed to SetImage and every frame pays two conversions.
         """
-        ds = self._double_sided
         phys = self._physical_image
-        lw = ds['logical_width']
-        lh = ds['logical_height']
-        for i in range(ds['copies']):
-            if ds['axis'] == 'vertical':
-                phys.paste(self.image, (0, i * lh))
-            else:
-                phys.paste(self.image, (i * lw, 0))
+        paste = phys.paste
+        image = self.image
+        for offset in self._double_sided['offsets']:
+            paste(image, offset)
         return phys
 
     def update_display(self):
@@ -756,6 +892,13 @@ class DisplayManager:
         need to know about it.
         """
         try:
+            if self._capture_mode_active:
+                # Skip hardware write — content is being captured off-screen.
+                # Checked before the lock: a capture on a worker thread must
+                # not wait on the render loop's push, and before the fallback
+                # branch so a captured frame never lands in the web preview.
+                return
+
             with self._update_lock:
                 if self.matrix is None:
                     # Fallback mode - no actual hardware to update
@@ -764,9 +907,6 @@ class DisplayManager:
                     self._write_snapshot_if_due()
                     return
 
-                if self._capture_mode_active:
-                    return  # Skip hardware write — content is being captured off-screen
-
                 digest = None
                 if self._dirty_tracking_enabled:
                     try:
@@ -970,7 +1110,10 @@ class DisplayManager:
         cache_key = (text, id(font))
         cached = self._text_width_cache.get(cache_key)
         if cached is not None:
-            self._text_width_cache.move_to_end(cache_key)
+            try:
+                self._text_width_cache.move_to_end(cache_key)
+            except KeyError:
+                pass  # evicted meanwhile by a shadow-canvas capture thread
             return cached[0]
 
         try:
@@ -1297,92 +1440,161 @@ class DisplayManager:
             
         return True
 
-    def defer_update(self, update_func, priority: int = 0):
+    def defer_update(self, update_func, priority: int = 0, key: Any = None):
         """Defer an update function to be called when not scrolling.
-        
+
+        The queue is a heap ordered by (priority, arrival), so adding is
+        O(log n) and the main loop no longer re-sorts the whole list every
+        iteration. Updates with the same priority run in the order they were
+        deferred.
+
         Args:
             update_func: Function to call when not scrolling
             priority: Priority level (lower numbers = higher priority)
+            key: Optional deduplication key. Deferring again with a key that
+                is still queued replaces the earlier update (its function,
+                priority and place in line), so a plugin that re-defers the
+                same refresh on every tick keeps one entry, not hundreds.
         """
         current_time = time.time()
-        
-        # Clean up expired updates before adding new ones
-        self._cleanup_expired_deferred_updates(current_time)
-        
-        # Limit queue size to prevent memory issues
-        if len(self._scrolling_state['deferred_updates']) >= self._scrolling_state['max_deferred_updates']:
-            # Remove oldest update to make room
-            self._scrolling_state['deferred_updates'].pop(0)
-            logger.debug("Removed oldest deferred update due to queue size limit")
-        
-        self._scrolling_state['deferred_updates'].append({
-            'func': update_func,
-            'priority': priority,
-            'timestamp': current_time
-        })
-        
-        # Only sort if we have a reasonable number of updates to avoid excessive sorting
-        if len(self._scrolling_state['deferred_updates']) <= 20:
-            self._scrolling_state['deferred_updates'].sort(key=lambda x: x['priority'])
-        
-        logger.debug(f"Deferred update added. Total deferred: {len(self._scrolling_state['deferred_updates'])}")
 
-    def process_deferred_updates(self):
-        """Process any deferred updates if not currently scrolling."""
+        with self._deferred_lock:
+            if key is not None:
+                previous = self._deferred_by_key.pop(key, None)
+                if previous is not None and previous[3] is not None:
+                    previous[3] = None
+                    self._deferred_live -= 1
+            self._push_deferred_locked(priority, current_time, update_func, key)
+            self._compact_deferred_locked()
+            live = self._deferred_live
+
+        logger.debug("Deferred update added. Total deferred: %d", live)
+
+    def process_deferred_updates(self, budget: Optional[float] = None):
+        """Process deferred updates, highest priority first, if not scrolling.
+
+        Runs updates until ``budget`` seconds have been spent (default:
+        ``_scrolling_state['deferred_update_budget']``), always at least one,
+        so a backlog drains over several main-loop iterations instead of
+        stalling one of them.
+        """
         current_time = time.time()
-        
-        # Always clean up expired updates, even if scrolling
-        # This prevents memory leaks from accumulated expired updates
+        state = self._scrolling_state
+
+        # Expired updates are dropped as they are popped; the periodic sweep
+        # only matters while scrolling keeps anything from being popped.
         self._cleanup_expired_deferred_updates(current_time)
-        
+
         if self.is_currently_scrolling():
             return
-            
-        if not self._scrolling_state['deferred_updates']:
-            return
-            
-        if not self._scrolling_state['deferred_updates']:
-            return
-            
-        # Process only a limited number of updates per call to avoid blocking
-        max_updates_per_call = min(5, len(self._scrolling_state['deferred_updates']))
-        updates_to_process = self._scrolling_state['deferred_updates'][:max_updates_per_call]
-        self._scrolling_state['deferred_updates'] = self._scrolling_state['deferred_updates'][max_updates_per_call:]
-        
-        logger.debug(f"Processing {len(updates_to_process)} deferred updates (queue size: {len(self._scrolling_state['deferred_updates'])})")
-        
+
+        if budget is None:
+            budget = state['deferred_update_budget']
+        ttl = state['deferred_update_ttl']
+        started = time.monotonic()
+        processed = 0
         failed_updates = []
-        for update_info in updates_to_process:
+
+        while True:
+            with self._deferred_lock:
+                popped = self._pop_deferred_locked()
+            if popped is None:
+                break
+            timestamp, update_func = popped[2], popped[3]
+            if current_time - timestamp > ttl:
+                logger.debug("Skipping expired deferred update")
+                continue
             try:
-                # Check if update is still valid (not too old)
-                if current_time - update_info['timestamp'] > self._scrolling_state['deferred_update_ttl']:
-                    logger.debug("Skipping expired deferred update")
-                    continue
-                    
-                update_info['func']()
+                update_func()
                 logger.debug("Deferred update executed successfully")
             except Exception as e:
                 logger.error(f"Error executing deferred update: {e}")
                 # Only retry recent failures, and limit retries
-                if current_time - update_info['timestamp'] < 60.0:  # Only retry for 1 minute
-                    failed_updates.append(update_info)
-        
-        # Re-add failed updates to the end of the queue (not the beginning)
+                if current_time - timestamp < 60.0:  # Only retry for 1 minute
+                    failed_updates.append(popped)
+            processed += 1
+            if time.monotonic() - started >= budget:
+                break
+
+        if processed:
+            logger.debug("Processed %d deferred updates (queue size: %d)",
+                         processed, self._deferred_live)
+
+        # Failed updates go back behind everything already queued at their
+        # priority — unless they were re-deferred while running.
         if failed_updates:
-            self._scrolling_state['deferred_updates'].extend(failed_updates)
+            with self._deferred_lock:
+                for priority, _, timestamp, update_func, key in failed_updates:
+                    if key is not None and key in self._deferred_by_key:
+                        continue
+                    self._push_deferred_locked(priority, timestamp, update_func, key)
+
+    def _push_deferred_locked(self, priority: int, timestamp: float,
+                              update_func: Callable, key: Any) -> None:
+        """Queue an entry, dropping the oldest at the size cap. Hold _deferred_lock."""
+        # Limit queue size to prevent memory issues
+        if self._deferred_live >= self._scrolling_state['max_deferred_updates']:
+            self._drop_oldest_deferred_locked()
+            logger.debug("Removed oldest deferred update due to queue size limit")
+        entry = [priority, next(self._deferred_seq), timestamp, update_func, key]
+        heapq.heappush(self._deferred_heap, entry)
+        self._deferred_live += 1
+        if key is not None:
+            self._deferred_by_key[key] = entry
+
+    def _pop_deferred_locked(self) -> Optional[list]:
+        """Pop the next live entry, discarding replaced ones. Hold _deferred_lock."""
+        heap = self._deferred_heap
+        while heap:
+            entry = heapq.heappop(heap)
+            if entry[3] is None:
+                continue
+            self._deferred_live -= 1
+            key = entry[4]
+            if key is not None and self._deferred_by_key.get(key) is entry:
+                del self._deferred_by_key[key]
+            return entry
+        return None
+
+    def _drop_oldest_deferred_locked(self) -> None:
+        """Drop the earliest-deferred live entry. O(n), only at the size cap."""
+        live = [entry for entry in self._deferred_heap if entry[3] is not None]
+        if not live:
+            return
+        oldest = min(live, key=lambda entry: entry[1])
+        oldest[3] = None
+        self._deferred_live -= 1
+        if oldest[4] is not None and self._deferred_by_key.get(oldest[4]) is oldest:
+            del self._deferred_by_key[oldest[4]]
+
+    def _compact_deferred_locked(self) -> None:
+        """Rebuild the heap once replaced entries outnumber live ones."""
+        if len(self._deferred_heap) > 2 * self._deferred_live + 16:
+            heap = [entry for entry in self._deferred_heap if entry[3] is not None]
+            heapq.heapify(heap)
+            self._deferred_heap = heap
 
     def _cleanup_expired_deferred_updates(self, current_time: float):
-        """Remove expired deferred updates to prevent memory leaks."""
+        """Remove expired deferred updates to prevent memory leaks.
+
+        A full sweep, so it runs at most once every tenth of the TTL.
+        """
         ttl = self._scrolling_state['deferred_update_ttl']
-        initial_count = len(self._scrolling_state['deferred_updates'])
-        
-        # Filter out expired updates
-        self._scrolling_state['deferred_updates'] = [
-            update for update in self._scrolling_state['deferred_updates']
-            if current_time - update['timestamp'] <= ttl
-        ]
-        
-        removed_count = initial_count - len(self._scrolling_state['deferred_updates'])
+        if current_time - self._deferred_last_sweep < ttl / 10:
+            return
+        self._deferred_last_sweep = current_time
+
+        removed_count = 0
+        with self._deferred_lock:
+            for entry in self._deferred_heap:
+                if entry[3] is not None and current_time - entry[2] > ttl:
+                    entry[3] = None
+                    self._deferred_live -= 1
+                    removed_count += 1
+                    if entry[4] is not None and self._deferred_by_key.get(entry[4]) is entry:
+                        del self._deferred_by_key[entry[4]]
+            self._compact_deferred_locked()
+
         if removed_count > 0:
             logger.debug(f"Cleaned up {removed_count} expired deferred updates")
 
@@ -1391,10 +1603,11 @@ class DisplayManager:
         return {
             'is_scrolling': self._scrolling_state['is_scrolling'],
             'last_activity': self._scrolling_state['last_scroll_activity'],
-            'deferred_count': len(self._scrolling_state['deferred_updates']),
+            'deferred_count': self._deferred_live,
             'inactivity_threshold': self._scrolling_state['scroll_inactivity_threshold'],
             'max_deferred_updates': self._scrolling_state['max_deferred_updates'],
-            'deferred_update_ttl': self._scrolling_state['deferred_update_ttl']
+            'deferred_update_ttl': self._scrolling_state['deferred_update_ttl'],
+            'deferred_update_budget': self._scrolling_state['deferred_update_budget'],
         }
 
     def _viewer_is_fresh(self, now: float) -> bool:
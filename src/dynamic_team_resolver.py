@@ -14,15 +14,52 @@ Usage:
     resolver = DynamicTeamResolver()
     resolved_teams = resolver.resolve_teams(["UGA", "AP_TOP_25", "AUB"])
     # Returns: ["UGA", "UGA", "AUB", "MICH", "OSU", ...] (AP_TOP_25 teams)
+
+Rankings are cached for the whole process and, when a CacheManager is
+given, on disk, until the next weekly poll release. They used to be kept for
+an hour in memory only, so every restart, and every hour during a season,
+each sports plugin resolving AP_TOP_25 at startup fetched them again. Only
+one fetch runs at a time; resolvers that ask meanwhile wait for its result.
 """
 
 import logging
+import threading
 import time
+from datetime import datetime, timedelta, timezone
 import requests
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# The AP poll is published on Sundays during the season, early afternoon
+# Eastern. Cached rankings stay valid until this time on the next Sunday
+# (UTC), which leaves ESPN a few hours to pick up the new poll.
+RANKINGS_RELEASE_WEEKDAY = 6  # Monday is 0
+RANKINGS_RELEASE_HOUR_UTC = 22
+RANKINGS_CACHE_KEY = 'dynamic_team_rankings_ncaa_fb'
+# When a refetch fails, the rankings from before are kept for this many
+# seconds before ESPN is asked again.
+RANKINGS_RETRY_DELAY = 600
+
+
+def next_rankings_release(after: float) -> float:
+    """
+    Timestamp of the first weekly rankings release strictly after a time.
+
+    Args:
+        after: Unix timestamp
+
+    Returns:
+        Unix timestamp of the next release
+    """
+    moment = datetime.fromtimestamp(after, tz=timezone.utc)
+    release = moment.replace(hour=RANKINGS_RELEASE_HOUR_UTC, minute=0,
+                             second=0, microsecond=0)
+    release += timedelta(days=(RANKINGS_RELEASE_WEEKDAY - moment.weekday()) % 7)
+    if release <= moment:
+        release += timedelta(days=7)
+    return release.timestamp()
+
 class DynamicTeamResolver:
     """
     Resolves dynamic team names to actual team abbreviations.
@@ -31,10 +68,13 @@ class DynamicTeamResolver:
     like AP Top 25 rankings, which update automatically.
     """
     
-    # Cache for rankings data
-    _rankings_cache: Dict[str, List[str]] = {}
+    # Cache for rankings data, shared by every instance
+    _rankings_cache: Dict[str, int] = {}
     _cache_timestamp: float = 0
-    _cache_duration: int = 3600  # 1 hour cache
+    _cache_expires_at: float = 0
+    # Held while fetching, so concurrent resolvers share one request
+    _fetch_lock = threading.Lock()
+    RANKINGS_URL = "https://site.api.espn.com/apis/site/v2/sports/football/college-football/rankings"
     
     # Supported dynamic team patterns
     DYNAMIC_PATTERNS = {
@@ -43,9 +83,17 @@ class DynamicTeamResolver:
         'AP_TOP_5': {'sport': 'ncaa_fb', 'limit': 5},
     }
     
-    def __init__(self, request_timeout: int = 30):
-        """Initialize the dynamic team resolver."""
+    def __init__(self, request_timeout: int = 30, cache_manager: Optional[Any] = None):
+        """
+        Initialize the dynamic team resolver.
+        
+        Args:
+            request_timeout: Timeout for the rankings request in seconds
+            cache_manager: Optional CacheManager used to keep the rankings
+                across restarts
+        """
         self.request_timeout = request_timeout
+        self.cache_manager = cache_manager
         self.logger = logger
         
     def resolve_teams(self, team_list: List[str], sport: str = 'ncaa_fb') -> List[str]:
@@ -125,23 +173,85 @@ class DynamicTeamResolver:
     
     def _fetch_ncaa_fb_rankings(self) -> Dict[str, int]:
         """
-        Fetch current NCAA Football rankings from ESPN API.
+        Get current NCAA Football rankings, fetching them from the ESPN API
+        if neither the shared nor the persisted cache has current ones.
         
         Returns:
             Dictionary mapping team abbreviations to rankings
         """
-        current_time = time.time()
+        rankings = self._cached_rankings()
+        if rankings is not None:
+            return rankings
         
-        # Check cache first
-        if (self._rankings_cache and 
-            current_time - self._cache_timestamp < self._cache_duration):
-            return self._rankings_cache
-            
+        with DynamicTeamResolver._fetch_lock:
+            # Another resolver may have fetched them while we waited
+            rankings = self._cached_rankings()
+            if rankings is not None:
+                return rankings
+            rankings = self._load_persisted_rankings()
+            if rankings is not None:
+                return rankings
+            rankings = self._request_ncaa_fb_rankings()
+            if not rankings and DynamicTeamResolver._rankings_cache:
+                # Keep serving the old rankings for a while, so that during
+                # an ESPN outage every resolver doesn't block on the request
+                # in turn
+                DynamicTeamResolver._cache_expires_at = time.time() + RANKINGS_RETRY_DELAY
+        
+        if not rankings and DynamicTeamResolver._rankings_cache:
+            self.logger.warning("Using rankings from before the last poll release")
+            return DynamicTeamResolver._rankings_cache
+        return rankings
+    
+    def _cached_rankings(self) -> Optional[Dict[str, int]]:
+        """The shared in-memory rankings if they are still current."""
+        if (DynamicTeamResolver._rankings_cache and
+                time.time() < DynamicTeamResolver._cache_expires_at):
+            return DynamicTeamResolver._rankings_cache
+        return None
+    
+    def _store_rankings(self, rankings: Dict[str, int], fetched_at: float,
+                        expires_at: float) -> None:
+        # Cache the results ON THE CLASS. Assigning through self would
+        # create instance attributes that shadow the shared class-level
+        # cache, making it per-instance — and every scoreboard constructs
+        # its own resolver, so the cache would never actually be shared.
+        DynamicTeamResolver._rankings_cache = rankings
+        DynamicTeamResolver._cache_timestamp = fetched_at
+        DynamicTeamResolver._cache_expires_at = expires_at
+    
+    def _load_persisted_rankings(self) -> Optional[Dict[str, int]]:
+        """Rankings saved by an earlier run, if they are still current."""
+        if self.cache_manager is None:
+            return None
+        try:
+            entry = self.cache_manager.get(RANKINGS_CACHE_KEY, max_age=None)
+            if not entry or time.time() >= entry['expires_at']:
+                return None
+            rankings = {abbr: int(rank) for abbr, rank in entry['rankings']}
+            fetched_at = float(entry['fetched_at'])
+            expires_at = float(entry['expires_at'])
+        except Exception as e:
+            self.logger.warning(f"Ignoring persisted rankings: {e}")
+            return None
+        if not rankings:
+            return None
+        self._store_rankings(rankings, fetched_at, expires_at)
+        self.logger.info(f"Using persisted rankings for {len(rankings)} teams")
+        return rankings
+    
+    def _request_ncaa_fb_rankings(self) -> Dict[str, int]:
+        """
+        Fetch NCAA Football rankings from the ESPN API and cache them.
+        
+        Returns:
+            Dictionary mapping team abbreviations to rankings, empty on failure
+        """
+        current_time = time.time()
         try:
             self.logger.info("Fetching fresh NCAA Football rankings from ESPN API")
-            rankings_url = "https://site.api.espn.com/apis/site/v2/sports/football/college-football/rankings"
             
-            response = requests.get(rankings_url, timeout=self.request_timeout)
+            response = requests.get(self.RANKINGS_URL, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -167,14 +277,9 @@ class DynamicTeamResolver:
                 
                 # Sort by ranking (1, 2, 3, etc.)
                 sorted_rankings = dict(sorted(rankings.items(), key=lambda x: x[1]))
-
-                # Cache the results ON THE CLASS. Assigning through self
-                # would create instance attributes that shadow the shared
-                # class-level cache, making it per-instance — and every
-                # scoreboard constructs its own resolver, so the cache
-                # would never actually be shared.
-                DynamicTeamResolver._rankings_cache = sorted_rankings
-                DynamicTeamResolver._cache_timestamp = current_time
+                expires_at = next_rankings_release(current_time)
+                self._store_rankings(sorted_rankings, current_time, expires_at)
+                self._persist_rankings(sorted_rankings, current_time, expires_at)
                 
                 self.logger.info(f"Fetched rankings for {len(sorted_rankings)} teams")
                 return sorted_rankings
@@ -184,6 +289,23 @@ class DynamicTeamResolver:
             
         return {}
     
+    def _persist_rankings(self, rankings: Dict[str, int], fetched_at: float,
+                          expires_at: float) -> None:
+        if self.cache_manager is None or not rankings:
+            return
+        try:
+            self.cache_manager.set(
+                RANKINGS_CACHE_KEY,
+                {
+                    'rankings': [[abbr, rank] for abbr, rank in rankings.items()],
+                    'fetched_at': fetched_at,
+                    'expires_at': expires_at,
+                },
+                ttl=max(1, int(expires_at - fetched_at)),
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not persist rankings: {e}")
+    
     def get_available_dynamic_teams(self) -> List[str]:
         """
         Get list of available dynamic team names.
@@ -225,20 +347,29 @@ class DynamicTeamResolver:
         shadow the shared cache for this instance."""
         DynamicTeamResolver._rankings_cache = {}
         DynamicTeamResolver._cache_timestamp = 0
+        DynamicTeamResolver._cache_expires_at = 0
+        if self.cache_manager is not None:
+            try:
+                self.cache_manager.delete(RANKINGS_CACHE_KEY)
+            except Exception as e:
+                self.logger.warning(f"Could not clear persisted rankings: {e}")
         self.logger.info("Cleared dynamic team rankings cache")
 
 
 # Convenience function for easy integration
-def resolve_dynamic_teams(team_list: List[str], sport: str = 'ncaa_fb') -> List[str]:
+def resolve_dynamic_teams(team_list: List[str], sport: str = 'ncaa_fb',
+                          cache_manager: Optional[Any] = None) -> List[str]:
     """
     Convenience function to resolve dynamic teams in a team list.
     
     Args:
         team_list: List of team names (can include dynamic names)
         sport: Sport type for context
+        cache_manager: Optional CacheManager used to keep the rankings
+            across restarts
         
     Returns:
         List of resolved team abbreviations
     """
-    resolver = DynamicTeamResolver()
+    resolver = DynamicTeamResolver(cache_manager=cache_manager)
     return resolver.resolve_teams(team_list, sport)
@@ -7,16 +7,28 @@ error frequency, patterns, and context.
 
 This is a local-only implementation with no external dependencies.
 Errors are stored in memory with optional JSON export.
+
+Pattern detection used to scan every kept record on every new error, and
+each update of a pattern appended the affected plugins again, so during a
+network outage (every plugin failing every cycle) each error cost O(records)
+and memory grew until the process restarted. Errors are now also counted in
+buckets keyed by (plugin, exception type, normalized message), each with a
+few sampled exemplars, and patterns are detected from per-type sliding-window
+counters. The cost of recording an error no longer depends on how many came
+before it, and memory is bounded by max_records and max_buckets.
 """
 
+import random
+import re
 import threading
+import time
 import traceback
 import json
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Deque, Dict, List, Optional, Any, Callable, Tuple
 import logging
 
 from src.exceptions import LEDMatrixError
@@ -70,12 +82,94 @@ class ErrorPattern:
         }
 
 
+# Words containing a digit (ids, ports, counts, addresses, durations) in
+# error messages; they are replaced so the same failure lands in one bucket.
+_VARIABLE_TOKEN = re.compile(r"\b\w*\d\w*\b")
+MAX_BUCKET_MESSAGE_CHARS = 300
+EXEMPLARS_PER_BUCKET = 3
+MAX_SAMPLE_MESSAGES = 5
+PATTERN_WINDOW_SLOTS = 60
+
+
+def normalize_message(message: str) -> str:
+    """
+    Reduce an error message to the part that identifies the failure.
+
+    Args:
+        message: Error message
+
+    Returns:
+        The message, truncated, with words containing digits replaced by <n>
+    """
+    return _VARIABLE_TOKEN.sub("<n>", message[:MAX_BUCKET_MESSAGE_CHARS])
+
+
+@dataclass
+class ErrorBucket:
+    """Count of one kind of error from one plugin, with sampled exemplars."""
+    error_type: str
+    message: str  # normalized
+    plugin_id: Optional[str]
+    count: int
+    first_seen: datetime
+    last_seen: datetime
+    exemplars: List[ErrorRecord] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "error_type": self.error_type,
+            "message": self.message,
+            "plugin_id": self.plugin_id,
+            "count": self.count,
+            "first_seen": self.first_seen.isoformat(),
+            "last_seen": self.last_seen.isoformat(),
+            "exemplars": [r.to_dict() for r in self.exemplars]
+        }
+
+
+class _SlidingWindowCounter:
+    """
+    Number of events in the last `window` seconds, kept as counts per slot
+    (window / slots seconds wide), so adding and reading are amortized O(1)
+    and memory is at most `slots` entries.
+    """
+
+    def __init__(self, window: float, slots: int = PATTERN_WINDOW_SLOTS):
+        self.slots = slots
+        self.slot_width = window / slots
+        self.total = 0
+        # [slot index, count, time of the slot's first event]
+        self._slots: Deque[list] = deque()
+
+    def add(self, now: float, at: datetime) -> int:
+        """Count an event at monotonic time `now` and return the window total."""
+        self._expire(now)
+        index = int(now // self.slot_width)
+        if self._slots and self._slots[-1][0] == index:
+            self._slots[-1][1] += 1
+        else:
+            self._slots.append([index, 1, at])
+        self.total += 1
+        return self.total
+
+    def first_seen(self) -> Optional[datetime]:
+        """Time of the oldest event still in the window."""
+        return self._slots[0][2] if self._slots else None
+
+    def _expire(self, now: float) -> None:
+        oldest = int(now // self.slot_width) - self.slots + 1
+        while self._slots and self._slots[0][0] < oldest:
+            self.total -= self._slots.popleft()[1]
+
+
 class ErrorAggregator:
     """
     Aggregates and analyzes errors across the system.
 
     Features:
     - Error counting by type, plugin, and time window
+    - Bucketing of repeated errors with sampled exemplars
     - Pattern detection (recurring errors)
     - Error rate alerting via callbacks
     - Export for analytics/reporting
@@ -88,7 +182,8 @@ class ErrorAggregator:
         max_records: int = 1000,
         pattern_threshold: int = 5,
         pattern_window_minutes: int = 60,
-        export_path: Optional[Path] = None
+        export_path: Optional[Path] = None,
+        max_buckets: int = 200
     ):
         """
         Initialize the error aggregator.
@@ -98,16 +193,25 @@ class ErrorAggregator:
             pattern_threshold: Number of occurrences to detect a pattern
             pattern_window_minutes: Time window for pattern detection
             export_path: Optional path for JSON export (auto-export on pattern detection)
+            max_buckets: Maximum number of error buckets; the least recently
+                seen is dropped to make room for a new one
         """
         self.logger = logging.getLogger(__name__)
         self.max_records = max_records
+        self.max_buckets = max_buckets
         self.pattern_threshold = pattern_threshold
         self.pattern_window = timedelta(minutes=pattern_window_minutes)
         self.export_path = export_path
 
-        self._records: List[ErrorRecord] = []
+        self._records: Deque[ErrorRecord] = deque(maxlen=max_records)
+        self._total_errors = 0
         self._error_counts: Dict[str, int] = defaultdict(int)
         self._plugin_error_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # Least recently seen first
+        self._buckets: "OrderedDict[Tuple[Optional[str], str, str], ErrorBucket]" = OrderedDict()
+        self._evicted_buckets = 0
+        self._type_windows: Dict[str, _SlidingWindowCounter] = {}
+        self._random = random.Random()  # nosec B311 - sampling, not security
         self._patterns: Dict[str, ErrorPattern] = {}
         self._pattern_callbacks: List[Callable[[ErrorPattern], None]] = []
         self._lock = threading.RLock()  # RLock allows nested acquisition for export_to_file
@@ -152,15 +256,15 @@ class ErrorAggregator:
                 stack_trace=traceback.format_exc()
             )
 
-            # Add record (with size limit)
+            # Add record (the deque drops the oldest past max_records)
             self._records.append(record)
-            if len(self._records) > self.max_records:
-                self._records.pop(0)
 
             # Update counts
+            self._total_errors += 1
             self._error_counts[error_type] += 1
             if plugin_id:
                 self._plugin_error_counts[plugin_id][error_type] += 1
+            self._add_to_bucket(record)
 
             # Check for patterns
             self._detect_pattern(record)
@@ -173,20 +277,49 @@ class ErrorAggregator:
 
             return record
 
+    def _add_to_bucket(self, record: ErrorRecord) -> None:
+        """Count the record in its bucket, keeping it as an exemplar with
+        reservoir sampling so each occurrence is equally likely to be kept."""
+        key = (record.plugin_id, record.error_type, normalize_message(record.message))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_buckets:
+                self._buckets.popitem(last=False)
+                self._evicted_buckets += 1
+            bucket = ErrorBucket(
+                error_type=record.error_type,
+                message=key[2],
+                plugin_id=record.plugin_id,
+                count=0,
+                first_seen=record.timestamp,
+                last_seen=record.timestamp
+            )
+            self._buckets[key] = bucket
+        else:
+            self._buckets.move_to_end(key)
+
+        bucket.count += 1
+        bucket.last_seen = record.timestamp
+        if len(bucket.exemplars) < EXEMPLARS_PER_BUCKET:
+            bucket.exemplars.append(record)
+        else:
+            slot = self._random.randrange(bucket.count)
+            if slot < EXEMPLARS_PER_BUCKET:
+                bucket.exemplars[slot] = record
+
     def _detect_pattern(self, record: ErrorRecord) -> None:
         """Detect recurring error patterns."""
-        cutoff = datetime.now() - self.pattern_window
-        recent_same_type = [
-            r for r in self._records
-            if r.error_type == record.error_type and r.timestamp > cutoff
-        ]
+        window = self._type_windows.get(record.error_type)
+        if window is None:
+            window = _SlidingWindowCounter(self.pattern_window.total_seconds())
+            self._type_windows[record.error_type] = window
+        count = window.add(time.monotonic(), record.timestamp)
 
-        if len(recent_same_type) >= self.pattern_threshold:
+        if count >= self.pattern_threshold:
             pattern_key = record.error_type
             is_new_pattern = pattern_key not in self._patterns
 
             # Determine severity based on count
-            count = len(recent_same_type)
             if count > self.pattern_threshold * 3:
                 severity = "critical"
             elif count > self.pattern_threshold * 2:
@@ -194,20 +327,20 @@ class ErrorAggregator:
             else:
                 severity = "warning"
 
-            # Collect affected plugins
-            affected_plugins = [r.plugin_id for r in recent_same_type if r.plugin_id]
-
-            # Collect sample messages
-            sample_messages = list(set(r.message for r in recent_same_type[:5]))
-
             if is_new_pattern:
                 pattern = ErrorPattern(
                     error_type=record.error_type,
                     count=count,
-                    first_seen=recent_same_type[0].timestamp,
+                    first_seen=window.first_seen() or record.timestamp,
                     last_seen=record.timestamp,
-                    affected_plugins=affected_plugins,
-                    sample_messages=sample_messages,
+                    affected_plugins=sorted({
+                        b.plugin_id for b in self._buckets.values()
+                        if b.error_type == record.error_type and b.plugin_id
+                    }),
+                    sample_messages=list(dict.fromkeys(
+                        b.exemplars[0].message for b in self._buckets.values()
+                        if b.error_type == record.error_type
+                    ))[:MAX_SAMPLE_MESSAGES],
                     severity=severity
                 )
                 self._patterns[pattern_key] = pattern
@@ -215,7 +348,7 @@ class ErrorAggregator:
                 self.logger.warning(
                     f"Error pattern detected: {record.error_type} occurred "
                     f"{count} times in last {self.pattern_window}. "
-                    f"Affected plugins: {set(affected_plugins) or 'unknown'}"
+                    f"Affected plugins: {set(pattern.affected_plugins) or 'unknown'}"
                 )
 
                 # Notify callbacks
@@ -230,10 +363,15 @@ class ErrorAggregator:
                     self._auto_export()
             else:
                 # Update existing pattern
-                self._patterns[pattern_key].count = count
-                self._patterns[pattern_key].last_seen = record.timestamp
-                self._patterns[pattern_key].severity = severity
-                self._patterns[pattern_key].affected_plugins.extend(affected_plugins)
+                pattern = self._patterns[pattern_key]
+                pattern.count = count
+                pattern.last_seen = record.timestamp
+                pattern.severity = severity
+                if record.plugin_id and record.plugin_id not in pattern.affected_plugins:
+                    pattern.affected_plugins.append(record.plugin_id)
+                if (len(pattern.sample_messages) < MAX_SAMPLE_MESSAGES
+                        and record.message not in pattern.sample_messages):
+                    pattern.sample_messages.append(record.message)
 
     def on_pattern_detected(self, callback: Callable[[ErrorPattern], None]) -> None:
         """
@@ -254,11 +392,12 @@ class ErrorAggregator:
         with self._lock:
             # Calculate error rate (errors per hour)
             session_duration = (datetime.now() - self._session_start).total_seconds() / 3600
-            error_rate = len(self._records) / max(session_duration, 0.01)
+            error_rate = self._total_errors / max(session_duration, 0.01)
+            top_buckets = sorted(self._buckets.values(), key=lambda b: b.count, reverse=True)[:20]
 
             return {
                 "session_start": self._session_start.isoformat(),
-                "total_errors": len(self._records),
+                "total_errors": self._total_errors,
                 "error_rate_per_hour": round(error_rate, 2),
                 "error_counts_by_type": dict(self._error_counts),
                 "plugin_error_counts": {
@@ -267,8 +406,11 @@ class ErrorAggregator:
                 "active_patterns": {
                     k: v.to_dict() for k, v in self._patterns.items()
                 },
+                "error_buckets": [b.to_dict() for b in top_buckets],
+                "bucket_count": len(self._buckets),
+                "evicted_buckets": self._evicted_buckets,
                 "recent_errors": [
-                    r.to_dict() for r in self._records[-20:]
+                    r.to_dict() for r in list(self._records)[-20:]
                 ]
             }
 
@@ -285,7 +427,7 @@ class ErrorAggregator:
         with self._lock:
             plugin_errors = self._plugin_error_counts.get(plugin_id, {})
             recent_plugin_errors = [
-                r for r in self._records[-100:]
+                r for r in list(self._records)[-100:]
                 if r.plugin_id == plugin_id
             ]
 
@@ -309,7 +451,7 @@ class ErrorAggregator:
 
     def clear_old_records(self, max_age_hours: int = 24) -> int:
         """
-        Clear records older than specified age.
+        Clear records, and buckets not seen since, older than specified age.
 
         Args:
             max_age_hours: Maximum age in hours
@@ -320,8 +462,17 @@ class ErrorAggregator:
         with self._lock:
             cutoff = datetime.now() - timedelta(hours=max_age_hours)
             original_count = len(self._records)
-            self._records = [r for r in self._records if r.timestamp > cutoff]
+            self._records = deque(
+                (r for r in self._records if r.timestamp > cutoff),
+                maxlen=self.max_records
+            )
             cleared = original_count - len(self._records)
+            # Least recently seen first, so stop at the first recent one
+            while self._buckets:
+                key, bucket = next(iter(self._buckets.items()))
+                if bucket.last_seen > cutoff:
+                    break
+                del self._buckets[key]
 
             if cleared > 0:
                 self.logger.info(f"Cleared {cleared} old error records")
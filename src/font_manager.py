@@ -34,6 +34,7 @@ import urllib.parse
 import urllib.request
 import zipfile
 import tempfile
+import threading
 import time
 from collections import OrderedDict
 from pathlib import Path
@@ -66,6 +67,15 @@ class FontManager:
         # font object (which would silently return wrong metrics).
         self.metrics_cache: "OrderedDict[Any, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
         self._METRICS_CACHE_MAX = 1024
+        # id(face) -> (face, ascender, {char: (advance, bitmap_rows)}) for BDF
+        # faces, filled lazily one character at a time. The per-string cache
+        # above mostly misses on scores and clocks, and each miss cost one
+        # FreeType load_char per character; with this table a miss is a sum
+        # over dict lookups, and FreeType only sees each character once per
+        # face. BDF is a fixed strike, so set_char_size cannot change these.
+        self._bdf_glyph_tables: Dict[int, Tuple[freetype.Face, int, Dict[str, Tuple[int, int]]]] = {}
+        # load_char() then reading face.glyph is not atomic; serializes misses.
+        self._bdf_glyph_lock = threading.Lock()
 
         # Plugin font management
         self.plugin_fonts: Dict[str, Dict[str, Any]] = {}  # plugin_id -> font_manifest
@@ -123,6 +133,7 @@ class FontManager:
         self.fonts_config = new_config.get("fonts", {})
         self.font_cache.clear()  # Clear cache to force reload
         self.metrics_cache.clear()  # Clear metrics cache
+        self._bdf_glyph_tables.clear()
         self.cache_generation += 1
         self._initialize_fonts()
         logger.info("FontManager configuration reloaded successfully")
@@ -562,6 +573,11 @@ class FontManager:
         Returns:
             Tuple of (width, height, baseline_offset)
         """
+        if isinstance(font, freetype.Face):
+            # BDF: a table sum is as cheap as the string-cache lookup, and
+            # keeping these strings out of that cache leaves it to TTF text.
+            return self._measure_bdf_text(text, font)
+
         # Key on the text itself (hash(text) could collide) + font identity;
         # the entry below keeps the font referenced so the id stays valid.
         cache_key = (text, id(font))
@@ -572,31 +588,11 @@ class FontManager:
             return cached[0]
 
         try:
-            if isinstance(font, freetype.Face):
-                # BDF font measurement using FreeType
-                width = 0
-                height = 0
-                baseline = 0
-                max_ascender = 0
-
-                for char in text:
-                    font.load_char(char)
-                    width += font.glyph.advance.x >> 6  # Convert from 26.6 fixed point
-                    glyph_height = font.glyph.bitmap.rows
-                    height = max(height, glyph_height)
-
-                    # Get ascender for baseline calculation
-                    ascender = font.size.ascender >> 6
-                    max_ascender = max(max_ascender, ascender)
-
-                baseline = max_ascender
-
-            else:
-                # TTF font measurement with PIL
-                bbox = font.getbbox(text)
-                width = bbox[2] - bbox[0]
-                height = bbox[3] - bbox[1]
-                baseline = -bbox[1]  # Distance from top to baseline
+            # TTF font measurement with PIL
+            bbox = font.getbbox(text)
+            width = bbox[2] - bbox[0]
+            height = bbox[3] - bbox[1]
+            baseline = -bbox[1]  # Distance from top to baseline
 
         except Exception as e:
             logger.error(f"Error measuring text '{text}': {e}", exc_info=True)
@@ -611,6 +607,41 @@ class FontManager:
             self.metrics_cache.popitem(last=False)
         return result
 
+    def _measure_bdf_text(self, text: str, face: freetype.Face) -> Tuple[int, int, int]:
+        """Measure text on a BDF face from its glyph table.
+
+        Width is the sum of advances, height the tallest glyph bitmap, and
+        baseline the face ascender (0 for empty text).
+        """
+        try:
+            entry = self._bdf_glyph_tables.get(id(face))
+            if entry is None:
+                # The entry keeps the face alive so its id can't be recycled.
+                entry = (face, face.size.ascender >> 6, {})
+                self._bdf_glyph_tables[id(face)] = entry
+            _, ascender, glyphs = entry
+
+            width = 0
+            height = 0
+            for char in text:
+                metrics = glyphs.get(char)
+                if metrics is None:
+                    with self._bdf_glyph_lock:
+                        face.load_char(char)
+                        # advance is 26.6 fixed point
+                        metrics = (face.glyph.advance.x >> 6, face.glyph.bitmap.rows)
+                    glyphs[char] = metrics
+                width += metrics[0]
+                if metrics[1] > height:
+                    height = metrics[1]
+
+            return (width, height, ascender if text else 0)
+
+        except Exception as e:
+            logger.error(f"Error measuring text '{text}': {e}", exc_info=True)
+            # Fallback measurements
+            return (len(text) * 8, 12, 10)
+
     def get_font_height(self, font: Union[ImageFont.FreeTypeFont, freetype.Face]) -> int:
         """Get the height of a font."""
         try:
@@ -746,6 +777,7 @@ class FontManager:
         """Clear font and metrics cache."""
         self.font_cache.clear()
         self.metrics_cache.clear()
+        self._bdf_glyph_tables.clear()
         logger.info("Font cache cleared")
 
     def get_available_fonts(self) -> Dict[str, str]:
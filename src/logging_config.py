@@ -5,12 +5,19 @@ Provides consistent logging configuration across the LEDMatrix application.
 Supports structured logging with context information and appropriate log levels.
 """
 
+import atexit
 import copy
+import heapq
+import itertools
 import logging
+import re
 import sys
 import os
 import json
-from typing import Optional, Dict, Any
+import threading
+import time
+import weakref
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from datetime import datetime
 
 
@@ -96,7 +103,9 @@ def setup_logging(
     level: Optional[int] = None,
     format_type: str = 'readable',
     include_location: bool = False,
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    rate_limit: bool = True,
+    rate_limits: Optional[Dict[str, Optional[Tuple[int, float]]]] = None
 ) -> None:
     """
     Set up centralized logging configuration.
@@ -106,6 +115,11 @@ def setup_logging(
         format_type: 'readable' for human-readable, 'json' for structured JSON
         include_location: Include module/function/line in readable format
         log_file: Optional file path for file logging
+        rate_limit: Suppress repeats of the same warning or lower-level
+            message (see RateLimitFilter)
+        rate_limits: Per-logger (limit, window_seconds), or None for no
+            limit, overriding DEFAULT_RATE_LIMIT for that logger and its
+            children
     """
     # Determine log level
     if level is None:
@@ -118,7 +132,12 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates, reporting anything
+    # their rate limiters are still holding back first
+    for handler in root_logger.handlers:
+        for log_filter in handler.filters:
+            if isinstance(log_filter, RateLimitFilter):
+                log_filter.flush()
     root_logger.handlers.clear()
     
     # Create formatter based on type
@@ -136,6 +155,8 @@ def setup_logging(
     # anywhere else.
     console_handler.setFormatter(
         JournalPriorityFormatter(formatter) if _under_systemd() else formatter)
+    if rate_limit:
+        RateLimitFilter(per_logger=rate_limits).attach(console_handler)
     root_logger.addHandler(console_handler)
     
     # File handler (if specified)
@@ -144,6 +165,8 @@ def setup_logging(
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
+            if rate_limit:
+                RateLimitFilter(per_logger=rate_limits).attach(file_handler)
             root_logger.addHandler(file_handler)
         except (IOError, OSError, PermissionError) as e:
             # Log to stderr since file logging failed
@@ -228,6 +251,189 @@ def _under_systemd() -> bool:
     return (stat_result.st_dev, stat_result.st_ino) == declared_ids
 
 
+#: (limit, window_seconds): at most `limit` records with the same logger,
+#: level and message template are passed per window by RateLimitFilter.
+DEFAULT_RATE_LIMIT = (5, 10.0)
+
+#: Words containing a digit. Replacing these in the formatted message
+#: recovers something close to the template ("Slow render 41ms" and "Slow
+#: render 57ms" are the same line) while messages that differ in words --
+#: "Error loading plugin clock" and "... stocks" -- stay apart.
+_VARIABLE_WORD = re.compile(r"\b\w*\d\w*\b")
+_TEMPLATE_CHARS = 200
+
+
+def _message_template(record: logging.LogRecord) -> str:
+    try:
+        msg = record.getMessage()
+    except Exception:  # pylint: disable=broad-except
+        # Bad args: logging reports that itself when the record is emitted.
+        msg = str(record.msg)
+    return _VARIABLE_WORD.sub("#", msg[:_TEMPLATE_CHARS])
+
+
+#: Filters whose pending counts are reported when the interpreter exits.
+_LIVE_FILTERS: "weakref.WeakSet[RateLimitFilter]" = weakref.WeakSet()
+
+
+def _flush_rate_limit_filters() -> None:
+    for log_filter in list(_LIVE_FILTERS):
+        try:
+            log_filter.flush()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
+# Registered after logging's own shutdown hook, so it runs before it (atexit
+# is last-in, first-out) while the handlers are still open.
+atexit.register(_flush_rate_limit_filters)
+
+
+class RateLimitFilter(logging.Filter):
+    """Handler filter that passes at most `limit` records with the same
+    (logger, level, message template) per window, and reports how many it
+    dropped when the window closes.
+
+    Hot paths (a plugin failing every frame, slow-render warnings, cache
+    misses) could log the same line many times a second. Formatting and
+    writing each one, and journald storing it, costs CPU the frame loop needs
+    on a Pi, and buries everything else in the journal. The first `limit`
+    records of a window go through unchanged; the rest are counted. The
+    first record the handler sees after the window closes is preceded by one
+    "Suppressed N similar messages" record at the same level, carrying the
+    last suppressed message and its context. flush() reports pending counts
+    immediately.
+
+    Records above max_level (by default ERROR and CRITICAL) are never
+    suppressed. Pending counts are also reported at interpreter exit.
+
+    A filter belongs to one handler (attach()), since a record passes
+    through the filters of every handler it reaches.
+    """
+
+    def __init__(self, limit: int = DEFAULT_RATE_LIMIT[0],
+                 window: float = DEFAULT_RATE_LIMIT[1],
+                 per_logger: Optional[Dict[str, Optional[Tuple[int, float]]]] = None,
+                 max_keys: int = 1024,
+                 max_level: int = logging.WARNING,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            limit: Records passed per key per window
+            window: Window length in seconds
+            per_logger: Logger name -> (limit, window), or None for no limit.
+                Applies to that logger and its children; the longest
+                matching name wins.
+            max_keys: Most keys tracked at once; past it the window closest
+                to closing is closed early.
+            max_level: Records above this level always pass
+            clock: Monotonic time source
+        """
+        super().__init__()
+        self.default_limit = (limit, window)
+        self.per_logger = dict(per_logger or {})
+        self.max_keys = max_keys
+        self.max_level = max_level
+        self.suppressed_total = 0
+        self._clock = clock
+        self._handler: Optional[logging.Handler] = None
+        self._lock = threading.Lock()
+        self._limits: Dict[str, Optional[Tuple[int, float]]] = {}
+        # key -> [passed, suppressed, last suppressed record, window length]
+        self._windows: Dict[Tuple, list] = {}
+        # (closes_at, seq, key, state), one entry per open window
+        self._closing: List[Tuple] = []
+        self._seq = itertools.count()
+
+    def attach(self, handler: logging.Handler) -> logging.Handler:
+        """Add this filter to a handler, which summaries are then sent to."""
+        self._handler = handler
+        handler.addFilter(self)
+        _LIVE_FILTERS.add(self)
+        return handler
+
+    def limit_for(self, name: str) -> Optional[Tuple[int, float]]:
+        """The (limit, window) for a logger, or None if it is not limited."""
+        try:
+            return self._limits[name]
+        except KeyError:
+            pass
+        limit = self.default_limit
+        candidate = name
+        while True:
+            if candidate in self.per_logger:
+                limit = self.per_logger[candidate]
+                break
+            if '.' not in candidate:
+                break
+            candidate = candidate.rsplit('.', 1)[0]
+        self._limits[name] = limit
+        return limit
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or getattr(record, 'rate_limit_summary', False):
+            return True
+        now = self._clock()
+        with self._lock:
+            closed = self._close_windows_locked(now)
+            limit = self.limit_for(record.name)
+            if limit is None:
+                allowed = True
+            else:
+                key = (record.name, record.levelno, _message_template(record))
+                state = self._windows.get(key)
+                if state is None:
+                    if len(self._windows) >= self.max_keys:
+                        closed.append(self._pop_closing_locked())
+                    state = [0, 0, None, limit[1]]
+                    self._windows[key] = state
+                    heapq.heappush(self._closing, (now + limit[1], next(self._seq), key, state))
+                allowed = state[0] < limit[0]
+                if allowed:
+                    state[0] += 1
+                else:
+                    state[1] += 1
+                    state[2] = record
+                    self.suppressed_total += 1
+        self._emit_summaries(closed)
+        return allowed
+
+    def flush(self) -> None:
+        """Report every pending suppressed count now."""
+        with self._lock:
+            closed = [self._pop_closing_locked() for _ in range(len(self._closing))]
+        self._emit_summaries(closed)
+
+    def _close_windows_locked(self, now: float) -> List[list]:
+        closed = []
+        while self._closing and self._closing[0][0] <= now:
+            closed.append(self._pop_closing_locked())
+        return closed
+
+    def _pop_closing_locked(self) -> list:
+        _, _, key, state = heapq.heappop(self._closing)
+        del self._windows[key]
+        return state
+
+    def _emit_summaries(self, closed: List[list]) -> None:
+        for _, suppressed, last, window in closed:
+            if not suppressed:
+                continue
+            summary = copy.copy(last)
+            summary.msg = "Suppressed %d similar messages in the last %.0fs, last: %s"
+            summary.args = (suppressed, window, last.getMessage()[:_TEMPLATE_CHARS])
+            summary.exc_info = None
+            summary.exc_text = None
+            summary.stack_info = None
+            summary.created = time.time()
+            summary.msecs = (summary.created - int(summary.created)) * 1000
+            summary.rate_limit_summary = True
+            if self._handler is not None:
+                self._handler.handle(summary)
+            else:
+                logging.getLogger(summary.name).handle(summary)
+
+
 class PluginLoggerAdapter(logging.LoggerAdapter):
     """LoggerAdapter that stamps every record with its plugin_id.
 
@@ -0,0 +1,126 @@
+"""
+Coalescing, atomic file persistence.
+
+State that changes in bursts -- a bulk enable/disable, a batch of installs --
+used to be rewritten in full on every change: N changes, N whole-file writes,
+each one a window in which a power cut leaves a truncated file behind. A
+DebouncedWriter turns that into "mark dirty, write once": the first change
+arms a timer, later changes within the interval ride along, and the write
+happens when it fires (or on flush(), or at interpreter exit).
+
+atomic_write_json() is the write itself: a temp file in the same directory,
+fsync'd, then os.replace()d over the target, so readers see either the old
+file or the new one, never a partial one.
+"""
+
+import atexit
+import json
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """Write data as JSON to path via temp file + fsync + os.replace.
+
+    Raises OSError/TypeError on failure; the temp file is removed and the
+    existing file is left untouched.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+# Writers with unflushed changes at exit get one last flush. Weak, so a
+# writer going away with its owner does not keep either alive.
+_live_writers: 'weakref.WeakSet[DebouncedWriter]' = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_at_exit() -> None:
+    for writer in list(_live_writers):
+        writer.flush()
+
+
+class DebouncedWriter:
+    """Calls write() at most once per interval, after the first mark_dirty()."""
+
+    def __init__(self, write: Callable[[], None], interval: float = 0.5,
+                 name: str = 'state') -> None:
+        """
+        Args:
+            write: Persists the current state. Called without any lock held
+                by the writer; it should snapshot its own data under its own
+                lock.
+            interval: Seconds between the first change and the write. 0
+                writes synchronously on every mark_dirty().
+            name: Used in log messages.
+        """
+        self._write = write
+        self.interval = interval
+        self.name = name
+        self._lock = threading.Lock()
+        # Serializes write() calls: a timer flush and an explicit flush()
+        # must not race each other onto the same temp file.
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self.write_count = 0
+        _live_writers.add(self)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Record a change; it reaches disk within interval seconds."""
+        if self.interval <= 0:
+            with self._lock:
+                self._dirty = True
+            self.flush()
+            return
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Write now if anything changed. Returns True if a write happened."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return False
+                # Cleared before writing: a change that lands during the
+                # write marks it dirty again and gets its own write.
+                self._dirty = False
+            try:
+                self._write()
+            except Exception as e:
+                logger.error("Error writing %s: %s", self.name, e, exc_info=True)
+                with self._lock:
+                    self._dirty = True
+                return False
+            self.write_count += 1
+            return True
@@ -2,9 +2,16 @@
 Operation history and audit log.
 
 Tracks all plugin operations and configuration changes for debugging and auditing.
+
+The history file is an append-only JSON-lines log: each operation appends one
+line instead of rewriting the whole history. When the file has grown to twice
+max_records lines it is compacted -- rewritten atomically with only the most
+recent max_records -- so it stays bounded. A line cut short by a power loss
+is skipped on load; every complete line before it survives.
 """
 
 import json
+import os
 import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -57,7 +64,9 @@ class OperationHistory:
         Initialize operation history.
         
         Args:
-            history_file: Path to file for persisting history
+            history_file: Path to the JSON-lines file for persisting history.
+                A legacy JSON-array file at the same path with a .json
+                suffix is migrated on first load.
             max_records: Maximum number of records to keep
             lazy_load: If True, defer loading history file until first access
         """
@@ -70,15 +79,23 @@ class OperationHistory:
         # In-memory history
         self._history: List[OperationRecord] = []
         self._lock = threading.RLock()
+
+        # Lines currently in the history file (complete or not); compaction
+        # runs when this reaches 2 * max_records.
+        self._file_lines = 0
+        self.compaction_count = 0
         
         # Load history from file if it exists (unless lazy loading)
-        if not self._lazy_load and self.history_file and self.history_file.exists():
-            self._load_history()
-            self._history_loaded = True
+        if not self._lazy_load:
+            self._ensure_loaded()
     
     def _ensure_loaded(self) -> None:
         """Ensure history is loaded (for lazy loading)."""
-        if not self._history_loaded and self.history_file and self.history_file.exists():
+        if self._history_loaded or not self.history_file:
+            return
+        with self._lock:
+            if self._history_loaded:
+                return
             self._load_history()
             self._history_loaded = True
     
@@ -130,7 +147,7 @@ class OperationHistory:
                 self._history = self._history[-self.max_records:]
             
             # Save to file
-            self._save_history()
+            self._append_record(record)
         
         return record_id
     
@@ -171,45 +188,126 @@ class OperationHistory:
         """Clear all operation history records."""
         with self._lock:
             self._history.clear()
-            self._save_history()
+            self._compact()
         self.logger.info("Operation history cleared")
 
-    def _save_history(self) -> None:
-        """Save history to file."""
+    def _append_record(self, record: OperationRecord) -> None:
+        """Append one record to the history file, compacting when it is due.
+
+        Caller holds self._lock.
+        """
         if not self.history_file:
             return
-        
+
+        if self._file_lines + 1 >= 2 * self.max_records:
+            # The record is already in self._history; compaction writes it.
+            self._compact()
+            return
+
         try:
-            with self._lock:
-                history_data = [record.to_dict() for record in self._history]
-            
-            # Ensure directory exists
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write to file
-            with open(self.history_file, 'w') as f:
-                json.dump(history_data, f, indent=2)
-            
+            line = json.dumps(record.to_dict(), default=str)
+            # One write() of a whole line, flushed but not fsync'd: audit
+            # history is not worth an SD-card sync per operation, and a torn
+            # last line is skipped on load.
+            with open(self.history_file, 'a') as f:
+                f.write(line + '\n')
+            self._file_lines += 1
         except Exception as e:
             self.logger.error(f"Error saving operation history: {e}", exc_info=True)
-    
+
+    def _compact(self) -> None:
+        """Rewrite the history file atomically with just the in-memory records.
+
+        Caller holds self._lock.
+        """
+        if not self.history_file:
+            return
+
+        tmp_path = self.history_file.with_name(self.history_file.name + '.tmp')
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                for record in self._history:
+                    f.write(json.dumps(record.to_dict(), default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.history_file)
+            self._file_lines = len(self._history)
+            self.compaction_count += 1
+        except Exception as e:
+            self.logger.error(f"Error compacting operation history: {e}", exc_info=True)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def _load_history(self) -> None:
-        """Load history from file."""
-        if not self.history_file or not self.history_file.exists():
+        """Load history from file, skipping lines that cannot be parsed."""
+        if not self.history_file:
             return
-        
+
+        if not self.history_file.exists():
+            self._migrate_legacy_history()
+            return
+
+        records: List[OperationRecord] = []
+        lines = 0
+        skipped = 0
+        torn = False
         try:
             with open(self.history_file, 'r') as f:
+                for line in f:
+                    lines += 1
+                    torn = not line.endswith('\n')
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(OperationRecord.from_dict(json.loads(line)))
+                    except (ValueError, TypeError):
+                        skipped += 1
+        except OSError as e:
+            self.logger.error(f"Error loading operation history: {e}", exc_info=True)
+            return
+
+        with self._lock:
+            self._history = records[-self.max_records:]
+            self._file_lines = lines
+            if skipped or torn:
+                # Rewrite without the bad lines; otherwise the next append
+                # would join its record onto a torn last line and both would
+                # be lost on the following load.
+                self._compact()
+
+        if skipped:
+            self.logger.warning(
+                f"Skipped {skipped} unreadable line(s) in {self.history_file}; "
+                f"kept {len(records)} operation records"
+            )
+        self.logger.info(f"Loaded {len(self._history)} operation records from file")
+
+    def _migrate_legacy_history(self) -> None:
+        """Import a JSON-array history file from before the JSON-lines log."""
+        if not self.history_file:
+            return
+        legacy_file = self.history_file.with_suffix('.json')
+        if legacy_file == self.history_file or not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, 'r') as f:
                 history_data = json.load(f)
-            
-            with self._lock:
-                self._history = [
-                    OperationRecord.from_dict(record_data)
-                    for record_data in history_data
-                ]
-            
-            self.logger.info(f"Loaded {len(self._history)} operation records from file")
-            
+            records = [OperationRecord.from_dict(record_data)
+                       for record_data in history_data]
         except Exception as e:
-            self.logger.error(f"Error loading operation history: {e}", exc_info=True)
+            self.logger.warning(f"Could not migrate legacy operation history {legacy_file}: {e}")
+            return
 
+        with self._lock:
+            self._history = records[-self.max_records:]
+            self._compact()
+        try:
+            legacy_file.unlink()
+        except OSError:
+            pass
+        self.logger.info(f"Migrated {len(self._history)} operation records from {legacy_file.name}")
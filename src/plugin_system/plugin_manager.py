@@ -1211,6 +1211,52 @@ class PluginManager:
                 self.logger.exception("Error updating plugin %s: %s", plugin_id, exc)
                 self._record_update_failure(plugin_id, exc=exc)
     
+    def update_plugin_now(self, plugin_id: str, timeout: Optional[float] = None) -> bool:
+        """Run one plugin's update() on the calling thread, outside the schedule.
+
+        Used for the initial update at startup. The plugin is claimed the same
+        way a scheduled update claims it, so a scheduler tick that lands while
+        this is still running skips the plugin rather than queueing a second
+        update() behind it, and its lock is held so display() is skipped until
+        the data is in.
+
+        A failure is not stamped into plugin_last_update: the plugin stays
+        immediately due and the next scheduler tick retries it, instead of
+        waiting a full interval because the network was not up yet at boot.
+
+        Args:
+            plugin_id: Plugin to update.
+            timeout: Executor timeout in seconds (None = executor default).
+
+        Returns:
+            True if update() completed successfully.
+        """
+        plugin_instance = self.plugins.get(plugin_id)
+        if plugin_instance is None or not hasattr(plugin_instance, "update"):
+            return False
+        if not self._reserve_for_update(plugin_id):
+            return False
+
+        with self.get_plugin_lock(plugin_id):
+            try:
+                success = self.plugin_executor.execute_update(
+                    plugin_instance, plugin_id, timeout=timeout)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.logger.exception("Error updating plugin %s: %s", plugin_id, exc)
+                success = False
+
+            if success:
+                with self._plugin_last_update_lock:
+                    self.plugin_last_update[plugin_id] = time.time()
+                self._note_update_completed(plugin_id)
+                self.state_manager.record_update(plugin_id)
+                self.state_manager.set_state(plugin_id, PluginState.ENABLED)
+                if self.health_tracker:
+                    self.health_tracker.record_success(plugin_id)
+            else:
+                self._release_reservation(plugin_id)
+        return success
+
     def get_plugin_health_metrics(self) -> Dict[str, Any]:
         """
         Get health metrics for all plugins.
@@ -3,20 +3,24 @@ Plugin Resource Monitor
 
 Tracks resource usage (memory, CPU, execution time) for plugins.
 Provides resource limits and performance monitoring.
+
+Several plugins can be inside monitor_call() at once (initial updates run on
+a pool, and the render thread keeps drawing meanwhile), so process-wide
+figures cannot say which plugin used what. CPU is therefore measured with the
+calling thread's own CPU clock, and memory -- when sampling is enabled -- by
+tracemalloc snapshots filtered to allocations made from the plugin's files.
 """
 
+import inspect
+import os
 import time
 import logging
 import threading
-from typing import Dict, Optional, Any, Callable
+import tracemalloc
+from collections import deque
+from typing import Deque, Dict, Optional, Any, Callable
 from dataclasses import dataclass, field, fields
 
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-
 
 class ResourceLimitExceeded(Exception):
     """Raised when a plugin exceeds its resource limits."""
@@ -42,6 +46,12 @@ class ResourceMetrics:
     max_execution_time: float = 0.0
     min_execution_time: float = float('inf')
     last_update_time: float = field(default_factory=time.time)
+    cpu_time: float = 0.0
+    total_cpu_time: float = 0.0
+    execution_time_p50: float = 0.0
+    execution_time_p95: float = 0.0
+    cpu_time_p50: float = 0.0
+    cpu_time_p95: float = 0.0
     
     def update_average_execution_time(self):
         """Update average execution time."""
@@ -49,6 +59,21 @@ class ResourceMetrics:
             self.total_execution_time = self.total_execution_time / self.call_count
 
 
+#: How many recent calls the p50/p95 figures are taken over, per plugin.
+_PERCENTILE_WINDOW = 100
+
+#: Stack depth tracemalloc records when this module starts it. One frame (the
+#: default) would charge an allocation to whichever library line made it --
+#: json, PIL, requests -- never to the plugin that called the library.
+_TRACEMALLOC_FRAMES = 16
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sequence."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
 #: How often a plugin's metrics are written to the cache, in seconds.
 #:
 #: Persisting on every call meant a small file rewritten roughly nine times a
@@ -68,22 +93,28 @@ class PluginResourceMonitor:
     Monitors resource usage for plugins.
     
     Tracks:
-    - Memory usage (if psutil available)
-    - CPU usage (if psutil available)
+    - CPU time spent by the calling thread
+    - Memory held by allocations made from the plugin's files (sampled)
     - Execution time for update() and display() calls
-    - Call counts and statistics
+    - Call counts, statistics and rolling p50/p95
     """
     
-    def __init__(self, cache_manager, enable_monitoring: bool = True):
+    def __init__(self, cache_manager, enable_monitoring: bool = True,
+                 memory_sample_every: int = 0):
         """
         Initialize resource monitor.
         
         Args:
             cache_manager: Cache manager for persisting metrics
-            enable_monitoring: Enable resource monitoring (requires psutil)
+            enable_monitoring: Enable CPU and memory attribution
+            memory_sample_every: Take a tracemalloc snapshot after every Nth
+                call per plugin (0 disables memory attribution). Tracing
+                costs every allocation in the process a little, and a
+                snapshot copies every live trace, so keep N large.
         """
         self.cache_manager = cache_manager
-        self.enable_monitoring = enable_monitoring and PSUTIL_AVAILABLE
+        self.enable_monitoring = enable_monitoring
+        self.memory_sample_every = max(0, int(memory_sample_every or 0))
         self.logger = logging.getLogger(__name__)
 
         # Resource metrics per plugin
@@ -100,26 +131,15 @@ class PluginResourceMonitor:
         # Lock for thread-safe access
         self._lock = threading.Lock()
 
-        # Cache a single psutil.Process handle. Reusing the same handle is what
-        # lets cpu_percent() be read non-blocking (interval=None): psutil returns
-        # the utilisation since the *previous* call on that same object. Creating
-        # a fresh Process() per call would force interval-based sampling that
-        # blocks the caller — unacceptable on the display loop's update path.
-        self._process = None
-        if self.enable_monitoring:
-            try:
-                self._process = psutil.Process()
-                # Prime cpu_percent so the first real measurement returns a
-                # meaningful delta instead of 0.0.
-                self._process.cpu_percent(interval=None)
-            except Exception:  # pragma: no cover - psutil edge cases
-                self._process = None
-
-        if not PSUTIL_AVAILABLE and enable_monitoring:
-            self.logger.warning(
-                "psutil not available - resource monitoring will be limited to execution time only"
-            )
-    
+        # Recent per-call samples behind the p50/p95 figures; in memory only.
+        self._execution_samples: Dict[str, Deque[float]] = {}
+        self._cpu_samples: Dict[str, Deque[float]] = {}
+
+        # Directory each plugin's code lives in (for the tracemalloc filter),
+        # and how many calls remain until its next memory sample.
+        self._plugin_paths: Dict[str, Optional[str]] = {}
+        self._calls_until_sample: Dict[str, int] = {}
+
     def _metrics_from_cache(self, plugin_id: str, cached: Any) -> "ResourceMetrics":
         """Build metrics from a cached record, ignoring anything unrecognised.
 
@@ -236,34 +256,86 @@ class PluginResourceMonitor:
                     return None
             return self._limits[plugin_id]
     
-    def _get_process_memory_mb(self) -> float:
-        """Get current process memory usage in MB."""
-        if not self.enable_monitoring or self._process is None:
-            return 0.0
-        try:
-            return self._process.memory_info().rss / 1024 / 1024
-        except Exception:
-            return 0.0
+    def register_plugin_path(self, plugin_id: str, path: str) -> None:
+        """Set the directory whose allocations are charged to plugin_id.
 
-    def _get_process_cpu_percent(self) -> float:
-        """Get current process CPU usage percentage (non-blocking).
+        Optional: by default it is the directory of the file that defines the
+        monitored callable's class (or the callable itself).
+        """
+        with self._lock:
+            self._plugin_paths[plugin_id] = os.path.abspath(path)
+
+    def _plugin_path(self, plugin_id: str, func: Callable) -> Optional[str]:
+        """Directory of plugin_id's code, derived from func on first use."""
+        with self._lock:
+            if plugin_id in self._plugin_paths:
+                return self._plugin_paths[plugin_id]
+        # The instance's class first: update() may be inherited from a base
+        # class living elsewhere. The function's own code is the fallback for
+        # classes whose module is not in sys.modules.
+        owner = getattr(func, '__self__', None)
+        path = None
+        for target in ((type(owner),) if owner is not None else ()) + (func,):
+            try:
+                path = os.path.dirname(os.path.abspath(inspect.getfile(target)))
+                break
+            except (TypeError, OSError):
+                continue
+        with self._lock:
+            return self._plugin_paths.setdefault(plugin_id, path)
 
-        Reads cpu_percent(interval=None) against the cached process handle, so
-        it returns immediately with the utilisation observed since the previous
-        call rather than blocking to sample a fresh interval.
+    def _memory_sample_due(self, plugin_id: str) -> bool:
+        """Count a call against the sampling interval; True on every Nth."""
+        if not self.enable_monitoring or not self.memory_sample_every:
+            return False
+        with self._lock:
+            remaining = self._calls_until_sample.get(plugin_id, 1) - 1
+            if remaining > 0:
+                self._calls_until_sample[plugin_id] = remaining
+                return False
+            self._calls_until_sample[plugin_id] = self.memory_sample_every
+            return True
+
+    def _sample_plugin_memory_mb(self, plugin_path: str) -> float:
+        """MB currently held by allocations whose traceback passes through plugin_path.
+
+        Starts tracemalloc on first use, so the first sample only sees what
+        was allocated from then on (a plugin's per-call allocations, but not
+        state it built at load time).
         """
-        if not self.enable_monitoring or self._process is None:
-            return 0.0
-        try:
-            return self._process.cpu_percent(interval=None)
-        except Exception:
-            return 0.0
-    
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACEMALLOC_FRAMES)
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(True, os.path.join(plugin_path, '*'), all_frames=True),
+        ])
+        return sum(trace.size for trace in snapshot.traces) / 1024 / 1024
+
+    def _record_sample(self, plugin_id: str, metrics: ResourceMetrics,
+                       execution_time: float, cpu_time: float) -> None:
+        """Fold one call into the rolling windows. Caller holds self._lock."""
+        executions = self._execution_samples.setdefault(
+            plugin_id, deque(maxlen=_PERCENTILE_WINDOW))
+        cpu_times = self._cpu_samples.setdefault(
+            plugin_id, deque(maxlen=_PERCENTILE_WINDOW))
+        executions.append(execution_time)
+        cpu_times.append(cpu_time)
+        ordered = sorted(executions)
+        metrics.execution_time_p50 = _percentile(ordered, 0.50)
+        metrics.execution_time_p95 = _percentile(ordered, 0.95)
+        ordered = sorted(cpu_times)
+        metrics.cpu_time_p50 = _percentile(ordered, 0.50)
+        metrics.cpu_time_p95 = _percentile(ordered, 0.95)
+
     def monitor_call(self, plugin_id: str, func: Callable, *args, **kwargs) -> Any:
         """
         Monitor a plugin method call.
         
         Tracks execution time and resource usage, enforces limits.
+
+        CPU is the calling thread's CPU time over the call (time.thread_time),
+        so concurrent plugins and the render thread are not charged to this
+        one. Threads the plugin starts itself are not counted. cpu_percent is
+        that CPU time as a share of the call's wall time.
         
         Args:
             plugin_id: Plugin identifier
@@ -280,9 +352,9 @@ class PluginResourceMonitor:
         metrics = self.get_metrics(plugin_id)
         limits = self.get_limits(plugin_id)
         
-        # Record start time and memory
+        # Record start time and this thread's CPU clock
         start_time = time.time()
-        start_memory = self._get_process_memory_mb()
+        start_cpu = time.thread_time()
         
         try:
             # Execute the function
@@ -290,6 +362,14 @@ class PluginResourceMonitor:
             
             # Calculate execution time
             execution_time = time.time() - start_time
+            cpu_time = time.thread_time() - start_cpu
+
+            # Outside the lock: a snapshot walks every live allocation.
+            memory_mb = None
+            if self._memory_sample_due(plugin_id):
+                plugin_path = self._plugin_path(plugin_id, func)
+                if plugin_path:
+                    memory_mb = self._sample_plugin_memory_mb(plugin_path)
             
             # Update metrics
             with self._lock:
@@ -303,12 +383,15 @@ class PluginResourceMonitor:
                     metrics.min_execution_time = min(metrics.min_execution_time, execution_time)
                 metrics.last_update_time = time.time()
                 
-                # Update memory and CPU if monitoring enabled
+                # Update CPU and memory if monitoring enabled
                 if self.enable_monitoring:
-                    end_memory = self._get_process_memory_mb()
-                    metrics.memory_mb = max(metrics.memory_mb, end_memory - start_memory)
-                    # CPU is harder to measure per-call, so we track it separately
-                    metrics.cpu_percent = self._get_process_cpu_percent()
+                    metrics.cpu_time = cpu_time
+                    metrics.total_cpu_time += cpu_time
+                    metrics.cpu_percent = (min(100.0, cpu_time / execution_time * 100)
+                                           if execution_time > 0 else 0.0)
+                    self._record_sample(plugin_id, metrics, execution_time, cpu_time)
+                    if memory_mb is not None:
+                        metrics.memory_mb = memory_mb
                 
                 # Persist metrics, at most once per interval per plugin.
                 self._persist_metrics(plugin_id, metrics)
@@ -397,7 +480,14 @@ class PluginResourceMonitor:
             'min_execution_time': round(metrics.min_execution_time if metrics.min_execution_time != float('inf') else 0.0, 3),
             'max_execution_time': round(metrics.max_execution_time, 3),
             'call_count': metrics.call_count,
-            'last_update_time': metrics.last_update_time
+            'last_update_time': metrics.last_update_time,
+            'cpu_time': round(metrics.cpu_time, 4),
+            'avg_cpu_time': round(metrics.total_cpu_time / metrics.call_count
+                                  if metrics.call_count else 0.0, 4),
+            'execution_time_p50': round(metrics.execution_time_p50, 3),
+            'execution_time_p95': round(metrics.execution_time_p95, 3),
+            'cpu_time_p50': round(metrics.cpu_time_p50, 4),
+            'cpu_time_p95': round(metrics.cpu_time_p95, 4),
         }
         
         if limits:
@@ -464,6 +554,12 @@ class PluginResourceMonitor:
                                    if metrics.min_execution_time != float('inf')
                                    else 0.0),
             'last_update_time': metrics.last_update_time,
+            'cpu_time': metrics.cpu_time,
+            'total_cpu_time': metrics.total_cpu_time,
+            'execution_time_p50': metrics.execution_time_p50,
+            'execution_time_p95': metrics.execution_time_p95,
+            'cpu_time_p50': metrics.cpu_time_p50,
+            'cpu_time_p95': metrics.cpu_time_p95,
         })
         # Only after the write lands. Marking it first would mean a failed
         # set() bought the next interval's silence without leaving a snapshot.
@@ -474,6 +570,8 @@ class PluginResourceMonitor:
         with self._lock:
             if plugin_id in self._metrics:
                 self._metrics[plugin_id] = ResourceMetrics()
+                self._execution_samples.pop(plugin_id, None)
+                self._cpu_samples.pop(plugin_id, None)
                 cache_key = self._get_metrics_key(plugin_id)
                 self.cache_manager.delete(cache_key)
                 # Let the next call persist immediately rather than leaving the
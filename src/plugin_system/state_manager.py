@@ -14,6 +14,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 
 from src.logging_config import get_logger
+from src.plugin_system.debounced_writer import DebouncedWriter, atomic_write_json
 
 
 class PluginStateStatus(Enum):
@@ -76,7 +77,7 @@ class PluginStateManager:
     Provides:
     - Single source of truth for plugin state
     - State change events/notifications
-    - State persistence
+    - State persistence (coalesced and atomic)
     - State versioning
     """
     
@@ -84,7 +85,8 @@ class PluginStateManager:
         self,
         state_file: Optional[str] = None,
         auto_save: bool = True,
-        lazy_load: bool = False
+        lazy_load: bool = False,
+        flush_interval: float = 0.5
     ):
         """
         Initialize state manager.
@@ -93,6 +95,9 @@ class PluginStateManager:
             state_file: Path to file for persisting state
             auto_save: Whether to automatically save state on changes
             lazy_load: If True, defer loading state file until first access
+            flush_interval: Seconds to coalesce changes before writing the
+                state file (0 writes on every change). Call flush() to
+                write immediately.
         """
         self.logger = get_logger(__name__)
         self.state_file = Path(state_file) if state_file else None
@@ -109,6 +114,10 @@ class PluginStateManager:
         
         # Threading
         self._lock = threading.RLock()
+
+        # Changes mark the state dirty; the writer persists them in batches.
+        self._writer = DebouncedWriter(self._write_state_file, flush_interval,
+                                       name='plugin state')
         
         # Load state from file if it exists (unless lazy loading)
         if not self._lazy_load and self.state_file and self.state_file.exists():
@@ -371,37 +380,40 @@ class PluginStateManager:
                 )
     
     def _save_state(self) -> None:
-        """Save state to file."""
+        """Schedule the state file to be written (see flush_interval)."""
         if not self.state_file:
             return
-        
-        try:
-            with self._lock:
-                # Convert states to dicts
-                states_data = {
-                    plugin_id: state.to_dict()
-                    for plugin_id, state in self._states.items()
-                }
-                
-                state_data = {
-                    'version': self._state_version,
-                    'states': states_data,
-                    'last_updated': datetime.now().isoformat()
-                }
-            
-            # Ensure directory exists with proper permissions
-            from src.common.permission_utils import (
-                ensure_directory_permissions,
-                get_config_dir_mode
-            )
-            ensure_directory_permissions(self.state_file.parent, get_config_dir_mode())
-            
-            # Write to file
-            with open(self.state_file, 'w') as f:
-                json.dump(state_data, f, indent=2)
-            
-        except Exception as e:
-            self.logger.error(f"Error saving plugin state: {e}", exc_info=True)
+        self._writer.mark_dirty()
+
+    def flush(self) -> bool:
+        """Write pending state changes now. Returns True if a write happened."""
+        return self._writer.flush()
+
+    def _write_state_file(self) -> None:
+        """Write the current state to file atomically."""
+        if not self.state_file:
+            return
+        with self._lock:
+            # Convert states to dicts
+            states_data = {
+                plugin_id: state.to_dict()
+                for plugin_id, state in self._states.items()
+            }
+
+            state_data = {
+                'version': self._state_version,
+                'states': states_data,
+                'last_updated': datetime.now().isoformat()
+            }
+
+        # Ensure directory exists with proper permissions
+        from src.common.permission_utils import (
+            ensure_directory_permissions,
+            get_config_dir_mode
+        )
+        ensure_directory_permissions(self.state_file.parent, get_config_dir_mode())
+
+        atomic_write_json(self.state_file, state_data)
     
     def _load_state(self) -> None:
         """Load state from file."""
@@ -411,7 +423,25 @@ class PluginStateManager:
         try:
             with open(self.state_file, 'r') as f:
                 state_data = json.load(f)
-            
+        except ValueError as e:
+            # Writes are atomic now, but a file written before they were (or
+            # damaged on disk) can still be truncated. Keep it for inspection
+            # and start empty; reconciliation rebuilds state from config.
+            corrupt_path = self.state_file.with_name(self.state_file.name + '.corrupt')
+            self.logger.error(
+                f"Plugin state file {self.state_file} is corrupt ({e}); "
+                f"moved to {corrupt_path.name} and starting with empty state"
+            )
+            try:
+                self.state_file.replace(corrupt_path)
+            except OSError:
+                pass
+            return
+        except OSError as e:
+            self.logger.error(f"Error reading plugin state: {e}", exc_info=True)
+            return
+
+        try:
             with self._lock:
                 # Load state version
                 self._state_version = state_data.get('version', 1)
@@ -0,0 +1,140 @@
+"""
+Startup Import Profiler
+
+Records how long each module takes to import, so a slow start can be traced to
+the imports responsible from the service log -- without re-running the display
+under ``python -X importtime`` and reading its stderr by hand.
+
+Enable with ``LEDMATRIX_PROFILE_IMPORTS=true`` (or ``run.py --profile-imports``).
+When disabled nothing is installed and every function here is a no-op.
+
+The profiler is a meta path finder placed ahead of the standard ones. It does
+not find anything itself: it asks the remaining finders for the spec and wraps
+the loader's ``exec_module`` with a timer. Times are tracked per thread, so
+plugins loaded in parallel do not charge each other for their imports.
+"""
+
+import os
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+ENV_VAR = 'LEDMATRIX_PROFILE_IMPORTS'
+
+
+class ImportProfiler(MetaPathFinder):
+    """Meta path finder that times module execution."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # module name -> (self seconds, cumulative seconds)
+        self._records: Dict[str, Tuple[float, float]] = {}
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            self._wrap_loader(fullname, spec.loader)
+            return spec
+        return None
+
+    def _wrap_loader(self, fullname: str, loader: Any) -> None:
+        # Built-in and frozen importers are shared classes, not per-module
+        # instances, and are cheap enough not to matter.
+        if loader is None or isinstance(loader, type):
+            return
+        exec_module = getattr(loader, 'exec_module', None)
+        if exec_module is None:
+            return
+
+        def timed_exec_module(module: Any) -> None:
+            stack = self._stack()
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                with self._lock:
+                    self._records[fullname] = (elapsed - children, elapsed)
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            pass
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def records(self) -> Dict[str, Tuple[float, float]]:
+        """module name -> (self seconds, cumulative seconds)."""
+        with self._lock:
+            return dict(self._records)
+
+    def report(self, top: int = 20) -> List[Tuple[str, float, float]]:
+        """The `top` slowest imports by cumulative time, slowest first."""
+        rows = [(name, own, total) for name, (own, total) in self.records().items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:top]
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def is_enabled_by_env() -> bool:
+    return os.environ.get(ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def enable_import_profiling() -> ImportProfiler:
+    """Install the profiler at the front of sys.meta_path (idempotent)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        sys.meta_path.insert(0, _profiler)
+    return _profiler
+
+
+def disable_import_profiling() -> None:
+    """Remove the profiler; records gathered so far are discarded."""
+    global _profiler
+    if _profiler is not None:
+        try:
+            sys.meta_path.remove(_profiler)
+        except ValueError:
+            pass
+        _profiler = None
+
+
+def get_import_profiler() -> Optional[ImportProfiler]:
+    return _profiler
+
+
+def log_import_profile(stage: str, top: int = 20) -> None:
+    """Log the slowest imports so far, tagged with the startup stage."""
+    if _profiler is None:
+        return
+    records = _profiler.records()
+    # Self times add up to the time spent importing; cumulative ones would
+    # count every nested module again for each of its parents.
+    total = sum(own for own, _ in records.values())
+    logger.info("Import profile (%s): %d modules, %.3fs total",
+                stage, len(records), total)
+    for name, own, cumulative in _profiler.report(top):
+        logger.info("  %8.1fms cumulative %8.1fms self  %s",
+                    cumulative * 1000, own * 1000, name)
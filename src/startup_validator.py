@@ -3,20 +3,35 @@ Startup Validator
 
 Validates system configuration, plugins, and dependencies on startup.
 Fails fast with clear error messages to prevent runtime issues.
+
+Results can be remembered across restarts: given a results_cache_path, each
+check's outcome is stored alongside a fingerprint of the inputs it looked at
+(config file hashes, cache directory ownership, plugin directory mtimes,
+systemd unit stats). On the next start a check whose fingerprint is unchanged
+replays its stored warnings instead of running again.
 """
 
+import hashlib
+import json
 import os
-from typing import Any, List, Optional, Tuple
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from src.exceptions import ConfigError, PluginError, CacheError
 from src.logging_config import get_logger
 
 
+#: Bump when a check's logic changes so stored results from the old logic
+#: are not replayed.
+_RESULTS_CACHE_VERSION = 1
+
+
 class StartupValidator:
     """Validates system state on startup."""
     
     def __init__(self, config_manager: Any, plugin_manager: Optional[Any] = None,
-                 cache_manager: Optional[Any] = None) -> None:
+                 cache_manager: Optional[Any] = None,
+                 results_cache_path: Optional[str] = None) -> None:
         """
         Initialize the startup validator.
 
@@ -27,14 +42,23 @@ class StartupValidator:
                 Pass it. Without one this validator builds its own just to read
                 a directory path, which reports on a cache the app does not
                 use and leaves behind a cleanup thread that nothing stops --
-                validation runs twice per startup, so that was two of them.
+                validation used to run twice per startup, so that was two of them.
+            results_cache_path: Optional JSON file for remembering per-check
+                results between restarts. None disables the cache and every
+                check runs every time.
         """
         self.config_manager = config_manager
         self.plugin_manager = plugin_manager
         self.cache_manager = cache_manager
+        self.results_cache_path = Path(results_cache_path) if results_cache_path else None
         self.logger = get_logger(__name__)
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        #: Seconds spent per check on the last validate_all(); a replayed check
+        #: records the (small) cost of computing its fingerprint.
+        self.timings: Dict[str, float] = {}
+        #: Checks whose stored result was replayed on the last validate_all().
+        self.cached_checks: List[str] = []
     
     def validate_all(self) -> Tuple[bool, List[str], List[str]]:
         """
@@ -49,22 +73,48 @@ class StartupValidator:
         # duplicated every message.
         self.errors = []
         self.warnings = []
+        self.timings = {}
+        self.cached_checks = []
 
-        # Validate configuration
-        self._validate_config()
-        
-        # Validate cache directory
-        self._validate_cache_directory()
-        
-        # Validate display configuration
-        self._validate_display_config()
-        
-        # Validate plugins if plugin manager is available
-        if self.plugin_manager:
-            self._validate_plugins()
+        stored = self._load_results_cache()
+        results: Dict[str, Dict[str, Any]] = {}
 
-        # Warn when the running systemd unit no longer matches the repo's
-        self._validate_systemd_units()
+        for name, check, fingerprint in self._checks():
+            check_start = time.perf_counter()
+            try:
+                key = fingerprint()
+            except Exception as e:
+                self.logger.debug("Could not fingerprint startup check %s: %s", name, e)
+                key = None
+
+            previous = stored.get(name)
+            if key is not None and previous and previous.get('fingerprint') == key:
+                self.errors.extend(previous.get('errors', []))
+                self.warnings.extend(previous.get('warnings', []))
+                self.cached_checks.append(name)
+                results[name] = previous
+            else:
+                errors_before, warnings_before = len(self.errors), len(self.warnings)
+                check()
+                new_errors = self.errors[errors_before:]
+                # A failing check is always re-run: errors are usually transient
+                # (a directory not mounted yet) or about to be fixed.
+                if key is not None and not new_errors:
+                    results[name] = {
+                        'fingerprint': key,
+                        'errors': [],
+                        'warnings': self.warnings[warnings_before:],
+                    }
+            self.timings[name] = time.perf_counter() - check_start
+
+        self._save_results_cache(results)
+        self.logger.info(
+            "Startup validation timings: %s",
+            ", ".join(
+                f"{name}={elapsed * 1000:.1f}ms" + (" (cached)" if name in self.cached_checks else "")
+                for name, elapsed in self.timings.items()
+            ),
+        )
         
         is_valid = len(self.errors) == 0
         
@@ -77,6 +127,118 @@ class StartupValidator:
         
         return (is_valid, self.errors.copy(), self.warnings.copy())
     
+    def _checks(self) -> List[Tuple[str, Callable[[], None], Callable[[], Optional[str]]]]:
+        """(name, check, fingerprint) for every check this run should perform.
+
+        A fingerprint returning None means "inputs unknown" and forces the
+        check to run.
+        """
+        checks = [
+            ('config', self._validate_config, self._config_fingerprint),
+            ('cache_directory', self._validate_cache_directory, self._cache_directory_fingerprint),
+            ('display', self._validate_display_config, self._config_fingerprint),
+        ]
+        # Validate plugins if plugin manager is available
+        if self.plugin_manager:
+            checks.append(('plugins', self._validate_plugins, self._plugins_fingerprint))
+        # Warn when the running systemd unit no longer matches the repo's
+        checks.append(('systemd_units', self._validate_systemd_units, self._systemd_fingerprint))
+        return checks
+
+    @staticmethod
+    def _digest(parts: List[Any]) -> str:
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _config_fingerprint(self) -> Optional[str]:
+        """Content hash of config, secrets and template files."""
+        parts: List[Any] = []
+        for attr in ('config_path', 'secrets_path', 'template_path'):
+            path = getattr(self.config_manager, attr, None)
+            if not isinstance(path, (str, os.PathLike)):
+                return None
+            try:
+                with open(path, 'rb') as f:
+                    parts.append([str(path), hashlib.sha256(f.read()).hexdigest()])
+            except FileNotFoundError:
+                parts.append([str(path), None])
+        return self._digest(parts)
+
+    def _cache_directory_fingerprint(self) -> Optional[str]:
+        """Cache directory path, ownership and mode, plus who is asking."""
+        if self.cache_manager is None:
+            # Building a CacheManager just to fingerprint it is the cost the
+            # cache is meant to avoid.
+            return None
+        cache_dir = self.cache_manager.get_cache_dir()
+        if not isinstance(cache_dir, (str, os.PathLike)):
+            return None
+        st = os.stat(cache_dir)
+        return self._digest([str(cache_dir), st.st_ino, st.st_mode, st.st_uid, st.st_gid,
+                             os.geteuid() if hasattr(os, 'geteuid') else None])
+
+    def _plugins_fingerprint(self) -> Optional[str]:
+        """Config hash plus the plugin directory listing with mtimes."""
+        config_key = self._config_fingerprint()
+        plugins_dir = getattr(self.plugin_manager, 'plugins_dir', None)
+        if config_key is None or not isinstance(plugins_dir, (str, os.PathLike)):
+            return None
+        entries = []
+        with os.scandir(plugins_dir) as it:
+            for entry in it:
+                try:
+                    entries.append([entry.name, entry.stat().st_mtime_ns])
+                except OSError:
+                    entries.append([entry.name, None])
+        entries.sort()
+        return self._digest([config_key, str(plugins_dir), entries])
+
+    def _systemd_fingerprint(self) -> Optional[str]:
+        """(mtime_ns, size) of each unit template and its installed copy."""
+        project_root = Path(__file__).resolve().parent.parent
+        parts: List[Any] = [str(project_root)]
+        for template_rel, installed_path in self._UNITS:
+            for path in (project_root / template_rel, Path(installed_path)):
+                try:
+                    st = path.stat()
+                    parts.append([str(path), st.st_mtime_ns, st.st_size])
+                except OSError:
+                    parts.append([str(path), None])
+        return self._digest(parts)
+
+    def _load_results_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Stored per-check results, or {} when absent, stale or unreadable."""
+        if self.results_cache_path is None:
+            return {}
+        try:
+            with open(self.results_cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.debug("Ignoring unreadable startup validation cache: %s", e)
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _RESULTS_CACHE_VERSION:
+            return {}
+        checks = data.get('checks')
+        return checks if isinstance(checks, dict) else {}
+
+    def _save_results_cache(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the stored results; failures only cost a re-run."""
+        if self.results_cache_path is None:
+            return
+        tmp_path = self.results_cache_path.with_suffix(self.results_cache_path.suffix + '.tmp')
+        try:
+            self.results_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _RESULTS_CACHE_VERSION, 'checks': results}, f)
+            os.replace(tmp_path, self.results_cache_path)
+        except OSError as e:
+            self.logger.debug("Could not save startup validation cache: %s", e)
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     #: Units this project installs, and where each is installed to.
     _UNITS = (
         ("systemd/ledmatrix.service", "/etc/systemd/system/ledmatrix.service"),
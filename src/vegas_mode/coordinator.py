@@ -22,6 +22,7 @@ from src.vegas_mode.plugin_adapter import PluginAdapter
 from src.vegas_mode.stream_manager import StreamManager
 from src.vegas_mode.render_pipeline import RenderPipeline
 from src.plugin_system.base_plugin import VegasDisplayMode
+from src.frame_timing import LABEL_VEGAS, get_frame_recorder
 
 if TYPE_CHECKING:
     from src.plugin_system.plugin_manager import PluginManager
@@ -404,6 +405,7 @@ class VegasModeCoordinator:
         # viewer actually notices is the worst frame, so track that too.
         frame_worst = 0.0
         frame_times: List[float] = []
+        frame_recorder = get_frame_recorder()
 
         logger.info("Starting Vegas iteration for %.1fs", duration)
 
@@ -443,6 +445,7 @@ class VegasModeCoordinator:
             if frame_elapsed > frame_worst:
                 frame_worst = frame_elapsed
             frame_times.append(frame_elapsed)
+            frame_recorder.record(LABEL_VEGAS, frame_elapsed)
 
             # Increment frame count and check for interrupt periodically
             frame_count += 1
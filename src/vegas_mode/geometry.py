@@ -30,6 +30,17 @@ DEFAULT_INK_THRESHOLD = 10
 # A window counts as "dead" when this fraction of its columns carry no ink.
 DEFAULT_DEAD_WINDOW_RATIO = 0.95
 
+# Blank-frame check for captured plugin output: a channel sample at or above
+# BLANK_CHANNEL_THRESHOLD is "bright", and a frame whose bright samples are
+# under BLANK_MAX_BRIGHT_RATIO of all samples (0.5%) is treated as blank.
+BLANK_CHANNEL_THRESHOLD = 15
+BLANK_MAX_BRIGHT_RATIO = 0.005
+
+
+def _rgb_array(img: Image.Image) -> np.ndarray:
+    """Zero-copy-where-possible (height, width, 3) view of an image."""
+    return np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+
 
 def column_has_ink(img: Image.Image, threshold: int = DEFAULT_INK_THRESHOLD) -> np.ndarray:
     """
@@ -43,7 +54,7 @@ def column_has_ink(img: Image.Image, threshold: int = DEFAULT_INK_THRESHOLD) ->
     Returns:
         Bool array of shape (width,)
     """
-    arr = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+    arr = _rgb_array(img)
     if arr.ndim != 3:
         # Degenerate/empty image — treat every column as blank.
         return np.zeros(img.width, dtype=bool)
@@ -72,6 +83,67 @@ def content_bounds(
     return first, last
 
 
+def has_ink(img: Image.Image, threshold: int = DEFAULT_INK_THRESHOLD) -> bool:
+    """True if any channel of any pixel exceeds ``threshold``.
+
+    ``has_ink(img, threshold=0)`` is False only for solid black.
+    """
+    arr = _rgb_array(img)
+    return arr.size > 0 and bool((arr > threshold).any())
+
+
+def bright_ratio(img: Image.Image, threshold: int = BLANK_CHANNEL_THRESHOLD) -> float:
+    """
+    Fraction of channel samples at or above ``threshold``.
+
+    Counts R, G and B separately, so a pure-red pixel contributes one bright
+    sample out of three. This is the measure the histogram-based blank check
+    used (bins ``threshold..255`` of each channel, over ``width*height*3``),
+    as one numpy reduction.
+
+    Args:
+        img: Image to measure (converted to RGB internally)
+        threshold: Minimum channel value that counts as bright
+
+    Returns:
+        Ratio in [0, 1]; 0.0 for an empty image
+    """
+    arr = _rgb_array(img)
+    if arr.size == 0:
+        return 0.0
+    return np.count_nonzero(arr >= threshold) / arr.size
+
+
+def is_blank(
+    img: Image.Image,
+    threshold: int = BLANK_CHANNEL_THRESHOLD,
+    max_ratio: float = BLANK_MAX_BRIGHT_RATIO,
+) -> bool:
+    """
+    True when fewer than ``max_ratio`` of the channel samples are bright.
+
+    Same answer as ``bright_ratio(img, threshold) < max_ratio``. A frame
+    whose brightest sample is under ``threshold`` -- the usual blank capture
+    -- is settled by ``max()``, which is several times cheaper than the
+    compare-and-count. Scanning wide strips in column blocks (or a strided
+    sample) to stop early measured slower than the single reduction: on a
+    2000x32 segment the count is ~35us and the PIL -> numpy copy ~70us, so
+    there is nothing left for an early exit to save.
+
+    Args:
+        img: Image to check
+        threshold: Minimum channel value that counts as bright
+        max_ratio: Bright-sample fraction below which the image is blank
+
+    Returns:
+        True if the image is blank
+    """
+    arr = _rgb_array(img)
+    if arr.size == 0 or arr.max() < threshold:
+        return True
+    return np.count_nonzero(arr >= threshold) < max_ratio * arr.size
+
+
 class TrimResult(NamedTuple):
     """Outcome of a ``trim_to_content`` call."""
 
@@ -13,7 +13,11 @@ from typing import Optional, List, Any, Tuple, Union, TYPE_CHECKING
 from PIL import Image
 
 from src.vegas_mode.geometry import (
+    BLANK_MAX_BRIGHT_RATIO,
     blank_runs,
+    bright_ratio,
+    has_ink,
+    is_blank,
     separation_gap,
     trim_to_content,
 )
@@ -23,6 +27,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Content paths whose images may still belong to the plugin (its own
+# get_vegas_content() result or its ScrollHelper's cached_image), which it is
+# free to redraw in place. Only these are copied before caching.
+_BORROWED_SOURCES = ('native', 'scroll_helper')
+
+
+def _shared_view(img: Image.Image) -> Image.Image:
+    """
+    A new Image object sharing img's pixel buffer, marked read-only.
+
+    Pillow copies a read-only image's buffer before any in-place write
+    (paste, putpixel, ImageDraw), so the view behaves like a private copy
+    while costing nothing until someone actually writes to it. Direct pixel
+    access via load() raises instead of writing through.
+
+    Image._new() is private Pillow API (there through 12.x, pinned by
+    test_vegas_plugin_adapter.TestSharedView); without it the view is a
+    plain copy, which costs memory but is always safe.
+    """
+    if not hasattr(img, '_new'):
+        return img.copy()
+    img.load()
+    view = img._new(img.im)
+    view.readonly = 1
+    return view
+
 
 class PluginAdapter:
     """
@@ -98,13 +128,15 @@ class PluginAdapter:
         Args:
             plugin: Plugin instance to get content from
             plugin_id: Plugin identifier for logging
-            offscreen_only: Skip every path that touches the shared display
-                canvas, for callers running off the render thread. The canvas
-                and the matrix proxy are process-wide mutable state, so
+            offscreen_only: The caller is off the render thread. The shared
+                canvas and matrix proxy are process-wide mutable state, so
                 narrowing or capturing through them from another thread would
-                corrupt the frame the render loop is pushing. Returns None when
-                the plugin can only be served that way, leaving the caller to
-                fetch it on the render thread.
+                corrupt the frame the render loop is pushing. When the display
+                manager offers shadow_canvas(), every path runs inside one (a
+                canvas private to this thread) and nothing needs deferring.
+                Otherwise canvas-bound paths are skipped and None is returned
+                for plugins that need them, leaving the caller to fetch those
+                on the render thread.
 
         Returns:
             List of PIL Images representing plugin content, or None if no content
@@ -124,6 +156,12 @@ class PluginAdapter:
             )
             return cached
 
+        if offscreen_only:
+            shadow_canvas = getattr(self.display_manager, 'shadow_canvas', None)
+            if shadow_canvas is not None:
+                with shadow_canvas():
+                    return self.get_content(plugin, plugin_id)
+
         # Try native Vegas content method first
         has_native = hasattr(plugin, 'get_vegas_content')
         logger.debug("[%s] Has get_vegas_content: %s", plugin_id, has_native)
@@ -199,7 +237,8 @@ class PluginAdapter:
             source: Which path produced the content, for logging
 
         Returns:
-            Trimmed image list, or None if nothing worth showing remains
+            Trimmed image list (read-only views of the cached images), or
+            None if nothing worth showing remains
         """
         if not self.config.auto_trim:
             # Trimming is off, but the width budget is a separate concern —
@@ -207,8 +246,7 @@ class PluginAdapter:
             # panel for minutes. Skipping it here previously let a 14,848px
             # segment through untouched.
             kept = self._apply_width_budget(list(images), plugin_id, plugin)
-            self._cache_content(plugin_id, kept)
-            return kept
+            return self._cache_content(plugin_id, kept, self._borrowed(images, source))
 
         original_width = sum(img.width for img in images)
         kept: List[Image.Image] = []
@@ -253,8 +291,7 @@ class PluginAdapter:
 
         kept = self._apply_width_budget(kept, plugin_id, plugin)
 
-        self._cache_content(plugin_id, kept)
-        return kept
+        return self._cache_content(plugin_id, kept, self._borrowed(images, source))
 
     def _capture(self):
         """
@@ -870,8 +907,10 @@ class PluginAdapter:
                 plugin_id, cached_image.width, cached_image.height, cached_image.mode
             )
 
-            # Copy the image to prevent modification
-            img = cached_image.copy()
+            # Not copied here: the padding strip and height fix below produce
+            # new images anyway, and if neither applies _cache_content copies
+            # this one (it is the plugin's, see _BORROWED_SOURCES).
+            img = cached_image
 
             # Plugins that build their own ticker image via this shared
             # ScrollHelper's create_scrolling_image() get a solid-black
@@ -933,7 +972,7 @@ class PluginAdapter:
         margins) are left untouched.
 
         Args:
-            img: Captured scroll_helper.cached_image (already copied)
+            img: scroll_helper.cached_image (not modified; crops are new images)
             scroll_helper: The plugin's ScrollHelper instance
             plugin_id: Plugin identifier for logging
 
@@ -945,7 +984,7 @@ class PluginAdapter:
             return img
 
         def is_solid_black(strip: Image.Image) -> bool:
-            return strip.convert('RGB').getextrema() == ((0, 0), (0, 0), (0, 0))
+            return not has_ink(strip, threshold=0)
 
         left = pad_width if is_solid_black(img.crop((0, 0, pad_width, img.height))) else 0
         right = (
@@ -1185,8 +1224,9 @@ class PluginAdapter:
         """
         Check if an image is essentially blank (all black or nearly so).
 
-        Uses histogram-based detection which is more reliable than
-        point sampling for content that may be positioned anywhere.
+        Counts bright channel samples over the whole frame, which is more
+        reliable than point sampling for content that may be positioned
+        anywhere. See geometry.bright_ratio / geometry.is_blank.
 
         Args:
             img: Image to check
@@ -1195,35 +1235,13 @@ class PluginAdapter:
         Returns:
             True if image is blank, or tuple (is_blank, bright_ratio) if return_ratio=True
         """
-        # Convert to RGB for consistent checking
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-
-        # Use histogram to check for any non-black content
-        # This is more reliable than point sampling
-        histogram = img.histogram()
-
-        # RGB histogram: 256 values per channel
-        # Check if there's any significant brightness in any channel
-        total_bright_pixels = 0
-        threshold = 15  # Minimum brightness to count as "content"
-
-        for channel_offset in [0, 256, 512]:  # R, G, B
-            for brightness in range(threshold, 256):
-                total_bright_pixels += histogram[channel_offset + brightness]
-
-        # If less than 0.5% of pixels have any brightness, consider blank
-        total_pixels = img.width * img.height
-        bright_ratio = total_bright_pixels / (total_pixels * 3)  # Normalize across channels
-
-        is_blank = bright_ratio < 0.005  # Less than 0.5% bright pixels
-
         if return_ratio:
-            return is_blank, bright_ratio
-        return is_blank
+            ratio = bright_ratio(img)
+            return ratio < BLANK_MAX_BRIGHT_RATIO, ratio
+        return is_blank(img)
 
     def _get_cached(self, plugin_id: str) -> Optional[List[Image.Image]]:
-        """Get cached content if still valid."""
+        """Get cached content if still valid, as fresh read-only views."""
         with self._cache_lock:
             if plugin_id not in self._content_cache:
                 return None
@@ -1233,18 +1251,51 @@ class PluginAdapter:
                 del self._content_cache[plugin_id]
                 return None
 
-            return content
+        return [_shared_view(img) for img in content]
+
+    @staticmethod
+    def _borrowed(images: List[Image.Image], source: str) -> frozenset:
+        """ids of the images in a fetch result that the plugin may still own."""
+        if source not in _BORROWED_SOURCES:
+            return frozenset()
+        return frozenset(id(img) for img in images)
+
+    def _cache_content(
+        self, plugin_id: str, content: List[Image.Image],
+        borrowed: frozenset = frozenset()
+    ) -> List[Image.Image]:
+        """
+        Cache content for a plugin, shared by reference.
+
+        Every segment image used to be deep-copied on the way in, and the
+        first caller kept the originals — two copies of every strip, three
+        once a compose step copied defensively. Now the cache holds the one
+        copy and every caller, including this one, gets read-only views of
+        it (see _shared_view): composing only reads them, and a consumer that
+        does draw on one gets a private copy from Pillow at that point.
+
+        Images still owned by the plugin (``borrowed``) are the exception;
+        the plugin can redraw those in place, so they are copied once here.
 
-    def _cache_content(self, plugin_id: str, content: List[Image.Image]) -> None:
-        """Cache content for a plugin."""
-        # Make copies to prevent mutation (done outside lock to minimize hold time)
-        cached_content = [img.copy() for img in content]
+        Args:
+            plugin_id: Plugin identifier
+            content: Images to cache; adapter-owned ones are not copied
+            borrowed: ids of images in ``content`` that belong to the plugin
+
+        Returns:
+            Read-only views of the cached images, for the caller to use
+        """
+        cached_content = tuple(
+            img.copy() if id(img) in borrowed else img for img in content
+        )
 
         with self._cache_lock:
             # Periodic cleanup of expired entries to prevent memory leak
             self._cleanup_expired_cache_locked()
             self._content_cache[plugin_id] = (time.time(), cached_content)
 
+        return [_shared_view(img) for img in cached_content]
+
     def _cleanup_expired_cache_locked(self) -> None:
         """Remove expired entries from cache. Must be called with _cache_lock held."""
         current_time = time.time()
@@ -243,10 +243,11 @@ class RenderPipeline:
         in, so by the time the strip needs extending the content is already sat
         waiting.
 
-        Only paths that avoid the shared display canvas run here; anything
-        needing it is marked and picked up on the render thread, where it is
-        safe. Those are the cheap ones — display capture measured 12-14ms
-        against seconds for the native renders.
+        Display capture and scroll-content generation run here too, on a
+        shadow canvas private to this thread (DisplayManager.shadow_canvas),
+        so the live frame is never touched. Only with a display manager that
+        has no shadow canvases are canvas-bound plugins marked and picked up
+        on the render thread instead (see drain_deferred).
         """
         if not self.config.continuous_scroll:
             return
@@ -283,9 +284,10 @@ class RenderPipeline:
         """
         Fetch one queued canvas-bound plugin and append it to the strip.
 
-        Called once per frame. These plugins cannot be prepared off the render
-        thread — display capture and scroll-content generation both need the
-        shared canvas — so each costs roughly 290ms here. Doing one at a time
+        Called once per frame. Only used with display managers that have no
+        shadow_canvas(): there, these plugins cannot be prepared off the
+        render thread — display capture and scroll-content generation both
+        need the shared canvas — so each costs roughly 290ms here. Doing one at a time
         spreads that out instead of stalling for the whole group at once, and the
         strip's lookahead means nothing runs dry while they arrive.
 
@@ -30,14 +30,17 @@ Sudoers Requirements:
 """
 
 import subprocess
+import functools
 import json
 import logging
 import os
+import tempfile
+import threading
 import time
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +78,13 @@ DEFAULT_AP_CHANNEL = 7
 # LED status message file (for display_controller integration)
 LED_STATUS_FILE = None  # Will be set dynamically
 
+# Name of the NetworkManager profile _enable_ap_mode_nmcli_hotspot creates
+AP_CONNECTION_NAME = "LEDMatrix-Setup-AP"
+
+# How long a network status snapshot is reused by callers that accept a
+# cached read (the web UI's status endpoint, the monitor daemon's check)
+NETWORK_SNAPSHOT_TTL = 5.0
+
 # NetworkManager connection file locations (Trixie uses /run, Bookworm uses /etc)
 NM_CONNECTIONS_PATHS = [
     Path("/etc/NetworkManager/system-connections"),
@@ -102,6 +112,82 @@ class WiFiStatus:
     ap_mode_active: bool = False
 
 
+@dataclass
+class NetworkSnapshot:
+    """WiFi and Ethernet state read at one point in time"""
+    wifi: WiFiStatus
+    ethernet_connected: bool = False
+    taken_at: float = 0.0  # time.time(), so other processes can judge its age
+
+    def age(self) -> float:
+        return time.time() - self.taken_at
+
+
+def _split_nmcli_terse(line: str) -> List[str]:
+    """Split an `nmcli -t` line on unescaped ':' and undo nmcli's escaping
+    (SSIDs and connection names may themselves contain ':' or '\\')."""
+    fields, current, escaped = [], [], False
+    for char in line:
+        if escaped:
+            current.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == ':':
+            fields.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    fields.append(''.join(current))
+    return fields
+
+
+def _parse_nmcli_device_show(output: str) -> List[Dict[str, str]]:
+    """Parse `nmcli -t -f GENERAL.*,IP4.ADDRESS device show` into one dict
+    per device. Devices are separated by a blank line; a new GENERAL.DEVICE
+    also starts a new one in case the separator is missing. Multi-valued
+    fields such as IP4.ADDRESS[1] are keyed without their index, first value
+    wins."""
+    devices: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition(':')
+        if not sep:
+            if current:
+                devices.append(current)
+                current = {}
+            continue
+        key = key.split('[', 1)[0].strip()
+        if key == 'GENERAL.DEVICE' and current:
+            devices.append(current)
+            current = {}
+        current.setdefault(key, value.replace('\\:', ':').strip())
+    if current:
+        devices.append(current)
+    return devices
+
+
+def _nmcli_state_connected(state: str) -> bool:
+    """GENERAL.STATE looks like '100 (connected)'; 100 is the only
+    fully-connected code (70 is still getting an IP, 30 disconnected)."""
+    try:
+        return int(state.split(None, 1)[0]) >= 100
+    except (ValueError, IndexError):
+        return state.strip().lower().startswith('connected')
+
+
+def _invalidates_network_snapshot(method):
+    """Drop the cached network snapshot once the wrapped method returns,
+    since it may have changed the state the snapshot describes."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_network_snapshot()
+    return wrapper
+
+
 class WiFiManager:
     """Manages WiFi connections and access point mode"""
     
@@ -362,177 +448,228 @@ class WiFiManager:
         except Exception as e:
             logger.error(f"Failed to save WiFi config: {e}")
     
-    def get_wifi_status(self) -> WiFiStatus:
+    def get_wifi_status(self, max_age: float = 0.0) -> WiFiStatus:
         """
         Get current WiFi connection status
         
+        Args:
+            max_age: Accept a snapshot up to this many seconds old (see
+                get_network_snapshot). The default 0 always reads fresh
+                state, which is what the connect/AP flows polling for a
+                change need.
+        
         Returns:
             WiFiStatus object with connection information
         """
+        return self.get_network_snapshot(max_age=max_age).wifi
+
+    # Shared by every WiFiManager in the process (the web UI creates one per
+    # request) and, through _SNAPSHOT_PATH, with the other LEDMatrix
+    # processes, so the web UI and the monitor daemon don't each run their
+    # own nmcli battery for the same answer.
+    _SNAPSHOT_PATH = Path("/tmp/ledmatrix_network_snapshot.json")  # nosec B108 - process-specific named file; device is single-user RPi
+    _snapshot: Optional[NetworkSnapshot] = None
+    _snapshot_lock = threading.Lock()
+    # Shared snapshots taken at or before this time are ignored. The monitor
+    # daemon runs as root and the web UI may not, so the web UI can't always
+    # remove the daemon's file from sticky /tmp when it invalidates.
+    _invalidated_at: float = 0.0
+
+    def get_network_snapshot(self, max_age: float = NETWORK_SNAPSHOT_TTL) -> NetworkSnapshot:
+        """
+        WiFi status, Ethernet state and AP state from one status read.
+
+        A status check used to cost 8-10 subprocesses (device status, several
+        device show queries, device wifi listings, systemctl, connection
+        show, and the same again for Ethernet). A fresh snapshot is one
+        `nmcli device show` for every device, plus one `device wifi list`
+        for the SSID and signal when WiFi is connected.
+
+        Args:
+            max_age: Seconds a cached snapshot (this process's or one another
+                process saved) may be reused; 0 forces a fresh read.
+
+        Returns:
+            NetworkSnapshot; a fresh read replaces the shared cache.
+        """
+        # Held while reading so concurrent callers wait for one read rather
+        # than each starting their own.
+        with WiFiManager._snapshot_lock:
+            if max_age > 0:
+                snapshot = WiFiManager._snapshot
+                if snapshot is None or not 0 <= snapshot.age() <= max_age:
+                    snapshot = self._load_shared_snapshot() or snapshot
+                if snapshot is not None and 0 <= snapshot.age() <= max_age:
+                    WiFiManager._snapshot = snapshot
+                    return snapshot
+            snapshot = self._read_network_snapshot()
+            WiFiManager._snapshot = snapshot
+            self._save_shared_snapshot(snapshot)
+            return snapshot
+
+    def invalidate_network_snapshot(self) -> None:
+        """
+        Forget the cached snapshot.
+
+        This process won't reuse any snapshot taken before now, even if the
+        shared file can't be removed (it belongs to another user). Other
+        processes stop seeing it once the file is removed.
+        """
+        with WiFiManager._snapshot_lock:
+            WiFiManager._snapshot = None
+            WiFiManager._invalidated_at = time.time()
+            try:
+                self._SNAPSHOT_PATH.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not remove network snapshot {self._SNAPSHOT_PATH}: {e}")
+
+    def _load_shared_snapshot(self) -> Optional[NetworkSnapshot]:
+        """The snapshot another process saved, or None if there is no usable one."""
+        try:
+            path = self._SNAPSHOT_PATH
+            # Only trust a snapshot written by root or by this user.
+            if path.stat().st_uid not in (0, os.getuid()):
+                return None
+            data = json.loads(path.read_text())
+            snapshot = NetworkSnapshot(
+                wifi=WiFiStatus(**data['wifi']),
+                ethernet_connected=bool(data['ethernet_connected']),
+                taken_at=float(data['taken_at']),
+            )
+            if snapshot.taken_at <= WiFiManager._invalidated_at:
+                return None
+            return snapshot
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable network snapshot: {e}")
+            return None
+
+    def _save_shared_snapshot(self, snapshot: NetworkSnapshot) -> None:
+        path = self._SNAPSHOT_PATH
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=path.name + '.', dir=str(path.parent))
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(asdict(snapshot), f)
+                # Readable by the web UI when it runs as a different user.
+                os.chmod(tmp_name, 0o644)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not save network snapshot to {path}: {e}")
+
+    def _read_network_snapshot(self) -> NetworkSnapshot:
         try:
             if self.has_nmcli:
-                return self._get_status_nmcli()
-            else:
-                return self._get_status_iwconfig()
+                return self._read_snapshot_nmcli()
+            return NetworkSnapshot(
+                wifi=self._get_status_iwconfig(),
+                ethernet_connected=self._is_ethernet_connected(),
+                taken_at=time.time(),
+            )
         except Exception as e:
             logger.error(f"Error getting WiFi status: {e}")
-            return WiFiStatus(connected=False)
-    
-    def _get_status_nmcli(self) -> WiFiStatus:
-        """Get WiFi status using nmcli"""
-        try:
-            # Check if connected - use device status first (more reliable)
-            result = subprocess.run(
-                ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE", "device", "status"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode != 0:
-                logger.warning("nmcli device status failed, assuming disconnected")
-                return WiFiStatus(connected=False)
-            
-            wifi_connected = False
-            ssid = None
-            ip_address = None
-            signal = 0
-            wlan_device = None
-            
-            # Find WiFi device and check its state
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                parts = line.split(':')
-                if len(parts) >= 3:
-                    device = parts[0].strip()
-                    dev_type = parts[1].strip().lower()
-                    state = parts[2].strip().lower()
-                    
-                    # Check if it's a WiFi device
-                    if dev_type == "wifi" or device.startswith("wlan"):
-                        wlan_device = device
-                        if state == "connected":
-                            wifi_connected = True
-                            break
-                        elif state in ["disconnected", "unavailable", "unmanaged"]:
-                            # Explicitly disconnected
-                            wifi_connected = False
-                            break
-            
-            # Get actual SSID and signal strength from WiFi device if connected
-            # Use device show to get the real SSID and signal, not the connection name
-            if wifi_connected and wlan_device:
-                # Get both SSID and signal in one query for efficiency
-                result = subprocess.run(
-                    ["nmcli", "-t", "-f", "802-11-wireless.ssid,WIFI.SIGNAL", "device", "show", wlan_device],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n'):
-                        if '802-11-wireless.ssid:' in line:
-                            ssid = line.split(':', 1)[1].strip()
-                            if ssid:
-                                continue
-                        elif 'WIFI.SIGNAL:' in line:
-                            try:
-                                signal = int(line.split(':', 1)[1].strip())
-                            except (ValueError, IndexError):
-                                pass
-                
-                # Fallback: Get SSID from active WiFi connection list if not found
-                if not ssid:
-                    result = subprocess.run(
-                        ["nmcli", "-t", "-f", "active,ssid", "device", "wifi"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        for line in result.stdout.strip().split('\n'):
-                            parts = line.split(':')
-                            if len(parts) >= 2 and parts[0].strip() == "yes":
-                                ssid = parts[1].strip()
-                                if ssid:
-                                    break
-                
-                # Fallback: Get signal strength if not already retrieved
-                if signal == 0 and wlan_device:
-                    result = subprocess.run(
-                        ["nmcli", "-t", "-f", "WIFI.SIGNAL", "device", "show", wlan_device],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        for line in result.stdout.strip().split('\n'):
-                            if 'WIFI.SIGNAL:' in line:
-                                try:
-                                    signal = int(line.split(':', 1)[1].strip())
-                                    break
-                                except (ValueError, IndexError):
-                                    pass
-            
-            # Get IP address if connected
-            if wifi_connected and wlan_device:
-                result = subprocess.run(
-                    ["nmcli", "-t", "-f", "IP4.ADDRESS", "device", "show", wlan_device],
+            return NetworkSnapshot(wifi=WiFiStatus(connected=False), taken_at=time.time())
+
+    def _read_snapshot_nmcli(self) -> NetworkSnapshot:
+        """Build a snapshot from one `nmcli device show` of every device."""
+        taken_at = time.time()
+        result = subprocess.run(
+            ["nmcli", "-t", "-f",
+             "GENERAL.DEVICE,GENERAL.TYPE,GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS",
+             "device", "show"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            logger.warning("nmcli device show failed, assuming disconnected")
+            return NetworkSnapshot(wifi=WiFiStatus(connected=False), taken_at=taken_at)
+
+        devices = _parse_nmcli_device_show(result.stdout)
+
+        # The ethernet check used to be device status plus a device show per
+        # connected interface; it only counts once the interface has an IP.
+        ethernet_connected = any(
+            dev.get('GENERAL.TYPE') == 'ethernet'
+            and _nmcli_state_connected(dev.get('GENERAL.STATE', ''))
+            and dev.get('IP4.ADDRESS')
+            for dev in devices
+        )
+
+        wifi_devices = [dev for dev in devices if dev.get('GENERAL.TYPE') == 'wifi']
+        wlan = next((dev for dev in wifi_devices
+                     if dev.get('GENERAL.DEVICE') == self._wifi_interface),
+                    wifi_devices[0] if wifi_devices else {})
+        wlan_device = wlan.get('GENERAL.DEVICE')
+        connection = wlan.get('GENERAL.CONNECTION') or None
+        wifi_connected = bool(wlan) and _nmcli_state_connected(wlan.get('GENERAL.STATE', ''))
+
+        ap_active = connection == AP_CONNECTION_NAME
+        if not ap_active and self.has_hostapd:
+            try:
+                hostapd = subprocess.run(
+                    ["systemctl", "is-active", HOSTAPD_SERVICE],
                     capture_output=True,
                     text=True,
-                    timeout=5
+                    timeout=2
                 )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n'):
-                        if '/' in line:
-                            # nmcli -t output is "IP4.ADDRESS[1]:x.x.x.x/prefix";
-                            # bare "x.x.x.x/prefix" is also accepted defensively.
-                            _, sep, rest = line.partition(':')
-                            ip_address = (rest if sep else line).split('/')[0].strip()
-                            break
-                
-                # Final fallback: Get signal strength by matching SSID in WiFi list
-                # (Only if we still don't have signal from device properties)
-                if signal == 0 and ssid:
-                    result = subprocess.run(
-                        ["nmcli", "-t", "-f", "SSID,SIGNAL", "device", "wifi"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        for line in result.stdout.strip().split('\n'):
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                line_ssid = parts[0].strip()
-                                if line_ssid == ssid:
-                                    try:
-                                        signal = int(parts[1].strip())
-                                        break
-                                    except (ValueError, IndexError):
-                                        pass
-            
-            # Check if AP mode is active
-            ap_active = self._is_ap_mode_active()
+                ap_active = hostapd.stdout.strip() == "active"
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+                pass
+
+        if ap_active:
             # wlan0 shows as "connected" in AP mode; clear client-station fields so
             # callers don't mistake the AP for an outbound WiFi connection.
-            if ap_active and wifi_connected:
-                wifi_connected = False
-                ssid = None
-                ip_address = None
+            if wifi_connected:
                 logger.debug(f"{wlan_device} is in AP mode — overriding wifi_connected to False")
-            
-            return WiFiStatus(
+            return NetworkSnapshot(
+                wifi=WiFiStatus(connected=False, ap_mode_active=True),
+                ethernet_connected=ethernet_connected,
+                taken_at=taken_at,
+            )
+
+        ssid = None
+        signal = 0
+        ip_address = None
+        if wifi_connected:
+            ip_address = (wlan.get('IP4.ADDRESS') or '').split('/')[0] or None
+            # The connection name is usually, but not necessarily, the SSID;
+            # the real SSID and the signal come from the scan cache
+            # (--rescan no: this never triggers a scan).
+            ssid = connection
+            result = subprocess.run(
+                ["nmcli", "-t", "-f", "ACTIVE,SSID,SIGNAL", "device", "wifi", "list",
+                 "ifname", wlan_device, "--rescan", "no"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    parts = _split_nmcli_terse(line)
+                    if len(parts) >= 3 and parts[0].strip() == "yes":
+                        ssid = parts[1] or ssid
+                        try:
+                            signal = int(parts[2].strip())
+                        except ValueError:
+                            pass
+                        break
+
+        return NetworkSnapshot(
+            wifi=WiFiStatus(
                 connected=wifi_connected,
                 ssid=ssid,
                 ip_address=ip_address,
                 signal=signal,
-                ap_mode_active=ap_active
-            )
-        except Exception as e:
-            logger.error(f"Error getting status with nmcli: {e}")
-            return WiFiStatus(connected=False)
+                ap_mode_active=False
+            ),
+            ethernet_connected=ethernet_connected,
+            taken_at=taken_at,
+        )
     
     def _get_status_iwconfig(self) -> WiFiStatus:
         """Get WiFi status using iwconfig (fallback)"""
@@ -1245,6 +1382,7 @@ class WiFiManager:
             logger.error(f"Error scanning with iwlist: {e}")
             return []
     
+    @_invalidates_network_snapshot
     def connect_to_network(self, ssid: str, password: str) -> Tuple[bool, str]:
         """
         Connect to a WiFi network with failsafe to restore original connection on failure.
@@ -1660,6 +1798,7 @@ class WiFiManager:
             logger.error(f"Error connecting with wpa_supplicant: {e}")
             return False, str(e)
     
+    @_invalidates_network_snapshot
     def disconnect_from_network(self, skip_ap_check: bool = False) -> Tuple[bool, str]:
         """
         Disconnect from the current WiFi network
@@ -1920,6 +2059,7 @@ class WiFiManager:
             'available': available,
         }
 
+    @_invalidates_network_snapshot
     def set_wifi_radio(self, enabled: bool, force: bool = False) -> Tuple[bool, str, Optional[str]]:
         """
         Turn the WiFi radio on or off.
@@ -1973,6 +2113,7 @@ class WiFiManager:
             logger.error("Error disabling WiFi radio: %s", e, exc_info=True)
             return False, "An error occurred while disabling WiFi radio.", 'error'
 
+    @_invalidates_network_snapshot
     def enable_ap_mode(self, force: bool = False) -> Tuple[bool, str]:
         """
         Enable access point mode
@@ -2309,6 +2450,7 @@ class WiFiManager:
             logger.error(f"Error getting AP status with nmcli: {e}")
             return {'active': False}
     
+    @_invalidates_network_snapshot
     def disable_ap_mode(self) -> Tuple[bool, str]:
         """
         Disable access point mode
@@ -2577,10 +2719,12 @@ address=/detectportal.firefox.com/192.168.4.1
             (state_changed, WiFiStatus, ethernet_connected, ap_active_after)
         """
         try:
-            # Get status with retry for more reliable detection
-            status = self._get_wifi_status_with_retry()
-            ethernet_connected = self._is_ethernet_connected()
-            ap_active = self._is_ap_mode_active()
+            # One snapshot carries WiFi, Ethernet and AP state; retried while
+            # disconnected for more reliable detection
+            snapshot = self._get_snapshot_with_retry()
+            status = snapshot.wifi
+            ethernet_connected = snapshot.ethernet_connected
+            ap_active = status.ap_mode_active
             changed = self._manage_ap_mode(status, ethernet_connected, ap_active)
             # State only ever changes via one enable or one disable, so the
             # post-state is the inverse of the pre-state when changed.
@@ -2700,17 +2844,32 @@ address=/detectportal.firefox.com/192.168.4.1
         Returns:
             WiFiStatus object
         """
+        return self._get_snapshot_with_retry(max_retries).wifi
+
+    def _get_snapshot_with_retry(self, max_retries=2) -> NetworkSnapshot:
+        """
+        Get a network snapshot, re-reading it while WiFi looks disconnected.
+
+        The first attempt accepts a snapshot up to NETWORK_SNAPSHOT_TTL old
+        (typically one the web UI just took); retries always read fresh.
+
+        Args:
+            max_retries: Number of retry attempts if first check fails
+
+        Returns:
+            NetworkSnapshot object
+        """
         for attempt in range(max_retries + 1):
-            status = self.get_wifi_status()
+            snapshot = self.get_network_snapshot(
+                max_age=NETWORK_SNAPSHOT_TTL if attempt == 0 else 0.0)
             # If we get a connected status, trust it immediately
-            if status.connected:
-                return status
+            if snapshot.wifi.connected:
+                return snapshot
             
             # If disconnected, wait a bit and retry (in case of transient issues)
             if attempt < max_retries:
                 time.sleep(1)
                 logger.debug(f"WiFi status check attempt {attempt + 1}/{max_retries + 1}: disconnected, retrying...")
         
-        # Return the last status (disconnected)
-        return status
-
+        # Return the last snapshot (disconnected)
+        return snapshot
@@ -1,12 +1,22 @@
 """Tests for adaptive image fitting (src/adaptive_images.py) and the
 LayoutContext image cache."""
 
+import gc
+import json
+import logging
+import sys
+import weakref
+from pathlib import Path
+from unittest.mock import MagicMock
+
 import pytest
 from PIL import Image
 
+import src.adaptive_images as adaptive_images
 from src.adaptive_images import (
     RESAMPLE_LANCZOS,
     RESAMPLE_NEAREST,
+    FitImageCache,
     ImageFitResult,
     draw_fitted_image,
     fit_image,
@@ -206,3 +216,132 @@ class TestResultIndependence:
         assert fit.image is not src
         ImageDraw.Draw(src).rectangle([0, 0, 19, 19], fill=(0, 255, 0, 255))
         assert fit.image.getpixel((5, 5)) == (255, 0, 0, 255)
+
+
+class TestFitImageCache:
+    def test_hit_returns_the_same_result(self):
+        cache = FitImageCache()
+        img = _solid(40, 40)
+        a = cache.fit(img, (20, 20))
+        assert cache.fit(img, (20, 20)) is a
+        assert cache.fit(img, (30, 30)) is not a
+        assert cache.fit(img, (20, 20), resample=RESAMPLE_NEAREST) is not a
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 3
+
+    def test_default_resample_shares_the_lanczos_entry(self):
+        cache = FitImageCache()
+        img = _solid(40, 40)
+        assert cache.fit(img, (20, 20)) is cache.fit(img, (20, 20), resample=RESAMPLE_LANCZOS)
+
+    def test_sources_are_not_pinned(self):
+        cache = FitImageCache()
+        img = _solid(40, 40)
+        cache.fit(img, (20, 20))
+        cache.fit(img, (10, 10))
+        ref = weakref.ref(img)
+        del img
+        gc.collect()
+        assert ref() is None
+        assert len(cache) == 0
+        assert cache.stats()["bytes"] == 0
+
+    def test_recycled_ids_never_serve_a_dead_source(self):
+        cache = FitImageCache()
+        for i in range(50):
+            color = (i, 255 - i, 0, 255)
+            fitted = cache.fit(_solid(8, 8, color), (4, 4), resample=RESAMPLE_NEAREST)
+            assert fitted.image.getpixel((0, 0)) == color
+
+    def test_byte_budget_evicts_least_recent(self):
+        # Each 10x10 RGBA fit is 400 bytes; room for two.
+        cache = FitImageCache(max_bytes=1000)
+        sources = [_solid(20, 20) for _ in range(3)]
+        first = cache.fit(sources[0], (10, 10))
+        cache.fit(sources[1], (10, 10))
+        cache.fit(sources[0], (10, 10))  # touch: sources[1] is now oldest
+        cache.fit(sources[2], (10, 10))
+        assert cache.stats()["bytes"] == 800
+        assert cache.fit(sources[0], (10, 10)) is first
+        assert cache.stats()["misses"] == 3
+        # The evicted source's finalizer is detached with its last entry.
+        assert id(sources[1]) not in cache._finalizers
+
+    def test_oversized_result_is_not_cached(self):
+        cache = FitImageCache(max_bytes=100)
+        img = _solid(10, 10)
+        assert cache.fit(img, (20, 20)).width == 20
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = FitImageCache()
+        cache.fit(_solid(10, 10), (5, 5))
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+        assert not cache._finalizers
+
+    def test_results_match_the_primitive(self):
+        cache = FitImageCache()
+        logo = _padded_logo()
+        for mode in ("contain", "cover", "fill_height", "stretch"):
+            cached = cache.fit(logo, (24, 16), mode=mode, crop_to_ink=True)
+            direct = fit_image(logo, (24, 16), mode=mode, crop_to_ink=True)
+            assert cached.image.tobytes() == direct.image.tobytes()
+            assert (cached.width, cached.height, cached.scale) == (direct.width, direct.height, direct.scale)
+
+
+def _skin_render_setup():
+    """The example baseball skin plus a host whose logo cache hands back
+    the same image objects every frame, as SportsCore's does."""
+    sys.modules.setdefault("rgbmatrix", MagicMock())
+    from src.skin_system import skin_runtime
+
+    skin = skin_runtime.load_skin("example-classic-baseball", sport="baseball")
+    fixture = Path(__file__).resolve().parents[1] / "src" / "skin_system" / "fixtures" / "baseball_live.json"
+    with open(fixture) as f:
+        game = json.load(f)
+    # Real logo files are a few hundred pixels square.
+    logos = {game["home_abbr"]: Image.new("RGBA", (300, 300), (200, 0, 0, 255)),
+             game["away_abbr"]: Image.new("RGBA", (300, 300), (0, 0, 200, 255))}
+    host = MagicMock()
+    host.sport = "baseball"
+    host.skin_options = {}
+    host.fonts = {}
+    host.logger = logging.getLogger("test_adaptive_images")
+    host._load_and_resize_logo.side_effect = lambda team_id, abbr, path, url: logos[abbr]
+
+    def render():
+        ctx = skin_runtime.build_context(host, game, size=(128, 32))
+        assert skin.render_live(ctx, game) is True
+        return ctx
+
+    return render
+
+
+class TestSkinRenderMemo:
+    def test_unchanged_skin_resizes_only_on_the_first_frame(self, monkeypatch):
+        monkeypatch.setattr(adaptive_images, "fit_image_cache", FitImageCache())
+        resizes = []
+        depth = [0]
+        original_resize = Image.Image.resize
+
+        def counting_resize(self, *args, **kwargs):
+            # Pillow resizes RGBA via an inner premultiplied resize call;
+            # count only the outermost one.
+            if depth[0] == 0:
+                resizes.append(self.size)
+            depth[0] += 1
+            try:
+                return original_resize(self, *args, **kwargs)
+            finally:
+                depth[0] -= 1
+
+        monkeypatch.setattr(Image.Image, "resize", counting_resize)
+        render = _skin_render_setup()
+
+        render()
+        first_frame = len(resizes)
+        assert first_frame == 2  # home + away logo
+        for _ in range(99):
+            render()
+        assert len(resizes) == first_frame
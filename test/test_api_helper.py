@@ -1,15 +1,22 @@
 """
 Tests for src/common/api_helper.py (APIHelper).
 
-Covers rate limiting, cached GETs, ESPN URL/cache-key construction,
+Covers per-host rate limiting (token buckets, Retry-After; the threaded
+tests use local HTTP stub servers), cached GETs, ESPN URL/cache-key construction,
 session header defaults and per-call merging, the retry adapter, and the
 fixed clear_cache() behavior (real CacheManager surface: clear_cache /
 delete / list_cache_files, with safe no-ops elsewhere).
 
-No real network: helper.session.get/post are always replaced with mocks.
+No real network: helper.session.get/post are replaced with mocks, or
+pointed at the local stubs.
 """
 
+import json
+import threading
+import time
 import types
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -17,7 +24,7 @@ import requests
 from freezegun import freeze_time
 
 import src.common.api_helper as api_helper_module
-from src.common.api_helper import APIHelper
+from src.common.api_helper import APIHelper, TokenBucket, parse_retry_after
 
 
 def _make_response(payload):
@@ -46,32 +53,219 @@ def helper(cache):
 # Rate limiting
 # ---------------------------------------------------------------------------
 
-class TestRateLimiting:
-    def test_sleeps_for_remaining_interval(self, helper, monkeypatch):
-        fake_time = MagicMock()
-        fake_time.time.side_effect = [102.0, 105.0]
-        monkeypatch.setattr(api_helper_module, 'time', fake_time)
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
 
-        helper.set_rate_limit(5)
-        helper._last_request_time = 100.0
-        helper._enforce_rate_limit()
+    def __call__(self):
+        return self.now
 
-        # 2s elapsed of a 5s interval -> sleep the remaining 3s.
-        fake_time.sleep.assert_called_once()
-        assert fake_time.sleep.call_args[0][0] == pytest.approx(3.0)
-        assert helper._last_request_time == 105.0
+    def sleep(self, seconds):
+        self.now += seconds
 
-    def test_no_sleep_when_interval_elapsed(self, helper, monkeypatch):
-        fake_time = MagicMock()
-        fake_time.time.side_effect = [200.0, 201.0]
-        monkeypatch.setattr(api_helper_module, 'time', fake_time)
 
-        helper.set_rate_limit(5)
-        helper._last_request_time = 100.0
-        helper._enforce_rate_limit()
+class TestTokenBucket:
+    def test_burst_then_refill_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
 
-        fake_time.sleep.assert_not_called()
-        assert helper._last_request_time == 201.0
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert bucket.time_until_available() == pytest.approx(0.5)
+        clock.now += 0.5
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    def test_acquire_sleeps_until_a_token_refills(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+
+        assert bucket.acquire(sleep=clock.sleep) == 0
+        assert bucket.acquire(sleep=clock.sleep) == pytest.approx(1.0)
+        assert clock.now == pytest.approx(1001.0)
+
+    def test_block_holds_even_an_unlimited_bucket(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0, clock=clock)
+        assert all(bucket.try_acquire() for _ in range(100))
+
+        bucket.block_for(30)
+
+        assert bucket.try_acquire() is False
+        assert bucket.time_until_available() == pytest.approx(30)
+        assert bucket.acquire(sleep=clock.sleep) == pytest.approx(30)
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after('120') == 120
+
+    def test_http_date(self):
+        now = datetime(2026, 8, 7, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after('Fri, 07 Aug 2026 12:01:30 GMT', now=now) == 90
+
+    def test_clamped_and_invalid(self):
+        assert parse_retry_after('99999999') == api_helper_module.MAX_RETRY_AFTER
+        assert parse_retry_after('-5') == 0
+        assert parse_retry_after('soon') is None
+        assert parse_retry_after(None) is None
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.arrivals.append(time.monotonic())
+            status, headers = server.responses.pop(0) if server.responses else (200, {})
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_hosts():
+    """Two local HTTP servers: two hosts as far as APIHelper is concerned."""
+    servers = []
+    for _ in range(2):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        server.daemon_threads = True  # don't join keep-alive handlers on close
+        server.lock = threading.Lock()
+        server.arrivals = []
+        server.responses = []
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        server.url = f'http://127.0.0.1:{server.server_address[1]}/'
+        servers.append(server)
+    yield servers
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestPerHostRateLimiting:
+    def test_per_host_rate_holds_across_threads(self, stub_hosts):
+        slow, fast = stub_hosts
+        helper = APIHelper(cache_manager=None)
+        helper.set_rate_limit(0)
+        helper.set_rate_limit(0.1, host=slow.url, burst=2)
+        results = []
+
+        def call_slow():
+            results.append(helper.get(slow.url))
+
+        start = time.monotonic()
+        _run_threads(call_slow, 8)
+        elapsed = time.monotonic() - start
+
+        assert all(r == {'path': '/'} for r in results) and len(results) == 8
+        arrivals = sorted(slow.arrivals)
+        # Two at once from the burst, then one per 0.1s.
+        assert elapsed >= 0.55
+        for earlier, later in zip(arrivals[1:], arrivals[2:]):
+            assert later - earlier >= 0.08
+
+    def test_unrelated_host_is_not_delayed(self, stub_hosts):
+        slow, fast = stub_hosts
+        helper = APIHelper(cache_manager=None)
+        helper.set_rate_limit(0)
+        helper.set_rate_limit(0.25, host=slow.url)
+        fast_times = []
+
+        def call_slow():
+            helper.get(slow.url)
+
+        def call_fast():
+            started = time.monotonic()
+            helper.get(fast.url)
+            fast_times.append(time.monotonic() - started)
+
+        slow_threads = [threading.Thread(target=call_slow) for _ in range(6)]
+        for thread in slow_threads:
+            thread.start()
+        time.sleep(0.05)  # slow host's bucket is now drained with waiters queued
+        _run_threads(call_fast, 6)
+        for thread in slow_threads:
+            thread.join()
+
+        assert len(slow.arrivals) == 6 and len(fast.arrivals) == 6
+        assert max(fast_times) < 0.2
+        assert max(slow.arrivals) - min(slow.arrivals) >= 1.0
+
+    def test_retry_after_blocks_only_that_host(self, stub_hosts):
+        limited, other = stub_hosts
+        limited.responses = [(429, {'Retry-After': '1'})]
+        helper = APIHelper(cache_manager=None)
+        helper.set_rate_limit(0)
+
+        assert helper.get(limited.url) is None
+        assert len(limited.arrivals) == 1  # 429 is not retried by the adapter
+        assert helper.time_until_allowed(limited.url) == pytest.approx(1.0, abs=0.1)
+        assert helper.time_until_allowed(other.url) == 0
+
+        started = time.monotonic()
+        assert helper.get(limited.url) == {'path': '/'}
+        assert time.monotonic() - started >= 0.85
+        assert helper.get_request_stats()['hosts'][_host(limited.url)]['blocked_for'] == 0
+
+    def test_long_retry_after_fails_fast_instead_of_blocking(self, stub_hosts):
+        limited, _ = stub_hosts
+        limited.responses = [(503, {'Retry-After': '600'})]
+        helper = APIHelper(cache_manager=None, max_retries=0)
+        helper.set_rate_limit(0)
+
+        assert helper.get(limited.url) is None
+        started = time.monotonic()
+        assert helper.get(limited.url) is None
+        assert time.monotonic() - started < 0.1
+        assert len(limited.arrivals) == 1
+        assert helper.time_until_allowed(limited.url) > 500
+
+    def test_retry_after_longer_than_the_call_timeout_fails_fast(self, stub_hosts):
+        limited, _ = stub_hosts
+        limited.responses = [(429, {'Retry-After': '5'})]
+        helper = APIHelper(cache_manager=None, default_timeout=30)
+        helper.set_rate_limit(0)
+
+        assert helper.get(limited.url) is None
+        started = time.monotonic()
+        assert helper.get(limited.url, timeout=1) is None
+        assert helper.post(limited.url, json_data={}, timeout=1) is None
+        assert time.monotonic() - started < 0.1
+        assert len(limited.arrivals) == 1
+
+    def test_changing_the_rate_keeps_a_retry_after_block(self, stub_hosts):
+        limited, other = stub_hosts
+        limited.responses = [(503, {'Retry-After': '600'})]
+        helper = APIHelper(cache_manager=None, max_retries=0)
+        helper.set_rate_limit(0)
+        assert helper.get(limited.url) is None
+        assert helper.get(other.url) == {'path': '/'}
+
+        helper.set_rate_limit(0.5)
+        assert helper.time_until_allowed(limited.url) > 500
+        helper.set_rate_limit(0.1, host=limited.url, burst=3)
+        assert helper.time_until_allowed(limited.url) > 500
+        assert helper.get(limited.url) is None
+        assert len(limited.arrivals) == 1
+        assert helper.time_until_allowed(other.url) == 0
+
+
+def _host(url):
+    return url.split('//')[1].rstrip('/')
 
 
 # ---------------------------------------------------------------------------
@@ -205,7 +399,11 @@ class TestSessionSetup:
 
         retries = helper.session.get_adapter('https://x').max_retries
         assert retries.total == 7
-        assert {429, 500, 502, 503, 504} <= set(retries.status_forcelist)
+        assert {500, 502, 503, 504} <= set(retries.status_forcelist)
+        # 429s come back to APIHelper, whose per-host bucket honors
+        # Retry-After, instead of being retried (or slept on) by urllib3.
+        assert 429 not in retries.status_forcelist
+        assert retries.respect_retry_after_header is False
 
 
 # ---------------------------------------------------------------------------
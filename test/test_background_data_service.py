@@ -3,10 +3,15 @@ Tests for src/background_data_service.py
 
 Covers BackgroundDataService: submit_fetch_request, get_result,
 is_request_complete, get_request_status, cancel_request, get_statistics,
-_cleanup_completed_requests, shutdown, and get_background_service singleton.
+_cleanup_completed_requests, shutdown, and get_background_service singleton,
+plus priority dispatch and in-flight deduplication against a local server.
 """
 
+import json
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 from concurrent.futures import Future
@@ -16,6 +21,7 @@ from src.background_data_service import (
     FetchStatus,
     FetchResult,
     FetchRequest,
+    canonical_request_key,
     get_background_service,
     shutdown_background_service,
 )
@@ -187,6 +193,176 @@ class TestFetchPath:
         mock_cache_manager.set.assert_called()
 
 
+# ---------------------------------------------------------------------------
+# Priority dispatch and in-flight deduplication (real HTTP, local server)
+# ---------------------------------------------------------------------------
+
+class StubServer:
+    """Local HTTP server that counts hits per path and records their order.
+
+    Requests to /slow take 0.3 s; requests to /block wait until release().
+    """
+
+    def __init__(self):
+        self.hits = {}
+        self.order = []
+        self._released = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                with stub._lock:
+                    stub.hits[path] = stub.hits.get(path, 0) + 1
+                    stub.order.append(path)
+                if path == "/slow":
+                    time.sleep(0.3)
+                elif path == "/block":
+                    stub._released.wait(5)
+                body = json.dumps({"events": [{"id": path}]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_address[1]}{path}"
+
+    def release(self):
+        self._released.set()
+
+    def close(self):
+        self.release()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    yield server
+    server.close()
+
+
+def wait_for(service, req_id, timeout=5):
+    future = service.get_future(req_id)
+    assert future is not None
+    return future.result(timeout=timeout)
+
+
+class TestDeduplication:
+    def test_concurrent_identical_submissions_share_one_fetch(self, service, mock_cache_manager, stub_server):
+        submitters = 20
+        barrier = threading.Barrier(submitters)
+        ids = []
+        callbacks = []
+
+        def submit(i):
+            barrier.wait()
+            ids.append(service.submit_fetch_request(
+                sport="nfl", year=2024,
+                url=stub_server.url("/slow"),
+                params={"dates": "2024", "limit": 1000},
+                cache_key=f"nfl_key_{i % 2}",
+                callback=callbacks.append,
+            ))
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(submitters)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        result = wait_for(service, ids[0])
+
+        assert stub_server.hits == {"/slow": 1}
+        assert len(set(ids)) == 1
+        assert result.success is True
+        assert len(callbacks) == submitters
+        assert all(r is result for r in callbacks)
+        stats = service.get_statistics()
+        assert stats["dedup_hits"] == submitters - 1
+        assert stats["total_requests"] == 1
+        cached_under = {c.args[0] for c in mock_cache_manager.set.call_args_list}
+        assert cached_under == {"nfl_key_0", "nfl_key_1"}
+
+    def test_finished_request_is_not_joined(self, service, stub_server):
+        first = service.submit_fetch_request(sport="nba", year=2024, url=stub_server.url("/a"), cache_key="a")
+        wait_for(service, first)
+        second = service.submit_fetch_request(sport="nba", year=2024, url=stub_server.url("/a"), cache_key="a")
+        wait_for(service, second)
+
+        assert stub_server.hits == {"/a": 2}
+        assert service.get_statistics()["dedup_hits"] == 0
+
+    def test_different_params_or_headers_are_separate(self):
+        base = canonical_request_key("https://site.api.espn.com/x?b=2", {"a": 1}, {"Accept": "json"})
+
+        assert canonical_request_key("HTTPS://Site.API.espn.com/x", {"a": "1", "b": 2},
+                                     {"accept": "json"}) == base
+        assert canonical_request_key("https://site.api.espn.com/x?b=2", {"a": 2},
+                                     {"Accept": "json"}) != base
+        assert canonical_request_key("https://site.api.espn.com/x?b=2", {"a": 1},
+                                     {"Accept": "xml"}) != base
+
+
+class TestPriorityDispatch:
+    def test_highest_priority_first_and_joiners_bump(self, mock_cache_manager, stub_server):
+        service = BackgroundDataService(mock_cache_manager, max_workers=1)
+        try:
+            blocker = service.submit_fetch_request(sport="x", year=1, url=stub_server.url("/block"), cache_key="block")
+            deadline = time.time() + 5
+            while not stub_server.order and time.time() < deadline:
+                time.sleep(0.01)
+
+            low = service.submit_fetch_request(sport="low", year=1, url=stub_server.url("/low"), cache_key="low", priority=1)
+            service.submit_fetch_request(sport="mid", year=1, url=stub_server.url("/mid"), cache_key="mid", priority=3)
+            service.submit_fetch_request(sport="high", year=1, url=stub_server.url("/high"), cache_key="high", priority=5)
+            # A more urgent caller wants the same data as the low one
+            assert service.submit_fetch_request(
+                sport="low", year=1, url=stub_server.url("/low"), cache_key="low", priority=9) == low
+            stub_server.release()
+            wait_for(service, blocker)
+            service.executor.shutdown(wait=True)
+
+            assert stub_server.order == ["/block", "/low", "/high", "/mid"]
+            stats = service.get_statistics()
+            assert stats["priority_bumps"] == 1
+            assert stats["dedup_hits"] == 1
+            assert stats["queue_size"] == 0
+        finally:
+            service.shutdown(wait=False)
+
+    def test_cancelled_request_is_skipped(self, mock_cache_manager, stub_server):
+        service = BackgroundDataService(mock_cache_manager, max_workers=1)
+        try:
+            service.submit_fetch_request(sport="x", year=1, url=stub_server.url("/block"), cache_key="block")
+            deadline = time.time() + 5
+            while not stub_server.order and time.time() < deadline:
+                time.sleep(0.01)
+            cancelled = service.submit_fetch_request(sport="c", year=1, url=stub_server.url("/cancelled"), cache_key="cancelled")
+            future = service.get_future(cancelled)
+
+            assert service.cancel_request(cancelled) is True
+            stub_server.release()
+            service.executor.shutdown(wait=True)
+
+            assert future.cancelled()
+            assert "/cancelled" not in stub_server.hits
+        finally:
+            service.shutdown(wait=False)
+
+
 # ---------------------------------------------------------------------------
 # Request status / cancel
 # ---------------------------------------------------------------------------
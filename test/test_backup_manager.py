@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import stat
+import tracemalloc
 import zipfile
 from pathlib import Path
 
@@ -177,6 +180,16 @@ def test_create_backup_manifest(project: Path, tmp_path: Path) -> None:
     assert set(manifest["contents"]) >= {"config", "secrets", "wifi", "fonts", "plugin_uploads", "plugins"}
 
 
+def test_create_backup_records_member_checksums(project: Path, tmp_path: Path) -> None:
+    zip_path = create_backup(project, output_dir=tmp_path / "exports")
+    with zipfile.ZipFile(zip_path) as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+        members = {name: zf.read(name) for name in zf.namelist() if name != "manifest.json"}
+    assert set(manifest["checksums"]) == set(members)
+    for name, data in members.items():
+        assert manifest["checksums"][name] == hashlib.sha256(data).hexdigest(), name
+
+
 # ---------------------------------------------------------------------------
 # Validate
 # ---------------------------------------------------------------------------
@@ -300,6 +313,125 @@ def test_restore_rejects_malicious_zip(empty_project: Path, tmp_path: Path) -> N
     assert any("unsafe" in e.lower() for e in result.errors)
 
 
+def _rewrite_member(zip_path: Path, name: str, data: bytes) -> None:
+    """Replace one member's content, leaving the manifest (and its checksum) as is."""
+    with zipfile.ZipFile(zip_path) as zf:
+        members = [(info, zf.read(info)) for info in zf.infolist()]
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for info, content in members:
+            zf.writestr(info.filename, data if info.filename == name else content)
+
+
+def _seed_existing_config(project_root: Path) -> Path:
+    target = project_root / "config" / "config.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text('{"existing": true}', encoding="utf-8")
+    return target
+
+
+def test_restore_checksum_mismatch_replaces_nothing(
+    project: Path, empty_project: Path, tmp_path: Path
+) -> None:
+    zip_path = create_backup(project, output_dir=tmp_path / "exports")
+    # The font comes after the config files in the archive.
+    _rewrite_member(zip_path, "assets/fonts/my-custom-font.ttf", b"TAMPERED")
+    existing = _seed_existing_config(empty_project)
+
+    result = restore_backup(zip_path, empty_project, RestoreOptions())
+
+    assert not result.success
+    assert result.restored == []
+    assert any("checksum mismatch" in e.lower() and "my-custom-font" in e for e in result.errors)
+    assert existing.read_text() == '{"existing": true}'
+    assert not (empty_project / "config" / "config_secrets.json").exists()
+
+
+def test_restore_corrupt_member_data_replaces_nothing(
+    project: Path, empty_project: Path, tmp_path: Path
+) -> None:
+    zip_path = create_backup(project, output_dir=tmp_path / "exports")
+    with zipfile.ZipFile(zip_path) as zf:
+        info = zf.getinfo("assets/fonts/my-custom-font.ttf")
+    # Local header is 30 bytes plus the name and extra field; damage the data.
+    data_start = info.header_offset + 30 + len(info.filename.encode()) + len(info.extra)
+    raw = bytearray(zip_path.read_bytes())
+    for i in range(info.compress_size):
+        raw[data_start + i] ^= 0xFF
+    zip_path.write_bytes(bytes(raw))
+    existing = _seed_existing_config(empty_project)
+
+    result = restore_backup(zip_path, empty_project, RestoreOptions())
+
+    assert not result.success
+    assert result.restored == []
+    assert existing.read_text() == '{"existing": true}'
+
+
+def test_restore_member_missing_from_manifest_is_rejected(
+    project: Path, empty_project: Path, tmp_path: Path
+) -> None:
+    zip_path = create_backup(project, output_dir=tmp_path / "exports")
+    with zipfile.ZipFile(zip_path, "a") as zf:
+        zf.writestr("assets/fonts/smuggled.ttf", b"x")
+
+    result = restore_backup(zip_path, empty_project, RestoreOptions())
+
+    assert not result.success
+    assert any("not listed" in e for e in result.errors)
+    assert not (empty_project / "config" / "config.json").exists()
+
+
+def test_restore_backup_without_checksums(empty_project: Path, tmp_path: Path) -> None:
+    """Backups made before checksums were recorded still restore."""
+    zip_path = tmp_path / "old.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("config/config.json", json.dumps({"old": True}))
+        zf.writestr("manifest.json", json.dumps({"schema_version": SCHEMA_VERSION, "contents": ["config"]}))
+
+    ok, _err, manifest = validate_backup(zip_path)
+    assert ok and manifest["has_checksums"] is False
+    result = restore_backup(zip_path, empty_project, RestoreOptions())
+
+    assert result.success, result.errors
+    assert json.loads((empty_project / "config" / "config.json").read_text()) == {"old": True}
+
+
+@pytest.mark.slow
+def test_large_font_set_keeps_memory_flat(empty_project: Path, tmp_path: Path) -> None:
+    """A 200 MB fonts directory round-trips without holding any file, or the
+    archive, in memory: Python allocations peak at a few chunk buffers."""
+    project = _make_project(tmp_path / "big_project")
+    fonts = project / "assets" / "fonts"
+    block = os.urandom(16 * 1024)
+    file_size = 5_000_000
+    for i in range(40):
+        with (fonts / f"big-{i:02d}.bdf").open("wb") as f:
+            f.write(f"font {i}\n".encode())
+            remaining = file_size - f.tell()
+            while remaining > 0:
+                f.write(block[:remaining])
+                remaining -= len(block)
+
+    limit = 16 * 1024 * 1024
+    tracemalloc.start()
+    try:
+        zip_path = create_backup(project, output_dir=tmp_path / "exports")
+        _current, create_peak = tracemalloc.get_traced_memory()
+
+        tracemalloc.reset_peak()
+        result = restore_backup(zip_path, empty_project, RestoreOptions())
+        _current, restore_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.success, result.errors
+    assert "fonts (41)" in result.restored
+    restored_font = empty_project / "assets" / "fonts" / "big-39.bdf"
+    assert restored_font.stat().st_size == file_size
+    assert create_peak < limit
+    assert restore_peak < limit
+
+
 def test_restore_over_a_file_the_user_cannot_write(
     project: Path, empty_project: Path, tmp_path: Path
 ) -> None:
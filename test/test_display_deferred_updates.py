@@ -0,0 +1,231 @@
+"""Tests for DisplayManager's deferred-update queue.
+
+Runs against RGBMatrixEmulator (EMULATOR=true) with the REAL DisplayManager,
+like test_display_dirty_tracking.py.
+
+defer_update() used to append to a list, pop(0) the oldest when full and
+re-sort the list, and process_deferred_updates() ran a fixed five updates per
+call however long they took. The queue is now a heap keyed by
+(priority, sequence) with optional deduplication keys, and each call works
+through it for a bounded time. The invariants:
+- lower priority numbers run first, equal priorities in deferral order
+- re-deferring a key replaces the queued update instead of adding another
+- one call stops once its time budget is spent, and a backlog of 1,000
+  updates drains across calls without losing or reordering anything
+"""
+
+import os
+import sys
+import time
+
+os.environ["EMULATOR"] = "true"
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture(scope="module")
+def _manager():
+    """One real DisplayManager on the emulator (it's a process singleton)."""
+    from src.display_manager import DisplayManager
+    DisplayManager._instance = None
+    DisplayManager._initialized = False
+    manager = DisplayManager({
+        "display": {
+            "hardware": {"rows": 32, "cols": 64, "chain_length": 2,
+                         "parallel": 1, "brightness": 90},
+            "runtime": {"gpio_slowdown": 0},
+        },
+    }, suppress_test_pattern=True)
+    yield manager
+    DisplayManager._instance = None
+    DisplayManager._initialized = False
+
+
+@pytest.fixture
+def dm(_manager):
+    """The shared manager with an empty queue and default limits."""
+    state = _manager._scrolling_state
+    saved = {name: state[name] for name in
+             ("max_deferred_updates", "deferred_update_ttl", "deferred_update_budget")}
+    _manager.set_scrolling_state(False)
+    state["last_scroll_activity"] = 0
+    _manager.process_deferred_updates(budget=float("inf"))
+    yield _manager
+    _manager.process_deferred_updates(budget=float("inf"))
+    state.update(saved)
+
+
+def _recorder(log, name):
+    return lambda: log.append(name)
+
+
+class TestOrdering:
+    def test_priority_then_deferral_order(self, dm):
+        ran = []
+        for name, priority in [("c1", 2), ("a1", 0), ("b1", 1), ("a2", 0), ("c2", 2)]:
+            dm.defer_update(_recorder(ran, name), priority=priority)
+
+        dm.process_deferred_updates(budget=float("inf"))
+
+        assert ran == ["a1", "a2", "b1", "c1", "c2"]
+        assert dm.get_scrolling_stats()["deferred_count"] == 0
+
+    def test_nothing_runs_while_scrolling(self, dm):
+        ran = []
+        dm.defer_update(_recorder(ran, "x"))
+        dm.set_scrolling_state(True)
+        dm.process_deferred_updates(budget=float("inf"))
+        assert ran == []
+        assert dm.get_scrolling_stats()["deferred_count"] == 1
+
+        dm.set_scrolling_state(False)
+        dm._scrolling_state["last_scroll_activity"] = 0
+        dm.process_deferred_updates(budget=float("inf"))
+        assert ran == ["x"]
+
+    def test_failed_update_is_retried_after_the_rest(self, dm):
+        ran = []
+
+        def flaky():
+            ran.append("flaky")
+            if ran.count("flaky") == 1:
+                raise RuntimeError("not yet")
+
+        dm.defer_update(flaky)
+        dm.defer_update(_recorder(ran, "next"))
+        dm.process_deferred_updates(budget=float("inf"))
+        dm.process_deferred_updates(budget=float("inf"))
+
+        assert ran == ["flaky", "next", "flaky"]
+        assert dm.get_scrolling_stats()["deferred_count"] == 0
+
+
+class TestDeduplication:
+    def test_redeferring_a_key_replaces_the_entry(self, dm):
+        ran = []
+        for i in range(100):
+            dm.defer_update(_recorder(ran, f"weather-{i}"), priority=1, key="weather")
+            if i == 50:
+                dm.defer_update(_recorder(ran, "clock"), priority=1)
+
+        assert dm.get_scrolling_stats()["deferred_count"] == 2
+        # Replaced entries are compacted away, not left to pile up.
+        assert len(dm._deferred_heap) < 50
+
+        dm.process_deferred_updates(budget=float("inf"))
+
+        # The replacement takes the latest place in line, after "clock".
+        assert ran == ["clock", "weather-99"]
+
+    def test_replacement_takes_the_new_priority(self, dm):
+        ran = []
+        dm.defer_update(_recorder(ran, "low"), priority=5, key="k")
+        dm.defer_update(_recorder(ran, "other"), priority=3)
+        dm.defer_update(_recorder(ran, "high"), priority=0, key="k")
+
+        dm.process_deferred_updates(budget=float("inf"))
+
+        assert ran == ["high", "other"]
+
+    def test_key_can_be_deferred_again_after_it_ran(self, dm):
+        ran = []
+        dm.defer_update(_recorder(ran, "first"), key="k")
+        dm.process_deferred_updates(budget=float("inf"))
+        dm.defer_update(_recorder(ran, "second"), key="k")
+        dm.process_deferred_updates(budget=float("inf"))
+        assert ran == ["first", "second"]
+        assert dm._deferred_by_key == {}
+
+
+class TestLimits:
+    def test_full_queue_drops_the_oldest(self, dm):
+        ran = []
+        dm._scrolling_state["max_deferred_updates"] = 3
+        for i in range(5):
+            dm.defer_update(_recorder(ran, i), priority=-i)
+
+        assert dm.get_scrolling_stats()["deferred_count"] == 3
+        dm.process_deferred_updates(budget=float("inf"))
+        assert ran == [4, 3, 2]
+
+    def test_retried_updates_respect_the_cap(self, dm):
+        ran = []
+        dm._scrolling_state["max_deferred_updates"] = 3
+
+        def flaky():
+            if "flaky" in attempts:
+                ran.append("flaky")
+                return
+            attempts.append("flaky")
+            # Fills the queue while it runs, so the retry finds it full.
+            for i in range(3):
+                dm.defer_update(_recorder(ran, i))
+            raise RuntimeError("try again")
+
+        attempts = []
+        dm.defer_update(flaky)
+        dm.process_deferred_updates(budget=0)
+
+        assert dm.get_scrolling_stats()["deferred_count"] == 3
+        dm.process_deferred_updates(budget=float("inf"))
+        # The oldest of the three made room for the retry.
+        assert ran == [1, 2, "flaky"]
+
+    def test_expired_updates_are_skipped(self, dm):
+        ran = []
+        dm.defer_update(_recorder(ran, "stale"))
+        dm.defer_update(_recorder(ran, "fresh"))
+        dm._deferred_heap[0][2] -= 3600
+
+        dm.process_deferred_updates(budget=float("inf"))
+
+        assert ran == ["fresh"]
+
+
+class TestBudget:
+    ITEM_SECONDS = 0.0005
+
+    def _busy(self, log, i):
+        def update():
+            end = time.perf_counter() + self.ITEM_SECONDS
+            while time.perf_counter() < end:
+                pass
+            log.append(i)
+        return update
+
+    def test_thousand_items_drain_within_budget(self, dm):
+        ran = []
+        dm._scrolling_state["max_deferred_updates"] = 2000
+        for i in range(1000):
+            dm.defer_update(self._busy(ran, i), priority=i % 3)
+
+        calls = 0
+        while dm.get_scrolling_stats()["deferred_count"]:
+            dm.process_deferred_updates(budget=0.005)
+            calls += 1
+            assert calls < 1000
+
+        expected = sorted(range(1000), key=lambda i: (i % 3, i))
+        assert ran == expected
+        # 1000 x 0.5ms of work in 5ms slices: at most ten updates per call,
+        # so at least 100 calls, where draining it all at once would be one.
+        assert calls >= 100
+
+    def test_default_budget_comes_from_state(self, dm):
+        ran = []
+        dm._scrolling_state["max_deferred_updates"] = 100
+        for i in range(20):
+            dm.defer_update(self._busy(ran, i))
+        dm._scrolling_state["deferred_update_budget"] = 0
+
+        dm.process_deferred_updates()
+
+        # A zero budget still makes progress: one update per call.
+        assert ran == [0]
+        assert dm.get_scrolling_stats()["deferred_update_budget"] == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -229,6 +229,46 @@ class TestDisplayManagerDoubleSided:
             dm.update_display()
             assert self._captured_physical(mock_rgb_matrix) is img
 
+    @staticmethod
+    def _reference_composite(logical, copies, axis):
+        """The per-frame tiling as originally written, for equivalence."""
+        from PIL import Image
+        lw, lh = logical.size
+        if axis == 'vertical':
+            phys = Image.new('RGB', (lw, lh * copies))
+        else:
+            phys = Image.new('RGB', (lw * copies, lh))
+        for i in range(copies):
+            if axis == 'vertical':
+                phys.paste(logical, (0, i * lh))
+            else:
+                phys.paste(logical, (i * lw, 0))
+        return phys
+
+    @pytest.mark.parametrize('copies,axis', [
+        (2, 'horizontal'), (4, 'horizontal'), (2, 'vertical'), (4, 'vertical'),
+    ])
+    def test_composite_matches_reference_pixel_for_pixel(self, mock_rgb_matrix, copies, axis):
+        """Precomputed offsets tile exactly like the per-copy arithmetic did."""
+        import random
+        from PIL import Image
+        DisplayManager._instance = None
+        with patch.dict('os.environ', {'EMULATOR': 'false'}):
+            dm = DisplayManager(self._config(enabled=True, copies=copies, axis=axis),
+                                suppress_test_pattern=True)
+            rng = random.Random(copies)
+            for _ in range(3):
+                logical = Image.frombytes(
+                    'RGB', dm.image.size,
+                    bytes(rng.randrange(256) for _ in range(dm.width * dm.height * 3)))
+                dm.image = logical
+                dm.update_display()
+
+                physical = self._captured_physical(mock_rgb_matrix)
+                assert physical.size == (128, 32)
+                expected = self._reference_composite(logical, copies, axis)
+                assert physical.tobytes() == expected.tobytes()
+
     def test_brightness_write_forwards_through_proxy(self, mock_rgb_matrix):
         """Setting brightness via the proxy reaches the real matrix."""
         DisplayManager._instance = None
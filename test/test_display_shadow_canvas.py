@@ -0,0 +1,219 @@
+"""Tests for per-thread shadow canvases (DisplayManager.shadow_canvas).
+
+Runs against RGBMatrixEmulator (EMULATOR=true) with the REAL DisplayManager,
+like test_display_dirty_tracking.py.
+
+Vegas mode's background prefetch used to defer every display-capture plugin
+to the render thread, because capturing swaps and draws into the shared
+canvas the render loop is pushing. Inside shadow_canvas() a thread's image,
+draw and matrix are its own, so those captures run on the prefetch thread.
+The invariants:
+- other threads (the render loop) keep seeing, and pushing, the live canvas
+- nothing a shadowed thread does reaches the matrix
+- PluginAdapter.get_content(offscreen_only=True) captures through a shadow
+  instead of giving up
+"""
+
+import os
+import sys
+import threading
+import time
+
+os.environ["EMULATOR"] = "true"
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture(scope="module")
+def dm():
+    """One real DisplayManager on the emulator (it's a process singleton)."""
+    from src.display_manager import DisplayManager
+    DisplayManager._instance = None
+    DisplayManager._initialized = False
+    manager = DisplayManager({
+        "display": {
+            "hardware": {"rows": 32, "cols": 64, "chain_length": 2,
+                         "parallel": 1, "brightness": 90},
+            "runtime": {"gpio_slowdown": 0},
+        },
+    }, suppress_test_pattern=True)
+    yield manager
+    DisplayManager._instance = None
+    DisplayManager._initialized = False
+
+
+class _MatrixSpy:
+    """Counts hardware calls through the real matrix object."""
+
+    CALLS = ("SwapOnVSync", "Clear")
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.counts = {name: 0 for name in self.CALLS}
+        self._orig = {name: getattr(matrix, name) for name in self.CALLS}
+
+    def __enter__(self):
+        for name in self.CALLS:
+            def counting(*args, _name=name, **kwargs):
+                self.counts[_name] += 1
+                return self._orig[_name](*args, **kwargs)
+            setattr(self.matrix, name, counting)
+        return self
+
+    def __exit__(self, *exc):
+        for name in self.CALLS:
+            setattr(self.matrix, name, self._orig[name])
+
+
+class CapturePlugin:
+    """A display()-only plugin: no get_vegas_content, no scroll_helper, so
+    Vegas mode can only get its content by capturing the canvas."""
+
+    def __init__(self, display_manager, color=(0, 200, 0)):
+        self.display_manager = display_manager
+        self.color = color
+        self.enabled = True
+
+    def display(self, force_clear=False):
+        dm = self.display_manager
+        dm.clear()
+        width, height = dm.matrix.width, dm.matrix.height
+        dm.draw.rectangle([0, 0, width - 1, height - 1], fill=self.color)
+        dm.update_display()
+
+
+class TestShadowCanvas:
+    def test_shadow_is_private_to_the_thread(self, dm):
+        live = dm.image
+        before = live.tobytes()
+        seen = {}
+
+        def worker():
+            with dm.shadow_canvas():
+                seen["image"] = dm.image
+                dm.draw.rectangle([0, 0, 5, 5], fill=(255, 0, 0))
+                seen["pixel"] = dm.image.getpixel((1, 1))
+            seen["after"] = dm.image
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["image"] is not live
+        assert seen["pixel"] == (255, 0, 0)
+        assert seen["after"] is live
+        assert dm.image is live
+        assert live.tobytes() == before
+
+    def test_hardware_calls_are_swallowed(self, dm):
+        with _MatrixSpy(dm.matrix) as spy:
+            with dm.shadow_canvas():
+                dm.clear()
+                dm.draw.rectangle([0, 0, 10, 10], fill=(0, 0, 255))
+                dm.update_display()
+                dm.matrix.SwapOnVSync(None)
+                dm.matrix.Clear()
+                dm.matrix.brightness = 5
+                assert dm.matrix.brightness == 90  # reads go through
+        assert spy.counts == {"SwapOnVSync": 0, "Clear": 0}
+        assert dm.matrix.brightness == 90
+
+    def test_render_size_narrows_only_the_shadow(self, dm):
+        live_width = dm.width
+        with dm.shadow_canvas():
+            with dm.capture_mode(), dm.render_size(40):
+                assert dm.matrix.width == 40
+                assert dm.image.size == (40, 32)
+            # capture_mode() restores rather than clears the flag.
+            assert dm._capture_mode_active
+            assert dm.matrix.width == live_width
+        assert dm.width == live_width
+        assert not dm._capture_mode_active
+
+    def test_nested_shadow_reuses_the_outer_one(self, dm):
+        with dm.shadow_canvas():
+            outer = dm.image
+            with dm.shadow_canvas():
+                assert dm.image is outer
+            assert dm.image is outer
+
+
+class TestConcurrentCapture:
+    def test_captures_leave_the_live_frames_unchanged(self, dm):
+        from src.vegas_mode.plugin_adapter import PluginAdapter
+
+        adapter = PluginAdapter(dm)
+        plugins = [CapturePlugin(dm, color=(0, 40 + 40 * i, 0)) for i in range(4)]
+        stop = threading.Event()
+        captured, errors = [], []
+
+        def capture_loop(index):
+            try:
+                while not stop.is_set():
+                    adapter.invalidate_cache(f"capture-{index}")
+                    images = adapter.get_content(
+                        plugins[index], f"capture-{index}", offscreen_only=True)
+                    captured.append((index, images))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        workers = [threading.Thread(target=capture_loop, args=(i,)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+
+        # The render loop: draw a known frame, push it, check what was
+        # pushed and what the canvas still holds.
+        pushed = []
+        for canvas in (dm.offscreen_canvas, dm.current_canvas):
+            def recording(image, *args, _orig=canvas.SetImage, **kwargs):
+                pushed.append(image.tobytes())
+                return _orig(image, *args, **kwargs)
+            canvas.SetImage = recording
+
+        mismatches = 0
+        try:
+            deadline = time.monotonic() + 1.5
+            frame = 0
+            while time.monotonic() < deadline:
+                frame += 1
+                color = (frame % 200 + 20, 0, 100)
+                expected = Image.new("RGB", dm.image.size, color)
+                dm.image.paste(expected)
+                dm.update_display()
+                if dm.image.tobytes() != expected.tobytes():
+                    mismatches += 1
+                if pushed and pushed[-1] != expected.tobytes():
+                    mismatches += 1
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+            for canvas in (dm.offscreen_canvas, dm.current_canvas):
+                del canvas.SetImage
+
+        assert not errors
+        assert frame > 10
+        assert mismatches == 0
+        assert len(captured) > 10
+        for index, images in captured:
+            assert images, "off-thread capture gave up"
+            assert images[0].getpixel((0, 0)) == plugins[index].color
+
+    def test_offscreen_only_without_shadow_support_still_defers(self):
+        from src.vegas_mode.plugin_adapter import PluginAdapter
+
+        class LegacyDisplayManager:
+            width = 64
+            height = 32
+            image = Image.new("RGB", (64, 32))
+
+        adapter = PluginAdapter(LegacyDisplayManager())
+        plugin = CapturePlugin(LegacyDisplayManager())
+        assert adapter.get_content(plugin, "legacy", offscreen_only=True) is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -7,17 +7,29 @@ class-shared rankings cache (fetch and clear_cache write through
 DynamicTeamResolver._rankings_cache / _cache_timestamp), TTL expiry,
 network-failure resilience, and the resolve_dynamic_teams module function.
 
-No real network: src.dynamic_team_resolver.requests.get is always patched.
+No real network: src.dynamic_team_resolver.requests.get is patched, except in
+TestSingleFlightAndPersistence, which fetches from a local stub server.
 """
 
+import json
+import threading
+import time
 import types
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
 import src.dynamic_team_resolver as dtr_module
-from src.dynamic_team_resolver import DynamicTeamResolver, resolve_dynamic_teams
+from src.cache_manager import CacheManager
+from src.dynamic_team_resolver import (
+    DynamicTeamResolver,
+    RANKINGS_RETRY_DELAY,
+    next_rankings_release,
+    resolve_dynamic_teams,
+)
 
 
 TOP_TEAMS = ['UGA', 'MICH', 'OSU', 'TEX', 'ALA', 'ORE', 'PSU', 'ND', 'FSU', 'OU']
@@ -48,9 +60,11 @@ def reset_class_cache():
     """Reset the CLASS-level shared cache between tests."""
     DynamicTeamResolver._rankings_cache = {}
     DynamicTeamResolver._cache_timestamp = 0
+    DynamicTeamResolver._cache_expires_at = 0
     yield
     DynamicTeamResolver._rankings_cache = {}
     DynamicTeamResolver._cache_timestamp = 0
+    DynamicTeamResolver._cache_expires_at = 0
 
 
 @pytest.fixture
@@ -190,13 +204,49 @@ class TestSharedCache:
         resolver.resolve_teams(['AP_TOP_5'])
         assert mock_get.call_count == 1
 
-        stamp = DynamicTeamResolver._cache_timestamp
+        expires_at = DynamicTeamResolver._cache_expires_at
+        assert expires_at == next_rankings_release(DynamicTeamResolver._cache_timestamp)
         monkeypatch.setattr(
-            dtr_module, 'time', types.SimpleNamespace(time=lambda: stamp + 3601))
+            dtr_module, 'time', types.SimpleNamespace(time=lambda: expires_at - 1))
+        resolver.resolve_teams(['AP_TOP_5'])
+        assert mock_get.call_count == 1
+
+        monkeypatch.setattr(
+            dtr_module, 'time', types.SimpleNamespace(time=lambda: expires_at))
+        resolver.resolve_teams(['AP_TOP_5'])
+        assert mock_get.call_count == 2
 
+    def test_stale_rankings_used_when_refetch_fails(self, resolver, mock_get, monkeypatch):
         resolver.resolve_teams(['AP_TOP_5'])
+        expires_at = DynamicTeamResolver._cache_expires_at
+        monkeypatch.setattr(
+            dtr_module, 'time', types.SimpleNamespace(time=lambda: expires_at + 60))
+        mock_get.side_effect = requests.exceptions.RequestException('boom')
+
+        assert resolver.resolve_teams(['AP_TOP_5']) == TOP_TEAMS[:5]
         assert mock_get.call_count == 2
 
+    def test_failed_refetch_is_not_retried_before_the_delay(self, resolver, mock_get, monkeypatch):
+        resolver.resolve_teams(['AP_TOP_5'])
+        now = [DynamicTeamResolver._cache_expires_at + 60]
+        monkeypatch.setattr(dtr_module, 'time', types.SimpleNamespace(time=lambda: now[0]))
+        ok_response = mock_get.return_value
+        mock_get.side_effect = requests.exceptions.RequestException('boom')
+        resolver.resolve_teams(['AP_TOP_5'])
+
+        # An ESPN outage: nobody waits on it again for the retry delay.
+        now[0] += RANKINGS_RETRY_DELAY - 1
+        for _ in range(5):
+            assert resolver.resolve_teams(['AP_TOP_5']) == TOP_TEAMS[:5]
+        assert mock_get.call_count == 2
+
+        mock_get.side_effect = None
+        mock_get.return_value = ok_response
+        now[0] += 1
+        assert resolver.resolve_teams(['AP_TOP_5']) == TOP_TEAMS[:5]
+        assert mock_get.call_count == 3
+        assert DynamicTeamResolver._cache_expires_at > now[0]
+
     def test_clear_cache_through_one_instance_affects_all(self, mock_get):
         resolver1 = DynamicTeamResolver()
         resolver1.resolve_teams(['AP_TOP_5'])
@@ -220,6 +270,137 @@ class TestSharedCache:
         assert mock_get.call_count == 1
 
 
+# ---------------------------------------------------------------------------
+# Weekly expiry
+# ---------------------------------------------------------------------------
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class TestNextRankingsRelease:
+    def test_midweek_expires_next_sunday(self):
+        # Wednesday 2024-10-16
+        assert next_rankings_release(_utc(2024, 10, 16, 12)) == _utc(2024, 10, 20, 22)
+
+    def test_sunday_before_and_after_release(self):
+        assert next_rankings_release(_utc(2024, 10, 20, 15)) == _utc(2024, 10, 20, 22)
+        assert next_rankings_release(_utc(2024, 10, 20, 22)) == _utc(2024, 10, 27, 22)
+        assert next_rankings_release(_utc(2024, 10, 20, 23)) == _utc(2024, 10, 27, 22)
+
+
+# ---------------------------------------------------------------------------
+# Single-flight fetching and persistence (real HTTP, local server)
+# ---------------------------------------------------------------------------
+
+class _RankingsServer:
+    """Local stub of the ESPN rankings endpoint that counts requests."""
+
+    def __init__(self, delay=0.2):
+        self.hits = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.hits += 1
+                time.sleep(delay)
+                body = json.dumps(_rankings_payload()).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}/rankings'
+        threading.Thread(target=self.httpd.serve_forever,
+                         kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def rankings_server(monkeypatch):
+    server = _RankingsServer()
+    monkeypatch.setattr(DynamicTeamResolver, 'RANKINGS_URL', server.url)
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    with patch('src.cache_manager.CacheManager._get_writable_cache_dir',
+               return_value=str(tmp_path)):
+        cm = CacheManager()
+    yield cm
+    cm.stop_cleanup_thread()
+
+
+class TestSingleFlightAndPersistence:
+    def test_concurrent_resolvers_share_one_fetch(self, rankings_server, cache_manager):
+        barrier = threading.Barrier(5)
+        results = []
+
+        def resolve():
+            resolver = DynamicTeamResolver(cache_manager=cache_manager)
+            barrier.wait()
+            results.append(resolver.resolve_teams(['AP_TOP_25']))
+
+        threads = [threading.Thread(target=resolve) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert rankings_server.hits == 1
+        assert results == [TOP_TEAMS] * 5
+
+    def test_restart_reuses_persisted_rankings(self, rankings_server, cache_manager, tmp_path):
+        DynamicTeamResolver(cache_manager=cache_manager).resolve_teams(['AP_TOP_5'])
+        assert rankings_server.hits == 1
+
+        # A new process: nothing in memory, a fresh CacheManager on the same dir.
+        DynamicTeamResolver._rankings_cache = {}
+        DynamicTeamResolver._cache_expires_at = 0
+        with patch('src.cache_manager.CacheManager._get_writable_cache_dir',
+                   return_value=str(tmp_path)):
+            restarted = CacheManager()
+        try:
+            result = resolve_dynamic_teams(['AP_TOP_10'], cache_manager=restarted)
+        finally:
+            restarted.stop_cleanup_thread()
+
+        assert result == TOP_TEAMS[:10]
+        assert rankings_server.hits == 1
+
+    def test_expired_persisted_rankings_are_refetched(self, rankings_server, cache_manager):
+        cache_manager.set('dynamic_team_rankings_ncaa_fb', {
+            'rankings': [['OLD', 1]],
+            'fetched_at': time.time() - 8 * 86400,
+            'expires_at': time.time() - 86400,
+        })
+
+        result = DynamicTeamResolver(cache_manager=cache_manager).resolve_teams(['AP_TOP_5'])
+
+        assert result == TOP_TEAMS[:5]
+        assert rankings_server.hits == 1
+
+    def test_clear_cache_removes_persisted_rankings(self, rankings_server, cache_manager):
+        resolver = DynamicTeamResolver(cache_manager=cache_manager)
+        resolver.resolve_teams(['AP_TOP_5'])
+
+        resolver.clear_cache()
+        resolver.resolve_teams(['AP_TOP_5'])
+
+        assert rankings_server.hits == 2
+
+
 # ---------------------------------------------------------------------------
 # Failure handling
 # ---------------------------------------------------------------------------
@@ -7,12 +7,16 @@ Tests:
 - Error summary generation
 - Plugin health tracking
 - Thread safety
+- Bucketing and bounded memory under an error flood
 """
 
 from datetime import datetime, timedelta
 from pathlib import Path
 import threading
 import sys
+import tracemalloc
+
+import pytest
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -20,10 +24,14 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from src.error_aggregator import (
+    EXEMPLARS_PER_BUCKET,
+    MAX_SAMPLE_MESSAGES,
+    PATTERN_WINDOW_SLOTS,
     ErrorAggregator,
     ErrorRecord,
     ErrorPattern,
     get_error_aggregator,
+    normalize_message,
     record_error
 )
 from src.exceptions import PluginError
@@ -188,6 +196,139 @@ class TestPatternDetection:
         assert callback_called[0].error_type == "ValueError"
 
 
+class TestBucketing:
+    """Test bucketing of repeated errors."""
+
+    def test_variable_tokens_share_a_bucket(self):
+        """Errors differing only in numbers or ids should share a bucket."""
+        aggregator = ErrorAggregator()
+
+        for port in (443, 8443, 80):
+            aggregator.record_error(
+                error=ConnectionError(f"HTTPSConnectionPool(port={port}): Max retries exceeded"),
+                plugin_id="weather"
+            )
+        aggregator.record_error(error=ConnectionError("Name resolution failed"), plugin_id="weather")
+        aggregator.record_error(error=ConnectionError("Name resolution failed"), plugin_id="stocks")
+
+        buckets = aggregator.get_error_summary()["error_buckets"]
+        assert [(b["plugin_id"], b["count"]) for b in buckets] == [
+            ("weather", 3), ("weather", 1), ("stocks", 1)]
+        assert buckets[0]["message"] == "HTTPSConnectionPool(port=<n>): Max retries exceeded"
+        assert len(buckets[0]["exemplars"]) == 3
+
+    def test_normalize_message(self):
+        assert normalize_message("id 0x7f3a2c timed out after 30s") == "id <n> timed out after <n>"
+        assert normalize_message("deadbeef is not a number") == "deadbeef is not a number"
+
+    def test_least_recently_seen_bucket_evicted(self):
+        """The bucket count should not exceed max_buckets."""
+        aggregator = ErrorAggregator(max_buckets=3)
+
+        for name in ("alpha", "beta", "gamma"):
+            aggregator.record_error(error=ValueError(f"bad {name}"))
+        aggregator.record_error(error=ValueError("bad alpha"))
+        aggregator.record_error(error=ValueError("bad delta"))
+
+        summary = aggregator.get_error_summary()
+        assert {b["message"] for b in summary["error_buckets"]} == {
+            "bad alpha", "bad gamma", "bad delta"}
+        assert summary["evicted_buckets"] == 1
+        assert summary["total_errors"] == 5
+
+    def test_pattern_plugins_not_duplicated(self):
+        """Updating a pattern should not keep appending its plugins."""
+        aggregator = ErrorAggregator(pattern_threshold=2)
+
+        for _ in range(50):
+            aggregator.record_error(error=TimeoutError("slow"), plugin_id="plugin-a")
+            aggregator.record_error(error=TimeoutError("slow"), plugin_id="plugin-b")
+
+        pattern = aggregator._patterns["TimeoutError"]
+        assert pattern.count == 100
+        assert sorted(pattern.affected_plugins) == ["plugin-a", "plugin-b"]
+
+    def test_pattern_window_slides(self, monkeypatch):
+        """Errors older than the window should stop counting."""
+        import src.error_aggregator as module
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        aggregator = ErrorAggregator(pattern_threshold=3, pattern_window_minutes=1)
+
+        aggregator.record_error(error=ValueError("x"))
+        aggregator.record_error(error=ValueError("x"))
+        now[0] += 61
+        aggregator.record_error(error=ValueError("x"))
+
+        assert "ValueError" not in aggregator._patterns
+
+    def test_clear_old_records_drops_stale_buckets(self):
+        aggregator = ErrorAggregator()
+        aggregator.record_error(error=ValueError("old"))
+        aggregator.record_error(error=ValueError("new"))
+        old_bucket = next(iter(aggregator._buckets.values()))
+        old_bucket.last_seen = datetime.now() - timedelta(hours=48)
+
+        aggregator.clear_old_records(max_age_hours=24)
+
+        assert [b.message for b in aggregator._buckets.values()] == ["new"]
+
+
+@pytest.mark.slow
+class TestErrorFlood:
+    """An outage where every plugin fails every cycle."""
+
+    def test_flood_has_bounded_memory_and_constant_cost(self):
+        aggregator = ErrorAggregator(max_records=1000, max_buckets=200)
+        new_patterns = []
+        aggregator.on_pattern_detected(lambda pattern: new_patterns.append(pattern.error_type))
+        plugins = [f"plugin-{i}" for i in range(40)]
+        total = 100_000
+        chunk = 10_000
+        sizes = []
+        most_slots = 0
+
+        tracemalloc.start()
+        try:
+            for start in range(0, total, chunk):
+                for i in range(start, start + chunk):
+                    plugin = plugins[i % len(plugins)]
+                    if i % 10 == 0:
+                        # Messages that never repeat, so buckets keep being evicted
+                        error = ValueError("unexpected payload from " + "".join(
+                            chr(97 + int(d)) for d in str(i)))
+                    else:
+                        error = ConnectionError(
+                            f"HTTPSConnectionPool(host='api.example.com', port=443): "
+                            f"Max retries exceeded (attempt {i})")
+                    aggregator.record_error(error=error, plugin_id=plugin, operation="update")
+                sizes.append(tracemalloc.get_traced_memory()[0])
+                most_slots = max([most_slots] + [
+                    len(window._slots) for window in aggregator._type_windows.values()])
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        summary = aggregator.get_error_summary()
+        assert summary["total_errors"] == total
+        assert summary["bucket_count"] <= 200
+        assert len(aggregator._records) == 1000
+        assert summary["active_patterns"]["ConnectionError"]["count"] == total * 9 // 10
+        # Memory stops growing once the record ring and the buckets are full...
+        assert sizes[-1] < sizes[1] * 1.5
+        assert peak < 16 * 1024 * 1024
+        # ...and so does the work per error: the pattern windows keep a
+        # bounded number of slots, buckets a bounded number of exemplars,
+        # and the scan over every bucket runs once per new pattern only.
+        assert most_slots <= PATTERN_WINDOW_SLOTS
+        assert all(len(b.exemplars) <= EXEMPLARS_PER_BUCKET
+                   for b in aggregator._buckets.values())
+        assert sorted(new_patterns) == ["ConnectionError", "ValueError"]
+        for pattern in aggregator._patterns.values():
+            assert len(pattern.affected_plugins) <= len(plugins)
+            assert len(pattern.sample_messages) <= MAX_SAMPLE_MESSAGES
+
+
 class TestErrorSummary:
     """Test error summary generation."""
 
@@ -8,6 +8,8 @@ test here asserts observable behavior: returned font types, cache identity,
 fallback selection, and BDF native-size reading.
 """
 
+import random
+
 import freetype
 import pytest
 from PIL import ImageFont
@@ -109,6 +111,99 @@ class TestMeasureText:
         assert long > short
 
 
+def _reference_bdf_measure(text, face):
+    """measure_text's BDF branch as it was before the glyph table: one
+    load_char per character, on every string-cache miss."""
+    width = 0
+    height = 0
+    max_ascender = 0
+    for char in text:
+        face.load_char(char)
+        width += face.glyph.advance.x >> 6
+        height = max(height, face.glyph.bitmap.rows)
+        max_ascender = max(max_ascender, face.size.ascender >> 6)
+    return (width, height, max_ascender)
+
+
+def _score_strings(n, seed=1234):
+    """Scoreboard/clock/ticker-shaped strings, nearly all unique."""
+    rng = random.Random(seed)
+    teams = ["NYY", "BOS", "LAD", "SF", "KC", "TB", "CHW", "ATL", "ÉTÉ"]
+    shapes = [
+        lambda: f"{rng.choice(teams)} {rng.randint(0, 150)} - {rng.randint(0, 150)} {rng.choice(teams)}",
+        lambda: f"Q{rng.randint(1, 4)} {rng.randint(0, 15)}:{rng.randint(0, 59):02d}",
+        lambda: f"{rng.randint(1, 12)}:{rng.randint(0, 59):02d} {rng.choice(['AM', 'PM'])}",
+        lambda: f"{rng.choice(teams)} {rng.uniform(-9, 9):+.2f}%",
+        lambda: f"{rng.randint(0, 3)}-{rng.randint(0, 2)} {rng.choice(['T', 'B'])}{rng.randint(1, 9)}",
+    ]
+    return [rng.choice(shapes)() for _ in range(n)]
+
+
+BDF_FAMILIES = ["5x7", "4x6", "6x10", "9x15b", "matrixchunky8", "tom-thumb"]
+
+
+def _bdf(fm, family):
+    return fm.get_font(family, fm.get_native_bdf_size(family))
+
+
+class TestBdfGlyphTable:
+    @pytest.mark.parametrize("family", BDF_FAMILIES)
+    def test_matches_per_character_load_char(self, fm, family):
+        face = _bdf(fm, family)
+        assert isinstance(face, freetype.Face)
+        texts = _score_strings(500) + ["", " ", "0", "\u2603", "~!@#$%^&*()"]
+        for text in texts:
+            assert fm.measure_text(text, face) == _reference_bdf_measure(text, face), text
+
+    def test_faces_get_separate_tables(self, fm):
+        small = _bdf(fm, "4x6")
+        large = _bdf(fm, "9x15b")
+        assert fm.measure_text("88", small) != fm.measure_text("88", large)
+        assert fm.measure_text("88", small) == _reference_bdf_measure("88", small)
+
+    def test_each_character_is_loaded_once(self, fm, monkeypatch):
+        face = _bdf(fm, "5x7")
+        fm.measure_text("warm", face)
+        calls = []
+        original = freetype.Face.load_char
+        monkeypatch.setattr(freetype.Face, "load_char",
+                            lambda self, *a, **kw: (calls.append(a[0]), original(self, *a, **kw))[1])
+        fm.measure_text("mraw", face)
+        fm.measure_text("a warm raw mar", face)
+        assert calls == [" "]
+
+    def test_bdf_strings_stay_out_of_the_string_cache(self, fm):
+        face = _bdf(fm, "5x7")
+        for text in _score_strings(50):
+            fm.measure_text(text, face)
+        assert not fm.metrics_cache
+
+    def test_clear_cache_drops_glyph_tables(self, fm):
+        fm.measure_text("1-0", _bdf(fm, "5x7"))
+        fm.clear_cache()
+        assert not fm._bdf_glyph_tables
+
+
+class TestBdfMeasureVolume:
+    """10k unique score strings: one load_char per distinct character, not
+    one per character of every string."""
+
+    def test_glyph_table_loads_each_character_once(self, fm, monkeypatch):
+        face = _bdf(fm, "5x7")
+        texts = _score_strings(10_000, seed=99)
+        reference = [_reference_bdf_measure(t, face) for t in texts]
+
+        calls = []
+        original = freetype.Face.load_char
+        monkeypatch.setattr(freetype.Face, "load_char",
+                            lambda self, *a, **kw: (calls.append(a[0]), original(self, *a, **kw))[1])
+        measured = [fm.measure_text(t, face) for t in texts]
+
+        assert measured == reference
+        assert len(calls) == len(set("".join(texts)))
+        assert len(calls) < sum(len(t) for t in texts) / 1000
+
+
 class TestCacheLifecycle:
     def test_clear_cache_empties_both_caches(self, fm):
         font = fm.get_font("press_start", 8)
@@ -0,0 +1,200 @@
+"""Tests for the frame-time histograms (src/frame_timing.py).
+
+Frame times used to be kept as raw samples and sorted for a p99 in the Vegas
+log line, and not measured at all in the plugin display loops. These check
+the bucketed percentiles against that exact nearest-rank percentile on
+synthetic frame-time distributions, the per-thread counters against one
+merged histogram, the status file the web UI reads, and what record() costs.
+"""
+
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from src.frame_timing import (
+    BUCKET_COUNT,
+    MAX_FRAME_US,
+    SUB_BUCKETS,
+    FrameTimeRecorder,
+    bucket_bounds,
+    bucket_index,
+)
+from src.vegas_mode.coordinator import _percentile
+
+FRACTIONS = (0.5, 0.9, 0.99, 0.999)
+
+
+def steady_with_stutter(rng, n):
+    """~8ms frames with jitter, and one in 200 a 40-200ms stall."""
+    return [rng.uniform(0.040, 0.200) if rng.random() < 0.005
+            else rng.lognormvariate(-4.8, 0.15) for _ in range(n)]
+
+
+def bimodal(rng, n):
+    """Scrolling frames (~3ms) mixed with full redraws (~30ms)."""
+    return [rng.gauss(0.030, 0.004) if rng.random() < 0.2
+            else rng.gauss(0.003, 0.0005) for _ in range(n)]
+
+
+def uniform(rng, n):
+    return [rng.uniform(0.0001, 1.0) for _ in range(n)]
+
+
+class TestBuckets:
+    def test_every_value_falls_inside_its_bucket(self):
+        rng = random.Random(1)
+        values = list(range(0, 5000)) + [rng.randrange(MAX_FRAME_US) for _ in range(20000)]
+        for value in values + [MAX_FRAME_US]:
+            low, high = bucket_bounds(bucket_index(value))
+            assert low <= value < high, value
+
+    def test_buckets_are_contiguous_and_relatively_narrow(self):
+        previous_high = 0
+        for index in range(BUCKET_COUNT):
+            low, high = bucket_bounds(index)
+            assert low == previous_high
+            if low >= 2 * SUB_BUCKETS:
+                assert (high - low) / low <= 1.0 / SUB_BUCKETS
+            previous_high = high
+        assert previous_high > MAX_FRAME_US
+
+
+class TestAccuracy:
+    @pytest.mark.parametrize('distribution', [steady_with_stutter, bimodal, uniform])
+    def test_percentiles_match_the_exact_nearest_rank(self, distribution):
+        samples = distribution(random.Random(7), 50000)
+        recorder = FrameTimeRecorder()
+        for seconds in samples:
+            recorder.record('vegas', seconds)
+        histogram = recorder.histogram('vegas')
+        ordered = sorted(samples)
+
+        assert histogram.count == len(samples)
+        for fraction in FRACTIONS:
+            exact = _percentile(ordered, fraction)
+            assert histogram.percentile(fraction) == pytest.approx(exact, rel=0.02), fraction
+        # The maximum and the mean are kept exactly (to the microsecond).
+        assert histogram.max == pytest.approx(ordered[-1], abs=1e-6)
+        assert histogram.mean == pytest.approx(sum(samples) / len(samples), abs=1e-6)
+
+    def test_stutter_shows_in_the_tail_not_the_median(self):
+        recorder = FrameTimeRecorder()
+        for _ in range(990):
+            recorder.record('plugin', 0.008)
+        for _ in range(10):
+            recorder.record('plugin', 0.150)
+        summary = recorder.histogram('plugin').to_dict()
+
+        assert summary['p50_ms'] == pytest.approx(8.0, rel=0.02)
+        assert summary['p99_ms'] == pytest.approx(8.0, rel=0.02)
+        assert summary['p999_ms'] == pytest.approx(150.0, rel=0.02)
+        assert summary['max_ms'] == 150.0
+
+    def test_out_of_range_frames_are_clamped(self):
+        recorder = FrameTimeRecorder()
+        recorder.record('plugin', -0.5)
+        recorder.record('plugin', 3600.0)
+        histogram = recorder.histogram('plugin')
+
+        assert histogram.count == 2
+        assert histogram.percentile(0.0) == 0.0
+        assert histogram.max == MAX_FRAME_US / 1e6
+
+    def test_empty_label(self):
+        summary = FrameTimeRecorder().histogram('on_demand').to_dict()
+        assert summary['count'] == 0 and summary['p99_ms'] == 0.0 and summary['buckets'] == []
+
+
+class TestThreads:
+    def test_per_thread_counts_merge_to_the_single_thread_histogram(self):
+        samples = steady_with_stutter(random.Random(3), 40000)
+        recorder = FrameTimeRecorder()
+        chunks = [samples[i::4] for i in range(4)]
+        threads = [threading.Thread(target=lambda chunk=chunk: [recorder.record('vegas', s) for s in chunk])
+                   for chunk in chunks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        single = FrameTimeRecorder()
+        for seconds in samples:
+            single.record('vegas', seconds)
+
+        assert len(recorder._tables['vegas']) == 4
+        assert recorder.histogram('vegas').to_dict() == single.histogram('vegas').to_dict()
+
+    def test_labels_are_kept_apart(self):
+        recorder = FrameTimeRecorder()
+        recorder.record('plugin', 0.004)
+        recorder.record('vegas', 0.008)
+        recorder.record('vegas', 0.009)
+
+        assert recorder.labels() == ['plugin', 'vegas']
+        assert recorder.histogram('plugin').count == 1
+        assert recorder.histogram('vegas').count == 2
+
+    def test_reset_keeps_threads_recording(self):
+        recorder = FrameTimeRecorder()
+        recorder.record('plugin', 0.004)
+        recorder.reset()
+        assert recorder.histogram('plugin').count == 0
+
+        recorder.record('plugin', 0.004)
+        assert recorder.histogram('plugin').count == 1
+
+
+class TestStatusFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / 'frame_times.json'
+        recorder = FrameTimeRecorder()
+        for seconds in (0.008, 0.009, 0.031):
+            recorder.record('vegas', seconds)
+
+        recorder.write_status_file(str(path))
+
+        data = json.loads(path.read_text())
+        assert list(data['labels']) == ['vegas']
+        vegas = data['labels']['vegas']
+        assert vegas['count'] == 3 and vegas['max_ms'] == 31.0
+        assert sum(count for _, _, count in vegas['buckets']) == 3
+        assert not list(tmp_path.glob('.led_frame_times_*'))
+
+    def test_writer_writes_only_when_frames_were_recorded(self, tmp_path):
+        path = tmp_path / 'frame_times.json'
+        recorder = FrameTimeRecorder()
+        recorder.start_status_writer(str(path), interval=0.05)
+        try:
+            time.sleep(0.2)
+            assert not path.exists()
+
+            recorder.record('plugin', 0.004)
+            deadline = time.monotonic() + 2.0
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert json.loads(path.read_text())['labels']['plugin']['count'] == 1
+            written = path.stat().st_mtime_ns
+            time.sleep(0.2)
+            assert path.stat().st_mtime_ns == written
+        finally:
+            recorder.stop_status_writer()
+
+
+@pytest.mark.slow
+class TestOverhead:
+    def test_record_cost(self):
+        recorder = FrameTimeRecorder()
+        rng = random.Random(5)
+        samples = steady_with_stutter(rng, 100000)
+        recorder.record('vegas', samples[0])  # first call registers the thread
+
+        started = time.perf_counter()
+        for seconds in samples:
+            recorder.record('vegas', seconds)
+        per_record = (time.perf_counter() - started) / len(samples)
+
+        # An 8ms frame budget at 125fps; generous for slow CI machines.
+        assert per_record < 20e-6
@@ -1,9 +1,9 @@
-"""Tests that startup does not wait indefinitely for plugins to fetch data.
+"""Tests that startup does not wait on plugins to fetch data one at a time.
 
 DisplayController.__init__ calls _update_modules() once, to populate plugin
-data before the first frame. It walks every loaded plugin in turn, and each
-update blocks the calling thread for up to the executor's 30s timeout, so the
-uncapped total is the sum of every slow plugin on the system.
+data before the first frame. It used to walk every loaded plugin in turn, and
+each update blocks for up to the executor's 30s timeout, so the uncapped total
+was the sum of every slow plugin on the system.
 
 Profiled on a live rig with py-spy, the main thread sat 9.34s in
 
@@ -15,12 +15,16 @@ and the controller's own log put the full pass at 82 seconds on the worst
 boot measured (55 and 26 on the two before). The panel shows nothing for all
 of it.
 
-Nothing is lost by stopping early: a plugin that has never updated is
-immediately due, so run_scheduled_updates() collects it seconds later with the
-display already running.
+The pass now runs the updates across a bounded pool and returns as soon as the
+first plugin has data. Updates still in flight finish in the background;
+plugins that had not started by the deadline are left to the update tick. A
+plugin that has never updated is immediately due, so run_scheduled_updates()
+collects it seconds later with the display already running.
 """
 
 import os
+import random
+import threading
 import time
 from unittest.mock import Mock
 
@@ -32,24 +36,50 @@ import pytest
 os.environ.setdefault("EMULATOR", "true")
 
 from src.display_controller import (  # noqa: E402
-    DisplayController, _INITIAL_UPDATE_BUDGET_SECONDS,
+    DisplayController, _INITIAL_UPDATE_BUDGET_SECONDS, _INITIAL_UPDATE_WORKERS,
     _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS)
 
 
-class FakeExecutor:
-    """Records which plugins were updated, and can make some of them slow."""
-
-    def __init__(self, cost=0.0, slow=()):
-        self.updated = []
-        self.cost = cost
-        self.slow = set(slow)
-
-    def execute_update(self, plugin, plugin_id, timeout=None):
-        self.updated.append(plugin_id)
-        if plugin_id in self.slow:
-            time.sleep(self.cost)
+class FakePluginManager:
+    """Stands in for PluginManager.update_plugin_now with per-plugin latency."""
+
+    def __init__(self, plugin_ids, latency=None, fail=()):
+        self.loaded_plugins = {pid: Mock() for pid in plugin_ids}
+        self.plugins = dict(self.loaded_plugins)
+        self.plugin_last_update = {}
+        self.health_tracker = None
+        self.latency = latency or {}
+        self.fail = set(fail)
+        self.started = []
+        self.finished = []
+        self.timeouts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def update_plugin_now(self, plugin_id, timeout=None):
+        with self._lock:
+            self.started.append(plugin_id)
+            self.timeouts.append(timeout)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency.get(plugin_id, 0.0))
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.finished.append(plugin_id)
+        if plugin_id in self.fail:
+            return False
+        self.plugin_last_update[plugin_id] = time.time()
         return True
 
+    def wait_finished(self, count, timeout=10.0):
+        end = time.time() + timeout
+        while len(self.finished) < count and time.time() < end:
+            time.sleep(0.01)
+        return len(self.finished) >= count
+
 
 @pytest.fixture
 def tiny_floor(monkeypatch):
@@ -58,91 +88,109 @@ def tiny_floor(monkeypatch):
     monkeypatch.setattr(mod, "_MIN_INITIAL_UPDATE_TIMEOUT_SECONDS", 0.01)
 
 
-def _controller(plugin_ids, executor):
+def _controller(pm):
     c = DisplayController.__new__(DisplayController)
-    c.plugin_manager = Mock()
-    # Both attributes, because _update_modules reads
-    # `loaded_plugins or plugins` and an empty dict is falsy.
-    c.plugin_manager.loaded_plugins = {pid: Mock() for pid in plugin_ids}
-    c.plugin_manager.plugins = dict(c.plugin_manager.loaded_plugins)
-    c.plugin_manager.plugin_executor = executor
-    c.plugin_manager.plugin_last_update = {}
-    c.plugin_manager.health_tracker = None
+    c.plugin_manager = pm
     return c
 
 
-class TestTheBudgetIsRespected:
-    def test_without_a_deadline_every_plugin_is_updated(self):
-        ex = FakeExecutor()
-        _controller(['a', 'b', 'c'], ex)._update_modules()
-        assert ex.updated == ['a', 'b', 'c']
-
-    def test_a_passed_deadline_stops_the_pass(self):
-        ex = FakeExecutor()
-        _controller(['a', 'b', 'c'], ex)._update_modules(deadline=time.time() - 1)
-        assert ex.updated == [], "updated %r after the deadline" % ex.updated
-
-    def test_slow_plugins_do_not_drag_in_the_rest(self, tiny_floor):
-        # One plugin burns the whole budget; the remainder must be left alone
-        # rather than each adding its own wait.
-        ex = FakeExecutor(cost=0.3, slow={'slow'})
-        c = _controller(['slow'] + ['p%d' % i for i in range(20)], ex)
+class TestTimeToFirstDisplay:
+    def test_twenty_plugins_wait_for_the_fastest_not_the_sum(self):
+        rng = random.Random(7)
+        ids = ['p%02d' % i for i in range(20)]
+        latency = {pid: rng.uniform(0.3, 1.2) for pid in ids}
+        # The pool starts the first _INITIAL_UPDATE_WORKERS plugins together,
+        # so the fastest of those is the first on screen.
+        fastest = min(ids[:_INITIAL_UPDATE_WORKERS], key=latency.get)
+        latency[fastest] = 0.1
+        pm = FakePluginManager(ids, latency)
+
         started = time.time()
-        c._update_modules(deadline=started + 0.2)
+        first = _controller(pm)._update_modules(deadline=started + 30)
         elapsed = time.time() - started
 
-        assert ex.updated == ['slow'], "updated %r" % ex.updated
-        # Bounded by the one in-flight update, not by twenty more.
-        assert elapsed < 1.0, "%.2fs" % elapsed
-
-    def test_a_generous_deadline_still_gets_everything(self):
-        ex = FakeExecutor()
-        c = _controller(['a', 'b', 'c'], ex)
-        c._update_modules(deadline=time.time() + 30)
-        assert ex.updated == ['a', 'b', 'c']
+        assert first == fastest
+        # Roughly the minimum latency; the serial sum is over 10 seconds.
+        assert elapsed < 0.1 + 0.25, "%.2fs to first display" % elapsed
+        assert sum(latency.values()) > 5
+        # The rest carry on in the background and all complete.
+        assert pm.wait_finished(20), pm.finished
+        assert set(pm.plugin_last_update) == set(ids)
+
+    def test_the_pool_is_bounded(self):
+        ids = ['p%d' % i for i in range(12)]
+        pm = FakePluginManager(ids, {pid: 0.05 for pid in ids})
+        _controller(pm)._update_modules()
+        assert pm.max_active <= _INITIAL_UPDATE_WORKERS
+        assert len(pm.finished) == 12
+
+    def test_a_failed_update_does_not_count_as_first(self):
+        pm = FakePluginManager(['broken', 'ok'], {'broken': 0.0, 'ok': 0.1},
+                               fail={'broken'})
+        first = _controller(pm)._update_modules(deadline=time.time() + 5)
+        assert first == 'ok'
 
-    def test_the_deadline_is_checked_before_each_plugin(self, tiny_floor):
-        # Not just once up front: the budget can be spent partway through.
-        ex = FakeExecutor(cost=0.15, slow={'a', 'b', 'c', 'd'})
-        c = _controller(['a', 'b', 'c', 'd'], ex)
-        c._update_modules(deadline=time.time() + 0.2)
-        assert 0 < len(ex.updated) < 4, "updated %r" % ex.updated
-
-
-class TestThePassIsBoundedInPractice:
-    def test_the_last_plugin_cannot_overrun_the_budget(self):
-        # Checking the deadline before each plugin is not enough on its own:
-        # one that starts with a moment left could still block for the
-        # executor's full timeout. On the rig that turned a 20s budget into a
-        # 31.8s pass, so the remaining budget is passed down as the timeout.
-        seen = []
+    def test_without_a_deadline_every_plugin_is_updated(self):
+        pm = FakePluginManager(['a', 'b', 'c'])
+        _controller(pm)._update_modules()
+        assert sorted(pm.finished) == ['a', 'b', 'c']
 
-        class Executor:
-            def execute_update(self, plugin, plugin_id, timeout=None):
-                seen.append(timeout)
-                return True
 
-        c = _controller(['a', 'b', 'c'], Executor())
-        deadline = time.time() + 5
-        c._update_modules(deadline=deadline)
+class TestStragglersRunInTheBackground:
+    def test_a_slow_plugin_is_not_cut_off_at_the_deadline(self, tiny_floor):
+        pm = FakePluginManager(['slow'], {'slow': 0.4})
+        started = time.time()
+        first = _controller(pm)._update_modules(deadline=started + 0.1)
+        assert first is None
+        assert time.time() - started < 0.3, "waited past the deadline"
+        assert pm.finished == []
+        assert pm.wait_finished(1)
+        assert 'slow' in pm.plugin_last_update
+
+    def test_updates_get_the_executor_timeout_not_the_remaining_budget(self):
+        pm = FakePluginManager(['a', 'b'])
+        _controller(pm)._update_modules(deadline=time.time() + 5)
+        assert pm.wait_finished(2)
+        assert pm.timeouts == [None, None]
+
+    def test_queued_plugins_past_the_deadline_are_deferred(self, tiny_floor, caplog):
+        # Every worker is busy past the deadline, so the rest never start.
+        ids = ['p%d' % i for i in range(_INITIAL_UPDATE_WORKERS * 2)]
+        pm = FakePluginManager(ids, {pid: 0.3 for pid in ids})
+        with caplog.at_level('INFO'):
+            _controller(pm)._update_modules(deadline=time.time() + 0.1)
+            assert pm.wait_finished(_INITIAL_UPDATE_WORKERS)
+            time.sleep(0.1)
+        assert len(pm.started) == _INITIAL_UPDATE_WORKERS
+        text = "\n".join(r.getMessage() for r in caplog.records)
+        assert 'budget' in text.lower(), text
+        for pid in ids:
+            if pid not in pm.started:
+                assert pid in text
 
-        assert seen and all(t is not None for t in seen), seen
-        assert all(t <= 5.01 for t in seen), seen
-        # The exact remainder, never clamped up: clamping would let the pass
-        # run past its deadline. Anything below the floor is deferred instead,
-        # so what does start always has a usable slot.
-        assert all(t >= _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS for t in seen), seen
 
-    def test_without_a_deadline_the_executor_default_is_left_alone(self):
-        seen = []
+class TestNothingIsSilentlyDropped:
+    def test_a_passed_deadline_starts_nothing_and_names_them(self, caplog):
+        pm = FakePluginManager(['a', 'b'])
+        with caplog.at_level('INFO'):
+            assert _controller(pm)._update_modules(deadline=time.time() - 1) is None
+        assert pm.started == []
+        text = "\n".join(r.getMessage() for r in caplog.records)
+        assert 'a' in text and 'b' in text, text
+        assert 'budget' in text.lower(), text
 
-        class Executor:
-            def execute_update(self, plugin, plugin_id, timeout=None):
-                seen.append(timeout)
-                return True
+    def test_nothing_is_logged_when_all_of_them_ran(self, caplog):
+        pm = FakePluginManager(['a'])
+        with caplog.at_level('INFO'):
+            _controller(pm)._update_modules(deadline=time.time() + 30)
+        assert not any('budget' in r.getMessage().lower() for r in caplog.records)
 
-        _controller(['a'], Executor())._update_modules()
-        assert seen == [None], seen
+    def test_circuit_broken_plugins_are_skipped(self):
+        pm = FakePluginManager(['a', 'b'])
+        pm.health_tracker = Mock()
+        pm.health_tracker.should_skip_plugin.side_effect = lambda pid: pid == 'a'
+        _controller(pm)._update_modules()
+        assert pm.started == ['b']
 
 
 class TestTheBudgetItself:
@@ -154,23 +202,17 @@ class TestTheBudgetItself:
     def test_it_is_long_enough_for_a_quick_plugin_or_two(self):
         assert _INITIAL_UPDATE_BUDGET_SECONDS >= 5
 
+    def test_a_plugin_starting_below_the_floor_is_deferred(self):
+        pm = FakePluginManager(['a'])
+        _controller(pm)._update_modules(
+            deadline=time.time() + _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS - 0.05)
+        assert pm.started == [], "started a plugin it could not give a slot to"
 
-class TestNothingIsSilentlyDropped:
-    def test_deferred_plugins_are_named_in_the_log(self, caplog):
-        ex = FakeExecutor()
-        c = _controller(['a', 'b'], ex)
-        with caplog.at_level('INFO'):
-            c._update_modules(deadline=time.time() - 1)
-        text = "\n".join(r.getMessage() for r in caplog.records)
-        assert 'a' in text and 'b' in text, text
-        assert 'budget' in text.lower(), text
-
-    def test_nothing_is_logged_when_all_of_them_ran(self, caplog):
-        ex = FakeExecutor()
-        c = _controller(['a'], ex)
-        with caplog.at_level('INFO'):
-            c._update_modules(deadline=time.time() + 30)
-        assert not any('budget' in r.getMessage().lower() for r in caplog.records)
+    def test_a_plugin_starting_above_the_floor_still_runs(self):
+        pm = FakePluginManager(['a'])
+        _controller(pm)._update_modules(
+            deadline=time.time() + _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS + 1)
+        assert pm.started == ['a']
 
 
 class TestItDoesNotBreakTheOrdinaryPaths:
@@ -180,45 +222,15 @@ class TestItDoesNotBreakTheOrdinaryPaths:
         c._update_modules(deadline=time.time() - 1)      # must not raise
 
     def test_an_empty_plugin_set_is_harmless(self):
-        ex = FakeExecutor()
-        _controller([], ex)._update_modules(deadline=time.time() + 5)
-        assert ex.updated == []
-
-
-class TestTooLittleBudgetDefersRatherThanClamps:
-    def test_a_plugin_starting_below_the_floor_is_deferred(self):
-        ex = FakeExecutor()
-        c = _controller(['a'], ex)
-        # Just under the floor: previously this was clamped up to the floor and
-        # run anyway, which pushed the pass past its deadline.
-        c._update_modules(
-            deadline=time.time() + _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS - 0.05)
-        assert ex.updated == [], "started a plugin it could not give a slot to"
-
-    def test_a_plugin_starting_above_the_floor_still_runs(self):
-        ex = FakeExecutor()
-        c = _controller(['a'], ex)
-        c._update_modules(
-            deadline=time.time() + _MIN_INITIAL_UPDATE_TIMEOUT_SECONDS + 1)
-        assert ex.updated == ['a']
-
-    def test_the_timeout_is_the_remainder_not_the_floor(self):
-        seen = []
-
-        class Executor:
-            def execute_update(self, plugin, plugin_id, timeout=None):
-                seen.append(timeout)
-                return True
-
-        c = _controller(['a'], Executor())
-        c._update_modules(deadline=time.time() + 9)
-        assert seen and 8.5 <= seen[0] <= 9.01, seen
-
-    def test_the_pass_cannot_outlast_its_deadline(self, tiny_floor):
-        # Every plugin sleeps well past the budget; the deferral keeps the
-        # whole pass inside it rather than overrunning by a floor's worth.
-        ex = FakeExecutor(cost=0.4, slow={'a', 'b', 'c', 'd', 'e'})
-        c = _controller(['a', 'b', 'c', 'd', 'e'], ex)
-        started = time.time()
-        c._update_modules(deadline=started + 0.5)
-        assert time.time() - started < 1.2, "%.2fs" % (time.time() - started)
+        pm = FakePluginManager([])
+        assert _controller(pm)._update_modules(deadline=time.time() + 5) is None
+
+    def test_plugin_managers_without_update_plugin_now_fall_back(self):
+        pm = Mock(spec=['loaded_plugins', 'plugin_last_update', 'health_tracker'])
+        plugin = Mock()
+        pm.loaded_plugins = {'a': plugin}
+        pm.plugin_last_update = {}
+        pm.health_tracker = None
+        assert _controller(pm)._update_modules(deadline=time.time() + 5) == 'a'
+        plugin.update.assert_called_once_with()
+        assert 'a' in pm.plugin_last_update
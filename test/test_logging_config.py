@@ -6,18 +6,20 @@ logging.getLogger).
 Includes regression guards for two fixed bugs: ContextualFormatter used to
 mutate record.msg in place (double-prefixing with two handlers), and
 log_error hardcoded exc_info=True so passing it explicitly raised
-TypeError.
+TypeError. Also covers RateLimitFilter, which suppresses repeated lines.
 """
 
 import json
 import logging
 import sys
+import time
 
 import pytest
 
 from src.logging_config import (
     ContextualFormatter,
     PluginLoggerAdapter,
+    RateLimitFilter,
     StructuredFormatter,
     get_logger,
     log_debug,
@@ -25,6 +27,7 @@ from src.logging_config import (
     log_info,
     log_warning,
     log_with_context,
+    _flush_rate_limit_filters,
     setup_logging,
 )
 
@@ -284,3 +287,214 @@ class TestLogWithContext:
         # Falsy exc_info is stored verbatim on the record; the contract is
         # simply "no traceback attached".
         assert not records[0].exc_info
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def messages(self):
+        return [r.getMessage() for r in self.records]
+
+
+def limited_logger(name, clock, **kwargs):
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = ListHandler()
+    log_filter = RateLimitFilter(clock=clock, **kwargs)
+    log_filter.attach(handler)
+    logger.addHandler(handler)
+    return logger, handler, log_filter
+
+
+class TestRateLimitFilter:
+    def test_flood_of_identical_warnings(self):
+        clock = FakeClock()
+        logger, handler, log_filter = limited_logger(
+            "test.ratelimit.flood", clock, limit=5, window=10.0)
+
+        # 10,000 identical warnings over one second
+        for i in range(10_000):
+            clock.now += 0.0001
+            logger.warning("Slow render: %dms", 40 + i % 20)
+        assert len(handler.records) == 5
+        assert log_filter.suppressed_total == 9_995
+
+        clock.now += 10
+        logger.warning("Slow render: %dms", 99)
+
+        assert len(handler.records) == 7
+        summary = handler.records[5]
+        assert summary.levelno == logging.WARNING
+        assert summary.name == "test.ratelimit.flood"
+        assert summary.getMessage() == (
+            "Suppressed 9995 similar messages in the last 10s, last: Slow render: 59ms")
+        assert handler.records[6].getMessage() == "Slow render: 99ms"
+
+    def test_fstring_variants_share_a_key(self):
+        clock = FakeClock()
+        logger, handler, _ = limited_logger("test.ratelimit.fstr", clock, limit=2, window=5.0)
+
+        for ms in (41, 57, 63, 70):
+            logger.warning(f"Plugin clock took {ms}ms to render")
+        logger.warning("Plugin clock has no data")
+
+        assert handler.messages() == [
+            "Plugin clock took 41ms to render",
+            "Plugin clock took 57ms to render",
+            "Plugin clock has no data",
+        ]
+
+    def test_levels_and_loggers_are_separate_keys(self):
+        clock = FakeClock()
+        logger, handler, _ = limited_logger("test.ratelimit.keys", clock, limit=1, window=5.0)
+
+        logger.info("cache miss")
+        logger.warning("cache miss")
+        logger.info("cache miss")
+
+        assert [r.levelno for r in handler.records] == [logging.INFO, logging.WARNING]
+
+    def test_per_logger_limits(self):
+        clock = FakeClock()
+        logger, handler, log_filter = limited_logger(
+            "test.ratelimit.cfg", clock, limit=1, window=5.0,
+            per_logger={"test.ratelimit.cfg.render": (3, 5.0),
+                        "test.ratelimit.cfg.render.debugging": None})
+        render = logging.getLogger("test.ratelimit.cfg.render.pipeline")
+        unlimited = logging.getLogger("test.ratelimit.cfg.render.debugging")
+
+        for _ in range(10):
+            logger.info("a")
+            render.info("b")
+            unlimited.info("c")
+
+        assert handler.messages().count("a") == 1
+        assert handler.messages().count("b") == 3
+        assert handler.messages().count("c") == 10
+        assert log_filter.limit_for("test.ratelimit.cfg.render.pipeline") == (3, 5.0)
+
+    def test_summary_keeps_context_and_drops_traceback(self):
+        clock = FakeClock()
+        logger, handler, log_filter = limited_logger(
+            "test.ratelimit.ctx", clock, limit=1, window=5.0)
+
+        for _ in range(3):
+            try:
+                raise ValueError("kaboom")
+            except ValueError:
+                logger.warning("update failed", exc_info=True, extra={"plugin_id": "clock"})
+        log_filter.flush()
+
+        summary = handler.records[-1]
+        assert summary.getMessage().startswith("Suppressed 2 similar messages")
+        assert summary.plugin_id == "clock"
+        assert summary.exc_info is None
+        assert "[Plugin: clock] Suppressed 2" in ContextualFormatter().format(summary)
+
+    def test_window_without_suppression_has_no_summary(self):
+        clock = FakeClock()
+        logger, handler, _ = limited_logger("test.ratelimit.quiet", clock, limit=5, window=5.0)
+
+        logger.info("once")
+        clock.now += 6
+        logger.info("twice")
+
+        assert handler.messages() == ["once", "twice"]
+
+    def test_key_table_is_bounded(self):
+        clock = FakeClock()
+        logger, handler, log_filter = limited_logger(
+            "test.ratelimit.keys_cap", clock, limit=1, window=60.0, max_keys=3)
+
+        logger.info("first")
+        logger.info("first")
+        for word in ("alpha", "beta", "gamma"):
+            logger.info(word)
+
+        assert len(log_filter._windows) == 3
+        # The oldest window was closed early to make room, and reported.
+        assert "Suppressed 1 similar messages in the last 60s, last: first" in handler.messages()
+
+    def test_suppressed_records_are_not_formatted(self):
+        logger, handler, _ = limited_logger("test.ratelimit.cost", time.monotonic,
+                                            limit=5, window=60.0)
+        formatted = []
+        handler.setFormatter(ContextualFormatter())
+        handler.emit = lambda record: formatted.append(handler.format(record))
+
+        for i in range(10_000):
+            logger.warning(f"Cache miss for scoreboard_{i % 7}")
+
+        assert len(formatted) == 5
+
+    def test_percent_style_args_are_part_of_the_key(self):
+        clock = FakeClock()
+        logger, handler, _ = limited_logger("test.ratelimit.args", clock, limit=1, window=5.0)
+
+        for plugin_id in ("clock", "stocks", "music"):
+            logger.warning("Error loading plugin %s: %s", plugin_id, "ImportError")
+            logger.warning("Error loading plugin %s: %s", plugin_id, "ImportError")
+        # Numbers in the arguments are still masked.
+        logger.warning("Slow render: %dms", 41)
+        logger.warning("Slow render: %dms", 57)
+
+        assert handler.messages() == [
+            "Error loading plugin clock: ImportError",
+            "Error loading plugin stocks: ImportError",
+            "Error loading plugin music: ImportError",
+            "Slow render: 41ms",
+        ]
+
+    def test_errors_are_never_suppressed(self):
+        clock = FakeClock()
+        logger, handler, log_filter = limited_logger(
+            "test.ratelimit.errors", clock, limit=1, window=5.0)
+
+        for _ in range(8):
+            logger.error("Error loading plugin %s", "clock")
+            logger.critical("display lost")
+
+        assert len(handler.records) == 16
+        assert log_filter.suppressed_total == 0
+
+    def test_pending_counts_are_reported_at_exit(self):
+        clock = FakeClock()
+        logger, handler, _ = limited_logger("test.ratelimit.exit", clock, limit=1, window=60.0)
+        for _ in range(4):
+            logger.warning("disk full")
+
+        _flush_rate_limit_filters()
+
+        assert handler.messages()[-1] == (
+            "Suppressed 3 similar messages in the last 60s, last: disk full")
+
+    def test_setup_logging_installs_and_flushes(self, capsys):
+        setup_logging(rate_limits={"test.ratelimit.setup.free": None})
+        handler = logging.getLogger().handlers[0]
+        log_filter = next(f for f in handler.filters if isinstance(f, RateLimitFilter))
+        assert log_filter.limit_for("test.ratelimit.setup.free") is None
+
+        logger = logging.getLogger("test.ratelimit.setup")
+        for _ in range(20):
+            logger.warning("disk full")
+        setup_logging(rate_limit=False)
+
+        out = capsys.readouterr().out
+        assert out.count("disk full") == 6
+        assert "Suppressed 15 similar messages" in out
+        assert not logging.getLogger().handlers[0].filters
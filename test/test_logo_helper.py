@@ -170,11 +170,107 @@ class TestCacheManagement:
         assert any(k.startswith("A_") for k in helper._logo_cache)
         assert not any(k.startswith("B_") for k in helper._logo_cache)
 
-    def test_clear_cache_empties_both_structures(self, helper, tmp_path):
+    def test_clear_cache_empties_cache_and_byte_count(self, helper, tmp_path):
         helper.load_logo("PHI", write_logo(tmp_path / "PHI.png"))
         helper.clear_cache()
         assert helper._logo_cache == {}
-        assert helper._cache_order == []
+        assert helper.get_cache_stats()["cached_bytes"] == 0
+
+    def test_byte_budget_evicts_least_recently_used(self, tmp_path):
+        # 20x20 RGBA = 1600 bytes; room for two.
+        helper = LogoHelper(64, 32, cache_size=100, logger=MagicMock(), cache_bytes=3500)
+        a, b, c = [write_logo(tmp_path / f"{n}.png") for n in ("A", "B", "C")]
+        helper.load_logo("A", a)
+        helper.load_logo("B", b)
+        helper.load_logo("A", a)
+        helper.load_logo("C", c)
+        assert [k.split("_")[0] for k in helper._logo_cache] == ["A", "C"]
+        assert helper.get_cache_stats()["cached_bytes"] == 3200
+
+    def test_logo_larger_than_budget_is_returned_but_not_cached(self, tmp_path):
+        helper = LogoHelper(64, 32, logger=MagicMock(), cache_bytes=1000)
+        small = helper.load_logo("A", write_logo(tmp_path / "A.png", size=(10, 10)))
+        big = helper.load_logo("B", write_logo(tmp_path / "B.png"))
+        assert big is not None and small is not None
+        assert [k.split("_")[0] for k in helper._logo_cache] == ["A"]
+
+    def test_reloading_a_key_does_not_double_count(self, helper, tmp_path):
+        path = write_logo(tmp_path / "A.png")
+        logo = helper.load_logo("A", path)
+        helper._cache_logo(next(iter(helper._logo_cache)), logo)
+        assert helper.get_cache_stats()["cached_bytes"] == 1600
+
+    def test_concurrent_loads_and_hits_keep_accounting_consistent(self, tmp_path):
+        import threading
+
+        helper = LogoHelper(64, 32, cache_size=40, logger=MagicMock(), cache_bytes=30 * 1600)
+        paths = [write_logo(tmp_path / f"T{i}.png") for i in range(60)]
+        errors = []
+        barrier = threading.Barrier(8)
+
+        def worker(seed):
+            barrier.wait()
+            try:
+                for n in range(300):
+                    i = (seed * 7 + n * 13) % len(paths)
+                    logo = helper.load_logo(f"T{i}", paths[i])
+                    assert logo is not None and logo.size == (20, 20)
+            except Exception as e:  # surfaced below; a thread can't fail the test
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(s,)) for s in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        stats = helper.get_cache_stats()
+        assert stats["cached_logos"] <= 30
+        assert stats["cached_bytes"] == 1600 * stats["cached_logos"]
+        assert set(helper._logo_sizes) == set(helper._logo_cache)
+
+    def test_full_500_entry_cache_evicts_like_a_list_lru(self, tmp_path):
+        """A full 500-entry cache under hits and evictions keeps the same
+        entries as the list-based LRU it replaced, which paid list.remove()
+        on every hit and list.pop(0) on every eviction."""
+        logo = Image.new("RGBA", (20, 20))
+        keys = [f"K{i}" for i in range(500)]
+
+        class ListLru:
+            def __init__(self):
+                self.cache, self.order = {}, []
+
+            def get(self, key):
+                if key in self.cache:
+                    self.order.remove(key)
+                    self.order.append(key)
+                    return self.cache[key]
+
+            def put(self, key, value):
+                if len(self.cache) >= 500:
+                    del self.cache[self.order.pop(0)]
+                self.cache[key] = value
+                self.order.append(key)
+
+        def run(get, put):
+            for k in keys:
+                put(k, logo)
+            for n in range(20000):
+                # Mostly hits on old entries (the worst case for list.remove)
+                # with a miss + eviction every tenth access.
+                if n % 10:
+                    assert get(keys[n % 50]) is logo
+                else:
+                    put(f"new{n}", logo)
+
+        helper = LogoHelper(64, 32, cache_size=500, logger=MagicMock())
+        run(helper._get_cached_logo, helper._cache_logo)
+        old = ListLru()
+        run(old.get, old.put)
+
+        assert list(helper._logo_cache) == old.order
+        assert helper.get_cache_stats()["cached_logos"] == 500
 
     def test_cache_stats(self, tmp_path):
         helper = LogoHelper(64, 32, cache_size=4, logger=MagicMock())
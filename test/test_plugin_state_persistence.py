@@ -0,0 +1,209 @@
+"""
+Tests for coalesced, atomic persistence of plugin state and operation history.
+
+Background: PluginStateManager and OperationHistory rewrote their whole JSON
+file on every change with a plain open(..., 'w'). A bulk enable/disable or a
+burst of installs cost one full rewrite per change, and a power cut mid-write
+left a truncated file that failed to load on the next start.
+
+State changes now mark the state dirty and a DebouncedWriter writes it at most
+once per interval (temp file + fsync + os.replace). Operation history is an
+append-only JSON-lines log that is compacted when it doubles.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.plugin_system.debounced_writer import DebouncedWriter, atomic_write_json
+from src.plugin_system.operation_history import OperationHistory
+from src.plugin_system.state_manager import PluginStateManager, PluginStateStatus
+
+
+class TestDebouncedWriter:
+
+    def test_burst_is_written_once(self):
+        writes = []
+        writer = DebouncedWriter(lambda: writes.append(1), interval=0.05)
+        for _ in range(100):
+            writer.mark_dirty()
+        time.sleep(0.2)
+        assert len(writes) == 1
+        assert not writer.dirty
+
+    def test_flush_writes_immediately_and_only_when_dirty(self):
+        writes = []
+        writer = DebouncedWriter(lambda: writes.append(1), interval=60)
+        assert writer.flush() is False
+        writer.mark_dirty()
+        assert writer.flush() is True
+        assert writer.flush() is False
+        assert len(writes) == 1
+
+    def test_zero_interval_writes_synchronously(self):
+        writes = []
+        writer = DebouncedWriter(lambda: writes.append(1), interval=0)
+        writer.mark_dirty()
+        writer.mark_dirty()
+        assert len(writes) == 2
+
+    def test_failed_write_stays_dirty(self):
+        calls = []
+
+        def write():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("disk full")
+
+        writer = DebouncedWriter(write, interval=60)
+        writer.mark_dirty()
+        assert writer.flush() is False
+        assert writer.dirty
+        assert writer.flush() is True
+
+
+class TestAtomicWrite:
+
+    def test_failed_write_leaves_existing_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        atomic_write_json(path, {"ok": True})
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"bad": object()})
+        assert json.loads(path.read_text()) == {"ok": True}
+        assert not (tmp_path / "state.json.tmp").exists()
+
+
+class TestPluginStateManager:
+
+    def test_500_update_burst_coalesces_writes(self, tmp_path):
+        state_file = tmp_path / "plugin_state.json"
+        manager = PluginStateManager(state_file=str(state_file), flush_interval=0.2)
+
+        for i in range(500):
+            manager.set_plugin_enabled(f"plugin-{i % 50}", i % 2 == 0)
+        manager.flush()
+
+        # A burst this fast lands in one or two flush windows, not 500 writes.
+        assert manager._writer.write_count <= 3
+        data = json.loads(state_file.read_text())
+        assert len(data["states"]) == 50
+        assert data["states"]["plugin-0"]["enabled"] is True
+        assert data["states"]["plugin-1"]["enabled"] is False
+
+    def test_pending_changes_reach_disk_without_flush(self, tmp_path):
+        state_file = tmp_path / "plugin_state.json"
+        manager = PluginStateManager(state_file=str(state_file), flush_interval=0.05)
+        manager.set_plugin_installed("clock", version="1.0.0")
+        assert not state_file.exists()
+        time.sleep(0.3)
+        assert "clock" in json.loads(state_file.read_text())["states"]
+
+    def test_round_trip(self, tmp_path):
+        state_file = tmp_path / "plugin_state.json"
+        manager = PluginStateManager(state_file=str(state_file))
+        manager.set_plugin_installed("clock", version="1.2.0")
+        manager.set_plugin_enabled("clock", True)
+        manager.flush()
+
+        reloaded = PluginStateManager(state_file=str(state_file))
+        state = reloaded.get_plugin_state("clock")
+        assert state.version == "1.2.0"
+        assert state.enabled is True
+        assert state.status == PluginStateStatus.ENABLED
+
+    def test_truncated_file_is_set_aside_and_replaced(self, tmp_path):
+        state_file = tmp_path / "plugin_state.json"
+        manager = PluginStateManager(state_file=str(state_file))
+        for name in ("clock", "weather"):
+            manager.set_plugin_enabled(name, True)
+        manager.flush()
+        content = state_file.read_text()
+        state_file.write_text(content[: len(content) // 2])
+
+        recovered = PluginStateManager(state_file=str(state_file))
+
+        assert recovered.get_all_states() == {}
+        assert (tmp_path / "plugin_state.json.corrupt").read_text() == content[: len(content) // 2]
+        recovered.set_plugin_enabled("clock", False)
+        recovered.flush()
+        assert json.loads(state_file.read_text())["states"]["clock"]["enabled"] is False
+
+
+class TestOperationHistory:
+
+    def test_500_operation_burst_appends_without_rewriting(self, tmp_path):
+        history_file = tmp_path / "operation_history.jsonl"
+        history = OperationHistory(history_file=str(history_file), max_records=1000)
+
+        for i in range(500):
+            history.record_operation("install", plugin_id=f"plugin-{i}")
+
+        assert history.compaction_count == 0
+        assert len(history_file.read_text().splitlines()) == 500
+        assert len(OperationHistory(history_file=str(history_file)).get_history(limit=1000)) == 500
+
+    def test_log_is_compacted_when_it_doubles(self, tmp_path):
+        history_file = tmp_path / "operation_history.jsonl"
+        history = OperationHistory(history_file=str(history_file), max_records=100)
+
+        for i in range(500):
+            history.record_operation("update", plugin_id=f"plugin-{i}")
+
+        # Compaction at every 200th line: 100 kept, 100 appended, repeat.
+        assert history.compaction_count == 4
+        assert len(history_file.read_text().splitlines()) <= 200
+        reloaded = OperationHistory(history_file=str(history_file), max_records=100)
+        records = reloaded.get_history(limit=1000)
+        assert len(records) == 100
+        assert records[0].plugin_id == "plugin-499"
+
+    def test_truncated_last_line_keeps_earlier_records(self, tmp_path):
+        history_file = tmp_path / "operation_history.jsonl"
+        history = OperationHistory(history_file=str(history_file))
+        for i in range(10):
+            history.record_operation("install", plugin_id=f"plugin-{i}")
+        content = history_file.read_text()
+        history_file.write_text(content[:-20])
+
+        recovered = OperationHistory(history_file=str(history_file))
+
+        records = recovered.get_history(limit=100)
+        assert len(records) == 9
+        assert {r.plugin_id for r in records} == {f"plugin-{i}" for i in range(9)}
+        recovered.record_operation("install", plugin_id="after")
+        assert recovered.get_history(limit=1)[0].plugin_id == "after"
+
+    def test_append_after_a_torn_last_line_survives_reload(self, tmp_path):
+        history_file = tmp_path / "operation_history.jsonl"
+        history = OperationHistory(history_file=str(history_file))
+        history.record_operation("install", plugin_id="a")
+        history.record_operation("install", plugin_id="b")
+        history_file.write_text(history_file.read_text()[:-20])
+
+        OperationHistory(history_file=str(history_file)).record_operation("install", plugin_id="c")
+
+        records = OperationHistory(history_file=str(history_file)).get_history(limit=100)
+        assert [r.plugin_id for r in records] == ["c", "a"]
+        assert history_file.read_text().endswith("\n")
+
+    def test_clear_history_empties_the_file(self, tmp_path):
+        history_file = tmp_path / "operation_history.jsonl"
+        history = OperationHistory(history_file=str(history_file))
+        history.record_operation("install", plugin_id="clock")
+        history.clear_history()
+        assert history_file.read_text() == ""
+        assert OperationHistory(history_file=str(history_file)).get_history() == []
+
+    def test_legacy_json_array_is_migrated(self, tmp_path):
+        legacy = tmp_path / "operation_history.json"
+        legacy.write_text(json.dumps([
+            {"operation_id": "a", "operation_type": "install", "plugin_id": "clock",
+             "timestamp": "2024-01-01T00:00:00", "status": "completed"},
+        ], indent=2))
+
+        history = OperationHistory(history_file=str(tmp_path / "operation_history.jsonl"))
+
+        assert [r.operation_id for r in history.get_history()] == ["a"]
+        assert not legacy.exists()
+        assert len((tmp_path / "operation_history.jsonl").read_text().splitlines()) == 1
@@ -194,6 +194,32 @@ class TestNoConcurrentUpdate:
             f"update() ran {plugin.max_concurrent}x concurrently via "
             "update_all_plugins()")
 
+    def test_initial_update_blocks_scheduler_overlap(self, pm):
+        """A scheduler tick during the startup update must not run it twice."""
+        pm._synchronous_updates = True
+        plugin = OverlapDetectingPlugin(update_seconds=0.25)
+        plugin_id = _install(pm, plugin, interval=60.0)
+
+        initial = threading.Thread(target=pm.update_plugin_now, args=(plugin_id,))
+        initial.start()
+        time.sleep(0.05)
+        pm.run_scheduled_updates()
+        initial.join(timeout=5)
+
+        assert plugin.update_calls == 1
+        assert plugin.max_concurrent == 1
+        assert pm.state_manager.get_state(plugin_id) == PluginState.ENABLED
+
+    def test_failed_initial_update_stays_due(self, pm):
+        class Failing(OverlapDetectingPlugin):
+            def update(self):
+                raise RuntimeError("network not up yet")
+
+        plugin_id = _install(pm, Failing(), interval=3600.0)
+        assert pm.update_plugin_now(plugin_id) is False
+        assert pm.state_manager.get_state(plugin_id) == PluginState.ENABLED
+        assert pm.plugin_last_update.get(plugin_id, 0.0) == 0.0
+
     def test_async_path_never_overlaps(self, pm):
         plugin = OverlapDetectingPlugin(update_seconds=0.2)
         plugin_id = _install(pm, plugin)
@@ -0,0 +1,252 @@
+"""
+Tests for parallel rendering in the starlark-apps plugin.
+
+Background: update() rendered every due app serially through a pixlet
+subprocess, so a refresh cycle took the sum of all render times and apps late
+in the list went stale. It now renders due apps on a bounded pool, reuses a
+cached WebP whose source/config fingerprint is unchanged and which is still
+inside the app's refresh window (including across restarts), and backs off
+from apps whose render fails instead of retrying them every cycle.
+
+These drive the real plugin against a fake `pixlet` shell script that sleeps
+and logs when each render starts and ends, so concurrency and skips are
+measured on actual subprocesses.
+"""
+
+import importlib.util
+import json
+import os
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent / "plugin-repos" / "starlark-apps"
+
+if str(PLUGIN_DIR) not in sys.path:
+    sys.path.insert(0, str(PLUGIN_DIR))
+_spec = importlib.util.spec_from_file_location("starlark_apps_manager", PLUGIN_DIR / "manager.py")
+manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(manager)
+
+RENDER_SECONDS = 0.5
+
+FAKE_PIXLET = """#!/bin/sh
+if [ "$1" = "version" ]; then echo "pixlet fake"; exit 0; fi
+star="$2"
+app=$(basename "$star" .star)
+out=""
+prev=""
+for arg in "$@"; do
+    [ "$prev" = "-o" ] && out="$arg"
+    prev="$arg"
+done
+echo "start $app $(date +%s.%N)" >> "{log}"
+sleep {seconds}
+if [ -f "$(dirname "$star")/fail" ]; then
+    echo "end $app $(date +%s.%N)" >> "{log}"
+    echo "boom" >&2
+    exit 1
+fi
+cp "{template}" "$out"
+echo "end $app $(date +%s.%N)" >> "{log}"
+"""
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """Apps directory, fake pixlet and render log."""
+    apps_dir = tmp_path / "starlark-apps"
+    apps_dir.mkdir()
+    log = tmp_path / "pixlet.log"
+    log.touch()
+    template = tmp_path / "template.webp"
+    Image.new("RGB", (64, 32), (255, 0, 0)).save(template, "WEBP")
+
+    script = tmp_path / "pixlet"
+    script.write_text(FAKE_PIXLET.format(log=log, template=template, seconds=RENDER_SECONDS))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+    monkeypatch.setattr(manager.StarlarkAppsPlugin, "_get_apps_directory", lambda self: apps_dir)
+    return {"apps_dir": apps_dir, "log": log, "script": script}
+
+
+def install_apps(apps_dir, app_ids):
+    manifest = {"apps": {}}
+    for app_id in app_ids:
+        app_dir = apps_dir / app_id
+        app_dir.mkdir()
+        (app_dir / f"{app_id}.star").write_text(f'def main():\n    return "{app_id}"\n')
+        (app_dir / "config.json").write_text(json.dumps({"label": app_id}))
+        manifest["apps"][app_id] = {"star_file": f"{app_id}.star", "render_interval": 300}
+    (apps_dir / "manifest.json").write_text(json.dumps(manifest))
+
+
+def make_plugin(env, **config):
+    display_manager = MagicMock()
+    display_manager.matrix.width = 64
+    display_manager.matrix.height = 32
+    config = {"pixlet_path": str(env["script"]), "magnify": 1, **config}
+    return manager.StarlarkAppsPlugin("starlark-apps", config, display_manager,
+                                      MagicMock(), MagicMock())
+
+
+def read_log(log):
+    """List of (app_id, start, end) for each finished render."""
+    starts, runs = {}, []
+    for line in log.read_text().splitlines():
+        kind, app_id, stamp = line.split()
+        if kind == "start":
+            starts[app_id] = float(stamp)
+        else:
+            runs.append((app_id, starts.pop(app_id), float(stamp)))
+    return runs
+
+
+def max_overlap(runs):
+    events = sorted([(start, 1) for _, start, _ in runs] + [(end, -1) for _, _, end in runs])
+    current = peak = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+class TestParallelRender:
+
+    def test_due_apps_render_concurrently_up_to_the_pool_size(self, env):
+        ids = [f"app{i}" for i in range(6)]
+        install_apps(env["apps_dir"], ids)
+        plugin = make_plugin(env, render_workers=3)
+
+        start = time.monotonic()
+        plugin.update()
+        elapsed = time.monotonic() - start
+
+        runs = read_log(env["log"])
+        assert sorted(app_id for app_id, _, _ in runs) == ids
+        assert max_overlap(runs) == 3
+        # Serial would be 6 x RENDER_SECONDS; two waves of three is 2x.
+        assert elapsed < 4 * RENDER_SECONDS
+        assert all(plugin.apps[app_id].frames for app_id in ids)
+
+    def test_render_workers_defaults_to_cpu_count(self, env):
+        install_apps(env["apps_dir"], [])
+        assert make_plugin(env).render_workers == (os.cpu_count() or 1)
+
+    def test_single_worker_renders_serially(self, env):
+        install_apps(env["apps_dir"], ["a", "b"])
+        make_plugin(env, render_workers=1).update()
+        assert max_overlap(read_log(env["log"])) == 1
+
+    def test_overlapping_renders_of_one_app_use_separate_temp_files(self, env):
+        install_apps(env["apps_dir"], ["a"])
+        plugin = make_plugin(env)
+        app = plugin.apps["a"]
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(plugin._render_app(app, force=True)))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True, True, True]
+        # All three pixlet runs were in flight at once (read_log() pairs
+        # starts and ends by app, so count the lines instead).
+        lines = env["log"].read_text().splitlines()
+        assert [line.split()[0] for line in lines][:3] == ["start"] * 3
+        assert not list((env["apps_dir"] / "a").glob(".cached_render_*"))
+        assert app.frames
+
+
+class TestSkipUnchanged:
+
+    def test_fresh_cache_is_reused_after_restart(self, env):
+        ids = ["a", "b", "c"]
+        install_apps(env["apps_dir"], ids)
+        make_plugin(env).update()
+        assert len(read_log(env["log"])) == 3
+
+        # A new plugin instance starts with last_render_time = 0, so every
+        # app is due; the cached renders are still current.
+        plugin = make_plugin(env)
+        plugin.update()
+
+        assert len(read_log(env["log"])) == 3
+        assert all(plugin.apps[app_id].frames for app_id in ids)
+
+    def test_changed_config_or_source_rerenders_only_that_app(self, env):
+        install_apps(env["apps_dir"], ["a", "b", "c"])
+        make_plugin(env).update()
+
+        (env["apps_dir"] / "a" / "config.json").write_text(json.dumps({"label": "changed"}))
+        (env["apps_dir"] / "b" / "b.star").write_text('def main():\n    return "new"\n')
+        make_plugin(env).update()
+
+        rendered = [app_id for app_id, _, _ in read_log(env["log"])]
+        assert sorted(rendered) == ["a", "a", "b", "b", "c"]
+
+    def test_cache_older_than_refresh_window_rerenders(self, env):
+        install_apps(env["apps_dir"], ["a"])
+        make_plugin(env).update()
+        cache_file = env["apps_dir"] / "a" / "cached_render.webp"
+        old = time.time() - 301
+        os.utime(cache_file, (old, old))
+
+        make_plugin(env).update()
+
+        assert len(read_log(env["log"])) == 2
+
+
+class TestBackoff:
+
+    def test_failed_app_backs_off_without_blocking_others(self, env):
+        install_apps(env["apps_dir"], ["good", "bad"])
+        (env["apps_dir"] / "bad" / "fail").touch()
+        plugin = make_plugin(env)
+
+        plugin.update()
+        bad = plugin.apps["bad"]
+        assert plugin.apps["good"].frames
+        assert bad.frames is None
+        assert bad.render_failures == 1
+        assert bad.retry_after - time.time() == pytest.approx(manager.RENDER_BACKOFF_BASE, abs=5)
+        assert not list((env["apps_dir"] / "bad").glob(".cached_render_*"))
+
+        # Still due, but backing off: no second pixlet run.
+        plugin.update()
+        assert [app_id for app_id, _, _ in read_log(env["log"])].count("bad") == 1
+
+    def test_backoff_doubles_and_resets_on_success(self, env):
+        install_apps(env["apps_dir"], ["bad"])
+        fail_marker = env["apps_dir"] / "bad" / "fail"
+        fail_marker.touch()
+        plugin = make_plugin(env)
+        app = plugin.apps["bad"]
+
+        delays = []
+        for _ in range(3):
+            app.retry_after = 0.0
+            plugin.update()
+            delays.append(round(app.retry_after - time.time()))
+        assert delays == pytest.approx([30, 60, 120], abs=2)
+
+        fail_marker.unlink()
+        assert plugin._render_app(app, force=True)
+        assert app.render_failures == 0
+        assert not app.in_backoff(time.time())
+
+    def test_manifest_render_timeout_is_clamped(self, env):
+        install_apps(env["apps_dir"], ["a"])
+        app = make_plugin(env).apps["a"]
+        app.manifest["render_timeout"] = 2
+        assert app.get_render_timeout(30) == 5
+        app.manifest["render_timeout"] = "nope"
+        assert app.get_render_timeout(30) == 30
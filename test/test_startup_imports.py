@@ -0,0 +1,117 @@
+"""The display process must not pay for optional heavy imports up front.
+
+On a Pi Zero 2 importing requests, scipy and the sports base classes adds
+seconds before the first frame, and a clock-only setup uses none of them.
+These run in a fresh interpreter: the test process has long since imported
+everything.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = [
+    'requests',
+    'scipy',
+    'flask',
+    'web_interface',
+    'src.common.api_helper',
+    'src.common.logo_helper',
+    'src.common.scroll_helper',
+    'src.adaptive_layout',
+    'src.base_classes.sports.core',
+    'src.background_data_service',
+]
+
+
+def _run(code: str) -> dict:
+    env = dict(os.environ, EMULATOR='true')
+    result = subprocess.run(
+        [sys.executable, '-c', textwrap.dedent(code)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_display_controller_import_leaves_heavy_modules_unloaded():
+    loaded = _run(f"""
+        import json, sys
+        import src.display_controller
+        print(json.dumps({{m: m in sys.modules for m in {HEAVY_MODULES!r}}}))
+    """)
+    assert not any(loaded.values()), [m for m, v in loaded.items() if v]
+
+
+def test_lazy_exports_load_on_first_use():
+    loaded = _run("""
+        import json, sys
+        import src.display_controller
+        before = 'src.common.scroll_helper' in sys.modules
+        from src.common import ScrollHelper
+        from src.base_classes.sports import SportsCore
+        print(json.dumps({
+            'before': before,
+            'scroll_helper': 'src.common.scroll_helper' in sys.modules,
+            'sports_core': 'src.base_classes.sports.core' in sys.modules,
+            'same_class': ScrollHelper.__module__ == 'src.common.scroll_helper',
+        }))
+    """)
+    assert loaded == {'before': False, 'scroll_helper': True,
+                      'sports_core': True, 'same_class': True}
+
+
+def test_scipy_is_not_imported_with_scroll_helper():
+    loaded = _run("""
+        import json, sys
+        import src.common.scroll_helper
+        print(json.dumps({'scipy': 'scipy' in sys.modules}))
+    """)
+    assert loaded == {'scipy': False}
+
+
+def test_unknown_lazy_attribute_raises_attribute_error():
+    import src.common
+    with pytest.raises(AttributeError):
+        src.common.NotAThing  # noqa: B018
+
+
+class TestImportProfiler:
+    def test_records_self_and_cumulative_time(self, tmp_path, monkeypatch):
+        from src import startup_profiler
+
+        (tmp_path / 'profiled_parent.py').write_text(
+            'import time\nimport profiled_child\ntime.sleep(0.02)\n')
+        (tmp_path / 'profiled_child.py').write_text(
+            'import time\ntime.sleep(0.05)\n')
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = startup_profiler.enable_import_profiling()
+        try:
+            import profiled_parent  # noqa: F401
+            records = profiler.records()
+        finally:
+            startup_profiler.disable_import_profiling()
+            sys.modules.pop('profiled_parent', None)
+            sys.modules.pop('profiled_child', None)
+
+        child_self, child_total = records['profiled_child']
+        parent_self, parent_total = records['profiled_parent']
+        assert child_total >= 0.05
+        assert parent_total >= child_total + 0.02
+        # The child's time is charged to the child, not the parent's self time.
+        assert parent_self < parent_total - 0.04
+        assert profiler.report(1)[0][0] == 'profiled_parent'
+
+    def test_disabled_profiler_logs_nothing(self, caplog):
+        from src import startup_profiler
+        startup_profiler.disable_import_profiling()
+        with caplog.at_level('INFO'):
+            startup_profiler.log_import_profile('stage')
+        assert not caplog.records
@@ -11,6 +11,7 @@ plugin > fallback ConfigError).
 """
 
 import copy
+import json
 import os
 from unittest.mock import MagicMock
 
@@ -246,6 +247,104 @@ class TestIdempotence:
         assert len(second[2]) == len(first[2])
 
 
+class TestResultsCache:
+    """Per-check results replayed across restarts when inputs are unchanged."""
+
+    CHECKS = ('_validate_config', '_validate_cache_directory',
+              '_validate_display_config', '_validate_plugins',
+              '_validate_systemd_units')
+
+    def _start(self, tmp_path, config):
+        """Build a validator the way DisplayController does on one boot."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir(exist_ok=True)
+        config_path = config_dir / "config.json"
+        if not config_path.exists():
+            config_path.write_text(json.dumps(config))
+        mgr = make_config_manager(config)
+        mgr.config_path = str(config_path)
+        mgr.secrets_path = str(config_dir / "config_secrets.json")
+        mgr.template_path = str(config_dir / "config.template.json")
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir(exist_ok=True)
+        cache_manager = MagicMock()
+        cache_manager.get_cache_dir.return_value = str(cache_dir)
+
+        plugins_dir = tmp_path / "plugins"
+        plugins_dir.mkdir(exist_ok=True)
+        pm = MagicMock()
+        pm.plugins_dir = plugins_dir
+        pm.discover_plugins.return_value = []
+
+        return StartupValidator(mgr, pm, cache_manager=cache_manager,
+                                results_cache_path=str(cache_dir / "startup_validation.json"))
+
+    def _config(self):
+        # Missing rows/cols and an absent plugin give warnings to replay.
+        return {'display': {'hardware': {'brightness': 90}}, 'timezone': 'UTC',
+                'ghost': {'enabled': True}}
+
+    def test_second_start_runs_no_checks_and_same_warnings(self, tmp_path):
+        first = self._start(tmp_path, self._config()).validate_all()
+        assert first[0] is True
+        assert "Plugin 'ghost' is enabled but not found in plugins directory" in first[2]
+
+        validator = self._start(tmp_path, self._config())
+        for name in self.CHECKS:
+            setattr(validator, name, MagicMock(side_effect=AssertionError(name)))
+        second = validator.validate_all()
+
+        assert second == first
+        assert set(validator.cached_checks) == {
+            'config', 'cache_directory', 'display', 'plugins', 'systemd_units'}
+        assert validator.config_manager.load_config.called is False
+        assert validator.plugin_manager.discover_plugins.called is False
+
+    def test_changed_config_reruns_dependent_checks(self, tmp_path):
+        self._start(tmp_path, self._config()).validate_all()
+        (tmp_path / "config" / "config.json").write_text('{"changed": true}')
+
+        validator = self._start(tmp_path, self._config())
+        validator.validate_all()
+        assert 'config' not in validator.cached_checks
+        assert 'plugins' not in validator.cached_checks
+        assert 'cache_directory' in validator.cached_checks
+
+    def test_new_plugin_directory_reruns_plugin_check(self, tmp_path):
+        self._start(tmp_path, self._config()).validate_all()
+        (tmp_path / "plugins" / "ghost").mkdir()
+
+        validator = self._start(tmp_path, self._config())
+        validator.validate_all()
+        assert 'plugins' not in validator.cached_checks
+        assert 'config' in validator.cached_checks
+
+    def test_failing_check_is_not_cached(self, tmp_path):
+        config = {'timezone': 'UTC'}  # no display section: errors
+        first = self._start(tmp_path, config).validate_all()
+        assert first[0] is False
+
+        validator = self._start(tmp_path, config)
+        second = validator.validate_all()
+        assert second == first
+        assert 'config' not in validator.cached_checks
+        assert 'display' not in validator.cached_checks
+
+    def test_timings_recorded_per_check(self, tmp_path):
+        validator = self._start(tmp_path, self._config())
+        validator.validate_all()
+        assert set(validator.timings) == {
+            'config', 'cache_directory', 'display', 'plugins', 'systemd_units'}
+        assert all(t >= 0 for t in validator.timings.values())
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        validator = self._start(tmp_path, self._config())
+        validator.results_cache_path.write_text("{not json")
+        assert validator.validate_all()[0] is True
+        assert validator.cached_checks == []
+
+
 class TestRaiseOnErrors:
     """Exception classification and precedence in raise_on_errors()."""
 
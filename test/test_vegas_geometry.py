@@ -6,11 +6,14 @@ from PIL import Image
 
 from src.vegas_mode.geometry import (
     DEFAULT_INK_THRESHOLD,
+    bright_ratio,
     column_has_ink,
     content_bounds,
     dead_window_stats,
     edge_blank,
     find_blank_cut,
+    has_ink,
+    is_blank,
     separation_gap,
     trim_to_content,
     window_coverage_stats,
@@ -54,6 +57,32 @@ class TestColumnHasInk:
         assert column_has_ink(img).tolist() == [False, False, True, False]
 
 
+class TestBlankChecks:
+    def test_has_ink_threshold_zero_means_not_solid_black(self):
+        assert not has_ink(make_img(16), threshold=0)
+        assert has_ink(make_img(16, fill=(0, 0, 1)), threshold=0)
+
+    def test_bright_ratio_counts_channels(self):
+        img = paint(make_img(10), 0, 1, color=(255, 0, 0))
+        assert bright_ratio(img) == pytest.approx(1 / 30)
+
+    def test_bright_ratio_threshold_is_inclusive(self):
+        assert bright_ratio(make_img(4, fill=(15, 15, 15))) == 1.0
+        assert bright_ratio(make_img(4, fill=(14, 14, 14))) == 0.0
+
+    def test_is_blank_matches_ratio_at_the_limit(self):
+        # 4, 5 and 6 bright columns out of 1000 straddle the 0.5% limit.
+        for columns in (4, 5, 6):
+            img = make_img(1000, height=10)
+            for x in range(columns):
+                paint(img, x * 300, x * 300 + 1)
+            assert is_blank(img) == (bright_ratio(img) < 0.005)
+
+    def test_empty_image_is_blank(self):
+        assert is_blank(Image.new('RGB', (0, 0)))
+        assert bright_ratio(Image.new('RGB', (0, 0))) == 0.0
+
+
 class TestContentBounds:
     def test_blank_returns_none(self):
         assert content_bounds(make_img(16)) is None
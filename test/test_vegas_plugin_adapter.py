@@ -4,16 +4,19 @@ Tests for src/vegas_mode/plugin_adapter.py
 Covers PluginAdapter._strip_scroll_padding(): the heuristic that crops a
 plugin's own baked-in leading/trailing blank margins before Vegas mode
 composites the content, so vegas_scroll.separator_width is the only gap
-applied between items.
+applied between items. Also covers _is_blank_image(), checked against the
+histogram implementation it replaced, and the copy-on-write content cache.
 """
 
 import logging
+import random
+import time
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw
 
 from src.common.scroll_helper import ScrollHelper
-from src.vegas_mode.plugin_adapter import PluginAdapter
+from src.vegas_mode.plugin_adapter import PluginAdapter, _shared_view
 
 
 class FakeDisplayManager:
@@ -136,3 +139,194 @@ class TestStripScrollPadding:
         strip_records = [r for r in caplog.records if "Stripping scroll_helper padding" in r.message]
         assert len(strip_records) == 1
         assert strip_records[0].levelno == logging.INFO
+
+
+def _histogram_is_blank(img, return_ratio=False):
+    """The histogram-and-Python-loop blank check _is_blank_image replaced."""
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    histogram = img.histogram()
+    total_bright_pixels = 0
+    threshold = 15
+    for channel_offset in [0, 256, 512]:
+        for brightness in range(threshold, 256):
+            total_bright_pixels += histogram[channel_offset + brightness]
+    total_pixels = img.width * img.height
+    bright_ratio = total_bright_pixels / (total_pixels * 3)
+    is_blank = bright_ratio < 0.005
+    if return_ratio:
+        return is_blank, bright_ratio
+    return is_blank
+
+
+def _segment(width, bright_pixels, seed, mode='RGB'):
+    """Black segment with `bright_pixels` random pixels set to random colors."""
+    rng = random.Random(seed)
+    img = Image.new('RGB', (width, 32), (0, 0, 0))
+    for _ in range(bright_pixels):
+        img.putpixel((rng.randrange(width), rng.randrange(32)),
+                     tuple(rng.randrange(0, 256) for _ in range(3)))
+    return img.convert(mode) if mode != 'RGB' else img
+
+
+class TestIsBlankImage:
+    @pytest.mark.parametrize("mode", ['RGB', 'RGBA', 'L', 'P'])
+    @pytest.mark.parametrize("bright_pixels", [0, 5, 40, 60, 400, 5000])
+    def test_matches_histogram_version(self, adapter, mode, bright_pixels):
+        img = _segment(500, bright_pixels, seed=bright_pixels, mode=mode)
+        expected_blank, expected_ratio = _histogram_is_blank(img, return_ratio=True)
+
+        is_blank, ratio = adapter._is_blank_image(img, return_ratio=True)
+
+        assert is_blank == expected_blank
+        assert ratio == pytest.approx(expected_ratio, abs=1e-12)
+        assert adapter._is_blank_image(img) == expected_blank
+
+    def test_dim_noise_stays_blank(self, adapter):
+        img = _solid(200, 32, (14, 14, 14))
+        assert adapter._is_blank_image(img)
+        assert _histogram_is_blank(img)
+
+    @pytest.mark.slow
+    def test_benchmark_wide_segments(self, adapter):
+        segments = [_segment(2000, n, seed=n) for n in (0, 50, 500, 20000)]
+        rounds = 20
+
+        def time_check(check):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for img in segments:
+                    check(img)
+            return (time.perf_counter() - start) / (rounds * len(segments))
+
+        histogram = time_check(_histogram_is_blank)
+        numpy_ratio = time_check(lambda img: adapter._is_blank_image(img, return_ratio=True))
+        numpy_bool = time_check(adapter._is_blank_image)
+
+        assert numpy_ratio < histogram
+        assert numpy_bool < histogram
+
+
+class NativePlugin:
+    """Hands back the same image object on every call, as plugins that
+    cache their Vegas card do."""
+
+    def __init__(self, image):
+        self.image = image
+
+    def get_vegas_content(self):
+        return self.image
+
+
+def _held_bytes(*image_lists):
+    """Bytes of distinct pixel buffers across image lists; views of the
+    same image share one buffer."""
+    buffers = {}
+    for images in image_lists:
+        for img in images:
+            buffers[id(img.im)] = img.width * img.height * len(img.getbands())
+    return sum(buffers.values())
+
+
+class TestSharedView:
+    """Pins the Pillow behaviour _shared_view relies on (Image._new)."""
+
+    def test_view_shares_the_buffer_read_only(self):
+        source = _solid(40, 8, (10, 200, 10))
+        view = _shared_view(source)
+        assert view is not source and view.im is source.im
+        assert view.readonly
+        assert (view.mode, view.size) == (source.mode, source.size)
+        assert view.tobytes() == source.tobytes()
+        with pytest.raises(ValueError):
+            view.load()[0, 0] = (255, 0, 0)
+
+    def test_writing_to_the_view_copies_first(self):
+        source = _solid(40, 8, (10, 200, 10))
+        view = _shared_view(source)
+        view.paste((0, 0, 255), (0, 0, 10, 8))
+        ImageDraw.Draw(view).point((20, 4), fill=(255, 0, 0))
+        assert view.im is not source.im
+        assert view.getpixel((5, 4)) == (0, 0, 255)
+        assert source.getpixel((5, 4)) == source.getpixel((20, 4)) == (10, 200, 10)
+
+    def test_falls_back_to_a_copy_without_private_new(self):
+        source = _solid(40, 8, (10, 200, 10))
+
+        class ImageWithoutNew:
+            """An image from a Pillow that no longer has Image._new()."""
+            def load(self):
+                raise AssertionError("only copy() is safe to use")
+
+            def copy(self):
+                return source.copy()
+
+        view = _shared_view(ImageWithoutNew())
+        assert view.im is not source.im
+        assert view.tobytes() == source.tobytes()
+
+
+class TestCopyOnWriteCache:
+    def test_cache_hits_share_one_buffer(self, adapter):
+        plugin = NativePlugin(_solid(300, 32, (10, 200, 10)))
+        first = adapter.get_content(plugin, "card")
+        second = adapter.get_content(plugin, "card")
+        assert first[0] is not second[0]
+        assert first[0].im is second[0].im
+        assert second[0].readonly
+
+    def test_plugin_redrawing_its_image_does_not_reach_the_cache(self, adapter):
+        plugin = NativePlugin(_solid(300, 32, (10, 200, 10)))
+        adapter.get_content(plugin, "card")
+        ImageDraw.Draw(plugin.image).rectangle([0, 0, 299, 31], fill=(255, 0, 0))
+        assert adapter.get_content(plugin, "card")[0].getpixel((5, 5)) == (10, 200, 10)
+
+    def test_consumer_writes_copy_instead_of_corrupting_the_cache(self, adapter):
+        plugin = NativePlugin(_solid(300, 32, (10, 200, 10)))
+        images = adapter.get_content(plugin, "card")
+        ImageDraw.Draw(images[0]).rectangle([0, 0, 9, 9], fill=(255, 0, 0))
+        images[0].paste((0, 0, 255), (20, 0, 30, 10))
+        images.clear()
+
+        again = adapter.get_content(plugin, "card")
+        assert len(again) == 1
+        assert again[0].getpixel((5, 5)) == (10, 200, 10)
+        assert again[0].getpixel((25, 5)) == (10, 200, 10)
+
+    def test_adapter_owned_images_are_not_copied(self, adapter):
+        # Trimming crops the plugin's image, so the cached image is already
+        # the adapter's own and is stored as-is.
+        image = _solid(300, 32, (0, 0, 0))
+        image.paste(_solid(100, 32, (10, 200, 10)), (100, 0))
+        stored = []
+        original_cache = adapter._cache_content
+
+        def spy(plugin_id, content, borrowed=frozenset()):
+            stored.extend((img, id(img) in borrowed) for img in content)
+            return original_cache(plugin_id, content, borrowed)
+
+        adapter._cache_content = spy
+        images = adapter.get_content(NativePlugin(image), "card")
+        (cached, was_borrowed), = stored
+        assert images[0].width < 300
+        assert not was_borrowed
+        assert images[0].im is cached.im
+
+    def test_thirty_plugins_hold_one_buffer_each(self, adapter):
+        plugins = 30
+        segments = [[_segment(1000, 3000, seed=i)] for i in range(plugins)]
+
+        def store_deep_copy(plugin_id, content):
+            cached = [img.copy() for img in content]
+            adapter._content_cache[plugin_id] = (time.time(), cached)
+            return content
+
+        def held_after(store):
+            adapter.invalidate_cache()
+            handed_out = [store(f"plugin-{i}", content) for i, content in enumerate(segments)]
+            cached = [images for _, images in adapter._content_cache.values()]
+            return _held_bytes(*handed_out, *cached)
+
+        shared = held_after(adapter._cache_content)
+        assert shared == plugins * 1000 * 32 * 3
+        assert shared * 2 == held_after(store_deep_copy)
@@ -4,6 +4,8 @@ The wifi monitor daemon used to fetch WiFi status before AND after each
 check on top of the check's own internal fetch — every fetch is several
 nmcli subprocess forks, every 30s, forever. The new API returns the state
 the check observed, so the daemon runs exactly one fetch battery per tick.
+That fetch is now a single NetworkSnapshot carrying WiFi, Ethernet and AP
+state together (see test_wifi_snapshot.py).
 """
 
 import os
@@ -14,7 +16,7 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src.wifi_manager import WiFiManager, WiFiStatus  # noqa: E402
+from src.wifi_manager import NetworkSnapshot, WiFiManager, WiFiStatus  # noqa: E402
 
 
 @pytest.fixture
@@ -30,8 +32,11 @@ def wm(tmp_path):
 
 
 def _wire(wm, connected, ethernet, ap_active):
-    wm._get_wifi_status_with_retry = MagicMock(
-        return_value=WiFiStatus(connected=connected, ssid="net" if connected else None))
+    wm._get_snapshot_with_retry = MagicMock(return_value=NetworkSnapshot(
+        wifi=WiFiStatus(connected=connected, ssid="net" if connected else None,
+                        ap_mode_active=ap_active),
+        ethernet_connected=ethernet))
+    wm._get_wifi_status_with_retry = MagicMock()
     wm._is_ethernet_connected = MagicMock(return_value=ethernet)
     wm._is_ap_mode_active = MagicMock(return_value=ap_active)
     wm.enable_ap_mode = MagicMock(return_value=(True, "ok"))
@@ -46,9 +51,11 @@ class TestWithState:
     def test_single_fetch_per_call(self, wm):
         _wire(wm, connected=True, ethernet=False, ap_active=False)
         wm.check_and_manage_ap_mode_with_state()
-        assert wm._get_wifi_status_with_retry.call_count == 1
-        assert wm._is_ethernet_connected.call_count == 1
-        assert wm._is_ap_mode_active.call_count == 1
+        assert wm._get_snapshot_with_retry.call_count == 1
+        # Ethernet and AP state come from the same snapshot.
+        assert wm._get_wifi_status_with_retry.call_count == 0
+        assert wm._is_ethernet_connected.call_count == 0
+        assert wm._is_ap_mode_active.call_count == 0
 
     def test_returns_observed_state(self, wm):
         _wire(wm, connected=True, ethernet=True, ap_active=False)
@@ -82,7 +89,7 @@ class TestWithState:
         assert wm.check_and_manage_ap_mode() is True
 
     def test_exception_path_never_raises(self, wm):
-        wm._get_wifi_status_with_retry = MagicMock(side_effect=RuntimeError("nmcli gone"))
+        wm._get_snapshot_with_retry = MagicMock(side_effect=RuntimeError("nmcli gone"))
         changed, status, _ethernet, _ap_after = wm.check_and_manage_ap_mode_with_state()
         assert changed is False
         assert status.connected is False
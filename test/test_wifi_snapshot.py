@@ -0,0 +1,329 @@
+"""Tests for the network status snapshot (WiFiManager.get_network_snapshot).
+
+A WiFi status check used to run 8-10 subprocesses: `nmcli device status`,
+several `nmcli device show` and `nmcli device wifi` queries, `systemctl
+is-active hostapd`, `nmcli connection show --active`, then device status and
+device show again for Ethernet. The web UI paid that on every status poll and
+the monitor daemon every 30 seconds. A snapshot is one `nmcli device show`
+(plus one `device wifi list` for SSID and signal when WiFi is connected),
+shared for a few seconds by every WiFiManager and, through a file, by the
+other processes.
+
+These run the real parsing against a fake `nmcli` on PATH that prints
+recorded output and logs each invocation, so the counts are real forks.
+"""
+
+import os
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.wifi_manager import (  # noqa: E402
+    NETWORK_SNAPSHOT_TTL,
+    WiFiManager,
+    _split_nmcli_terse,
+)
+
+# Recorded `nmcli -t -f GENERAL.DEVICE,GENERAL.TYPE,GENERAL.STATE,
+# GENERAL.CONNECTION,IP4.ADDRESS device show` output (Pi 4, Bookworm).
+DEVICE_SHOW = {
+    "wifi": """\
+GENERAL.DEVICE:wlan0
+GENERAL.TYPE:wifi
+GENERAL.STATE:100 (connected)
+GENERAL.CONNECTION:Home Net
+IP4.ADDRESS[1]:192.168.1.50/24
+
+GENERAL.DEVICE:eth0
+GENERAL.TYPE:ethernet
+GENERAL.STATE:20 (unavailable)
+GENERAL.CONNECTION:
+
+GENERAL.DEVICE:lo
+GENERAL.TYPE:loopback
+GENERAL.STATE:100 (connected (externally))
+GENERAL.CONNECTION:lo
+IP4.ADDRESS[1]:127.0.0.1/8
+
+GENERAL.DEVICE:p2p-dev-wlan0
+GENERAL.TYPE:wifi-p2p
+GENERAL.STATE:30 (disconnected)
+GENERAL.CONNECTION:
+""",
+    "ethernet": """\
+GENERAL.DEVICE:eth0
+GENERAL.TYPE:ethernet
+GENERAL.STATE:100 (connected)
+GENERAL.CONNECTION:Wired connection 1
+IP4.ADDRESS[1]:10.0.0.5/24
+
+GENERAL.DEVICE:wlan0
+GENERAL.TYPE:wifi
+GENERAL.STATE:30 (disconnected)
+GENERAL.CONNECTION:
+""",
+    "ap": """\
+GENERAL.DEVICE:wlan0
+GENERAL.TYPE:wifi
+GENERAL.STATE:100 (connected)
+GENERAL.CONNECTION:LEDMatrix-Setup-AP
+IP4.ADDRESS[1]:192.168.4.1/24
+
+GENERAL.DEVICE:eth0
+GENERAL.TYPE:ethernet
+GENERAL.STATE:20 (unavailable)
+GENERAL.CONNECTION:
+""",
+    "hostapd": """\
+GENERAL.DEVICE:wlan0
+GENERAL.TYPE:wifi
+GENERAL.STATE:10 (unmanaged)
+GENERAL.CONNECTION:
+""",
+}
+
+# Recorded `nmcli -t -f ACTIVE,SSID,SIGNAL device wifi list ifname wlan0
+# --rescan no`; the active network's SSID is not the connection name and
+# has an escaped ':' in it.
+WIFI_LIST = """\
+no:Neighbour:40
+yes:Home\\:Net 5G:72
+no:Other:30
+"""
+
+FAKE_TOOL = """#!{python}
+import os, sys, time
+
+with open({calls!r}, 'a') as f:
+    f.write(os.path.basename(sys.argv[0]) + ' ' + ' '.join(sys.argv[1:]) + '\\n')
+time.sleep({delay})
+fixtures = {fixtures!r}
+scenario = open({scenario!r}).read().strip()
+if os.path.basename(sys.argv[0]) == 'systemctl':
+    print('active' if scenario == 'hostapd' else 'inactive')
+elif 'show' in sys.argv:
+    sys.stdout.write(fixtures['device_show'][scenario])
+elif 'list' in sys.argv:
+    sys.stdout.write(fixtures['wifi_list'])
+else:
+    sys.exit(10)
+"""
+
+
+class FakeTools:
+    """A fake `nmcli` and `systemctl` on PATH that log every invocation."""
+
+    def __init__(self, directory: Path, delay: float = 0.0):
+        self.calls = directory / "calls.log"
+        self.calls.touch()
+        self._scenario = directory / "scenario"
+        self.scenario = "wifi"
+        script = FAKE_TOOL.format(
+            python=sys.executable, calls=str(self.calls), delay=delay,
+            scenario=str(self._scenario),
+            fixtures={"device_show": DEVICE_SHOW, "wifi_list": WIFI_LIST})
+        for name in ("nmcli", "systemctl"):
+            tool = directory / name
+            tool.write_text(script)
+            tool.chmod(tool.stat().st_mode | stat.S_IXUSR)
+
+    @property
+    def scenario(self) -> str:
+        return self._scenario.read_text()
+
+    @scenario.setter
+    def scenario(self, name: str) -> None:
+        self._scenario.write_text(name)
+
+    def invocations(self) -> List[str]:
+        return self.calls.read_text().splitlines()
+
+
+def _manager(has_hostapd: bool = False) -> WiFiManager:
+    manager = WiFiManager.__new__(WiFiManager)
+    # minimal attribute setup without running the real __init__
+    manager.config = {"auto_enable_ap_mode": True}
+    manager.has_nmcli = True
+    manager.has_hostapd = has_hostapd
+    manager._wifi_interface = "wlan0"
+    manager._disconnected_checks = 0
+    manager._disconnected_checks_required = 3
+    manager._ap_enabled_at = None
+    return manager
+
+
+def _make_tools(tmp_path, monkeypatch, delay=0.0) -> FakeTools:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return FakeTools(bin_dir, delay=delay)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(WiFiManager, "_SNAPSHOT_PATH", tmp_path / "snapshot.json")
+    monkeypatch.setattr(WiFiManager, "_snapshot", None)
+    monkeypatch.setattr(WiFiManager, "_invalidated_at", 0.0)
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    return _make_tools(tmp_path, monkeypatch)
+
+
+class TestParsing:
+    def test_connected_wifi(self, tools):
+        snapshot = _manager().get_network_snapshot(max_age=0)
+
+        assert snapshot.wifi.connected is True
+        assert snapshot.wifi.ssid == "Home:Net 5G"
+        assert snapshot.wifi.ip_address == "192.168.1.50"
+        assert snapshot.wifi.signal == 72
+        assert snapshot.wifi.ap_mode_active is False
+        # Loopback is "connected" with an IP but is not Ethernet.
+        assert snapshot.ethernet_connected is False
+        calls = tools.invocations()
+        assert len(calls) == 2
+        assert calls[1].endswith("device wifi list ifname wlan0 --rescan no")
+
+    def test_ethernet_only_is_one_call(self, tools):
+        tools.scenario = "ethernet"
+        snapshot = _manager().get_network_snapshot(max_age=0)
+
+        assert snapshot.wifi.connected is False
+        assert snapshot.wifi.ssid is None
+        assert snapshot.ethernet_connected is True
+        assert len(tools.invocations()) == 1
+
+    def test_ap_profile_is_not_a_wifi_connection(self, tools):
+        tools.scenario = "ap"
+        snapshot = _manager().get_network_snapshot(max_age=0)
+
+        assert snapshot.wifi.ap_mode_active is True
+        assert snapshot.wifi.connected is False
+        assert snapshot.wifi.ip_address is None
+        assert len(tools.invocations()) == 1
+
+    def test_hostapd_is_asked_only_when_installed(self, tools):
+        tools.scenario = "hostapd"
+        assert _manager(has_hostapd=False).get_network_snapshot(max_age=0).wifi.ap_mode_active is False
+        assert _manager(has_hostapd=True).get_network_snapshot(max_age=0).wifi.ap_mode_active is True
+        assert [c.split()[0] for c in tools.invocations()] == ["nmcli", "nmcli", "systemctl"]
+
+    def test_terse_escaping(self):
+        assert _split_nmcli_terse("yes:a\\:b\\\\:12") == ["yes", "a:b\\", "12"]
+
+
+class TestSharing:
+    def test_ttl_reuse_across_instances(self, tools):
+        first = _manager().get_wifi_status(max_age=NETWORK_SNAPSHOT_TTL)
+        # The web UI builds a new WiFiManager per request.
+        for _ in range(10):
+            assert _manager().get_wifi_status(max_age=NETWORK_SNAPSHOT_TTL) == first
+        assert len(tools.invocations()) == 2
+
+        # The default is still a fresh read for the connect/AP flows.
+        _manager().get_wifi_status()
+        assert len(tools.invocations()) == 4
+
+    def test_snapshot_is_shared_through_the_file(self, tools):
+        _manager().get_network_snapshot(max_age=0)
+        # Another process: nothing cached in memory, only the file.
+        WiFiManager._snapshot = None
+
+        snapshot = _manager().get_network_snapshot()
+
+        assert snapshot.wifi.ssid == "Home:Net 5G"
+        assert len(tools.invocations()) == 2
+
+    def test_stale_snapshot_is_read_again(self, tools):
+        manager = _manager()
+        manager.get_network_snapshot(max_age=0)
+        WiFiManager._snapshot.taken_at -= NETWORK_SNAPSHOT_TTL + 1
+        WiFiManager._SNAPSHOT_PATH.unlink()
+
+        manager.get_network_snapshot()
+
+        assert len(tools.invocations()) == 4
+
+    def test_invalidate_forgets_memory_and_file(self, tools):
+        manager = _manager()
+        manager.get_network_snapshot()
+        tools.scenario = "ethernet"
+
+        manager.invalidate_network_snapshot()
+
+        assert not WiFiManager._SNAPSHOT_PATH.exists()
+        assert manager.get_network_snapshot().ethernet_connected is True
+        assert len(tools.invocations()) == 3
+
+    def test_invalidate_ignores_a_shared_file_it_cannot_remove(self, tools, monkeypatch):
+        # The monitor daemon (root) saved a snapshot; the web UI, running as
+        # another user, can neither remove nor replace it in sticky /tmp.
+        _manager().get_network_snapshot(max_age=0)
+        WiFiManager._snapshot = None
+        shared = WiFiManager._SNAPSHOT_PATH
+        real_unlink, real_replace = Path.unlink, os.replace
+
+        def unlink(path, *args, **kwargs):
+            if path == shared:
+                raise PermissionError(13, "Operation not permitted")
+            return real_unlink(path, *args, **kwargs)
+
+        def replace(src, dst):
+            if Path(dst) == shared:
+                raise PermissionError(13, "Operation not permitted")
+            return real_replace(src, dst)
+
+        monkeypatch.setattr(Path, "unlink", unlink)
+        monkeypatch.setattr(os, "replace", replace)
+        tools.scenario = "ethernet"
+        manager = _manager()
+
+        manager.invalidate_network_snapshot()
+
+        assert shared.exists()
+        assert manager.get_network_snapshot().ethernet_connected is True
+        assert len(tools.invocations()) == 3
+        # The fresh read is kept in memory even though it couldn't be shared.
+        assert _manager().get_network_snapshot().ethernet_connected is True
+        assert len(tools.invocations()) == 3
+
+    def test_concurrent_callers_share_one_read(self, tmp_path, monkeypatch):
+        tools = _make_tools(tmp_path, monkeypatch, delay=0.2)
+        results = []
+
+        def poll():
+            results.append(_manager().get_network_snapshot())
+
+        threads = [threading.Thread(target=poll) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+        assert len(tools.invocations()) == 2
+
+
+class TestMonitorCheck:
+    def test_check_reuses_a_fresh_snapshot(self, tools):
+        # The web UI just polled status...
+        _manager().get_wifi_status(max_age=NETWORK_SNAPSHOT_TTL)
+
+        # ...so the daemon's check runs nothing of its own.
+        changed, status, ethernet, ap_after = _manager().check_and_manage_ap_mode_with_state()
+
+        assert (changed, status.connected, ethernet, ap_after) == (False, True, False, False)
+        assert len(tools.invocations()) == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -1,9 +1,18 @@
 """Tests for the web interface's in-memory cache helpers."""
+import threading
+import time
 from typing import Iterator
 
 import pytest
 
-from web_interface.cache import delete_cached, get_cached, invalidate_cache, set_cached
+from web_interface.cache import (
+    BoundedTTLCache,
+    delete_cached,
+    get_cache_stats,
+    get_cached,
+    invalidate_cache,
+    set_cached,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -44,3 +53,168 @@ def test_invalidate_cache_pattern() -> None:
     invalidate_cache('fonts')
     assert get_cached('fonts_catalog') is None
     assert get_cached('plugins_list') == 2
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    """Over the entry budget, the entry read least recently goes first."""
+    cache = BoundedTTLCache(max_entries=3)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key)
+    assert cache.get('a') == 'a'  # a is now most recent; b is LRU
+    cache.set('d', 'd')
+    assert cache.get('b') is None
+    assert [cache.get(k) for k in ('a', 'c', 'd')] == ['a', 'c', 'd']
+    assert cache.stats()['evictions'] == 1
+
+
+def test_byte_budget_evicts() -> None:
+    """Entries are evicted to keep the estimated size within max_bytes."""
+    cache = BoundedTTLCache(max_entries=100, max_bytes=4096)
+    for i in range(10):
+        cache.set(f'k{i}', 'x' * 1000)
+    stats = cache.stats()
+    assert stats['bytes'] <= 4096
+    assert stats['entries'] < 10
+    assert cache.get('k9') is not None
+    assert cache.get('k0') is None
+
+
+def test_value_larger_than_budget_is_not_cached() -> None:
+    """A single oversized value does not flush the rest of the cache."""
+    cache = BoundedTTLCache(max_bytes=2048)
+    cache.set('small', 1)
+    cache.set('huge', 'x' * 10_000)
+    assert cache.get('huge') is None
+    assert cache.get('small') == 1
+
+
+def test_ttl_expiry() -> None:
+    """An entry is gone once its write-time TTL has elapsed."""
+    clock = FakeClock()
+    cache = BoundedTTLCache(clock=clock)
+    cache.set('k', 'v', ttl_seconds=10)
+    clock.now += 9.9
+    assert cache.get('k') == 'v'
+    clock.now += 0.2
+    assert cache.get('k') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_read_side_ttl_is_honoured() -> None:
+    """A shorter ttl on read expires an entry stored with a longer one."""
+    clock = FakeClock()
+    cache = BoundedTTLCache(clock=clock)
+    cache.set('k', 'v', ttl_seconds=300)
+    clock.now += 20
+    assert cache.get('k', ttl_seconds=10) is None
+
+
+def test_sweep_removes_unread_expired_keys() -> None:
+    """Expired keys that are never read again are dropped by the write-path sweep."""
+    clock = FakeClock()
+    cache = BoundedTTLCache(sweep_interval=30, clock=clock)
+    for i in range(5):
+        cache.set(f'once{i}', i, ttl_seconds=5)
+    clock.now += 31
+    cache.set('fresh', 1, ttl_seconds=60)
+    assert cache.stats()['entries'] == 1
+    assert cache.stats()['expirations'] == 5
+
+
+def test_hit_miss_counters() -> None:
+    cache = BoundedTTLCache()
+    cache.set('k', 1)
+    cache.get('k')
+    cache.get('k')
+    cache.get('nope')
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+
+
+def test_get_or_compute_single_computation_under_concurrency() -> None:
+    """16 concurrent readers missing on one key run compute exactly once."""
+    cache = BoundedTTLCache()
+    calls = []
+    barrier = threading.Barrier(16)
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {'value': 42}
+
+    results = []
+
+    def reader():
+        barrier.wait()
+        results.append(cache.get_or_compute('expensive', compute, ttl_seconds=60))
+
+    threads = [threading.Thread(target=reader) for _ in range(16)]
+    for t in threads:
+        t.start()
+    # Give every reader time to reach the in-flight wait before finishing.
+    deadline = time.monotonic() + 5
+    while cache.stats()['misses'] < 16 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert results == [{'value': 42}] * 16
+    assert cache.get('expensive') == {'value': 42}
+
+
+def test_get_or_compute_propagates_errors_and_does_not_cache() -> None:
+    cache = BoundedTTLCache()
+
+    def boom():
+        raise RuntimeError('scan failed')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('k', boom)
+    assert cache.stats()['in_flight'] == 0
+    assert cache.get_or_compute('k', lambda: 'ok') == 'ok'
+
+
+def test_get_or_compute_waiter_stops_waiting_on_a_hung_compute() -> None:
+    """A waiter computes the value itself rather than hang with the owner."""
+    cache = BoundedTTLCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def hung():
+        started.set()
+        release.wait(5)
+        return 'late'
+
+    owner = threading.Thread(target=cache.get_or_compute, args=('fonts', hung))
+    owner.start()
+    try:
+        assert started.wait(5)
+        assert cache.get_or_compute('fonts', lambda: 'local', wait_timeout=0.05) == 'local'
+        assert cache.get('fonts') == 'local'
+        assert cache.stats()['wait_timeouts'] == 1
+    finally:
+        release.set()
+        owner.join(5)
+    assert cache.stats()['in_flight'] == 0
+
+
+def test_module_stats_exposed() -> None:
+    """get_cache_stats reports the shared cache used by the helpers."""
+    set_cached('a', 1)
+    get_cached('a')
+    stats = get_cache_stats()
+    assert stats['entries'] == 1
+    assert stats['hits'] >= 1
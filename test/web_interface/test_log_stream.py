@@ -0,0 +1,187 @@
+"""Tests for incremental log streaming (web_interface/log_stream.py).
+
+The logs SSE stream used to re-run `journalctl -n 50` every 5 seconds and
+resend the whole chunk. These drive a LogTail against a fake `journalctl`
+that streams JSON entries the way `journalctl -f -o json` does and records
+every time it is started, so duplicates and re-spawns are measured on a real
+subprocess.
+"""
+import json
+import stat
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from web_interface.log_stream import (
+    LogTail,
+    journalctl_command,
+    log_payload,
+    parse_log_line,
+)
+
+FAKE_JOURNALCTL = """#!{python}
+import json, sys, time
+
+with open({spawns!r}, 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+
+def entry(i):
+    return json.dumps({{
+        '__CURSOR': 'c%d' % i,
+        '__REALTIME_TIMESTAMP': str(1700000000000000 + i * 1000),
+        '_HOSTNAME': 'pi',
+        'SYSLOG_IDENTIFIER': 'ledmatrix',
+        '_PID': '42',
+        '_SYSTEMD_UNIT': 'ledmatrix.service',
+        'PRIORITY': '6',
+        'MESSAGE': 'line %d' % i,
+    }})
+
+resume = [a for a in sys.argv if a.startswith('--after-cursor=')]
+if resume:
+    start = int(resume[0].split('=c')[1]) + 1
+    waves = [range(start, start + 3)]
+else:
+    waves = [range(0, 50), range(50, 70), range(70, 71)]
+for wave in waves:
+    for i in wave:
+        print(entry(i), flush=True)
+    time.sleep(0.4)
+if {crash}:
+    sys.exit(3)
+time.sleep(30)
+"""
+
+
+def make_journalctl(tmp_path: Path, crash: bool = False) -> Dict[str, Path]:
+    spawns = tmp_path / 'spawns.log'
+    spawns.touch()
+    script = tmp_path / 'journalctl'
+    script.write_text(FAKE_JOURNALCTL.format(
+        python=sys.executable, spawns=str(spawns), crash=crash))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return {'script': script, 'spawns': spawns}
+
+
+def collect(tail: LogTail, seconds: float) -> List[dict]:
+    """Payloads stream() yields within the given time (idle ticks skipped)."""
+    payloads = []
+    stream = tail.stream()
+    deadline = time.monotonic() + seconds
+    try:
+        for payload in stream:
+            if payload is not None:
+                payloads.append(payload)
+            if time.monotonic() >= deadline:
+                break
+    finally:
+        stream.close()
+    return payloads
+
+
+def messages(payloads: List[dict]) -> List[str]:
+    return [record['message'] for p in payloads for record in p['records']]
+
+
+class TestLogTail:
+
+    def test_streams_each_line_once_from_one_process(self, tmp_path):
+        fake = make_journalctl(tmp_path)
+        tail = LogTail(journalctl_command(str(fake['script'])), idle_tick=0.1)
+
+        payloads = collect(tail, 2.0)
+
+        assert messages(payloads) == [f'line {i}' for i in range(71)]
+        assert tail.spawn_count == 1
+        spawns = fake['spawns'].read_text().splitlines()
+        assert len(spawns) == 1
+        assert '-f -o json' in spawns[0] and '-n 50' in spawns[0]
+        # The three waves arrive as three events, not 71.
+        assert len(payloads) == 3
+        assert payloads[0]['logs'].splitlines()[0].endswith('pi ledmatrix[42]: line 0')
+        assert not tail.running()
+
+    def test_restart_resumes_after_last_cursor(self, tmp_path):
+        fake = make_journalctl(tmp_path)
+        tail = LogTail(journalctl_command(str(fake['script'])), idle_tick=0.1,
+                       restart_delay=0)
+
+        first = collect(tail, 1.6)
+        second = collect(tail, 0.8)
+
+        assert messages(first) == [f'line {i}' for i in range(71)]
+        assert messages(second) == ['line 71', 'line 72', 'line 73']
+        assert fake['spawns'].read_text().splitlines()[1].endswith('--after-cursor=c70')
+
+    def test_crashed_follower_restarts_at_most_once_per_delay(self, tmp_path):
+        fake = make_journalctl(tmp_path, crash=True)
+        tail = LogTail(journalctl_command(str(fake['script'])), idle_tick=0.1,
+                       restart_delay=2.0)
+
+        # Crashes at ~1.2s, restarts at 2.0s, crashes again at ~2.4s and
+        # would not be restarted before 4.0s.
+        got = messages(collect(tail, 3.0))
+
+        assert 'Log follower exited with return code 3' in got
+        lines = [m for m in got if m.startswith('line ')]
+        assert lines == [f'line {i}' for i in range(74)]
+        assert tail.spawn_count == 2
+
+    def test_backlog_holds_only_sent_records(self, tmp_path):
+        fake = make_journalctl(tmp_path)
+        tail = LogTail(journalctl_command(str(fake['script'])), ring_size=10,
+                       idle_tick=0.1)
+        assert tail.backlog() is None
+
+        collect(tail, 1.6)
+
+        backlog = tail.backlog()
+        assert [r['message'] for r in backlog['records']] == [f'line {i}' for i in range(61, 71)]
+
+    def test_batch_is_in_the_backlog_while_it_is_being_sent(self, tmp_path):
+        fake = make_journalctl(tmp_path)
+        tail = LogTail(journalctl_command(str(fake['script'])), idle_tick=0.1)
+        stream = tail.stream()
+        try:
+            payload = next(p for p in stream if p is not None)
+            # The broadcaster fans this batch out before asking for the next
+            # one; a subscriber joining now must find it in the backlog...
+            backlog = tail.backlog()
+            assert backlog['records'] == payload['records']
+            # ...and can tell the broadcast of it is one it already has.
+            assert backlog['seq'] == payload['seq'] == 1
+            assert next(p for p in stream if p is not None)['seq'] == 2
+        finally:
+            stream.close()
+
+    def test_burst_beyond_max_batch_keeps_newest(self, tmp_path):
+        fake = make_journalctl(tmp_path)
+        tail = LogTail(journalctl_command(str(fake['script'])), max_batch=20,
+                       idle_tick=0.1)
+
+        payloads = collect(tail, 1.6)
+
+        assert messages(payloads[:1]) == [f'line {i}' for i in range(30, 50)]
+        assert payloads[0]['dropped'] == 30
+        assert tail.dropped_count == 30
+
+
+class TestParsing:
+
+    def test_non_utf8_message_bytes(self):
+        record = parse_log_line(json.dumps({
+            '__CURSOR': 'x', '__REALTIME_TIMESTAMP': '1700000000000000',
+            'MESSAGE': [104, 105, 255], 'SYSLOG_IDENTIFIER': 'ledmatrix',
+        }))
+        assert record['message'] == 'hi�'
+        assert record['line'].endswith(' localhost ledmatrix: hi�')
+
+    def test_plain_text_line_passes_through(self):
+        record = parse_log_line('Failed to add match: No such unit\n')
+        assert record['line'] == 'Failed to add match: No such unit'
+        assert record['cursor'] is None
+
+    def test_payload_keeps_logs_text_for_the_viewer(self):
+        records = [parse_log_line('a'), parse_log_line('b')]
+        assert log_payload(records)['logs'] == 'a\nb'
@@ -0,0 +1,149 @@
+"""Tests for the shared system-metrics sampler (web_interface/system_metrics.py).
+
+The stats SSE stream used to run `vcgencmd get_throttled` every 10 seconds
+while /api/v3/system/status sampled the same metrics again per request. These
+drive a SystemSampler against a fake `vcgencmd` that logs each time it is
+started, so the spawn counts are real subprocesses.
+"""
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+
+from web_interface.system_metrics import (
+    VCGENCMD_MAX_FAILURES,
+    SystemSampler,
+    decode_throttled,
+    find_cpu_thermal_zone,
+)
+
+FAKE_VCGENCMD = """#!{python}
+import sys
+with open({spawns!r}, 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+if {fail}:
+    print('VCHI initialization failed')
+    sys.exit(255)
+print('throttled=0x50005')
+"""
+
+
+def make_vcgencmd(tmp_path: Path, fail: bool = False):
+    spawns = tmp_path / 'spawns.log'
+    spawns.touch()
+    script = tmp_path / 'vcgencmd'
+    script.write_text(FAKE_VCGENCMD.format(
+        python=sys.executable, spawns=str(spawns), fail=fail))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return str(script), spawns
+
+
+def spawn_count(spawns: Path) -> int:
+    return len(spawns.read_text().splitlines())
+
+
+class TestSharing:
+
+    def test_one_spawn_per_interval_regardless_of_subscribers(self, tmp_path):
+        vcgencmd, spawns = make_vcgencmd(tmp_path)
+        sampler = SystemSampler(interval=0.2, vcgencmd=vcgencmd)
+        stop = threading.Event()
+        received = []
+
+        def subscriber():
+            stream = sampler.stream()
+            for sample in stream:
+                if sample is not None:
+                    received.append(sample['timestamp'])
+                if stop.is_set():
+                    break
+            stream.close()
+
+        def rest_client():
+            while not stop.is_set():
+                assert sampler.latest()['power'] is not None
+                time.sleep(0.01)
+
+        workers = ([threading.Thread(target=subscriber) for _ in range(8)]
+                   + [threading.Thread(target=rest_client) for _ in range(4)])
+        start = time.monotonic()
+        for worker in workers:
+            worker.start()
+        time.sleep(1.5)
+        stop.set()
+        for worker in workers:
+            worker.join()
+        sampler.stop()
+        elapsed = time.monotonic() - start
+
+        spawned = spawn_count(spawns)
+        # About one per 0.2 s interval, not one per reader per interval.
+        assert 5 <= spawned <= elapsed / 0.2 + 2
+        assert len(set(received)) <= spawned
+
+    def test_history_is_a_bounded_ring(self, tmp_path):
+        sampler = SystemSampler(interval=0.05, history=3)
+        sampler.latest()
+        time.sleep(0.4)
+        history = sampler.history()
+        sampler.stop()
+
+        assert len(history) == 3
+        assert [s['timestamp'] for s in history] == sorted(s['timestamp'] for s in history)
+
+    def test_thread_stops_without_readers(self, tmp_path):
+        vcgencmd, spawns = make_vcgencmd(tmp_path)
+        sampler = SystemSampler(interval=0.05, vcgencmd=vcgencmd, idle_timeout=0.2)
+        sampler.latest()
+        time.sleep(0.5)
+        idle = spawn_count(spawns)
+        time.sleep(0.3)
+
+        assert spawn_count(spawns) == idle
+        assert not sampler._thread
+        # The next reader starts it again.
+        sampler.latest()
+        assert spawn_count(spawns) == idle + 1
+        sampler.stop()
+
+
+class TestMetrics:
+
+    def test_throttle_flags(self, tmp_path):
+        vcgencmd, _ = make_vcgencmd(tmp_path)
+        power = SystemSampler(vcgencmd=vcgencmd).latest()['power']
+
+        assert power == decode_throttled(0x50005)
+        assert power['under_voltage_now'] and power['throttled_now']
+        assert power['under_voltage_occurred'] and power['throttled_occurred']
+        assert not power['freq_capped_now']
+
+    def test_missing_vcgencmd(self):
+        sample = SystemSampler(vcgencmd=None).latest()
+        assert sample['power'] is None
+
+    def test_failing_vcgencmd_is_given_up_on(self, tmp_path):
+        vcgencmd, spawns = make_vcgencmd(tmp_path, fail=True)
+        sampler = SystemSampler(interval=0.01, vcgencmd=vcgencmd)
+        for _ in range(VCGENCMD_MAX_FAILURES + 3):
+            assert sampler._take_sample()['power'] is None
+
+        assert spawn_count(spawns) == VCGENCMD_MAX_FAILURES
+
+    def test_prefers_the_cpu_thermal_zone(self, tmp_path):
+        for index, (zone_type, temp) in enumerate([('acpitz', '27800'),
+                                                   ('x86_pkg_temp', '48234')]):
+            zone = tmp_path / f'thermal_zone{index}'
+            zone.mkdir()
+            (zone / 'type').write_text(zone_type + '\n')
+            (zone / 'temp').write_text(temp + '\n')
+
+        thermal_zone = find_cpu_thermal_zone(tmp_path)
+
+        assert thermal_zone == tmp_path / 'thermal_zone1' / 'temp'
+        assert SystemSampler(thermal_zone=thermal_zone).latest()['cpu_temp'] == 48.2
+
+    def test_no_thermal_zone(self, tmp_path):
+        assert find_cpu_thermal_zone(tmp_path) is None
+        assert SystemSampler(thermal_zone=None).latest()['cpu_temp'] is None
@@ -3,7 +3,6 @@ import json
 import logging
 import os
 import queue
-import re
 import shutil
 import sys
 import subprocess
@@ -27,10 +26,10 @@ from src.plugin_system.operation_queue import PluginOperationQueue
 from src.plugin_system.state_manager import PluginStateManager
 from src.plugin_system.operation_history import OperationHistory
 from src.plugin_system.health_monitor import PluginHealthMonitor
+from web_interface.log_stream import LogTail, file_tail_command, journalctl_command
+from web_interface.system_metrics import SystemSampler
 
 _JOURNALCTL = shutil.which('journalctl')
-_SYSTEMCTL = shutil.which('systemctl')
-_VCGENCMD = shutil.which('vcgencmd')
 
 # Create Flask app
 app = Flask(__name__)
@@ -141,7 +140,7 @@ plugin_state_manager = PluginStateManager(
 # Initialize operation history
 # Use lazy_load=True to defer file loading until first use (improves startup time)
 operation_history = OperationHistory(
-    history_file=str(project_root / "data" / "operation_history.json"),
+    history_file=str(project_root / "data" / "operation_history.jsonl"),
     max_records=1000,
     lazy_load=True
 )
@@ -173,6 +172,9 @@ api_v3.operation_queue = operation_queue
 api_v3.plugin_state_manager = plugin_state_manager
 api_v3.operation_history = operation_history
 api_v3.health_monitor = health_monitor
+# One system-metrics sampler shared by the stats stream and /system/status
+system_sampler = SystemSampler.for_this_host()
+api_v3.system_sampler = system_sampler
 # Initialize cache manager for API endpoints
 from src.cache_manager import CacheManager
 api_v3.cache_manager = CacheManager()
@@ -272,21 +274,10 @@ def serve_plugin_asset(plugin_id, filename):
             'message': 'Internal server error'
         }), 500
 
-# Prime psutil CPU measurement once at startup so interval=None returns a real value
-try:
-    import psutil as _psutil_prime
-    _psutil_prime.cpu_percent(interval=None)
-except ImportError:
-    pass
-
 # Cached AP mode check — avoids creating a WiFiManager per request
 _ap_mode_cache = {'value': False, 'timestamp': 0}
 _AP_MODE_CACHE_TTL = 30  # seconds — AP mode is user-initiated; 30s is fine
 
-# Cached ledmatrix service status for SSE stats stream
-_ledmatrix_service_cache = {'active': False, 'timestamp': 0}
-_LEDMATRIX_SERVICE_CACHE_TTL = 15  # seconds
-
 def is_ap_mode_active():
     """
     Check if access point mode is currently active (cached, 30s TTL).
@@ -527,18 +518,35 @@ class _StreamBroadcaster:
 
     This means N browser tabs share one generator instead of each running their own,
     keeping PIL encodes / subprocess forks constant regardless of how many tabs are open.
+
+    A generator may yield None as an idle tick: nothing is sent, but the
+    broadcaster gets to notice it has no subscribers left. ``initial``, if
+    given, returns a payload for each new subscriber to start with (or None).
+    Payloads may be numbered with a ``seq``; a subscriber is not sent one
+    whose ``seq`` its initial payload already covered.
     """
 
-    def __init__(self, generator_factory):
+    def __init__(self, generator_factory, initial=None):
         self._generator_factory = generator_factory
-        self._clients: set = set()
+        self._initial = initial
+        # client queue -> seq of its initial payload (None if unnumbered)
+        self._clients: dict = {}
         self._lock = threading.Lock()
         self._thread: threading.Thread | None = None
 
     def subscribe(self) -> queue.Queue:
         q: queue.Queue = queue.Queue(maxsize=5)
         with self._lock:
-            self._clients.add(q)
+            # Under the fan-out lock, so no broadcast goes out between the
+            # initial payload and the client joining; a payload the initial
+            # one already contains is skipped by its seq.
+            seen = None
+            if self._initial is not None:
+                data = self._initial()
+                if data is not None:
+                    q.put_nowait(data)
+                    seen = data.get('seq')
+            self._clients[q] = seen
             if not (self._thread and self._thread.is_alive()):
                 self._thread = threading.Thread(target=self._broadcast, daemon=True)
                 self._thread.start()
@@ -546,16 +554,30 @@ class _StreamBroadcaster:
 
     def unsubscribe(self, q: queue.Queue) -> None:
         with self._lock:
-            self._clients.discard(q)
+            self._clients.pop(q, None)
 
     def _broadcast(self):
-        for data in self._generator_factory():
+        generator = self._generator_factory()
+        try:
+            self._fan_out(generator)
+        finally:
+            # Closing runs the generator's cleanup now (e.g. stopping the
+            # log follower) rather than whenever it is collected.
+            generator.close()
+
+    def _fan_out(self, generator):
+        for data in generator:
             with self._lock:
                 if not self._clients:
                     # No subscribers — exit so the thread doesn't spin indefinitely.
                     # subscribe() will restart it when a new client arrives.
                     break
-                for q in self._clients:
+                if data is None:
+                    continue
+                seq = data.get('seq') if isinstance(data, dict) else None
+                for q, seen in self._clients.items():
+                    if seq is not None and seen is not None and seq <= seen:
+                        continue
                     try:
                         q.put_nowait(data)
                     except queue.Full:
@@ -570,91 +592,23 @@ class _StreamBroadcaster:
                         except queue.Full:
                             pass
 
-def _get_power_status():
-    """Check Raspberry Pi under-voltage/throttling status via vcgencmd.
-
-    Returns a dict of decoded flags, or None on non-Pi platforms (no
-    vcgencmd) or if the call fails for any reason. See:
-    https://www.raspberrypi.com/documentation/computers/os.html#get_throttled
-    """
-    if not _VCGENCMD:
-        return None
-    try:
-        result = subprocess.run(
-            [_VCGENCMD, 'get_throttled'], capture_output=True, text=True, timeout=2
-        )
-        match = re.search(r'0x([0-9a-fA-F]+)', result.stdout)
-        if not match:
-            return None
-        bits = int(match.group(1), 16)
-        return {
-            'under_voltage_now': bool(bits & 0x1),
-            'freq_capped_now': bool(bits & 0x2),
-            'throttled_now': bool(bits & 0x4),
-            'soft_temp_limit_now': bool(bits & 0x8),
-            'under_voltage_occurred': bool(bits & 0x10000),
-            'freq_capped_occurred': bool(bits & 0x20000),
-            'throttled_occurred': bool(bits & 0x40000),
-            'soft_temp_limit_occurred': bool(bits & 0x80000),
-        }
-    except (subprocess.SubprocessError, OSError, ValueError) as e:
-        app.logger.warning("vcgencmd get_throttled failed: %s", e)
-        return None
-
 # System status generator for SSE
 def system_status_generator():
-    """Generate system status updates"""
-    while True:
-        try:
-            # Try to import psutil for system stats
-            try:
-                import psutil
-                # interval=None is non-blocking; primed at module startup above
-                cpu_percent = round(psutil.cpu_percent(interval=None), 1)
-                memory = psutil.virtual_memory()
-                memory_used_percent = round(memory.percent, 1)
-
-                # Try to get CPU temperature (Raspberry Pi specific)
-                cpu_temp = 0
-                try:
-                    with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                        cpu_temp = round(float(f.read()) / 1000.0, 1)
-                except (OSError, ValueError):
-                    pass
-
-            except ImportError:
-                cpu_percent = 0
-                memory_used_percent = 0
-                cpu_temp = 0
-
-            # Check if display service is running (cached to avoid per-client subprocess forks)
-            now = time.time()
-            if (now - _ledmatrix_service_cache['timestamp']) >= _LEDMATRIX_SERVICE_CACHE_TTL:
-                if _SYSTEMCTL:
-                    try:
-                        result = subprocess.run([_SYSTEMCTL, 'is-active', 'ledmatrix'],
-                                                capture_output=True, text=True, timeout=2)
-                        _ledmatrix_service_cache['active'] = result.stdout.strip() == 'active'
-                    except (subprocess.SubprocessError, OSError) as e:
-                        app.logger.warning("systemctl status check failed: %s", e)
-                _ledmatrix_service_cache['timestamp'] = now
-            service_active = _ledmatrix_service_cache['active']
-            
-            status = {
-                'timestamp': time.time(),
-                'uptime': 'Running',
-                'service_active': service_active,
-                'cpu_percent': cpu_percent,
-                'memory_used_percent': memory_used_percent,
-                'cpu_temp': cpu_temp,
-                'disk_used_percent': 0,
-                'power': _get_power_status()
-            }
-            yield status
-        except Exception as e:
-            app.logger.error("SSE generator error", exc_info=True)
-            yield {'error': 'An error occurred; see server logs'}
-        time.sleep(10)  # Update every 10 seconds (reduced frequency for better performance)
+    """Generate system status updates from the shared sampler"""
+    for sample in system_sampler.stream():
+        if sample is None:
+            yield None
+            continue
+        yield {
+            'timestamp': sample['timestamp'],
+            'uptime': 'Running',
+            'service_active': bool(sample['service_active']),
+            'cpu_percent': sample['cpu_percent'] or 0,
+            'memory_used_percent': sample['memory_used_percent'] or 0,
+            'cpu_temp': sample['cpu_temp'] or 0,
+            'disk_used_percent': sample['disk_used_percent'] or 0,
+            'power': sample['power']
+        }
 
 # Display preview generator for SSE
 def display_preview_generator():
@@ -736,72 +690,32 @@ def display_preview_generator():
         
         time.sleep(1.0)  # Check once per second — halves PIL encode overhead vs 0.5s
 
-# Logs generator for SSE
-def logs_generator():
-    """Generate log updates from journalctl"""
-    while True:
-        try:
-            # Get recent logs from journalctl (simplified version)
-            # Note: User should be in systemd-journal group to read logs without sudo
-            try:
-                if not _JOURNALCTL:
-                    yield {'timestamp': time.time(), 'logs': 'journalctl not found; cannot read logs'}
-                    time.sleep(60)
-                    continue
-                result = subprocess.run(
-                    [_JOURNALCTL, '-u', 'ledmatrix.service', '-u', 'ledmatrix-web.service',
-                     '-n', '50', '--no-pager', '--output=short-iso'],
-                    capture_output=True, text=True, timeout=5
-                )
-
-                if result.returncode == 0:
-                    logs_text = result.stdout.strip()
-                    if logs_text:
-                        logs_data = {
-                            'timestamp': time.time(),
-                            'logs': logs_text
-                        }
-                        yield logs_data
-                    else:
-                        # No logs available
-                        logs_data = {
-                            'timestamp': time.time(),
-                            'logs': 'No logs available from ledmatrix or ledmatrix-web service'
-                        }
-                        yield logs_data
-                else:
-                    # journalctl failed
-                    error_data = {
-                        'timestamp': time.time(),
-                        'logs': f'journalctl failed with return code {result.returncode}: {result.stderr.strip()}'
-                    }
-                    yield error_data
-
-            except subprocess.TimeoutExpired:
-                # Timeout - just skip this update
-                pass
-            except Exception:
-                app.logger.error("Error running journalctl", exc_info=True)
-                error_data = {
-                    'timestamp': time.time(),
-                    'logs': 'Error running journalctl; see server logs'
-                }
-                yield error_data
+# Logs generator for SSE. One follower process shared by every viewer; it
+# runs while the logs broadcaster has subscribers (see web_interface/log_stream.py).
+# Note: User should be in systemd-journal group to read logs without sudo
+_TAIL = shutil.which('tail')
+_LOG_FILE = os.environ.get('LEDMATRIX_LOG_FILE')
+if _JOURNALCTL:
+    _log_tail: LogTail | None = LogTail(journalctl_command(_JOURNALCTL))
+elif _TAIL and _LOG_FILE:
+    _log_tail = LogTail(file_tail_command(_TAIL, _LOG_FILE))
+else:
+    _log_tail = None
 
-        except Exception:
-            app.logger.error("Unexpected error in logs generator", exc_info=True)
-            error_data = {
-                'timestamp': time.time(),
-                'logs': 'Unexpected error in logs generator; see server logs'
-            }
-            yield error_data
 
-        time.sleep(5)  # Update every 5 seconds (reduced frequency for better performance)
+def logs_generator():
+    """Generate log updates: only lines not sent before, batched."""
+    if _log_tail is None:
+        while True:
+            yield {'timestamp': time.time(), 'logs': 'journalctl not found; cannot read logs'}
+            time.sleep(60)
+    yield from _log_tail.stream()
 
 # One broadcaster per stream — shared across all SSE clients
 _stats_broadcaster = _StreamBroadcaster(system_status_generator)
 _display_broadcaster = _StreamBroadcaster(display_preview_generator)
-_logs_broadcaster = _StreamBroadcaster(logs_generator)
+_logs_broadcaster = _StreamBroadcaster(
+    logs_generator, initial=_log_tail.backlog if _log_tail else None)
 
 
 def _sse_stream(broadcaster: _StreamBroadcaster) -> Response:
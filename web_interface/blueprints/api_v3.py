@@ -1489,41 +1489,35 @@ def save_raw_secrets_config():
         return jsonify({'status': 'error', 'message': error_message,
                         'details': describe_exception(e)}), 500
 
+def _get_system_sampler():
+    """The app's shared SystemSampler; a blueprint used without app.py gets its own."""
+    sampler = getattr(api_v3, 'system_sampler', None)
+    if sampler is None:
+        from web_interface.system_metrics import SystemSampler
+        sampler = api_v3.system_sampler = SystemSampler.for_this_host()
+    return sampler
+
 @api_v3.route('/system/status', methods=['GET'])
 def get_system_status():
-    """Get system status"""
-    try:
-        # Check cache first (10 second TTL for system status)
-        try:
-            from web_interface.cache import get_cached, set_cached
-            cached_result = get_cached('system_status', ttl_seconds=10)
-            if cached_result is not None:
-                return jsonify({'status': 'success', 'data': cached_result})
-        except ImportError:
-            # Cache not available, continue without caching
-            get_cached = None
-            set_cached = None
+    """Get system status
 
-        # Import psutil for system monitoring
-        try:
-            import psutil
-        except ImportError:
+    Served from the shared sampler the stats stream also reads, so a request
+    never samples (or spawns vcgencmd/systemctl) on its own while the sampler
+    is running. ``?history=1`` adds the kept samples, oldest first.
+    """
+    try:
+        sampler = _get_system_sampler()
+        if not sampler.has_psutil:
             # Fallback if psutil not available
             return jsonify({
                 'status': 'error',
                 'message': 'psutil not available for system monitoring'
             }), 503
 
-        # Get system metrics using psutil
-        cpu_percent = psutil.cpu_percent(interval=0.1)  # Short interval for responsiveness
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        disk = psutil.disk_usage('/')
-        disk_percent = disk.percent
+        sample = sampler.latest()
 
         # Calculate uptime
-        boot_time = psutil.boot_time()
-        uptime_seconds = time.time() - boot_time
+        uptime_seconds = time.time() - sample['boot_time'] if sample['boot_time'] else 0
         uptime_hours = uptime_seconds / 3600
         uptime_days = uptime_hours / 24
 
@@ -1535,43 +1529,29 @@ def get_system_status():
         else:
             uptime_str = f"{int(uptime_seconds / 60)}m"
 
-        # Get CPU temperature (Raspberry Pi)
-        cpu_temp = None
-        try:
-            temp_file = '/sys/class/thermal/thermal_zone0/temp'
-            if os.path.exists(temp_file):
-                with open(temp_file, 'r') as f:
-                    temp_millidegrees = int(f.read().strip())
-                    cpu_temp = temp_millidegrees / 1000.0  # Convert to Celsius
-        except (IOError, ValueError, OSError):
-            # Temperature sensor not available or error reading
-            cpu_temp = None
-
-        # Get display service status
-        service_status = _get_display_service_status()
-
         status = {
-            'timestamp': time.time(),
+            'timestamp': sample['timestamp'],
             'uptime': uptime_str,
             'uptime_seconds': int(uptime_seconds),
-            'service_active': service_status.get('active', False),
-            'cpu_percent': round(cpu_percent, 1),
-            'memory_used_percent': round(memory_percent, 1),
-            'memory_total_mb': round(memory.total / (1024 * 1024), 1),
-            'memory_used_mb': round(memory.used / (1024 * 1024), 1),
-            'cpu_temp': round(cpu_temp, 1) if cpu_temp is not None else None,
-            'disk_used_percent': round(disk_percent, 1),
-            'disk_total_gb': round(disk.total / (1024 * 1024 * 1024), 1),
-            'disk_used_gb': round(disk.used / (1024 * 1024 * 1024), 1)
+            'service_active': bool(sample['service_active']),
+            'cpu_percent': sample['cpu_percent'],
+            'memory_used_percent': sample['memory_used_percent'],
+            'memory_total_mb': sample['memory_total_mb'],
+            'memory_used_mb': sample['memory_used_mb'],
+            'cpu_temp': sample['cpu_temp'],
+            'disk_used_percent': sample['disk_used_percent'],
+            'disk_total_gb': sample['disk_total_gb'],
+            'disk_used_gb': sample['disk_used_gb'],
+            'power': sample['power']
         }
+        if request.args.get('history') in ('1', 'true'):
+            status['history'] = sampler.history()
 
-        # Cache the result if available
-        if set_cached:
-            try:
-                set_cached('system_status', status, ttl_seconds=10)
-            except Exception:
-                pass  # Cache write failed, but continue
-
+        try:
+            from web_interface.cache import get_cache_stats
+            status['web_cache'] = get_cache_stats()
+        except ImportError:
+            pass
         return jsonify({'status': 'success', 'data': status})
     except Exception as e:
         logger.error('Unhandled exception', exc_info=True)
@@ -2447,6 +2427,26 @@ def get_hardware_status():
         logger.error("Unexpected error reading hardware status", exc_info=True)
         return jsonify({"status": "error", "message": "Unable to read hardware status"}), 500
 
+@api_v3.route('/display/frame-times', methods=['GET'])
+def get_display_frame_times():
+    """Return the frame-time histograms (plugin, vegas, on_demand) written by the display service."""
+    status_path = "/tmp/led_matrix_frame_times.json"  # nosec B108
+    try:
+        with open(status_path) as f:
+            frame_times = json.load(f)
+        return jsonify({"status": "success", "data": frame_times})
+    except FileNotFoundError:
+        return jsonify({"status": "success", "data": {"labels": {}, "error": "No frames recorded yet"}})
+    except PermissionError:
+        logger.warning("Permission denied reading frame-time status file; display service may be running as a different user")
+        return jsonify({"status": "success", "data": {"labels": {}, "error": "Frame times temporarily unavailable"}})
+    except json.JSONDecodeError:
+        logger.error("Failed to parse frame-time status file", exc_info=True)
+        return jsonify({"status": "success", "data": {"labels": {}, "error": "Frame-time status file corrupted"}})
+    except Exception:
+        logger.error("Unexpected error reading frame times", exc_info=True)
+        return jsonify({"status": "error", "message": "Unable to read frame times"}), 500
+
 @api_v3.route('/display/current', methods=['GET'])
 def get_display_current():
     """Get current display state"""
@@ -6532,96 +6532,94 @@ def authenticate_ytm():
         logger.error('Error in authenticate_ytm', exc_info=True)
         return jsonify({'status': 'error', 'message': 'An error occurred; see logs for details', 'details': describe_exception(e)}), 500
 
+def _build_fonts_catalog():
+    """Scan assets/fonts and describe every font file found."""
+    # Try to import freetype, but continue without it if unavailable
+    try:
+        import freetype
+        freetype_available = True
+    except ImportError:
+        freetype_available = False
+
+    # Scan assets/fonts directory for actual font files
+    fonts_dir = PROJECT_ROOT / "assets" / "fonts"
+    catalog = {}
+
+    if fonts_dir.exists() and fonts_dir.is_dir():
+        for filename in os.listdir(fonts_dir):
+            if filename.endswith(('.ttf', '.otf', '.bdf')):
+                filepath = fonts_dir / filename
+                # Generate family name from filename (without extension)
+                family_name = os.path.splitext(filename)[0]
+
+                # Try to get font metadata using freetype (for TTF/OTF)
+                metadata = {}
+                if filename.endswith(('.ttf', '.otf')) and freetype_available:
+                    try:
+                        face = freetype.Face(str(filepath))
+                        if face.valid:
+                            # Get font family name from font file
+                            family_name_from_font = face.family_name.decode('utf-8') if face.family_name else family_name
+                            metadata = {
+                                'family': family_name_from_font,
+                                'style': face.style_name.decode('utf-8') if face.style_name else 'Regular',
+                                'num_glyphs': face.num_glyphs,
+                                'units_per_em': face.units_per_EM
+                            }
+                            # Use font's family name if available
+                            if family_name_from_font:
+                                family_name = family_name_from_font
+                    except Exception:
+                        # If freetype fails, use filename-based name
+                        pass
+
+                # Store relative path from project root
+                relative_path = str(filepath.relative_to(PROJECT_ROOT))
+                font_type = 'ttf' if filename.endswith('.ttf') else 'otf' if filename.endswith('.otf') else 'bdf'
+
+                # Generate human-readable display name from family_name
+                display_name = family_name.replace('-', ' ').replace('_', ' ')
+                # Add space before capital letters for camelCase names
+                display_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', display_name)
+                # Add space before numbers that follow letters
+                display_name = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', display_name)
+                # Clean up multiple spaces
+                display_name = ' '.join(display_name.split())
+
+                # Use filename (without extension) as unique key to avoid collisions
+                # when multiple files share the same family_name from font metadata
+                catalog_key = os.path.splitext(filename)[0]
+
+                # Check if this is a system font (cannot be deleted)
+                is_system = catalog_key.lower() in SYSTEM_FONTS
+
+                catalog[catalog_key] = {
+                    'filename': filename,
+                    'family_name': family_name,
+                    'display_name': display_name,
+                    'path': relative_path,
+                    'type': font_type,
+                    'is_system': is_system,
+                    'metadata': metadata if metadata else None
+                }
+
+    return catalog
+
+
 @api_v3.route('/fonts/catalog', methods=['GET'])
 def get_fonts_catalog():
     """Get fonts catalog"""
     try:
-        # Check cache first (5 minute TTL)
-        try:
-            from web_interface.cache import get_cached, set_cached
-            cached_result = get_cached('fonts_catalog', ttl_seconds=300)
-            if cached_result is not None:
-                return jsonify({'status': 'success', 'data': {'catalog': cached_result}})
-        except ImportError:
-            # Cache not available, continue without caching
-            get_cached = None
-            set_cached = None
-
-        # Try to import freetype, but continue without it if unavailable
+        # Cached for 5 minutes; concurrent misses share one directory scan.
         try:
-            import freetype
-            freetype_available = True
+            from web_interface.cache import get_or_compute
         except ImportError:
-            freetype_available = False
+            get_or_compute = None
 
-        # Scan assets/fonts directory for actual font files
-        fonts_dir = PROJECT_ROOT / "assets" / "fonts"
-        catalog = {}
-
-        if fonts_dir.exists() and fonts_dir.is_dir():
-            for filename in os.listdir(fonts_dir):
-                if filename.endswith(('.ttf', '.otf', '.bdf')):
-                    filepath = fonts_dir / filename
-                    # Generate family name from filename (without extension)
-                    family_name = os.path.splitext(filename)[0]
-
-                    # Try to get font metadata using freetype (for TTF/OTF)
-                    metadata = {}
-                    if filename.endswith(('.ttf', '.otf')) and freetype_available:
-                        try:
-                            face = freetype.Face(str(filepath))
-                            if face.valid:
-                                # Get font family name from font file
-                                family_name_from_font = face.family_name.decode('utf-8') if face.family_name else family_name
-                                metadata = {
-                                    'family': family_name_from_font,
-                                    'style': face.style_name.decode('utf-8') if face.style_name else 'Regular',
-                                    'num_glyphs': face.num_glyphs,
-                                    'units_per_em': face.units_per_EM
-                                }
-                                # Use font's family name if available
-                                if family_name_from_font:
-                                    family_name = family_name_from_font
-                        except Exception:
-                            # If freetype fails, use filename-based name
-                            pass
-
-                    # Store relative path from project root
-                    relative_path = str(filepath.relative_to(PROJECT_ROOT))
-                    font_type = 'ttf' if filename.endswith('.ttf') else 'otf' if filename.endswith('.otf') else 'bdf'
-
-                    # Generate human-readable display name from family_name
-                    display_name = family_name.replace('-', ' ').replace('_', ' ')
-                    # Add space before capital letters for camelCase names
-                    display_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', display_name)
-                    # Add space before numbers that follow letters
-                    display_name = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', display_name)
-                    # Clean up multiple spaces
-                    display_name = ' '.join(display_name.split())
-
-                    # Use filename (without extension) as unique key to avoid collisions
-                    # when multiple files share the same family_name from font metadata
-                    catalog_key = os.path.splitext(filename)[0]
-
-                    # Check if this is a system font (cannot be deleted)
-                    is_system = catalog_key.lower() in SYSTEM_FONTS
-
-                    catalog[catalog_key] = {
-                        'filename': filename,
-                        'family_name': family_name,
-                        'display_name': display_name,
-                        'path': relative_path,
-                        'type': font_type,
-                        'is_system': is_system,
-                        'metadata': metadata if metadata else None
-                    }
-
-        # Cache the result (5 minute TTL) if available
-        if set_cached:
-            try:
-                set_cached('fonts_catalog', catalog, ttl_seconds=300)
-            except Exception:
-                logger.error("[FontCatalog] Failed to cache fonts_catalog", exc_info=True)
+        if get_or_compute:
+            catalog = get_or_compute('fonts_catalog', _build_fonts_catalog, ttl_seconds=300)
+        else:
+            catalog = _build_fonts_catalog()
 
         return jsonify({'status': 'success', 'data': {'catalog': catalog}})
     except Exception as e:
@@ -7877,10 +7875,12 @@ def get_sync_status():
 def get_wifi_status():
     """Get current WiFi connection status"""
     try:
-        from src.wifi_manager import WiFiManager
+        from src.wifi_manager import NETWORK_SNAPSHOT_TTL, WiFiManager
 
         wifi_manager = WiFiManager()
-        status = wifi_manager.get_wifi_status()
+        # The page polls this; a snapshot a few seconds old (possibly the
+        # monitor daemon's) saves an nmcli run per poll.
+        status = wifi_manager.get_wifi_status(max_age=NETWORK_SNAPSHOT_TTL)
 
         # Get auto-enable setting from config
         auto_enable_ap = wifi_manager.config.get("auto_enable_ap_mode", True)  # Default: True (safe due to grace period)
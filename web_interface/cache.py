@@ -1,48 +1,310 @@
 """
-Simple in-memory cache for expensive operations.
+Bounded in-memory cache for expensive operations.
 Separated from app.py to avoid circular import issues.
+
+Entries live in an LRU ordered by access and expire after their TTL. The
+cache is bounded both by entry count and by an estimated byte budget, so keys
+that are written once and never read again cannot accumulate for the life of
+the Flask process. Expired entries are swept opportunistically on writes (at
+most once per sweep interval) rather than by a dedicated thread.
+
+get_or_compute() adds stampede protection: when several request threads miss
+on the same key at once, one computes the value and the rest wait for it
+(up to a timeout, so a hung compute() doesn't hang every waiter with it).
 """
+import os
+import sys
+import threading
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_SWEEP_INTERVAL = 30.0
+# How long get_or_compute() waits on another thread's compute() before
+# computing the value itself.
+DEFAULT_WAIT_TIMEOUT = 30.0
+
+# How deep _estimate_size walks into nested containers. Cached values are
+# API payloads (dicts of lists of dicts); beyond this depth the estimate
+# stops growing, which is fine for a budget that only needs to be roughly right.
+_SIZE_ESTIMATE_DEPTH = 4
+
+
+def _env_int(name: str, default: int) -> int:
+    """Positive integer from the environment, or default."""
+    raw = os.environ.get(name)
+    if raw:
+        try:
+            value = int(raw)
+            if value > 0:
+                return value
+        except ValueError:
+            pass
+    return default
+
+
+def _estimate_size(value: Any, depth: int = _SIZE_ESTIMATE_DEPTH) -> int:
+    """Rough byte size of value, following containers up to depth levels."""
+    size = sys.getsizeof(value, 64)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_size(k, depth - 1) + _estimate_size(v, depth - 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item, depth - 1)
+    return size
+
+
+class _InFlight:
+    """A computation one thread is running on behalf of all waiters."""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class BoundedTTLCache:
+    """Thread-safe LRU cache with per-entry TTL and entry/byte budgets."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            max_entries: Maximum number of live entries.
+            max_bytes: Maximum estimated size of all cached values.
+            sweep_interval: Minimum seconds between expired-entry sweeps.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, stored_at, expires_at, size)
+        self._entries: 'OrderedDict[str, Tuple[Any, float, float, int]]' = OrderedDict()
+        self._bytes = 0
+        self._last_sweep = clock()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._computations = 0
+        self._wait_timeouts = 0
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired.
+
+        ttl_seconds, when given, is an additional read-side age limit: an
+        entry older than that is treated as expired even if it was stored
+        with a longer TTL.
+        """
+        now = self._clock()
+        with self._lock:
+            found, value = self._lookup_locked(key, now, ttl_seconds)
+            if found:
+                self._hits += 1
+                return value
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: float = 60) -> None:
+        """Store value under key for ttl_seconds, evicting LRU entries if over budget."""
+        now = self._clock()
+        size = _estimate_size(value)
+        with self._lock:
+            self._store_locked(key, value, now, ttl_seconds, size)
+            self._maybe_sweep_locked(now)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       ttl_seconds: float = 60,
+                       wait_timeout: float = DEFAULT_WAIT_TIMEOUT) -> Any:
+        """Return the cached value, computing it once if missing.
 
+        Concurrent callers that miss on the same key share one call to
+        compute(). If compute raises, every waiter sees the same exception
+        and nothing is cached. A None result is returned but not cached.
+        A waiter whose shared compute() has not finished within
+        wait_timeout seconds calls compute() itself.
+        """
+        now = self._clock()
+        with self._lock:
+            found, value = self._lookup_locked(key, now, ttl_seconds)
+            if found:
+                self._hits += 1
+                return value
+            self._misses += 1
+            flight = self._in_flight.get(key)
+            owner = flight is None
+            if flight is None:
+                flight = _InFlight()
+                self._in_flight[key] = flight
 
-# Simple in-memory cache for expensive operations
-_cache = {}
-_cache_timestamps = {}
+        if not owner:
+            if flight.event.wait(wait_timeout):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            # The owner's compute() is stuck (e.g. walking a stalled
+            # filesystem); don't stay stuck with it.
+            with self._lock:
+                self._wait_timeouts += 1
+                self._computations += 1
+            value = compute()
+            if value is not None:
+                self.set(key, value, ttl_seconds)
+            return value
+
+        try:
+            value = compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            flight.value = value
+            if value is not None:
+                self.set(key, value, ttl_seconds)
+            return value
+        finally:
+            with self._lock:
+                self._computations += 1
+                self._in_flight.pop(key, None)
+            flight.event.set()
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._remove_locked(key)
+
+    def invalidate(self, pattern: Optional[str] = None) -> None:
+        """Remove entries whose key contains pattern, or all entries."""
+        with self._lock:
+            if pattern is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in [k for k in self._entries if pattern in k]:
+                self._remove_locked(key)
+
+    def sweep(self) -> int:
+        """Drop every expired entry now. Returns the number removed."""
+        now = self._clock()
+        with self._lock:
+            return self._sweep_locked(now)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current occupancy."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self._max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self._max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 3) if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'computations': self._computations,
+                'wait_timeouts': self._wait_timeouts,
+                'in_flight': len(self._in_flight),
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters."""
+        with self._lock:
+            self._hits = self._misses = 0
+            self._evictions = self._expirations = self._computations = 0
+            self._wait_timeouts = 0
+
+    # -- internals; callers hold self._lock ---------------------------------
+
+    def _lookup_locked(self, key: str, now: float,
+                       ttl_seconds: Optional[float]) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, stored_at, expires_at, _ = entry
+        if now >= expires_at or (ttl_seconds is not None and now - stored_at >= ttl_seconds):
+            self._remove_locked(key)
+            self._expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store_locked(self, key: str, value: Any, now: float,
+                      ttl_seconds: float, size: int) -> None:
+        self._remove_locked(key)
+        if size > self._max_bytes:
+            # Would evict everything else and still not fit.
+            return
+        self._entries[key] = (value, now, now + ttl_seconds, size)
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            _, (_, _, _, old_size) = self._entries.popitem(last=False)
+            self._bytes -= old_size
+            self._evictions += 1
+
+    def _remove_locked(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    def _maybe_sweep_locked(self, now: float) -> None:
+        if now - self._last_sweep >= self._sweep_interval:
+            self._sweep_locked(now)
+
+    def _sweep_locked(self, now: float) -> int:
+        expired = [k for k, entry in self._entries.items() if now >= entry[2]]
+        for key in expired:
+            self._remove_locked(key)
+        self._expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+
+_cache = BoundedTTLCache(
+    max_entries=_env_int('LEDMATRIX_WEB_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES),
+    max_bytes=_env_int('LEDMATRIX_WEB_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES),
+)
 
 
 def get_cached(key: str, ttl_seconds: int = 60) -> Optional[Any]:
     """Get value from cache if not expired."""
-    if key in _cache:
-        if time.time() - _cache_timestamps[key] < ttl_seconds:
-            return _cache[key]
-        else:
-            # Expired, remove
-            del _cache[key]
-            del _cache_timestamps[key]
-    return None
+    return _cache.get(key, ttl_seconds)
 
 
 def set_cached(key: str, value: Any, ttl_seconds: int = 60) -> None:
     """Set value in cache with TTL."""
-    _cache[key] = value
-    _cache_timestamps[key] = time.time()
+    _cache.set(key, value, ttl_seconds)
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], ttl_seconds: int = 60,
+                   wait_timeout: float = DEFAULT_WAIT_TIMEOUT) -> Any:
+    """Get value from cache, computing it at most once across concurrent misses."""
+    return _cache.get_or_compute(key, compute, ttl_seconds, wait_timeout)
 
 
 def delete_cached(key: str) -> None:
     """Remove a single key from the cache if present."""
-    _cache.pop(key, None)
-    _cache_timestamps.pop(key, None)
+    _cache.delete(key)
 
 
 def invalidate_cache(pattern: Optional[str] = None) -> None:
     """Invalidate cache entries matching pattern, or all if pattern is None."""
-    if pattern is None:
-        _cache.clear()
-        _cache_timestamps.clear()
-    else:
-        keys_to_remove = [k for k in _cache.keys() if pattern in k]
-        for key in keys_to_remove:
-            del _cache[key]
-            del _cache_timestamps[key]
+    _cache.invalidate(pattern)
+
 
+def get_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters and occupancy of the shared cache."""
+    return _cache.stats()
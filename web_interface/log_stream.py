@@ -0,0 +1,298 @@
+"""
+Incremental log streaming for the /api/v3/stream/logs SSE endpoint.
+Separated from app.py so it can be tested without importing the Flask app.
+
+The logs stream used to run `journalctl -n 50` every 5 seconds and send the
+whole chunk each time: a fork/exec and a journal re-read per tick, the same
+lines re-sent over and over, and new lines up to 5 seconds late. A LogTail
+keeps one long-lived `journalctl -f -o json` (or `tail -F` on a log file
+where there is no journal), parses each line into a record as it arrives,
+and stream() yields only records it has not sent before. Bursts are
+coalesced into one event per batch window, and the last ring_size records
+are kept so a late subscriber starts with some context. Each batch is
+numbered (``seq``), and the backlog carries the number of the last batch
+in it, so a subscriber can skip a batch it already got from the backlog.
+
+When the follower exits it is restarted, at most once per restart_delay,
+from the last journal cursor, so a restart does not replay lines already
+sent.
+"""
+import json
+import logging
+import queue
+import subprocess
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UNITS = ('ledmatrix.service', 'ledmatrix-web.service')
+DEFAULT_BACKLOG = 50
+DEFAULT_RING_SIZE = 200
+
+CommandFactory = Callable[[Optional[str]], List[str]]
+
+
+def journalctl_command(journalctl: str, units=DEFAULT_UNITS,
+                       backlog: int = DEFAULT_BACKLOG) -> CommandFactory:
+    """Command factory for following the given units' journal as JSON.
+
+    The first start shows the last ``backlog`` entries; a restart resumes
+    after the last cursor seen instead.
+    """
+    def command(cursor: Optional[str]) -> List[str]:
+        cmd = [journalctl, '-f', '-o', 'json', '--no-pager']
+        for unit in units:
+            cmd += ['-u', unit]
+        if cursor:
+            cmd.append(f'--after-cursor={cursor}')
+        else:
+            cmd += ['-n', str(backlog)]
+        return cmd
+    return command
+
+
+def file_tail_command(tail: str, path: str,
+                      backlog: int = DEFAULT_BACKLOG) -> CommandFactory:
+    """Command factory for following a plain log file (no journal cursor)."""
+    started: List[bool] = []
+
+    def command(cursor: Optional[str]) -> List[str]:
+        lines = '0' if started else str(backlog)
+        started.append(True)
+        return [tail, '-n', lines, '-F', path]
+    return command
+
+
+def _journal_field(entry: Dict[str, Any], name: str) -> Optional[str]:
+    """A journal field as text. journalctl -o json writes fields that are not
+    valid UTF-8 as arrays of byte values, and repeated fields as arrays."""
+    value = entry.get(name)
+    if isinstance(value, list):
+        if value and all(isinstance(b, int) for b in value):
+            try:
+                return bytes(value).decode('utf-8', 'replace')
+            except ValueError:
+                return None
+        value = value[0] if value else None
+    return value if value is None else str(value)
+
+
+def parse_log_line(line: str) -> Dict[str, Any]:
+    """Turn one output line into a record.
+
+    Journal JSON entries are rendered into ``line`` the way
+    ``journalctl --output=short-iso`` prints them, which is the format the
+    log viewer parses and what /api/v3/logs returns. Anything else (a plain
+    log file, an error journalctl printed) becomes a record with only
+    ``message`` and ``line``.
+    """
+    text = line.rstrip('\n')
+    entry = None
+    if text.startswith('{'):
+        try:
+            entry = json.loads(text)
+        except ValueError:
+            entry = None
+    if not isinstance(entry, dict):
+        return {'cursor': None, 'timestamp': time.time(), 'unit': None,
+                'priority': None, 'message': text, 'line': text}
+
+    try:
+        timestamp = int(entry['__REALTIME_TIMESTAMP']) / 1e6
+    except (KeyError, TypeError, ValueError):
+        timestamp = time.time()
+    message = _journal_field(entry, 'MESSAGE') or ''
+    hostname = _journal_field(entry, '_HOSTNAME') or 'localhost'
+    identifier = (_journal_field(entry, 'SYSLOG_IDENTIFIER')
+                  or _journal_field(entry, '_COMM') or 'unknown')
+    pid = _journal_field(entry, 'SYSLOG_PID') or _journal_field(entry, '_PID')
+    priority_field = _journal_field(entry, 'PRIORITY')
+    try:
+        priority = int(priority_field) if priority_field is not None else None
+    except ValueError:
+        priority = None
+
+    stamp = datetime.fromtimestamp(timestamp).astimezone().strftime('%Y-%m-%dT%H:%M:%S%z')
+    source = f'{identifier}[{pid}]' if pid else identifier
+    return {
+        'cursor': entry.get('__CURSOR'),
+        'timestamp': timestamp,
+        'unit': _journal_field(entry, '_SYSTEMD_UNIT'),
+        'priority': priority,
+        'message': message,
+        'line': f'{stamp} {hostname} {source}: {message}',
+    }
+
+
+def log_payload(records: List[Dict[str, Any]], dropped: int = 0,
+                seq: Optional[int] = None) -> Dict[str, Any]:
+    """SSE payload for a batch. ``logs`` keeps the newline-joined text the
+    viewer already appends; ``records`` carries the parsed fields; ``seq``
+    numbers the (last) batch the records came from."""
+    return {
+        'timestamp': time.time(),
+        'logs': '\n'.join(record['line'] for record in records),
+        'records': records,
+        'dropped': dropped,
+        'seq': seq,
+    }
+
+
+class LogTail:
+    """One long-lived log follower shared by every subscriber of a stream."""
+
+    def __init__(self, command_factory: CommandFactory,
+                 ring_size: int = DEFAULT_RING_SIZE,
+                 batch_window: float = 0.25,
+                 max_batch: int = 500,
+                 idle_tick: float = 5.0,
+                 restart_delay: float = 5.0) -> None:
+        """
+        Args:
+            command_factory: Builds the follower command from the last
+                journal cursor seen (None on the first start).
+            ring_size: Records kept for late subscribers (see backlog()).
+            batch_window: Seconds to gather records after the first one of
+                a batch, so a burst becomes one event rather than hundreds.
+            max_batch: Most records sent in one event; older ones in a
+                bigger burst are dropped and counted.
+            idle_tick: stream() yields None this often when nothing arrives,
+                so its consumer can notice it has no subscribers left.
+            restart_delay: Minimum seconds between follower starts.
+        """
+        self._command_factory = command_factory
+        self._ring: deque = deque(maxlen=ring_size)
+        self._seq = 0  # number of the last batch added to the ring
+        self._pending: queue.Queue = queue.Queue(maxsize=max_batch * 2)
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._cursor: Optional[str] = None
+        self._last_start = float('-inf')
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.idle_tick = idle_tick
+        self.restart_delay = restart_delay
+        self.spawn_count = 0
+        self.dropped_count = 0
+        self._overflow = 0
+
+    def backlog(self) -> Optional[Dict[str, Any]]:
+        """Payload with the most recently sent records, or None if there are none.
+
+        Its ``seq`` is that of the last batch in it; stream() payloads with
+        the same or a lower ``seq`` hold nothing new for its subscriber.
+        """
+        with self._lock:
+            records = list(self._ring)
+            seq = self._seq
+        return log_payload(records, seq=seq) if records else None
+
+    def running(self) -> bool:
+        with self._lock:
+            return self._process is not None and self._process.poll() is None
+
+    def stream(self) -> Iterator[Optional[Dict[str, Any]]]:
+        """Yield a payload per batch of new records, or None when idle.
+
+        Starts the follower if needed and stops it when the generator is
+        closed.
+        """
+        try:
+            while True:
+                self._ensure_running()
+                try:
+                    first = self._pending.get(timeout=self.idle_tick)
+                except queue.Empty:
+                    yield None
+                    continue
+                time.sleep(self.batch_window)
+                batch = [first]
+                while True:
+                    try:
+                        batch.append(self._pending.get_nowait())
+                    except queue.Empty:
+                        break
+                with self._lock:
+                    dropped, self._overflow = self._overflow, 0
+                if len(batch) > self.max_batch:
+                    dropped += len(batch) - self.max_batch
+                    batch = batch[-self.max_batch:]
+                self.dropped_count += dropped
+                # Buffered before it is sent, so a subscriber that joins
+                # while the batch is going out gets it from backlog() (and
+                # skips the broadcast by its seq) rather than not at all.
+                with self._lock:
+                    self._ring.extend(batch)
+                    self._seq += 1
+                    seq = self._seq
+                yield log_payload(batch, dropped, seq)
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop the follower; the next stream() resumes after the last cursor."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _ensure_running(self) -> None:
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                return
+            if time.monotonic() - self._last_start < self.restart_delay:
+                return
+            command = self._command_factory(self._cursor)
+            self._last_start = time.monotonic()
+            try:
+                process = subprocess.Popen(
+                    command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL, text=True, errors='replace', bufsize=1)
+            except OSError as e:
+                logger.error("Could not start log follower %s: %s", command[0], e)
+                self._enqueue_locked(parse_log_line(f'Could not start {command[0]}: {e}'))
+                return
+            self._process = process
+            self.spawn_count += 1
+        threading.Thread(target=self._read, args=(process,), daemon=True,
+                         name='log-tail-reader').start()
+
+    def _read(self, process: subprocess.Popen) -> None:
+        for line in process.stdout or ():  # always a pipe; typed Optional
+            if not line.strip():
+                continue
+            record = parse_log_line(line)
+            with self._lock:
+                if record['cursor']:
+                    self._cursor = record['cursor']
+                self._enqueue_locked(record)
+        returncode = process.wait()
+        with self._lock:
+            stopped = self._process is not process
+        if not stopped and returncode != 0:
+            with self._lock:
+                self._enqueue_locked(parse_log_line(
+                    f'Log follower exited with return code {returncode}'))
+
+    def _enqueue_locked(self, record: Dict[str, Any]) -> None:
+        """Queue a record for stream(), dropping the oldest if it's full."""
+        while True:
+            try:
+                self._pending.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                    self._overflow += 1
+                except queue.Empty:
+                    pass
@@ -0,0 +1,277 @@
+"""
+Shared system-metrics sampling for the web interface.
+Separated from app.py so it can be tested without importing the Flask app.
+
+The stats SSE stream used to read psutil, the thermal zone, `systemctl` and
+`vcgencmd get_throttled` every 10 seconds, while /api/v3/system/status took
+its own samples on request, including a 0.1 s cpu_percent window that also
+reset the stream's CPU measurement. A SystemSampler is one thread that takes
+a sample every interval while anyone is reading and keeps the last few for
+history; the stream and the REST endpoint both read from it, so the number
+of subprocesses per interval doesn't depend on how many tabs are open.
+
+The thread stops after idle_timeout seconds without a reader and is started
+again by the next one.
+"""
+import logging
+import re
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import psutil
+except ImportError:  # optional at runtime; metrics are reported as None
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 10.0
+DEFAULT_HISTORY = 60
+THERMAL_ROOT = Path('/sys/class/thermal')
+# Zone types that measure the SoC/CPU, best first (Pi, x86, other ARM).
+CPU_THERMAL_TYPES = ('cpu-thermal', 'cpu_thermal', 'x86_pkg_temp', 'soc_thermal')
+# After this many failed `vcgencmd get_throttled` calls in a row (e.g. no
+# access to /dev/vcio) it is not asked again.
+VCGENCMD_MAX_FAILURES = 3
+
+_MB = 1024 * 1024
+_GB = 1024 * 1024 * 1024
+
+
+def find_cpu_thermal_zone(root: Path = THERMAL_ROOT) -> Optional[Path]:
+    """The temp file of the CPU's thermal zone, or of the first zone, or None."""
+    try:
+        zones = sorted(root.glob('thermal_zone*'))
+    except OSError:
+        return None
+    by_type = {}
+    for zone in zones:
+        try:
+            by_type.setdefault((zone / 'type').read_text().strip(), zone)
+        except OSError:
+            continue
+    for zone_type in CPU_THERMAL_TYPES:
+        if zone_type in by_type:
+            return by_type[zone_type] / 'temp'
+    for zone in zones:
+        if (zone / 'temp').exists():
+            return zone / 'temp'
+    return None
+
+
+def decode_throttled(bits: int) -> Dict[str, bool]:
+    """Decode `vcgencmd get_throttled` flags. See:
+    https://www.raspberrypi.com/documentation/computers/os.html#get_throttled
+    """
+    return {
+        'under_voltage_now': bool(bits & 0x1),
+        'freq_capped_now': bool(bits & 0x2),
+        'throttled_now': bool(bits & 0x4),
+        'soft_temp_limit_now': bool(bits & 0x8),
+        'under_voltage_occurred': bool(bits & 0x10000),
+        'freq_capped_occurred': bool(bits & 0x20000),
+        'throttled_occurred': bool(bits & 0x40000),
+        'soft_temp_limit_occurred': bool(bits & 0x80000),
+    }
+
+
+class SystemSampler:
+    """One background sampler of system metrics shared by every reader."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL,
+                 history: int = DEFAULT_HISTORY,
+                 vcgencmd: Optional[str] = None,
+                 systemctl: Optional[str] = None,
+                 service: str = 'ledmatrix',
+                 thermal_zone: Optional[Path] = None,
+                 idle_timeout: float = 60.0) -> None:
+        """
+        Args:
+            interval: Seconds between samples.
+            history: Samples kept for history().
+            vcgencmd: Path of vcgencmd, or None for no throttle flags.
+            systemctl: Path of systemctl, or None to not report the
+                display service's state.
+            service: Unit whose state is reported as service_active.
+            thermal_zone: Temperature file in millidegrees, or None for no
+                temperature.
+            idle_timeout: The thread stops after this many seconds without
+                a reader.
+        """
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self._vcgencmd = vcgencmd
+        self._vcgencmd_failures = 0
+        self._systemctl = systemctl
+        self._service = service
+        self._thermal_zone = thermal_zone
+        self._samples: deque = deque(maxlen=history)
+        self._seq = 0
+        self._taken_at = float('-inf')  # monotonic time of the latest sample
+        self._last_read = time.monotonic()
+        self._cond = threading.Condition()
+        self._sample_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        if psutil is not None:
+            # cpu_percent(interval=None) measures since the previous call;
+            # prime it so the first sample is a real value.
+            psutil.cpu_percent(interval=None)
+
+    @classmethod
+    def for_this_host(cls, **kwargs) -> 'SystemSampler':
+        """A sampler using the tools and thermal zone found on this machine."""
+        kwargs.setdefault('vcgencmd', shutil.which('vcgencmd'))
+        kwargs.setdefault('systemctl', shutil.which('systemctl'))
+        kwargs.setdefault('thermal_zone', find_cpu_thermal_zone())
+        return cls(**kwargs)
+
+    @property
+    def has_psutil(self) -> bool:
+        return psutil is not None
+
+    def latest(self) -> Dict[str, Any]:
+        """The most recent sample, taken now if there is no recent one."""
+        self._touch()
+        return dict(self._sample_if_older(2 * self.interval))
+
+    def history(self) -> List[Dict[str, Any]]:
+        """The kept samples, oldest first."""
+        self._touch()
+        with self._cond:
+            return [dict(sample) for sample in self._samples]
+
+    def stream(self) -> Iterator[Optional[Dict[str, Any]]]:
+        """Yield each new sample as it is taken, or None when one is late,
+        so the consumer can notice it has no subscribers left."""
+        seen = 0
+        while True:
+            self._touch()
+            self._sample_if_older(2 * self.interval)
+            with self._cond:
+                if self._seq == seen:
+                    self._cond.wait(timeout=self.interval * 1.5)
+                if self._seq == seen:
+                    sample = None
+                else:
+                    seen = self._seq
+                    sample = dict(self._samples[-1])
+            yield sample
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _touch(self) -> None:
+        with self._cond:
+            self._last_read = time.monotonic()
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                 name='system-metrics-sampler')
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                if time.monotonic() - self._last_read > self.idle_timeout:
+                    self._thread = None
+                    return
+                due = self._taken_at + self.interval
+            if self._stop.wait(max(0.0, due - time.monotonic())):
+                break
+            # A reader may have just taken one; don't take two in a row.
+            self._sample_if_older(self.interval / 2)
+
+    def _sample_if_older(self, max_age: float) -> Dict[str, Any]:
+        # One sample at a time, so readers that arrive together share it.
+        with self._sample_lock:
+            with self._cond:
+                if self._samples and time.monotonic() - self._taken_at < max_age:
+                    return self._samples[-1]
+            sample = self._take_sample()
+            with self._cond:
+                self._samples.append(sample)
+                self._taken_at = time.monotonic()
+                self._seq += 1
+                self._cond.notify_all()
+            return sample
+
+    def _take_sample(self) -> Dict[str, Any]:
+        sample: Dict[str, Any] = {
+            'timestamp': time.time(),
+            'cpu_percent': None,
+            'memory_used_percent': None,
+            'memory_total_mb': None,
+            'memory_used_mb': None,
+            'disk_used_percent': None,
+            'disk_total_gb': None,
+            'disk_used_gb': None,
+            'boot_time': None,
+            'cpu_temp': self._read_temperature(),
+            'power': self._read_throttled(),
+            'service_active': self._read_service_active(),
+        }
+        if psutil is not None:
+            try:
+                memory = psutil.virtual_memory()
+                disk = psutil.disk_usage('/')
+                sample.update({
+                    'cpu_percent': round(psutil.cpu_percent(interval=None), 1),
+                    'memory_used_percent': round(memory.percent, 1),
+                    'memory_total_mb': round(memory.total / _MB, 1),
+                    'memory_used_mb': round(memory.used / _MB, 1),
+                    'disk_used_percent': round(disk.percent, 1),
+                    'disk_total_gb': round(disk.total / _GB, 1),
+                    'disk_used_gb': round(disk.used / _GB, 1),
+                    'boot_time': psutil.boot_time(),
+                })
+            except (OSError, RuntimeError) as e:
+                logger.warning("psutil sampling failed: %s", e)
+        return sample
+
+    def _read_temperature(self) -> Optional[float]:
+        if self._thermal_zone is None:
+            return None
+        try:
+            return round(int(self._thermal_zone.read_text().strip()) / 1000.0, 1)
+        except (OSError, ValueError):
+            return None
+
+    def _read_throttled(self) -> Optional[Dict[str, bool]]:
+        """Decoded throttle flags, or None on non-Pi platforms (no vcgencmd)
+        or if the call fails."""
+        if not self._vcgencmd or self._vcgencmd_failures >= VCGENCMD_MAX_FAILURES:
+            return None
+        try:
+            result = subprocess.run([self._vcgencmd, 'get_throttled'],
+                                    capture_output=True, text=True, timeout=2)
+            match = re.search(r'0x([0-9a-fA-F]+)', result.stdout)
+            if not match:
+                raise ValueError(f"unexpected output {result.stdout.strip()!r}")
+            self._vcgencmd_failures = 0
+            return decode_throttled(int(match.group(1), 16))
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
+            self._vcgencmd_failures += 1
+            if self._vcgencmd_failures >= VCGENCMD_MAX_FAILURES:
+                logger.warning("vcgencmd get_throttled failed %d times, not asking again: %s",
+                               self._vcgencmd_failures, e)
+            return None
+
+    def _read_service_active(self) -> Optional[bool]:
+        if not self._systemctl:
+            return None
+        try:
+            result = subprocess.run([self._systemctl, 'is-active', self._service],
+                                    capture_output=True, text=True, timeout=2)
+            return result.stdout.strip() == 'active'
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning("systemctl status check failed: %s", e)
+            return None